@@ -54,3 +54,12 @@ Development Philosophy:
 Time Complexity: N/A (package initialization)
 Space Complexity: O(1) - minimal memory for package setup
 """
+
+import os
+
+
+# Opt in to timing every src module import, so cold-start cost is visible on the startup profile endpoint
+if os.getenv("PROMPTCRAFT_PROFILE_IMPORTS", "false").lower() in ("true", "1", "yes", "on"):
+    from src.utils.startup_profiler import get_startup_profiler
+
+    get_startup_profiler().install_import_timer()
@@ -0,0 +1,323 @@
+"""
+Parsed agent definition index.
+
+Caches parsed agent definitions keyed by file path and content hash so that
+discovery does not re-read and re-parse YAML/Markdown files it has already
+seen.
+
+Invalidation:
+    Directories passed to ``watch`` are monitored with a watchdog observer when
+    the optional ``watchdog`` package is installed, and by polling file mtimes
+    every ``poll_interval`` seconds otherwise. A cached definition under a
+    watched directory is served without touching the filesystem until a
+    change is reported for its path. Definitions outside watched directories
+    are revalidated with a ``stat`` on every lookup.
+
+Snapshots:
+    ``save_snapshot`` writes every cached definition, with the mtime, size and
+    SHA-256 of the file it came from, to a compact JSON file. A new process
+    loads the snapshot and only has to ``stat`` each file to reuse its
+    definition; a file is parsed again only if its content hash changed.
+"""
+
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Generic, TypeVar
+
+
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+T = TypeVar("T")
+
+
+@dataclass
+class _IndexEntry(Generic[T]):
+    definition: T
+    mtime_ns: int
+    size: int
+    sha256: str
+    trusted: bool = False  # Verified since the last change notification for a watched path
+
+
+class _ChangeHandler:
+    """watchdog event handler forwarding changed paths to the index."""
+
+    def __init__(self, index: "AgentDefinitionIndex[Any]") -> None:
+        self._index = index
+
+    def dispatch(self, event: Any) -> None:
+        self._index.invalidate(event.src_path)
+        if dest_path := getattr(event, "dest_path", None):
+            self._index.invalidate(dest_path)
+
+
+class AgentDefinitionIndex(Generic[T]):
+    """Cache of parsed definitions invalidated by file changes."""
+
+    def __init__(
+        self,
+        decode: Callable[[dict[str, Any]], T],
+        snapshot_path: Path | None = None,
+        poll_interval: float = 2.0,
+        use_watcher: bool = True,
+    ) -> None:
+        """
+        Initialize the index and load its snapshot, if any.
+
+        Args:
+            decode: Rebuilds a definition from its snapshot dictionary
+            snapshot_path: File the index is persisted to (None disables snapshots)
+            poll_interval: Seconds between mtime polls when no watcher is running
+            use_watcher: Use a watchdog observer for watched directories when available
+        """
+        self._decode = decode
+        self.snapshot_path = snapshot_path
+        self.poll_interval = poll_interval
+        self.use_watcher = use_watcher and Observer is not None
+
+        self._entries: dict[str, _IndexEntry[T]] = {}
+        self._watched: list[Path] = []
+        self._poll_signatures: dict[str, tuple[int, int]] = {}
+        self._last_poll = 0.0
+        self._observer: Any = None
+        self._listeners: list[Callable[[str], None]] = []
+        self._lock = threading.RLock()
+        self._dirty = False
+
+        self.hits = 0
+        self.parses = 0
+
+        if snapshot_path is not None:
+            self.load_snapshot()
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener`` with the path of every reported change."""
+        self._listeners.append(listener)
+
+    def watch(self, directories: list[Path]) -> None:
+        """
+        Monitor directories for changes to the definitions cached from them.
+
+        Args:
+            directories: Directories to watch recursively; missing ones are skipped
+        """
+        with self._lock:
+            for watched_path in directories:
+                directory = Path(watched_path).absolute()
+                if not directory.is_dir() or directory in self._watched:
+                    continue
+                self._watched.append(directory)
+                if self.use_watcher:
+                    if self._observer is None:
+                        self._observer = Observer()
+                        self._observer.daemon = True
+                        self._observer.start()
+                    self._observer.schedule(_ChangeHandler(self), str(directory), recursive=True)
+            if not self.use_watcher:
+                self._poll_signatures = self._scan()
+                self._last_poll = time.monotonic()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the filesystem watcher and wait up to ``timeout`` seconds for its thread to exit."""
+        with self._lock:
+            observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout)
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        signatures = {}
+        for directory in self._watched:
+            for path in directory.rglob("*"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if path.is_file():
+                    signatures[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def check_for_changes(self) -> None:
+        """Poll watched directories for changes if no watcher is running and the poll interval elapsed."""
+        if self.use_watcher or not self._watched:
+            return
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return
+        with self._lock:
+            self._last_poll = now
+            signatures = self._scan()
+            previous = self._poll_signatures
+            self._poll_signatures = signatures
+        for path in previous.keys() | signatures.keys():
+            if previous.get(path) != signatures.get(path):
+                self.invalidate(path)
+
+    def invalidate(self, path: str | Path) -> None:
+        """Mark the definition cached for ``path`` as needing revalidation."""
+        key = str(Path(path).absolute())
+        with self._lock:
+            if entry := self._entries.get(key):
+                entry.trusted = False
+        for listener in self._listeners:
+            listener(key)
+
+    def _is_watched(self, path: Path) -> bool:
+        return any(path.is_relative_to(directory) for directory in self._watched)
+
+    def load(self, path: Path, parse: Callable[[str], T]) -> T:
+        """
+        Get the definition in ``path``, parsing the file only if its content changed.
+
+        Entries are keyed by absolute path, so snapshots are valid across working directories.
+
+        Args:
+            path: Definition file
+            parse: Parses the file content into a definition
+
+        Returns:
+            The parsed definition
+        """
+        self.check_for_changes()
+        path = Path(path).absolute()
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.trusted:
+                self.hits += 1
+                return entry.definition
+
+        try:
+            stat = path.stat()
+        except OSError:
+            # Not a regular file on disk; nothing to key a cache entry on
+            return parse(path.read_text())
+
+        if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            entry.trusted = self._is_watched(path)
+            self.hits += 1
+            return entry.definition
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if entry is not None and entry.sha256 == digest:
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                entry.trusted = self._is_watched(path)
+                self._dirty = True
+                self.hits += 1
+                return entry.definition
+
+        definition = parse(data.decode("utf-8"))
+        with self._lock:
+            self._entries[key] = _IndexEntry(
+                definition=definition,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                sha256=digest,
+                trusted=self._is_watched(path),
+            )
+            self._dirty = True
+            self.parses += 1
+        return definition
+
+    def load_snapshot(self) -> int:
+        """
+        Load cached definitions from the snapshot file.
+
+        Returns:
+            int: Number of definitions loaded
+        """
+        if self.snapshot_path is None or not self.snapshot_path.is_file():
+            return 0
+        try:
+            snapshot = json.loads(self.snapshot_path.read_text())
+            if snapshot.get("version") != SNAPSHOT_VERSION:
+                return 0
+            entries = {
+                path: _IndexEntry(
+                    definition=self._decode(item["definition"]),
+                    mtime_ns=item["mtime_ns"],
+                    size=item["size"],
+                    sha256=item["sha256"],
+                )
+                for path, item in snapshot["entries"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable agent definition snapshot %s: %s", self.snapshot_path, e)
+            return 0
+
+        with self._lock:
+            for path, entry in entries.items():
+                self._entries.setdefault(path, entry)
+        return len(entries)
+
+    def save_snapshot(self) -> bool:
+        """
+        Write the cached definitions to the snapshot file if anything changed.
+
+        Returns:
+            bool: True if a snapshot was written
+        """
+        if self.snapshot_path is None:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            snapshot = {
+                "version": SNAPSHOT_VERSION,
+                "entries": {
+                    path: {
+                        "mtime_ns": entry.mtime_ns,
+                        "size": entry.size,
+                        "sha256": entry.sha256,
+                        "definition": asdict(entry.definition),
+                    }
+                    for path, entry in self._entries.items()
+                },
+            }
+            self._dirty = False
+
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(snapshot, separators=(",", ":")))
+            temp_path.replace(self.snapshot_path)
+        except OSError as e:
+            logger.warning("Failed to write agent definition snapshot %s: %s", self.snapshot_path, e)
+            return False
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "parses": self.parses,
+                "watched_directories": [str(directory) for directory in self._watched],
+                "mode": "watcher" if self.use_watcher else "polling",
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = [
+    "AgentDefinitionIndex",
+]
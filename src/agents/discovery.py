@@ -21,10 +21,13 @@ import yaml
 from src.utils.logging_mixin import LoggerMixin
 
 from .base_agent import BaseAgent
+from .definition_index import AgentDefinitionIndex
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SNAPSHOT_PATH = Path.home() / ".cache" / "promptcraft" / "agent-definitions.json"
+
 
 @dataclass
 class AgentDefinition:
@@ -55,6 +58,21 @@ class AgentDefinition:
             context=ContextConfig(**data.get("context", {})),
             implementation=ImplementationConfig(**data["implementation"]),
         )
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AgentDefinition":
+        """Create AgentDefinition from the output of ``dataclasses.asdict``."""
+        return cls(
+            id=data["id"],
+            version=data["version"],
+            description=data["description"],
+            category=data["category"],
+            runtime=RuntimeConfig(**data["runtime"]),
+            dependencies=DependencyConfig(**data["dependencies"]),
+            tools=ToolConfig(**data["tools"]),
+            context=ContextConfig(**data["context"]),
+            implementation=ImplementationConfig(**data["implementation"]),
+        )
 
 
 @dataclass
@@ -187,9 +205,22 @@ class AgentResourceManager:
 
 
 class AgentDiscoverySystem(LoggerMixin):
-    """Intelligent agent discovery with cascade loading."""
+    """Intelligent agent discovery with cascade loading.
     
-    def __init__(self) -> None:
+    Parsed definitions are cached in an AgentDefinitionIndex, so warm discovery
+    is a dictionary lookup. The application opts in to persisting the index to
+    ``snapshot_path``, so cold starts skip parsing, and to watching the user and
+    project agent directories with ``start_watching``; whoever starts the
+    watcher calls ``close`` at shutdown.
+    """
+    
+    def __init__(self, snapshot_path: Path | None = None) -> None:
+        """Initialize the discovery system.
+        
+        Args:
+            snapshot_path: Parsed definition snapshot file (None disables snapshots;
+                the application uses DEFAULT_SNAPSHOT_PATH)
+        """
         super().__init__()
         self.search_paths = [
             Path.home() / ".claude/agents",      # User-level
@@ -200,6 +231,28 @@ class AgentDiscoverySystem(LoggerMixin):
         self.loaded_agents: dict[str, AgentDefinition] = {}
         self.agent_cache_ttl = timedelta(minutes=30)
         self.discovery_config = self._load_discovery_config()
+        
+        # Parsed definitions, invalidated by file changes in the agent directories
+        self.definition_index: AgentDefinitionIndex[AgentDefinition] = AgentDefinitionIndex(
+            AgentDefinition.from_dict,
+            snapshot_path=snapshot_path,
+        )
+        self.definition_index.add_listener(self._on_definition_changed)
+    
+    def start_watching(self) -> None:
+        """Watch the user and project agent directories so cached definitions skip revalidation."""
+        self.definition_index.watch([Path.home() / ".claude/agents", Path(".agents")])
+    
+    def close(self) -> None:
+        """Stop watching agent directories and persist the definition snapshot."""
+        self.definition_index.stop()
+        self.definition_index.save_snapshot()
+    
+    def _on_definition_changed(self, path: str) -> None:
+        """Drop discovered agents when a definition file changes, since a higher-priority one may now exist."""
+        if self.loaded_agents:
+            self.logger.debug("Agent definition changed: %s", path)
+            self.loaded_agents.clear()
     
     def _load_discovery_config(self) -> dict[str, Any]:
         """Load discovery configuration."""
@@ -226,6 +279,7 @@ class AgentDiscoverySystem(LoggerMixin):
         """Discover agent with intelligent fallback."""
         
         # 1. Check cache
+        self.definition_index.check_for_changes()
         if agent_id in self.loaded_agents:
             self.logger.debug("Using cached definition for agent %s", agent_id)
             return self.loaded_agents[agent_id]
@@ -239,6 +293,7 @@ class AgentDiscoverySystem(LoggerMixin):
                     # Validate dependencies
                     if self.validate_dependencies(agent_def):
                         self.loaded_agents[agent_id] = agent_def
+                        self.definition_index.save_snapshot()
                         self.logger.info("Discovered agent %s via %s", agent_id, search_strategy)
                         return agent_def
                     self.logger.warning("Agent %s dependencies not satisfied", agent_id)
@@ -269,10 +324,8 @@ class AgentDiscoverySystem(LoggerMixin):
         for ext in [".md", ".yaml", ".yml"]:
             agent_file = user_path / f"{agent_id}{ext}"
             if agent_file.exists():
-                content = agent_file.read_text()
-                if ext == ".md":
-                    return self._parse_markdown_agent(content)
-                return AgentDefinition.from_yaml(content)
+                parser = self._parse_markdown_agent if ext == ".md" else AgentDefinition.from_yaml
+                return self.definition_index.load(agent_file, parser)
         
         return None
     
@@ -287,8 +340,7 @@ class AgentDiscoverySystem(LoggerMixin):
             for ext in [".yaml", ".yml"]:
                 agent_file = search_path / f"{agent_id}{ext}"
                 if agent_file.exists():
-                    content = agent_file.read_text()
-                    return AgentDefinition.from_yaml(content)
+                    return self.definition_index.load(agent_file, AgentDefinition.from_yaml)
         
         return None
     
@@ -299,8 +351,7 @@ class AgentDiscoverySystem(LoggerMixin):
         for ext in [".yaml", ".yml"]:
             agent_file = defaults_path / f"{agent_id}{ext}"
             if agent_file.exists():
-                content = agent_file.read_text()
-                return AgentDefinition.from_yaml(content)
+                return self.definition_index.load(agent_file, AgentDefinition.from_yaml)
         
         return None
     
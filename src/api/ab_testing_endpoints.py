@@ -24,7 +24,7 @@ import time
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from pydantic import BaseModel, Field, field_validator
 from sqlalchemy import text
 
@@ -699,18 +699,35 @@ async def record_metric_event(
 # Dashboard and Monitoring Endpoints
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
 @router.get("/dashboard/{experiment_id}", response_class=HTMLResponse)
 @rate_limit(RateLimits.API_DEFAULT)
 async def get_experiment_dashboard(
-    request: Request,  # noqa: ARG001  # Required by FastAPI
+    request: Request,
     experiment_id: str,
-) -> HTMLResponse:
-    """Get HTML dashboard for an experiment."""
+) -> Response:
+    """Get HTML dashboard for an experiment.
+
+    Responds 304 Not Modified when the client's If-None-Match header carries
+    the ETag of the experiment's current data.
+    """
     try:
         dashboard = await get_dashboard_instance()
-        html_content = await dashboard.generate_dashboard_html(experiment_id)
-
-        return HTMLResponse(content=html_content)
+        rendered = await dashboard.render_dashboard(experiment_id)
+        if rendered.etag is None:
+            return HTMLResponse(content=rendered.html)
+
+        headers = {"ETag": rendered.etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), rendered.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return HTMLResponse(content=rendered.html, headers=headers)
 
     except Exception as e:
         logger.error("Failed to generate dashboard for experiment %s: %s", repr(experiment_id), repr(str(e)))
@@ -8,6 +8,7 @@ This module provides FastAPI endpoints for service token management including:
 """
 
 from datetime import datetime
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
@@ -17,6 +18,7 @@ from src.auth.middleware import ServiceTokenUser, require_authentication
 from src.auth.models import AuthenticatedUser
 from src.auth.service_token_manager import ServiceTokenManager
 from src.utils.datetime_compat import UTC, timedelta
+from src.utils.startup_profiler import get_startup_profiler
 
 
 def require_admin_role(request: Request) -> AuthenticatedUser:
@@ -446,6 +448,21 @@ async def system_health() -> dict[str, str]:
     return {"status": "healthy", "timestamp": datetime.now(UTC).isoformat() + "Z"}
 
 
+@system_router.get("/startup-profile")
+async def startup_profile(
+    request: Request,  # noqa: ARG001
+    limit: int = Query(25, ge=1, le=200, description="Number of modules to list"),
+    current_user: AuthenticatedUser = Depends(require_admin_role),  # noqa: ARG001
+) -> dict[str, Any]:
+    """Get module import and startup step timings for this process (admin only).
+
+    Modules deferred until first use are listed separately with the time they
+    were loaded. Import timings are only collected when the process starts with
+    ``PROMPTCRAFT_PROFILE_IMPORTS`` set.
+    """
+    return get_startup_profiler().report(limit=limit)
+
+
 # Audit endpoints for CI/CD logging
 audit_router = APIRouter(prefix="/api/v1/audit", tags=["audit"])
 
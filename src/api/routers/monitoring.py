@@ -8,8 +8,10 @@ import time
 from typing import Any
 
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from src.utils.metrics_registry import OPENMETRICS_CONTENT_TYPE, get_metrics_registry
 from src.utils.performance_monitor import (
     get_performance_monitor,
     get_resource_monitor,
@@ -27,6 +29,9 @@ router = APIRouter(
     },
 )
 
+# Scrape endpoint router (mounted at the application root)
+metrics_router = APIRouter(tags=["monitoring"])
+
 
 class MetricsResponse(BaseModel):
     """Response model for metrics endpoint."""
@@ -267,3 +272,18 @@ async def stop_resource_monitoring() -> dict[str, str]:
     await resource_monitor.stop_monitoring()
 
     return {"message": "Resource monitoring stopped", "timestamp": str(time.time())}
+
+
+@metrics_router.get(
+    "/metrics",
+    summary="OpenMetrics exposition",
+    description="Expose every registered metric in the OpenMetrics text format for scraping",
+    response_class=StreamingResponse,
+)
+async def get_openmetrics() -> StreamingResponse:
+    """Stream all registered metrics in OpenMetrics format.
+
+    Returns:
+        Streaming OpenMetrics response.
+    """
+    return StreamingResponse(get_metrics_registry().render(), media_type=OPENMETRICS_CONTENT_TYPE)
@@ -34,6 +34,8 @@ Environment Variables:
     PROMPTCRAFT_EMAIL_WHITELIST: Comma-separated list of allowed emails/domains
     PROMPTCRAFT_ADMIN_EMAILS: Comma-separated list of admin emails
     PROMPTCRAFT_SESSION_TIMEOUT: Session timeout in seconds (default: 3600)
+    PROMPTCRAFT_SESSION_STORE: Session storage: memory, sqlite or redis (default: memory)
+    PROMPTCRAFT_SESSION_STORE_URL: SQLite database path or Redis URL for shared session storage
     PROMPTCRAFT_DEV_MODE: Enable development mode (default: False)
 """
 
@@ -53,6 +55,7 @@ from .config import (
     CloudflareConfig,
     ConfigLoader,
     ConfigManager,
+    SessionStore,
     get_auth_config,
     get_config_manager,
     reset_config,
@@ -65,6 +68,13 @@ from .middleware import (
     require_admin,
     require_auth,
 )
+from .session_store import (
+    InMemorySessionBackend,
+    RedisSessionBackend,
+    SessionBackend,
+    SqliteSessionBackend,
+    create_session_backend,
+)
 from .whitelist import (
     EmailWhitelistConfig,
     EmailWhitelistValidator,
@@ -95,10 +105,16 @@ __all__ = [
     "ConfigManager",
     "EmailWhitelistConfig",
     "EmailWhitelistValidator",
+    "InMemorySessionBackend",
+    "RedisSessionBackend",
+    "SessionBackend",
+    "SessionStore",
     "SimpleSessionManager",
+    "SqliteSessionBackend",
     "WhitelistEntry",
     "WhitelistManager",
     "create_auth_middleware",
+    "create_session_backend",
     "create_validator_from_env",
     "extract_user_from_cloudflare_headers",
     "get_auth_config",
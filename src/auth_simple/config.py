@@ -13,6 +13,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+from .session_store import create_session_backend
 from .whitelist import EmailWhitelistValidator
 
 
@@ -26,6 +27,14 @@ class AuthMode(str, Enum):
     DISABLED = "disabled"  # For development/testing only
 
 
+class SessionStore(str, Enum):
+    """Session storage backends."""
+
+    MEMORY = "memory"  # Per-process; single worker only
+    SQLITE = "sqlite"  # Shared by the workers on one host
+    REDIS = "redis"  # Shared across hosts
+
+
 class LogLevel(str, Enum):
     """Logging levels for authentication."""
 
@@ -64,6 +73,11 @@ class AuthConfig(BaseModel):
     enable_session_cookies: bool = True
     session_cookie_secure: bool = True
     session_cookie_httponly: bool = True
+    session_store: SessionStore = SessionStore.MEMORY
+    session_store_url: str | None = Field(
+        default=None,
+        description="SQLite database path or Redis URL for shared session storage",
+    )
 
     # Public paths (no authentication required)
     public_paths: set[str] = Field(
@@ -221,6 +235,8 @@ class ConfigLoader:
         config_data["session_timeout"] = cls._get_int_env(f"{prefix}SESSION_TIMEOUT", 3600)
         config_data["enable_session_cookies"] = cls._get_bool_env(f"{prefix}ENABLE_SESSION_COOKIES", True)
         config_data["session_cookie_secure"] = cls._get_bool_env(f"{prefix}SESSION_COOKIE_SECURE", True)
+        config_data["session_store"] = os.getenv(f"{prefix}SESSION_STORE", "memory")
+        config_data["session_store_url"] = os.getenv(f"{prefix}SESSION_STORE_URL") or None
 
         # Public paths
         config_data["public_paths"] = os.getenv(f"{prefix}PUBLIC_PATHS", "")
@@ -327,7 +343,10 @@ class ConfigManager:
         from .middleware import CloudflareAccessMiddleware, SimpleSessionManager
 
         validator = self.create_whitelist_validator()
-        session_manager = SimpleSessionManager(session_timeout=self.config.session_timeout)
+        session_manager = SimpleSessionManager(
+            session_timeout=self.config.session_timeout,
+            backend=create_session_backend(self.config.session_store.value, self.config.session_store_url),
+        )
 
         return CloudflareAccessMiddleware(
             app=None,  # Will be set by FastAPI
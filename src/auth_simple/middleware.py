@@ -5,10 +5,12 @@ Cloudflare Access header extraction with email whitelist validation,
 replacing complex JWT validation with simple header-based authentication.
 """
 
+import asyncio
 from collections.abc import Callable
 from datetime import datetime
 import logging
 import secrets
+import threading
 from typing import Any
 
 from fastapi import HTTPException, Request, Response
@@ -18,6 +20,7 @@ from starlette.types import ASGIApp, Receive, Scope, Send
 from src.utils.datetime_compat import UTC
 
 from .cloudflare_auth import CloudflareAuthError, CloudflareAuthHandler
+from .session_store import InMemorySessionBackend, SessionBackend, SessionRefresh
 from .whitelist import EmailWhitelistValidator
 
 
@@ -25,17 +28,58 @@ logger = logging.getLogger(__name__)
 
 
 class SimpleSessionManager:
-    """In-memory session management for streamlined authentication."""
+    """Session management for streamlined authentication.
+
+    Sessions live in a pluggable ``SessionBackend``. The default in-memory
+    backend is per-process; a shared backend (SQLite or Redis) lets any worker
+    serve any session, so multiple workers need no sticky sessions.
+
+    Sliding expiry is applied in place for the in-memory backend. For shared
+    backends, refreshed expiry times are coalesced per session and written in
+    batches by a background thread every ``refresh_interval`` seconds, keeping
+    writes off the request path. A session may therefore expire up to
+    ``refresh_interval`` seconds early if it is only used just before a flush
+    is due.
+    """
 
-    def __init__(self, session_timeout: int = 3600) -> None:
+    def __init__(
+        self,
+        session_timeout: int = 3600,
+        backend: SessionBackend | None = None,
+        refresh_interval: float = 5.0,
+    ) -> None:
         """Initialize session manager.
 
         Args:
             session_timeout: Session timeout in seconds (default: 1 hour)
+            backend: Session storage (default: per-process in-memory storage)
+            refresh_interval: Seconds between batched sliding-expiry writes to a shared backend
         """
-        self.sessions: dict[str, dict] = {}
+        self.backend = backend or InMemorySessionBackend()
         self.session_timeout = session_timeout
-        logger.info("Initialized session manager with %ss timeout", session_timeout)
+        self.refresh_interval = refresh_interval
+        self._pending_refreshes: dict[str, SessionRefresh] = {}
+        self._refresh_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self._stopped = threading.Event()
+        logger.info(
+            "Initialized session manager with %ss timeout (%s)",
+            session_timeout,
+            type(self.backend).__name__,
+        )
+
+    @property
+    def sessions(self) -> dict[str, dict]:
+        """Sessions held in this process (always empty for shared backends)."""
+        return getattr(self.backend, "sessions", {})
+
+    @property
+    def shared(self) -> bool:
+        """Whether sessions live in a shared backend, whose calls block on storage I/O."""
+        return self.backend.shared
+
+    def _expires_at(self, last_accessed: datetime) -> float:
+        return last_accessed.timestamp() + self.session_timeout
 
     def create_session(
         self,
@@ -56,20 +100,23 @@ class SimpleSessionManager:
             Session ID
         """
         session_id = secrets.token_urlsafe(32)
-        self.sessions[session_id] = {
+        now = datetime.now(UTC)
+        session = {
             "email": email,
             "is_admin": is_admin,
             "user_tier": user_tier,
-            "created_at": datetime.now(UTC),
-            "last_accessed": datetime.now(UTC),
+            "created_at": now,
+            "last_accessed": now,
             "cf_context": cf_context or {},
         }
+        self.backend.create(session_id, session, self._expires_at(now), now.timestamp())
+        self._ensure_flusher()
 
         logger.debug("Created session %s for %s (admin: %s, tier: %s)", session_id, email, is_admin, user_tier)
         return session_id
 
     def get_session(self, session_id: str) -> dict | None:
-        """Get session if valid, clean up if expired.
+        """Get session if valid and extend its expiry.
 
         Args:
             session_id: Session identifier
@@ -80,18 +127,20 @@ class SimpleSessionManager:
         if not session_id:
             return None
 
-        session = self.sessions.get(session_id)
+        now = datetime.now(UTC)
+        session = self.backend.get(session_id, now.timestamp())
         if not session:
             return None
 
-        # Check if session is expired
-        if self._is_session_expired(session):
-            logger.debug("Session %s expired, removing", session_id)
-            del self.sessions[session_id]
-            return None
-
         # Update last accessed time
-        session["last_accessed"] = datetime.now(UTC)
+        session["last_accessed"] = now
+        refresh = SessionRefresh(session_id, session, self._expires_at(now))
+        if self.backend.shared:
+            with self._refresh_lock:
+                self._pending_refreshes[session_id] = refresh
+            self._ensure_flusher()
+        else:
+            self.backend.refresh([refresh], now.timestamp())
         return session
 
     def invalidate_session(self, session_id: str) -> bool:
@@ -103,8 +152,9 @@ class SimpleSessionManager:
         Returns:
             True if session was found and removed
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
+        with self._refresh_lock:
+            self._pending_refreshes.pop(session_id, None)
+        if self.backend.delete(session_id):
             logger.debug("Invalidated session %s", session_id)
             return True
         return False
@@ -117,16 +167,51 @@ class SimpleSessionManager:
         return bool(datetime.now(UTC) > expiry)
 
     def cleanup_expired_sessions(self) -> None:
-        """Remove expired sessions from memory."""
-        expired_sessions = [
-            session_id for session_id, session in self.sessions.items() if self._is_session_expired(session)
-        ]
+        """Remove expired sessions from storage."""
+        removed = self.backend.purge_expired(datetime.now(UTC).timestamp())
+        if removed:
+            logger.debug("Cleaned up %s expired sessions", removed)
+
+    def flush_refreshes(self) -> int:
+        """Write pending sliding-expiry updates to the backend.
+
+        Returns:
+            Number of sessions refreshed
+        """
+        with self._refresh_lock:
+            pending, self._pending_refreshes = self._pending_refreshes, {}
+        if not pending:
+            return 0
+        try:
+            self.backend.refresh(list(pending.values()), datetime.now(UTC).timestamp())
+        except Exception as e:
+            logger.warning("Failed to refresh %s sessions: %s", len(pending), e)
+            return 0
+        return len(pending)
 
-        for session_id in expired_sessions:
-            del self.sessions[session_id]
+    def _ensure_flusher(self) -> None:
+        if not self.backend.shared or self._flusher is not None or self._stopped.is_set():
+            return
+        with self._refresh_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._run_flusher, name="session-refresh", daemon=True)
+                self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        while not self._stopped.wait(self.refresh_interval):
+            self.flush_refreshes()
+            try:
+                self.cleanup_expired_sessions()
+            except Exception as e:
+                logger.warning("Failed to clean up expired sessions: %s", e)
 
-        if expired_sessions:
-            logger.debug("Cleaned up %s expired sessions", len(expired_sessions))
+    def close(self) -> None:
+        """Stop the background flusher, write pending refreshes and close the backend."""
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush_refreshes()
+        self.backend.close()
 
 
 class CloudflareAccessMiddleware:
@@ -281,6 +366,17 @@ class CloudflareAccessMiddleware:
         """Check if path is public (no authentication required)."""
         return path in self.all_public_paths or path.startswith("/static/")
 
+    async def _call_session_manager(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a session manager method, in a worker thread when its backend does I/O.
+
+        Shared backends (SQLite, Redis) block on storage calls, so they run via
+        ``asyncio.to_thread`` to keep the event loop free. In-memory lookups are
+        called directly.
+        """
+        if self.session_manager.shared is True:
+            return await asyncio.to_thread(method, *args, **kwargs)
+        return method(*args, **kwargs)
+
     async def _authenticate_request(self, request: Request) -> None:
         """Authenticate the request and set user context.
 
@@ -311,7 +407,11 @@ class CloudflareAccessMiddleware:
         existing_session_id = request.cookies.get("session_id")
         
         if existing_session_id:
-            session_data = self.session_manager.get_session(existing_session_id)
+            try:
+                session_data = await self._call_session_manager(self.session_manager.get_session, existing_session_id)
+            except Exception as e:
+                logger.error("Session lookup error: %s", e)
+                raise HTTPException(status_code=503, detail="Session storage unavailable") from e
             if session_data and session_data["email"] == cloudflare_user.email:
                 # Use existing session but update with current tier info
                 session_id = existing_session_id
@@ -323,14 +423,15 @@ class CloudflareAccessMiddleware:
         if not session_id:
             # Create new session if no valid existing session
             try:
-                session_id = self.session_manager.create_session(
+                session_id = await self._call_session_manager(
+                    self.session_manager.create_session,
                     email=cloudflare_user.email,
                     is_admin=user_tier.has_admin_privileges,
                     user_tier=user_tier.value,
                     cf_context={},
                 )
                 # Verify session was created successfully
-                if not session_id or not self.session_manager.get_session(session_id):
+                if not session_id or not await self._call_session_manager(self.session_manager.get_session, session_id):
                     raise HTTPException(status_code=500, detail="Session creation failed")
             except Exception as e:
                 if isinstance(e, HTTPException):
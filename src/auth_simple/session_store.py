@@ -0,0 +1,328 @@
+"""Pluggable session storage for the simplified authentication middleware.
+
+Sessions expire ``session_timeout`` seconds after they were last accessed.
+Backends store each session with an absolute ``expires_at`` timestamp and
+never return a session past its expiry, so a lookup is a single read.
+
+Backends:
+    - ``InMemorySessionBackend``: per-process dictionary. Expiry times are kept
+      in a min-heap that is swept on every write, so expired sessions are
+      removed even if they are never looked up again.
+    - ``SqliteSessionBackend``: a SQLite database in WAL mode shared by every
+      worker on the host.
+    - ``RedisSessionBackend``: shared across hosts; expiry is a server-side TTL.
+
+Sliding expiry:
+    Shared backends receive refreshed expiry times in batches (see
+    ``SimpleSessionManager``), so a request only pays for the session read and
+    repeated requests within a flush interval cost a single write.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+import heapq
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REDIS_PREFIX = "promptcraft:session"
+DEFAULT_SWEEP_BATCH = 16
+DEFAULT_SQLITE_PATH = Path.home() / ".cache" / "promptcraft" / "sessions.db"
+
+_DATETIME_FIELDS = ("created_at", "last_accessed")
+
+
+@dataclass(frozen=True)
+class SessionRefresh:
+    """A sliding-expiry update for one session.
+
+    Attributes:
+        session_id: Session identifier
+        session: Session data including its new ``last_accessed`` time
+        expires_at: New expiry as a POSIX timestamp
+    """
+
+    session_id: str
+    session: dict[str, Any]
+    expires_at: float
+
+
+def encode_session(session: dict[str, Any]) -> str:
+    """Serialize session data, storing timestamps as ISO 8601 strings."""
+    data = dict(session)
+    for name in _DATETIME_FIELDS:
+        if isinstance(data.get(name), datetime):
+            data[name] = data[name].isoformat()
+    return json.dumps(data, separators=(",", ":"))
+
+
+def decode_session(payload: str | bytes) -> dict[str, Any]:
+    """Deserialize session data written by ``encode_session``."""
+    data = json.loads(payload)
+    for name in _DATETIME_FIELDS:
+        if isinstance(data.get(name), str):
+            data[name] = datetime.fromisoformat(data[name])
+    return data
+
+
+class SessionBackend(ABC):
+    """Storage for sessions with absolute expiry times.
+
+    All timestamps are POSIX seconds supplied by the caller, so backends never
+    read the clock themselves.
+    """
+
+    #: Whether sessions are visible to other processes; local backends are refreshed in place
+    shared: bool = True
+
+    @abstractmethod
+    def create(self, session_id: str, session: dict[str, Any], expires_at: float, now: float) -> None:
+        """Store a new session."""
+
+    @abstractmethod
+    def get(self, session_id: str, now: float) -> dict[str, Any] | None:
+        """Get a session in a single read, or None if it is missing or expired."""
+
+    @abstractmethod
+    def refresh(self, updates: Sequence[SessionRefresh], now: float) -> None:
+        """Apply a batch of sliding-expiry updates; sessions deleted meanwhile stay deleted."""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """Delete a session, returning whether it existed."""
+
+    @abstractmethod
+    def purge_expired(self, now: float) -> int:
+        """Remove expired sessions, returning how many were removed."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Release any resources held by the backend."""
+
+
+class InMemorySessionBackend(SessionBackend):
+    """Per-process session storage with a min-heap expiry sweep.
+
+    The heap holds at most one entry per session. Refreshing a session only
+    updates its expiry in ``_expires_at``; when the sweep reaches an entry whose
+    session has since been refreshed, the entry is pushed back with the new
+    expiry instead of being removed.
+    """
+
+    shared = False
+
+    def __init__(self, sweep_batch: int = DEFAULT_SWEEP_BATCH) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            sweep_batch: Maximum heap entries examined by the sweep after each write
+        """
+        self.sessions: dict[str, dict[str, Any]] = {}
+        self.sweep_batch = sweep_batch
+        self._expires_at: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def create(self, session_id: str, session: dict[str, Any], expires_at: float, now: float) -> None:
+        with self._lock:
+            if session_id not in self._expires_at:
+                heapq.heappush(self._heap, (expires_at, session_id))
+            self.sessions[session_id] = session
+            self._expires_at[session_id] = expires_at
+            self._sweep_locked(now, self.sweep_batch)
+
+    def get(self, session_id: str, now: float) -> dict[str, Any] | None:
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is None:
+                return None
+            if now > self._expires_at[session_id]:
+                self._remove_locked(session_id)
+                return None
+            return session
+
+    def refresh(self, updates: Sequence[SessionRefresh], now: float) -> None:
+        with self._lock:
+            for update in updates:
+                if update.session_id in self._expires_at:
+                    self._expires_at[update.session_id] = update.expires_at
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._remove_locked(session_id)
+
+    def purge_expired(self, now: float) -> int:
+        with self._lock:
+            return self._sweep_locked(now, len(self._heap))
+
+    def _remove_locked(self, session_id: str) -> bool:
+        # The heap entry is dropped lazily when the sweep reaches it
+        self._expires_at.pop(session_id, None)
+        return self.sessions.pop(session_id, None) is not None
+
+    def _sweep_locked(self, now: float, budget: int) -> int:
+        removed = 0
+        for _ in range(budget):
+            if not self._heap or self._heap[0][0] >= now:
+                break
+            _, session_id = heapq.heappop(self._heap)
+            expires_at = self._expires_at.get(session_id)
+            if expires_at is None:
+                continue
+            if now > expires_at:
+                self._remove_locked(session_id)
+                removed += 1
+            else:
+                heapq.heappush(self._heap, (expires_at, session_id))
+        return removed
+
+
+class SqliteSessionBackend(SessionBackend):
+    """Session storage in a SQLite database shared by all workers on a host."""
+
+    def __init__(self, path: str | Path = DEFAULT_SQLITE_PATH, timeout: float = 5.0) -> None:
+        """
+        Open (or create) the session database.
+
+        Args:
+            path: Database file, or ":memory:" for a private in-process database
+            timeout: Seconds to wait for another worker's write lock
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=timeout, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)",
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at)")
+
+    def create(self, session_id: str, session: dict[str, Any], expires_at: float, now: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (id, data, expires_at) VALUES (?, ?, ?)",
+                (session_id, encode_session(session), expires_at),
+            )
+
+    def get(self, session_id: str, now: float) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM sessions WHERE id = ? AND expires_at >= ?",
+                (session_id, now),
+            ).fetchone()
+        return decode_session(row[0]) if row else None
+
+    def refresh(self, updates: Sequence[SessionRefresh], now: float) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE sessions SET data = ?, expires_at = MAX(expires_at, ?) WHERE id = ?",
+                [(encode_session(update.session), update.expires_at, update.session_id) for update in updates],
+            )
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,)).rowcount > 0
+
+    def purge_expired(self, now: float) -> int:
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM sessions WHERE expires_at < ?", (now,)).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisSessionBackend(SessionBackend):
+    """Session storage shared through a Redis-protocol server.
+
+    Each session is a string key whose TTL is its remaining lifetime, so
+    expired sessions are removed server-side. Refreshes use ``SET ... XX`` in a
+    single pipeline, which never resurrects a session deleted meanwhile.
+    """
+
+    def __init__(self, client: Any, prefix: str = DEFAULT_REDIS_PREFIX) -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.prefix}:{session_id}"
+
+    @staticmethod
+    def _ttl_ms(expires_at: float, now: float) -> int:
+        return max(1, int((expires_at - now) * 1000))
+
+    def create(self, session_id: str, session: dict[str, Any], expires_at: float, now: float) -> None:
+        self.client.set(self._key(session_id), encode_session(session), px=self._ttl_ms(expires_at, now))
+
+    def get(self, session_id: str, now: float) -> dict[str, Any] | None:
+        payload = self.client.get(self._key(session_id))
+        return decode_session(payload) if payload is not None else None
+
+    def refresh(self, updates: Sequence[SessionRefresh], now: float) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        for update in updates:
+            pipe.set(
+                self._key(update.session_id),
+                encode_session(update.session),
+                px=self._ttl_ms(update.expires_at, now),
+                xx=True,
+            )
+        pipe.execute()
+
+    def delete(self, session_id: str) -> bool:
+        return bool(self.client.delete(self._key(session_id)))
+
+    def purge_expired(self, now: float) -> int:
+        # Keys expire server-side
+        return 0
+
+
+def create_session_backend(backend: str = "memory", url: str | None = None) -> SessionBackend:
+    """Create a session backend by name.
+
+    Args:
+        backend: "memory", "sqlite" or "redis"
+        url: Database file for sqlite, or connection URL for redis
+
+    Returns:
+        Configured session backend
+
+    Raises:
+        ValueError: If the backend is unknown or its dependency is missing
+    """
+    if backend == "memory":
+        return InMemorySessionBackend()
+    if backend == "sqlite":
+        logger.info("Using SQLite session storage at %s", url or DEFAULT_SQLITE_PATH)
+        return SqliteSessionBackend(url or DEFAULT_SQLITE_PATH)
+    if backend == "redis":
+        try:
+            import redis  # noqa: PLC0415 - only needed for shared deployments, and slow to import
+        except ImportError as e:
+            raise ValueError("Redis session storage requires the redis package") from e
+        logger.info("Using Redis session storage")
+        return RedisSessionBackend(redis.Redis.from_url(url or "redis://localhost:6379/0", socket_timeout=1.0))
+    raise ValueError(f"Unknown session backend: {backend}")
+
+
+__all__ = [
+    "InMemorySessionBackend",
+    "RedisSessionBackend",
+    "SessionBackend",
+    "SessionRefresh",
+    "SqliteSessionBackend",
+    "create_session_backend",
+    "decode_session",
+    "encode_session",
+]
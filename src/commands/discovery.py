@@ -8,7 +8,7 @@ Intelligent discovery system for Claude Code slash commands with hybrid approach
 Project-level (.claude/commands/) -> User-level (~/.claude/commands/) fallback.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -16,10 +16,26 @@ import re
 from typing import Any
 
 from src.utils.logging_mixin import LoggerMixin
+from src.utils.resource_catalog import ResourceCatalog, get_resource_catalog
+from src.utils.trigram_index import TrigramIndex
 
 
 logger = logging.getLogger(__name__)
 
+# Built-in commands, available when no project or user file defines the ID
+BUILTIN_COMMANDS = {
+    "help": {
+        "name": "Help",
+        "description": "Show available commands and usage",
+        "content": "# Help Command\n\nBuilt-in help command for listing available slash commands.",
+    },
+}
+
+# Search weights of the fields a command is indexed by
+COMMAND_ID_WEIGHT = 1.0
+NAME_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 0.5
+
 
 @dataclass
 class CommandDefinition:
@@ -35,14 +51,44 @@ class CommandDefinition:
     parameters: list[str] = field(default_factory=list)
     examples: list[str] = field(default_factory=list)
     last_updated: datetime | None = None
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["file_path"] = str(self.file_path)
+        data["last_updated"] = self.last_updated.isoformat() if self.last_updated else None
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CommandDefinition":
+        """Create CommandDefinition from the output of ``to_dict``."""
+        last_updated = data.get("last_updated")
+        return cls(
+            **{
+                **data,
+                "file_path": Path(data["file_path"]),
+                "last_updated": datetime.fromisoformat(last_updated) if last_updated else None,
+            },
+        )
 
 
 
 class CommandsDiscoverySystem(LoggerMixin):
-    """Discovery system for Claude Code slash commands with project-first, user-fallback approach."""
+    """Discovery system for Claude Code slash commands with project-first, user-fallback approach.
     
-    def __init__(self, project_root: Path | None = None) -> None:
+    Command files are parsed through a ResourceCatalog shared with the scripts
+    and standards discovery systems, so each file is parsed once per change.
+    """
+    
+    def __init__(self, project_root: Path | None = None, catalog: ResourceCatalog | None = None) -> None:
+        """Initialize the discovery system.
+        
+        Args:
+            project_root: Project directory (defaults to the current directory)
+            catalog: Parsed resource catalog (defaults to the shared catalog)
+        """
         super().__init__()
+        self.catalog = catalog if catalog is not None else get_resource_catalog()
         self.project_root = project_root or Path.cwd()
         self.project_commands_path = self.project_root / ".claude" / "commands"
         self.user_commands_path = Path.home() / ".claude" / "commands"
@@ -52,6 +98,15 @@ class CommandsDiscoverySystem(LoggerMixin):
         self._cache_timestamp: datetime | None = None
         self._cache_ttl_seconds = 300  # 5 minutes
         
+        # Source file (path, mtime) signatures per command ID, to refresh only what changed
+        self._command_signatures: dict[str, tuple[tuple[str, int], ...]] = {}
+        
+        # Fuzzy search index over the cache, updated on search for the IDs a refresh touched;
+        # rebuilt if the cache dict is replaced
+        self._search_index = TrigramIndex()
+        self._indexed_cache: dict[str, CommandDefinition] = self._commands_cache
+        self._unindexed_command_ids: set[str] = set()
+        
         # Command categories for organization
         self.command_categories = {
             "quality": ["quality-", "lint", "format"],
@@ -139,21 +194,41 @@ class CommandsDiscoverySystem(LoggerMixin):
         self.logger.warning(f"Command '{command_id}' not found in any source")
         return None
     
-    def search_commands(self, query: str) -> list[CommandDefinition]:
-        """Search commands by name, description, or content."""
+    def search_commands(self, query: str, limit: int | None = None) -> list[CommandDefinition]:
+        """Search commands by ID, name, or description, best match first.
+        
+        Matching is fuzzy, so prefixes, substrings and small typos all find a command.
+        """
         if self._should_refresh_cache():
             self._refresh_commands_cache()
         
-        query = query.lower()
-        matching_commands = []
+        if not query.strip():
+            return list(self._commands_cache.values())[:limit]
         
-        for command in self._commands_cache.values():
-            if (query in command.command_id.lower() or 
-                query in command.name.lower() or 
-                query in command.description.lower()):
-                matching_commands.append(command)
+        self._update_search_index()
+        return [self._commands_cache[match.key] for match in self._search_index.search(query, limit)]
+    
+    def _update_search_index(self) -> None:
+        """Bring the search index in line with the commands cache."""
+        if self._indexed_cache is not self._commands_cache:
+            self._search_index.clear()
+            self._unindexed_command_ids = set(self._commands_cache)
+            self._indexed_cache = self._commands_cache
         
-        return matching_commands
+        for command_id in self._unindexed_command_ids:
+            command = self._commands_cache.get(command_id)
+            if command is None:
+                self._search_index.remove(command_id)
+                continue
+            self._search_index.add(
+                command_id,
+                [
+                    (command.command_id, COMMAND_ID_WEIGHT),
+                    (command.name, NAME_WEIGHT),
+                    (command.description, DESCRIPTION_WEIGHT),
+                ],
+            )
+        self._unindexed_command_ids.clear()
     
     def _search_project_commands(self, command_id: str) -> CommandDefinition | None:
         """Search for command in project-level directory."""
@@ -162,7 +237,7 @@ class CommandsDiscoverySystem(LoggerMixin):
             
         command_file = self.project_commands_path / f"{command_id}.md"
         if command_file.exists():
-            return self._create_command_definition(command_id, command_file, "project")
+            return self._load_command_definition(command_id, command_file, "project")
         
         return None
     
@@ -173,23 +248,14 @@ class CommandsDiscoverySystem(LoggerMixin):
             
         command_file = self.user_commands_path / f"{command_id}.md"
         if command_file.exists():
-            return self._create_command_definition(command_id, command_file, "user")
+            return self._load_command_definition(command_id, command_file, "user")
             
         return None
     
     def _search_builtin_commands(self, command_id: str) -> CommandDefinition | None:
         """Search for built-in commands (placeholder for future implementation)."""
-        # Built-in commands could be defined here for essential functionality
-        builtin_commands = {
-            "help": {
-                "name": "Help",
-                "description": "Show available commands and usage",
-                "content": "# Help Command\n\nBuilt-in help command for listing available slash commands.",
-            },
-        }
-        
-        if command_id in builtin_commands:
-            builtin_info = builtin_commands[command_id]
+        if command_id in BUILTIN_COMMANDS:
+            builtin_info = BUILTIN_COMMANDS[command_id]
             return CommandDefinition(
                 command_id=command_id,
                 name=builtin_info["name"],
@@ -202,6 +268,16 @@ class CommandsDiscoverySystem(LoggerMixin):
         
         return None
     
+    def _load_command_definition(self, command_id: str, file_path: Path, source_type: str) -> CommandDefinition:
+        """Get the CommandDefinition for a file from the catalog, parsing the file only if it changed."""
+        return self.catalog.load(
+            "commands",
+            file_path,
+            lambda: self._create_command_definition(command_id, file_path, source_type),
+            CommandDefinition.from_dict,
+            identity=(command_id, source_type),
+        )
+    
     def _create_command_definition(self, command_id: str, file_path: Path, source_type: str) -> CommandDefinition:
         """Create a CommandDefinition from a file path."""
         try:
@@ -311,47 +387,65 @@ class CommandsDiscoverySystem(LoggerMixin):
                 command.category = "general"
     
     def _refresh_commands_cache(self) -> None:
-        """Refresh the commands cache by scanning all available sources."""
-        self.logger.debug("Refreshing commands cache")
-        self._commands_cache.clear()
+        """Bring the commands cache up to date with all available sources.
         
-        # Collect all command IDs from all sources
-        all_command_ids = set()
-        
-        # Scan project commands
-        if self.project_commands_path.exists():
-            for file_path in self.project_commands_path.glob("*.md"):
-                if file_path.stem.startswith("_"):  # Skip README and other meta files
-                    continue
-                command_id = file_path.stem
-                all_command_ids.add(command_id)
+        Only commands whose source files were added, modified or removed
+        since the last refresh are rediscovered; the rest stay cached.
+        Rediscovered files are parsed only if the catalog has not seen their
+        current version, even in an earlier process.
+        """
+        self.logger.debug("Refreshing commands cache")
+        with self.catalog.timed_scan("commands"):
+            self._update_commands_cache()
+        self.catalog.save_snapshot()
+    
+    def _update_commands_cache(self) -> None:
+        """Rediscover the commands whose source files changed since the last refresh."""
+        signatures = self._scan_command_signatures()
+        removed = self._commands_cache.keys() - signatures.keys()
+        changed = [
+            command_id
+            for command_id, signature in signatures.items()
+            if command_id not in self._commands_cache or self._command_signatures.get(command_id) != signature
+        ]
         
-        # Scan user commands
-        if self.user_commands_path.exists():
-            for file_path in self.user_commands_path.glob("*.md"):
-                if file_path.stem.startswith("_"):  # Skip README and other meta files
-                    continue
-                command_id = file_path.stem
-                all_command_ids.add(command_id)
-        
-        # Add built-in command IDs
-        builtin_commands = {
-            "help": {
-                "name": "Help",
-                "description": "Show available commands and usage",
-                "content": "# Help Command\n\nBuilt-in help command for listing available slash commands.",
-            },
-        }
-        all_command_ids.update(builtin_commands.keys())
+        for command_id in removed:
+            del self._commands_cache[command_id]
         
-        # Discover each command (project-first, user-fallback, then built-in)
-        for command_id in all_command_ids:
+        # Discover each changed command (project-first, user-fallback, then built-in)
+        for command_id in changed:
             command = self.discover_command(command_id)
             if command:
                 self._commands_cache[command_id] = command
+            else:
+                self._commands_cache.pop(command_id, None)
+        
+        self._unindexed_command_ids.update(removed, changed)
         
+        self._command_signatures = signatures
         self._cache_timestamp = utc_now()
-        self.logger.info(f"Refreshed commands cache with {len(self._commands_cache)} commands")
+        self.logger.info(
+            f"Refreshed commands cache with {len(self._commands_cache)} commands "
+            f"({len(changed)} rediscovered, {len(removed)} removed)",
+        )
+    
+    def _scan_command_signatures(self) -> dict[str, tuple[tuple[str, int], ...]]:
+        """Map every available command ID to the (path, mtime) of its source files."""
+        signatures: dict[str, list[tuple[str, int]]] = {command_id: [] for command_id in BUILTIN_COMMANDS}
+        
+        for commands_path in (self.project_commands_path, self.user_commands_path):
+            if not commands_path.exists():
+                continue
+            for file_path in commands_path.glob("*.md"):
+                if file_path.stem.startswith("_"):  # Skip README and other meta files
+                    continue
+                try:
+                    mtime_ns = file_path.stat().st_mtime_ns
+                except OSError:
+                    continue
+                signatures.setdefault(file_path.stem, []).append((str(file_path), mtime_ns))
+        
+        return {command_id: tuple(files) for command_id, files in signatures.items()}
     
     def _should_refresh_cache(self) -> bool:
         """Check if cache should be refreshed."""
@@ -389,6 +483,7 @@ class CommandsDiscoverySystem(LoggerMixin):
             "commands_by_source": commands_by_source,
             "commands_by_category": commands_by_category,
             "supported_categories": list(self.command_categories.keys()),
+            "catalog": self.catalog.get_stats(),
         }
 
 
@@ -14,6 +14,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field, computed_field
 
+from src.utils.lazy_import import lazy_import
+
 from .constants import FILE_PATH_PATTERNS, SECRET_FIELD_NAMES, SENSITIVE_ERROR_PATTERNS
 from .settings import (
     ApplicationSettings,
@@ -24,14 +26,27 @@ from .settings import (
 from .validation import validate_configuration_on_startup
 
 
-# Conditional import for MCP integration to avoid circular imports
-try:
-    from src.mcp_integration import MCPClient, MCPConfigurationManager, ParallelSubagentExecutor
-except ImportError:
-    # MCP integration may not be available during early bootstrap
-    MCPClient = None  # type: ignore[misc,assignment]
-    MCPConfigurationManager = None  # type: ignore[misc,assignment]
-    ParallelSubagentExecutor = None  # type: ignore[misc,assignment]
+# MCP integration is imported on first use: it avoids circular imports and keeps
+# the MCP stack off the startup path of processes that never check MCP health
+_mcp_integration = lazy_import("src.mcp_integration")
+_MCP_COMPONENTS = ("MCPClient", "MCPConfigurationManager", "ParallelSubagentExecutor")
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve MCP components on first access (None if MCP integration is unavailable)."""
+    if name not in _MCP_COMPONENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(_mcp_integration, name)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
+
+def _mcp_component(name: str) -> Any:
+    return globals()[name] if name in globals() else __getattr__(name)
+
 
 # Compile regex patterns once for better performance
 _COMPILED_SENSITIVE_PATTERNS = [
@@ -457,13 +472,14 @@ async def get_mcp_configuration_health() -> dict[str, Any]:
     """
     try:
         # Check if MCP components are available
-        if MCPClient is None or MCPConfigurationManager is None or ParallelSubagentExecutor is None:
+        mcp_client_class, config_manager_class, executor_class = (_mcp_component(name) for name in _MCP_COMPONENTS)
+        if mcp_client_class is None or config_manager_class is None or executor_class is None:
             raise ImportError("MCP integration components not available")
 
         # Initialize MCP components
-        config_manager = MCPConfigurationManager()
-        mcp_client = MCPClient()
-        parallel_executor = ParallelSubagentExecutor(config_manager, mcp_client)
+        config_manager = config_manager_class()
+        mcp_client = mcp_client_class()
+        parallel_executor = executor_class(config_manager, mcp_client)
 
         # Get health status from all components
         config_health = config_manager.get_health_status()
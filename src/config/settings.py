@@ -365,6 +365,21 @@ class ApplicationSettings(BaseSettings):
         description="Whether to echo SQL queries for debugging",
     )
 
+    db_query_instrumentation_enabled: bool = Field(
+        default=True,
+        description="Record per-statement latency and detect slow queries and N+1 patterns",
+    )
+
+    db_slow_query_threshold: float = Field(
+        default=0.5,
+        description="Statements taking at least this many seconds are logged as slow queries",
+    )
+
+    db_n_plus_one_threshold: int = Field(
+        default=10,
+        description="Executions of one statement within a request that are reported as an N+1 pattern",
+    )
+
     # API Keys and Secrets (sensitive values)
     api_key: SecretStr | None = Field(
         default=None,
@@ -462,6 +477,43 @@ class ApplicationSettings(BaseSettings):
         description="Percentage of traffic to route to OpenRouter (0-100) for gradual rollout",
     )
 
+    openrouter_hedging_enabled: bool = Field(
+        default=False,
+        description="Whether slow OpenRouter requests are hedged with a duplicate to the next fallback model",
+    )
+
+    openrouter_hedge_percentile: float = Field(
+        default=95.0,
+        gt=0,
+        lt=100,
+        description="Per-model latency percentile after which an OpenRouter request is hedged",
+    )
+
+    openrouter_hedge_budget_percent: float = Field(
+        default=5.0,
+        ge=0,
+        le=100,
+        description="Maximum extra OpenRouter requests sent as hedges, as a percentage of requests",
+    )
+
+    hybrid_routing_adaptive_enabled: bool = Field(
+        default=False,
+        description="Whether hybrid routing shifts traffic toward the faster, healthier backend",
+    )
+
+    hybrid_routing_max_traffic_shift: int = Field(
+        default=50,
+        ge=0,
+        le=100,
+        description="Maximum percentage of traffic adaptive routing may move away from the configured split",
+    )
+
+    hybrid_routing_half_life_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Half-life in seconds of the latency and error-rate estimates used by adaptive routing",
+    )
+
     # Qdrant Vector Database Configuration
     qdrant_host: str = Field(
         default="192.168.1.16",
@@ -520,6 +572,42 @@ class ApplicationSettings(BaseSettings):
         description="Query timeout in seconds",
     )
 
+    # Audit Logging Configuration
+    audit_log_async_enabled: bool = Field(
+        default=False,
+        description="Whether audit events are buffered and written by a background worker",
+    )
+
+    audit_log_path: str = Field(
+        default="logs/audit.jsonl",
+        description="JSON lines file for asynchronously written audit events",
+    )
+
+    audit_log_buffer_size: int = Field(
+        default=10000,
+        description="Maximum buffered non-critical audit events before the overflow policy applies",
+    )
+
+    audit_log_overflow_policy: str = Field(
+        default="drop_oldest",
+        description="Overflow policy for non-critical audit events: drop_oldest or drop_newest",
+    )
+
+    audit_log_max_bytes: int = Field(
+        default=50 * 1024 * 1024,  # 50MB
+        description="Audit log size in bytes that triggers rotation",
+    )
+
+    audit_log_backup_count: int = Field(
+        default=5,
+        description="Number of rotated audit log files to keep",
+    )
+
+    audit_log_compress: bool = Field(
+        default=False,
+        description="Whether the audit log file is gzip compressed",
+    )
+
     # File Upload Security Configuration
     max_files: int = Field(
         default=5,
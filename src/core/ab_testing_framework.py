@@ -18,6 +18,7 @@ Architecture:
 - ExperimentManager: Core orchestration and control
 - UserSegmentation: Assignment and characteristic-based grouping
 - MetricsCollector: Real-time performance and UX metrics
+- MetricRollupStore: Hourly and daily metric rollups for dashboards
 - StatisticalAnalyzer: Significance testing and validation
 - FeatureFlagManager: Dynamic experiment control
 - RolloutController: Progressive deployment automation
@@ -35,19 +36,38 @@ import time
 from typing import Any
 
 from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, String, create_engine
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.config.settings import get_settings
-from src.utils.datetime_compat import ensure_aware, utc_now
+from src.utils.datetime_compat import aware_to_naive, ensure_aware, utc_now
 from src.utils.observability import ObservabilityMixin
 from src.utils.performance_monitor import PerformanceMonitor
+from src.utils.quantile_sketch import QuantileSketch
 
 from .dynamic_loading_integration import ProcessingResult
 
 
 logger = logging.getLogger(__name__)
 
+# Metric rollups
+ROLLUP_GRANULARITIES = ("hour", "day")
+CONVERSION_THRESHOLD_PERCENT = 70.0  # Token reduction that counts as a conversion
+ROLLUP_SKETCH_ACCURACY = 0.02
+ROLLUP_SKETCH_EXACT_LIMIT = 16  # Keeps serialized sketches small
+ROLLUP_RECORD_ATTEMPTS = 3  # Retries when a concurrent writer creates the same bucket first
+_ROLLUP_TOTALS = (
+    "event_count",
+    "success_count",
+    "error_count",
+    "conversion_count",
+    "response_time_count",
+    "response_time_sum",
+    "token_reduction_count",
+    "token_reduction_sum",
+)
+
 # Database models for A/B testing
 BaseModel = declarative_base()
 
@@ -186,6 +206,30 @@ class MetricEventModel(BaseModel):  # type: ignore[valid-type,misc]
     error_message = Column(String)
 
 
+class MetricRollupModel(BaseModel):  # type: ignore[valid-type,misc]
+    """Metric events pre-aggregated per time bucket, maintained as events are recorded."""
+
+    __tablename__ = "ab_metric_rollups"
+
+    # Key order serves the dashboard's per-experiment time-range scans
+    experiment_id = Column(String, primary_key=True)
+    granularity = Column(String, primary_key=True)  # hour or day
+    bucket_start = Column(DateTime, primary_key=True)  # UTC
+    variant = Column(String, primary_key=True)
+    event_type = Column(String, primary_key=True)
+
+    # Aggregates
+    event_count = Column(Integer, nullable=False, default=0)
+    success_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)  # Error events and events with success=False
+    conversion_count = Column(Integer, nullable=False, default=0)
+    response_time_count = Column(Integer, nullable=False, default=0)
+    response_time_sum = Column(Float, nullable=False, default=0.0)
+    token_reduction_count = Column(Integer, nullable=False, default=0)
+    token_reduction_sum = Column(Float, nullable=False, default=0.0)
+    response_time_sketch = Column(JSON)  # Serialized QuantileSketch
+
+
 # Pydantic Models
 
 
@@ -507,6 +551,178 @@ class UserSegmentation:
             return False
 
 
+class MetricRollupStore:
+    """Maintains and reads hourly and daily metric rollups.
+
+    Every recorded event is added to one hourly and one daily rollup row per
+    experiment, variant and event type, in the same transaction as the raw
+    event. Timeline reads only touch rollup rows, so their cost depends on the
+    number of buckets rather than the number of events.
+
+    Rollups for an event are written in a SAVEPOINT. If a concurrent writer
+    inserts the same bucket row first, the savepoint is rolled back and the
+    update is retried against that row, without touching the raw event.
+    """
+
+    def __init__(self, db_session: Session) -> None:
+        self.db_session = db_session
+
+    @staticmethod
+    def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+        """Get the start of the UTC bucket containing ``timestamp`` (naive timestamps are UTC)."""
+        if timestamp.tzinfo is not None:
+            timestamp = aware_to_naive(timestamp)
+        start = timestamp.replace(minute=0, second=0, microsecond=0)
+        if granularity == "day":
+            return start.replace(hour=0)
+        if granularity == "hour":
+            return start
+        raise ValueError(f"Unknown rollup granularity: {granularity}")
+
+    @staticmethod
+    def _new_sketch() -> QuantileSketch:
+        return QuantileSketch(relative_accuracy=ROLLUP_SKETCH_ACCURACY, exact_limit=ROLLUP_SKETCH_EXACT_LIMIT)
+
+    def _keys(self, event: Any) -> list[dict[str, Any]]:
+        timestamp = event.timestamp or utc_now()
+        return [
+            {
+                "experiment_id": event.experiment_id,
+                "granularity": granularity,
+                "bucket_start": self.bucket_start(timestamp, granularity),
+                "variant": event.variant,
+                "event_type": event.event_type,
+            }
+            for granularity in ROLLUP_GRANULARITIES
+        ]
+
+    @staticmethod
+    def _new_rollup(key: dict[str, Any]) -> MetricRollupModel:
+        return MetricRollupModel(**key, **dict.fromkeys(_ROLLUP_TOTALS, 0))
+
+    @staticmethod
+    def _apply(rollup: MetricRollupModel, sketch: QuantileSketch, event: Any) -> None:
+        rollup.event_count += 1
+        if event.success:
+            rollup.success_count += 1
+        if event.event_type == "error" or event.success is False:
+            rollup.error_count += 1
+        if event.response_time_ms:
+            rollup.response_time_count += 1
+            rollup.response_time_sum += event.response_time_ms
+            sketch.add(event.response_time_ms)
+        if event.token_reduction_percentage:
+            rollup.token_reduction_count += 1
+            rollup.token_reduction_sum += event.token_reduction_percentage
+            if event.token_reduction_percentage >= CONVERSION_THRESHOLD_PERCENT:
+                rollup.conversion_count += 1
+
+    def record(self, event: MetricEvent | MetricEventModel) -> None:
+        """Add an event to its hourly and daily rollups; the caller commits.
+
+        Raises:
+            IntegrityError: If the buckets kept being created concurrently after every retry
+        """
+        for attempt in range(1, ROLLUP_RECORD_ATTEMPTS + 1):
+            try:
+                with self.db_session.begin_nested():
+                    for key in self._keys(event):
+                        self._add_to_bucket(key, event)
+                return
+            except IntegrityError:
+                if attempt == ROLLUP_RECORD_ATTEMPTS:
+                    raise
+                logger.debug("Rollup bucket for %s was created concurrently, retrying", event.experiment_id)
+
+    def _add_to_bucket(self, key: dict[str, Any], event: MetricEvent | MetricEventModel) -> None:
+        # Locks the row on databases that support it, so concurrent writers do not lose updates
+        rollup = self.db_session.get(MetricRollupModel, key, with_for_update=True)
+        if rollup is None:
+            rollup = self._new_rollup(key)
+            self.db_session.add(rollup)
+        stored = rollup.response_time_sketch
+        sketch = QuantileSketch.from_dict(stored) if stored else self._new_sketch()
+        self._apply(rollup, sketch, event)
+        if sketch.count:
+            rollup.response_time_sketch = sketch.to_dict()
+
+    def rebuild(self, experiment_id: str | None = None) -> int:
+        """
+        Recompute rollups from raw events, e.g. for events recorded before rollups existed.
+
+        Args:
+            experiment_id: Experiment to rebuild, or None for all experiments
+
+        Returns:
+            int: Number of events aggregated; the caller commits
+        """
+        rollups_query = self.db_session.query(MetricRollupModel)
+        events_query = self.db_session.query(MetricEventModel)
+        if experiment_id is not None:
+            rollups_query = rollups_query.filter(MetricRollupModel.experiment_id == experiment_id)
+            events_query = events_query.filter(MetricEventModel.experiment_id == experiment_id)
+        rollups_query.delete(synchronize_session=False)
+
+        rollups: dict[tuple, tuple[MetricRollupModel, QuantileSketch]] = {}
+        events = 0
+        for event in events_query.yield_per(1000):
+            for key in self._keys(event):
+                entry = rollups.get(tuple(key.values()))
+                if entry is None:
+                    entry = rollups[tuple(key.values())] = (self._new_rollup(key), self._new_sketch())
+                self._apply(*entry, event)
+            events += 1
+
+        for rollup, sketch in rollups.values():
+            rollup.response_time_sketch = sketch.to_dict() if sketch.count else None
+            self.db_session.add(rollup)
+        self.db_session.flush()
+        return events
+
+    def timeline(
+        self,
+        experiment_id: str,
+        since: datetime,
+        granularity: str = "hour",
+        event_types: tuple[str, ...] | None = None,
+        include_latency: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Get rollup totals per bucket, combined across variants and event types.
+
+        Args:
+            experiment_id: Experiment identifier
+            since: Start of the range; the bucket containing it is included
+            granularity: "hour" or "day"
+            event_types: Event types to include, or None for all
+            include_latency: Whether to merge response time sketches into ``response_time_sketch``
+
+        Returns:
+            List[Dict[str, Any]]: ``bucket_start`` and totals for each bucket with events, oldest first
+        """
+        query = self.db_session.query(MetricRollupModel).filter(
+            MetricRollupModel.experiment_id == experiment_id,
+            MetricRollupModel.granularity == granularity,
+            MetricRollupModel.bucket_start >= self.bucket_start(since, granularity),
+        )
+        if event_types is not None:
+            query = query.filter(MetricRollupModel.event_type.in_(event_types))
+
+        buckets: dict[datetime, dict[str, Any]] = {}
+        for rollup in query.order_by(MetricRollupModel.bucket_start).all():
+            bucket = buckets.get(rollup.bucket_start)
+            if bucket is None:
+                bucket = buckets[rollup.bucket_start] = {"bucket_start": rollup.bucket_start}
+                bucket.update(dict.fromkeys(_ROLLUP_TOTALS, 0))
+                if include_latency:
+                    bucket["response_time_sketch"] = self._new_sketch()
+            for name in _ROLLUP_TOTALS:
+                bucket[name] += getattr(rollup, name) or 0
+            if include_latency and rollup.response_time_sketch:
+                bucket["response_time_sketch"].merge(QuantileSketch.from_dict(rollup.response_time_sketch))
+        return list(buckets.values())
+
+
 class MetricsCollector:
     """Collects and stores A/B testing metrics."""
 
@@ -536,6 +752,12 @@ class MetricsCollector:
             )
 
             self.db_session.add(event_model)
+            self.db_session.flush()
+            try:
+                MetricRollupStore(self.db_session).record(event)
+            except SQLAlchemyError as e:
+                # The raw event is still committed; MetricRollupStore.rebuild repairs the rollups
+                self.logger.warning("Failed to update metric rollups for %s: %s", event.experiment_id, e)
             self.db_session.commit()
 
             return True
@@ -1219,6 +1441,7 @@ class ExperimentManager(ObservabilityMixin):
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
         self.logger = logging.getLogger(__name__)
+        self._backfill_metric_rollups()
 
         # Initialize components
         self.performance_monitor = PerformanceMonitor()
@@ -1239,6 +1462,20 @@ class ExperimentManager(ObservabilityMixin):
         finally:
             session.close()
 
+    def _backfill_metric_rollups(self) -> None:
+        """Build rollups for events recorded before rollups were maintained."""
+        try:
+            with self.get_db_session() as db_session:
+                if db_session.query(MetricRollupModel).first() is not None:
+                    return
+                if db_session.query(MetricEventModel).first() is None:
+                    return
+                events = MetricRollupStore(db_session).rebuild()
+                db_session.commit()
+                self.logger.info("Built metric rollups from %d existing events", events)
+        except Exception as e:
+            self.logger.warning("Failed to backfill metric rollups: %s", e)
+
     def _serialize_config(self, config: ExperimentConfig) -> dict:
         """Convert ExperimentConfig to JSON-serializable dictionary."""
         config_dict = config.__dict__.copy()
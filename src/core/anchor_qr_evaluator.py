@@ -14,8 +14,12 @@ The ANCHOR-QR protocol provides:
 - E.6: Overall Fitness and Final Review for holistic quality assessment
 
 Architecture:
-    The evaluator processes CREATE framework prompts through six sequential steps,
-    each building upon the previous to provide comprehensive quality validation.
+    The evaluator processes CREATE framework prompts through six evaluation steps.
+    The prompt is scanned once into ``PromptFeatures`` (lowercased text, sentences,
+    word count and the keywords it contains), which every step reads instead of
+    re-scanning the text. Steps can run concurrently, evaluation can stop as soon as
+    the weighted score can no longer pass, and results are cached by prompt hash,
+    rigor level and the context fields the steps read.
     Results include numeric scores, diagnostic flags, and actionable recommendations.
 
 Key Components:
@@ -35,11 +39,15 @@ Called by:
     - src.ui.journeys.journey1_smart_templates: For evaluation integration
     - Quality assurance systems: For systematic prompt review
 
-Complexity: O(n*m) where n is prompt length and m is evaluation depth
+Complexity: O(n*k) where n is prompt length and k is the number of distinct keywords
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import copy
 from dataclasses import dataclass, field
 from enum import Enum
+import hashlib
 import re
 from typing import Any
 
@@ -68,6 +76,112 @@ MIN_LEXICAL_DIVERSITY = 0.40  # TTR threshold
 MIN_SENTENCE_VARIABILITY = 15  # Percentage short/long sentences
 AVERAGE_SENTENCE_LENGTH_TARGET = (17, 22)  # Word range
 
+PASSING_SCORE = 70.0
+MAX_STEP_SCORE = 100.0  # Upper bound on a step score, used to stop evaluation early
+DEFAULT_EVALUATION_CACHE_SIZE = 128
+
+# Case-sensitive CREATE section markers
+CREATE_SECTION_HEADERS = [
+    "# C - Context",
+    "# R - Request",
+    "# E - Examples",
+    "# A - Augmentations",
+    "# T - Tone",
+    "# E - Evaluation",
+]
+CREATE_COMPONENTS = [
+    "C - Context",
+    "R - Request",
+    "E - Examples",
+    "A - Augmentations",
+    "T - Tone",
+    "E - Evaluation",
+]
+
+# Lowercase keywords each evaluation step looks for in the prompt
+REFLECTION_INDICATORS = ["does the response", "ensure that", "verify", "confirm", "check"]
+REASONING_KEYWORDS = [
+    "step by step",
+    "alternative",
+    "consider",
+    "approach",
+    "method",
+    "perspective",
+    "viewpoint",
+    "reasoning path",
+]
+CONSISTENCY_INDICATORS = ["consistent", "coherent", "logical", "contradictory", "align"]
+COMPARATIVE_ELEMENTS = ["compare", "contrast", "evaluate alternatives", "weigh options"]
+VERIFICATION_KEYWORDS = [
+    "verify",
+    "validate",
+    "confirm",
+    "check",
+    "ensure accuracy",
+    "fact-check",
+    "cross-reference",
+    "substantiate",
+]
+EVIDENCE_KEYWORDS = [
+    "evidence",
+    "source",
+    "citation",
+    "reference",
+    "documentation",
+    "support",
+    "substantiate",
+    "back up",
+]
+UNCERTAINTY_KEYWORDS = [
+    "uncertain",
+    "unclear",
+    "unknown",
+    "cannot determine",
+    "insufficient information",
+    "hedge",
+    "qualifying",
+]
+SOURCING_REQUIREMENTS = ["cite", "reference", "source", "attribution", "documentation"]
+CONFIDENCE_REQUIREMENTS = ["confidence", "certainty", "reliability", "accuracy", "precision"]
+QUANTITATIVE_KEYWORDS = ["measurable", "specific", "quantifiable", "numerical", "percentage"]
+SAFETY_KEYWORDS = ["safety", "security", "privacy", "bias", "harmful", "ethical"]
+CONSTRAINT_KEYWORDS = ["constraint", "limitation", "boundary", "scope", "restriction"]
+AI_REFERENCES = ["ai", "artificial intelligence", "language model", "chatbot", "assistant"]
+ACTIONABLE_KEYWORDS = ["actionable", "specific", "implement", "apply", "use", "execute"]
+PROFESSIONAL_KEYWORDS = ["professional", "business", "industry", "standard", "best practice"]
+SUCCESS_INDICATORS = ["success criteria", "quality standard", "evaluation", "assessment"]
+HEDGE_WORDS = ["may", "might", "could", "possibly", "likely", "potentially", "suggest"]
+DIVERSITY_KEYWORDS = ["varied", "diverse", "different", "alternative", "various"]
+VARIABILITY_KEYWORDS = ["variability", "mix", "range", "different lengths", "short and long"]
+
+_PROMPT_KEYWORDS = frozenset(
+    EXPERT_JUDGMENT_KEYWORDS
+    + REFLECTION_INDICATORS
+    + REASONING_KEYWORDS
+    + CONSISTENCY_INDICATORS
+    + COMPARATIVE_ELEMENTS
+    + VERIFICATION_KEYWORDS
+    + EVIDENCE_KEYWORDS
+    + UNCERTAINTY_KEYWORDS
+    + SOURCING_REQUIREMENTS
+    + CONFIDENCE_REQUIREMENTS
+    + QUANTITATIVE_KEYWORDS
+    + SAFETY_KEYWORDS
+    + CONSTRAINT_KEYWORDS
+    + AI_REFERENCES
+    + ACTIONABLE_KEYWORDS
+    + PROFESSIONAL_KEYWORDS
+    + SUCCESS_INDICATORS
+    + DIVERSITY_KEYWORDS
+    + VARIABILITY_KEYWORDS,
+)
+# Keywords without whitespace occur in the prompt exactly when they occur inside one of its words,
+# so they are matched against the prompt's distinct words rather than the whole text
+_WORD_KEYWORDS = frozenset(keyword for keyword in _PROMPT_KEYWORDS if not any(c.isspace() for c in keyword))
+_PHRASE_KEYWORDS = _PROMPT_KEYWORDS - _WORD_KEYWORDS
+_PROMPT_SECTIONS = frozenset(CREATE_SECTION_HEADERS + CREATE_COMPONENTS)
+_HEDGE_PATTERN = re.compile("|".join(re.escape(hedge) for hedge in HEDGE_WORDS))
+
 
 class RigorLevel(str, Enum):
     """Evaluation rigor levels for ANCHOR-QR-8 protocol."""
@@ -127,10 +241,12 @@ class ComprehensiveEvaluation:
     improvement_recommendations: list[str] = field(default_factory=list)
     compliance_score: float = 0.0  # CREATE framework compliance (0-100)
 
+    skipped_steps: list[EvaluationStep] = field(default_factory=list)  # Steps not run after an early exit
+
     @property
     def is_passing(self) -> bool:
         """Determine if evaluation passes quality threshold (>70 overall score)."""
-        return self.overall_score >= 70.0
+        return self.overall_score >= PASSING_SCORE
 
     @property
     def needs_revision(self) -> bool:
@@ -142,6 +258,45 @@ class ComprehensiveEvaluation:
         )
 
 
+@dataclass(frozen=True)
+class PromptFeatures:
+    """Prompt features shared by every evaluation step, extracted in a single pass."""
+
+    text: str
+    lowered: str
+    word_count: int
+    sentences: list[str]  # Lowercased, split on sentence punctuation
+    keywords: frozenset[str]  # Step keywords present in the lowercased prompt
+    sections: frozenset[str]  # CREATE section markers present in the prompt
+
+    @classmethod
+    def extract(cls, prompt: "str | PromptFeatures") -> "PromptFeatures":
+        """Extract features from a prompt, or return them if already extracted."""
+        if isinstance(prompt, PromptFeatures):
+            return prompt
+        lowered = prompt.lower()
+        words = lowered.split()
+        distinct_words = "\n".join(dict.fromkeys(words))
+        keywords = {keyword for keyword in _WORD_KEYWORDS if keyword in distinct_words}
+        keywords.update(keyword for keyword in _PHRASE_KEYWORDS if keyword in lowered)
+        return cls(
+            text=prompt,
+            lowered=lowered,
+            word_count=len(words),
+            sentences=re.split(r"[.!?]+", lowered),
+            keywords=frozenset(keywords),
+            sections=frozenset(section for section in _PROMPT_SECTIONS if section in prompt),
+        )
+
+    def count(self, keywords: list[str]) -> int:
+        """Count how many of the keywords appear in the prompt."""
+        return sum(1 for keyword in keywords if keyword in self.keywords)
+
+    def missing_sections(self, sections: list[str]) -> list[str]:
+        """Get the CREATE section markers that do not appear in the prompt."""
+        return [section for section in sections if section not in self.sections]
+
+
 class ANCHORQREvaluator(LoggerMixin):
     """
     ANCHOR-QR-8 evaluation protocol implementation for CREATE framework prompts.
@@ -156,11 +311,29 @@ class ANCHORQREvaluator(LoggerMixin):
     - Diagnostic flag generation for common quality issues
     - Stylometry validation per ANCHOR-QR-7 standards
     - Confidence scoring and uncertainty quantification
+    - Optional concurrent steps, early exit and result caching
     """
 
-    def __init__(self) -> None:
-        """Initialize the ANCHOR-QR evaluator with default settings."""
+    def __init__(
+        self,
+        max_workers: int = 1,
+        early_exit: bool = False,
+        cache_size: int = DEFAULT_EVALUATION_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the ANCHOR-QR evaluator.
+
+        Args:
+            max_workers: Threads used to run evaluation steps (1 runs them in order)
+            early_exit: Stop once the weighted score can no longer reach PASSING_SCORE
+            cache_size: Maximum number of cached evaluations (0 disables caching)
+        """
         super().__init__()
+        self.max_workers = max_workers
+        self.early_exit = early_exit
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, RigorLevel, bool, bool], ComprehensiveEvaluation] = OrderedDict()
+        self.cache_stats = {"hits": 0, "misses": 0, "early_exits": 0}
         self.evaluation_weights = {
             EvaluationStep.REFLECTION_LOOP: 0.15,
             EvaluationStep.SELF_CONSISTENCY: 0.20,
@@ -191,6 +364,14 @@ class ANCHORQREvaluator(LoggerMixin):
         Space Complexity: O(n) for evaluation data structures
         """
         try:
+            cache_key = self._cache_key(prompt, context, rigor_level)
+            cached = self._cache.get(cache_key) if self.cache_size > 0 else None
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                self.cache_stats["hits"] += 1
+                return copy.deepcopy(cached)
+            self.cache_stats["misses"] += 1
+
             self.logger.info("Starting ANCHOR-QR-8 evaluation with %s rigor", rigor_level.value)
 
             # Initialize evaluation
@@ -200,29 +381,42 @@ class ANCHORQREvaluator(LoggerMixin):
                 rigor_level=rigor_level,
             )
 
-            # Execute all evaluation steps
+            # Execute evaluation steps over features extracted once
+            features = PromptFeatures.extract(prompt)
+            step_results = self._run_steps(features, context, rigor_level)
             for step in EvaluationStep:
-                step_result = self._evaluate_step(step, prompt, context, rigor_level)
-                evaluation.step_results[step] = step_result
-                evaluation.all_flags.update(step_result.flags)
+                if step in step_results:
+                    evaluation.step_results[step] = step_results[step]
+                    evaluation.all_flags.update(step_results[step].flags)
+                else:
+                    evaluation.skipped_steps.append(step)
+            if evaluation.skipped_steps:
+                self.cache_stats["early_exits"] += 1
 
             # Calculate overall scores
             evaluation.overall_score = self._calculate_weighted_score(evaluation.step_results)
             evaluation.overall_confidence = self._calculate_overall_confidence(evaluation.step_results)
-            evaluation.compliance_score = self._calculate_create_compliance(prompt, evaluation.step_results)
+            evaluation.compliance_score = self._calculate_create_compliance(features, evaluation.step_results)
 
             # Identify critical issues
             evaluation.critical_issues = self._identify_critical_issues(evaluation)
             evaluation.improvement_recommendations = self._generate_improvement_recommendations(evaluation)
 
+            if self.cache_size > 0:
+                self._cache[cache_key] = copy.deepcopy(evaluation)
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
             self.logger.info(
                 "ANCHOR-QR-8 evaluation complete. "
                 "Score: %.1f, "
                 "Flags: %d, "
-                "Issues: %d",
+                "Issues: %d, "
+                "Skipped steps: %d",
                 evaluation.overall_score,
                 len(evaluation.all_flags),
                 len(evaluation.critical_issues),
+                len(evaluation.skipped_steps),
             )
 
             return evaluation
@@ -231,10 +425,72 @@ class ANCHORQREvaluator(LoggerMixin):
             self.logger.error("ANCHOR-QR-8 evaluation failed: %s", e)
             return self._create_error_evaluation(str(e), rigor_level)
 
+    def _cache_key(
+        self,
+        prompt: str,
+        context: dict[str, Any],
+        rigor_level: RigorLevel,
+    ) -> tuple[str, RigorLevel, bool, bool]:
+        """Build the cache key from the prompt hash, rigor level and the context fields steps read."""
+        prompt_hash = hashlib.blake2b(prompt.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+        has_query = bool(context.get("query", "").strip())
+        is_complex = context.get("query_analysis", {}).get("complexity") == "complex"
+        return prompt_hash, rigor_level, has_query, is_complex
+
+    def _run_steps(
+        self,
+        features: PromptFeatures,
+        context: dict[str, Any],
+        rigor_level: RigorLevel,
+    ) -> dict[EvaluationStep, EvaluationResult]:
+        """Run the evaluation steps, concurrently if configured, stopping early if enabled."""
+        step_results: dict[EvaluationStep, EvaluationResult] = {}
+
+        if self.max_workers <= 1:
+            for step in EvaluationStep:
+                step_results[step] = self._evaluate_step(step, features, context, rigor_level)
+                if self._cannot_pass(step_results):
+                    break
+            return step_results
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_step = {
+                executor.submit(self._evaluate_step, step, features, context, rigor_level): step
+                for step in EvaluationStep
+            }
+            for future in as_completed(future_to_step):
+                step_results[future_to_step[future]] = future.result()
+                if self._cannot_pass(step_results):
+                    for pending in future_to_step:
+                        pending.cancel()
+                    break
+        return step_results
+
+    def _cannot_pass(self, step_results: dict[EvaluationStep, EvaluationResult]) -> bool:
+        """Check, in early-exit mode, whether the remaining steps can no longer lift the score to passing."""
+        if not self.early_exit or len(step_results) == len(EvaluationStep):
+            return False
+        best_score = 0.0
+        total_weight = 0.0
+        for step in EvaluationStep:
+            weight = self.evaluation_weights.get(step, 0.1)
+            result = step_results.get(step)
+            best_score += (result.score if result is not None else MAX_STEP_SCORE) * weight
+            total_weight += weight
+        return best_score / total_weight < PASSING_SCORE
+
+    def clear_cache(self) -> None:
+        """Clear cached evaluations."""
+        self._cache.clear()
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get evaluation cache statistics."""
+        return {**self.cache_stats, "size": len(self._cache), "max_size": self.cache_size}
+
     def _evaluate_step(
         self,
         step: EvaluationStep,
-        prompt: str,
+        prompt: str | PromptFeatures,
         context: dict[str, Any],
         rigor_level: RigorLevel,
     ) -> EvaluationResult:
@@ -249,11 +505,12 @@ class ANCHORQREvaluator(LoggerMixin):
 
     def _evaluate_reflection_loop(
         self,
-        prompt: str,
+        prompt: str | PromptFeatures,
         context: dict[str, Any],
         rigor_level: RigorLevel,
     ) -> EvaluationResult:
         """E.1: Reflection Loop - Self-critique and iterative revision assessment."""
+        features = PromptFeatures.extract(prompt)
         result = EvaluationResult(
             step=EvaluationStep.REFLECTION_LOOP,
             score=75.0,  # Base score
@@ -268,15 +525,7 @@ class ANCHORQREvaluator(LoggerMixin):
             result.score -= 20
 
         # Analyze prompt structure completeness
-        create_components = [
-            "# C - Context",
-            "# R - Request",
-            "# E - Examples",
-            "# A - Augmentations",
-            "# T - Tone",
-            "# E - Evaluation",
-        ]
-        missing_components = [comp for comp in create_components if comp not in prompt]
+        missing_components = features.missing_sections(CREATE_SECTION_HEADERS)
 
         if missing_components:
             result.flags.append(DiagnosticFlag.VERIFICATION_ISSUE)
@@ -284,14 +533,7 @@ class ANCHORQREvaluator(LoggerMixin):
             result.score -= len(missing_components) * 10
 
         # Check for self-reflection elements
-        reflection_indicators = [
-            "does the response",
-            "ensure that",
-            "verify",
-            "confirm",
-            "check",
-        ]
-        reflection_count = sum(1 for indicator in reflection_indicators if indicator in prompt.lower())
+        reflection_count = features.count(REFLECTION_INDICATORS)
 
         if reflection_count < 2:
             result.recommendations.append("Add more self-reflection prompts to encourage iterative thinking")
@@ -304,11 +546,12 @@ class ANCHORQREvaluator(LoggerMixin):
 
     def _evaluate_self_consistency_check(
         self,
-        prompt: str,
+        prompt: str | PromptFeatures,
         context: dict[str, Any],
         rigor_level: RigorLevel,
     ) -> EvaluationResult:
         """E.2: Self-Consistency Check - Multiple reasoning paths validation."""
+        features = PromptFeatures.extract(prompt)
         result = EvaluationResult(
             step=EvaluationStep.SELF_CONSISTENCY,
             score=70.0,
@@ -316,17 +559,7 @@ class ANCHORQREvaluator(LoggerMixin):
         )
 
         # Check for multiple reasoning approaches
-        reasoning_keywords = [
-            "step by step",
-            "alternative",
-            "consider",
-            "approach",
-            "method",
-            "perspective",
-            "viewpoint",
-            "reasoning path",
-        ]
-        reasoning_count = sum(1 for keyword in reasoning_keywords if keyword in prompt.lower())
+        reasoning_count = features.count(REASONING_KEYWORDS)
 
         if reasoning_count >= 3:
             result.score += 10
@@ -335,14 +568,7 @@ class ANCHORQREvaluator(LoggerMixin):
             result.score -= 10
 
         # Check for consistency requirements
-        consistency_indicators = [
-            "consistent",
-            "coherent",
-            "logical",
-            "contradictory",
-            "align",
-        ]
-        consistency_count = sum(1 for indicator in consistency_indicators if indicator in prompt.lower())
+        consistency_count = features.count(CONSISTENCY_INDICATORS)
 
         if consistency_count == 0:
             result.flags.append(DiagnosticFlag.VERIFICATION_ISSUE)
@@ -351,8 +577,7 @@ class ANCHORQREvaluator(LoggerMixin):
 
         # Advanced rigor: Check for comparative analysis requirements
         if rigor_level == RigorLevel.ADVANCED:
-            comparative_elements = ["compare", "contrast", "evaluate alternatives", "weigh options"]
-            comparative_count = sum(1 for elem in comparative_elements if elem in prompt.lower())
+            comparative_count = features.count(COMPARATIVE_ELEMENTS)
 
             if comparative_count == 0:
                 result.recommendations.append("Add comparative analysis requirements for advanced rigor")
@@ -365,11 +590,12 @@ class ANCHORQREvaluator(LoggerMixin):
 
     def _evaluate_chain_of_verification(
         self,
-        prompt: str,
+        prompt: str | PromptFeatures,
         context: dict[str, Any],
         rigor_level: RigorLevel,
     ) -> EvaluationResult:
         """E.3: Chain-of-Verification - Complex claims validation assessment."""
+        features = PromptFeatures.extract(prompt)
         result = EvaluationResult(
             step=EvaluationStep.CHAIN_OF_VERIFICATION,
             score=65.0,
@@ -377,17 +603,7 @@ class ANCHORQREvaluator(LoggerMixin):
         )
 
         # Check for verification requirements
-        verification_keywords = [
-            "verify",
-            "validate",
-            "confirm",
-            "check",
-            "ensure accuracy",
-            "fact-check",
-            "cross-reference",
-            "substantiate",
-        ]
-        verification_count = sum(1 for keyword in verification_keywords if keyword in prompt.lower())
+        verification_count = features.count(VERIFICATION_KEYWORDS)
 
         if verification_count >= 2:
             result.score += 15
@@ -397,17 +613,7 @@ class ANCHORQREvaluator(LoggerMixin):
             result.score -= 20
 
         # Check for evidence requirements
-        evidence_keywords = [
-            "evidence",
-            "source",
-            "citation",
-            "reference",
-            "documentation",
-            "support",
-            "substantiate",
-            "back up",
-        ]
-        evidence_count = sum(1 for keyword in evidence_keywords if keyword in prompt.lower())
+        evidence_count = features.count(EVIDENCE_KEYWORDS)
 
         if evidence_count == 0:
             result.flags.append(DiagnosticFlag.VERIFICATION_ISSUE)
@@ -415,16 +621,7 @@ class ANCHORQREvaluator(LoggerMixin):
             result.score -= 15
 
         # Check for uncertainty handling
-        uncertainty_keywords = [
-            "uncertain",
-            "unclear",
-            "unknown",
-            "cannot determine",
-            "insufficient information",
-            "hedge",
-            "qualifying",
-        ]
-        uncertainty_count = sum(1 for keyword in uncertainty_keywords if keyword in prompt.lower())
+        uncertainty_count = features.count(UNCERTAINTY_KEYWORDS)
 
         if uncertainty_count == 0:
             result.recommendations.append("Add requirements for handling uncertain or incomplete information")
@@ -438,11 +635,12 @@ class ANCHORQREvaluator(LoggerMixin):
 
     def _evaluate_confidence_sourcing_accuracy(
         self,
-        prompt: str,
+        prompt: str | PromptFeatures,
         context: dict[str, Any],
         rigor_level: RigorLevel,
     ) -> EvaluationResult:
         """E.4: Confidence, Sourcing and Accuracy - Source attribution assessment."""
+        features = PromptFeatures.extract(prompt)
         result = EvaluationResult(
             step=EvaluationStep.CONFIDENCE_SOURCING,
             score=70.0,
@@ -450,21 +648,14 @@ class ANCHORQREvaluator(LoggerMixin):
         )
 
         # Check for expert judgment indicators
-        expert_judgment_count = sum(1 for keyword in EXPERT_JUDGMENT_KEYWORDS if keyword in prompt.lower())
+        expert_judgment_count = features.count(EXPERT_JUDGMENT_KEYWORDS)
 
         if expert_judgment_count > 0:
             result.flags.append(DiagnosticFlag.EXPERT_JUDGMENT)
             result.metadata["expert_judgment_areas"] = expert_judgment_count
 
         # Check for sourcing requirements
-        sourcing_requirements = [
-            "cite",
-            "reference",
-            "source",
-            "attribution",
-            "documentation",
-        ]
-        sourcing_count = sum(1 for req in sourcing_requirements if req in prompt.lower())
+        sourcing_count = features.count(SOURCING_REQUIREMENTS)
 
         if sourcing_count >= 2:
             result.score += 10
@@ -473,14 +664,7 @@ class ANCHORQREvaluator(LoggerMixin):
             result.score -= 15
 
         # Check for confidence indicators
-        confidence_requirements = [
-            "confidence",
-            "certainty",
-            "reliability",
-            "accuracy",
-            "precision",
-        ]
-        confidence_count = sum(1 for req in confidence_requirements if req in prompt.lower())
+        confidence_count = features.count(CONFIDENCE_REQUIREMENTS)
 
         if confidence_count == 0:
             result.recommendations.append("Add confidence assessment requirements")
@@ -488,14 +672,7 @@ class ANCHORQREvaluator(LoggerMixin):
 
         # Advanced rigor: Check for quantitative accuracy requirements
         if rigor_level == RigorLevel.ADVANCED:
-            quantitative_keywords = [
-                "measurable",
-                "specific",
-                "quantifiable",
-                "numerical",
-                "percentage",
-            ]
-            quantitative_count = sum(1 for keyword in quantitative_keywords if keyword in prompt.lower())
+            quantitative_count = features.count(QUANTITATIVE_KEYWORDS)
 
             if quantitative_count == 0:
                 result.recommendations.append("Add quantitative accuracy requirements for advanced rigor")
@@ -507,11 +684,12 @@ class ANCHORQREvaluator(LoggerMixin):
 
     def _evaluate_style_safety_constraint_pass(
         self,
-        prompt: str,
+        prompt: str | PromptFeatures,
         context: dict[str, Any],
         rigor_level: RigorLevel,
     ) -> EvaluationResult:
         """E.5: Style, Safety and Constraint Pass - Compliance verification."""
+        features = PromptFeatures.extract(prompt)
         result = EvaluationResult(
             step=EvaluationStep.STYLE_SAFETY,
             score=75.0,
@@ -519,19 +697,11 @@ class ANCHORQREvaluator(LoggerMixin):
         )
 
         # Check for stylometry requirements
-        stylometry_score = self._evaluate_stylometry_requirements(prompt)
+        stylometry_score = self._evaluate_stylometry_requirements(features)
         result.score = (result.score + stylometry_score) / 2
 
         # Check for safety considerations
-        safety_keywords = [
-            "safety",
-            "security",
-            "privacy",
-            "bias",
-            "harmful",
-            "ethical",
-        ]
-        safety_count = sum(1 for keyword in safety_keywords if keyword in prompt.lower())
+        safety_count = features.count(SAFETY_KEYWORDS)
 
         if context.get("query_analysis", {}).get("complexity") == "complex" and safety_count == 0:
             result.flags.append(DiagnosticFlag.SAFETY_CONCERN)
@@ -539,28 +709,14 @@ class ANCHORQREvaluator(LoggerMixin):
             result.score -= 10
 
         # Check for constraint specifications
-        constraint_keywords = [
-            "constraint",
-            "limitation",
-            "boundary",
-            "scope",
-            "restriction",
-        ]
-        constraint_count = sum(1 for keyword in constraint_keywords if keyword in prompt.lower())
+        constraint_count = features.count(CONSTRAINT_KEYWORDS)
 
         if constraint_count == 0:
             result.recommendations.append("Add clear constraint specifications")
             result.score -= 5
 
         # Check for prohibited AI references (CREATE framework rule)
-        ai_references = [
-            "ai",
-            "artificial intelligence",
-            "language model",
-            "chatbot",
-            "assistant",
-        ]
-        ai_reference_count = sum(1 for ref in ai_references if ref in prompt.lower())
+        ai_reference_count = features.count(AI_REFERENCES)
 
         if ai_reference_count > 1:  # Allow minimal references in instructions
             result.flags.append(DiagnosticFlag.STYLE_VIOLATION)
@@ -575,11 +731,12 @@ class ANCHORQREvaluator(LoggerMixin):
 
     def _evaluate_overall_fitness_final_review(
         self,
-        prompt: str,
+        prompt: str | PromptFeatures,
         context: dict[str, Any],
         rigor_level: RigorLevel,
     ) -> EvaluationResult:
         """E.6: Overall Fitness and Final Review - Holistic quality assessment."""
+        features = PromptFeatures.extract(prompt)
         result = EvaluationResult(
             step=EvaluationStep.OVERALL_FITNESS,
             score=80.0,
@@ -587,7 +744,7 @@ class ANCHORQREvaluator(LoggerMixin):
         )
 
         # Assess prompt completeness
-        word_count = len(prompt.split())
+        word_count = features.word_count
         expected_min_words = {
             RigorLevel.BASIC: 200,
             RigorLevel.STANDARD: 400,
@@ -601,41 +758,20 @@ class ANCHORQREvaluator(LoggerMixin):
             result.score -= 15
 
         # Check for actionability
-        actionable_keywords = [
-            "actionable",
-            "specific",
-            "implement",
-            "apply",
-            "use",
-            "execute",
-        ]
-        actionable_count = sum(1 for keyword in actionable_keywords if keyword in prompt.lower())
+        actionable_count = features.count(ACTIONABLE_KEYWORDS)
 
         if actionable_count < 2:
             result.recommendations.append("Increase actionability requirements for practical value")
             result.score -= 5
 
         # Assess professional quality indicators
-        professional_keywords = [
-            "professional",
-            "business",
-            "industry",
-            "standard",
-            "best practice",
-        ]
-        professional_count = sum(1 for keyword in professional_keywords if keyword in prompt.lower())
+        professional_count = features.count(PROFESSIONAL_KEYWORDS)
 
         if professional_count >= 2:
             result.score += 5
 
         # Check for clear success criteria
-        success_indicators = [
-            "success criteria",
-            "quality standard",
-            "evaluation",
-            "assessment",
-        ]
-        success_count = sum(1 for indicator in success_indicators if indicator in prompt.lower())
+        success_count = features.count(SUCCESS_INDICATORS)
 
         if success_count == 0:
             result.issues.append("No clear success criteria specified")
@@ -648,14 +784,14 @@ class ANCHORQREvaluator(LoggerMixin):
 
         return result
 
-    def _evaluate_stylometry_requirements(self, prompt: str) -> float:
+    def _evaluate_stylometry_requirements(self, prompt: str | PromptFeatures) -> float:
         """Evaluate adherence to ANCHOR-QR-7 stylometry standards."""
+        features = PromptFeatures.extract(prompt)
         score = 70.0  # Base score
 
         # Check for hedge density requirements
-        hedge_words = ["may", "might", "could", "possibly", "likely", "potentially", "suggest"]
-        sentences = re.split(r"[.!?]+", prompt)
-        hedge_sentences = sum(1 for sentence in sentences if any(hedge in sentence.lower() for hedge in hedge_words))
+        sentences = features.sentences
+        hedge_sentences = sum(1 for sentence in sentences if _HEDGE_PATTERN.search(sentence))
 
         if len(sentences) > 0:
             hedge_density = (hedge_sentences / len(sentences)) * 100
@@ -665,27 +801,13 @@ class ANCHORQREvaluator(LoggerMixin):
                 score -= 5
 
         # Check for lexical diversity indicators
-        diversity_keywords = [
-            "varied",
-            "diverse",
-            "different",
-            "alternative",
-            "various",
-        ]
-        diversity_count = sum(1 for keyword in diversity_keywords if keyword in prompt.lower())
+        diversity_count = features.count(DIVERSITY_KEYWORDS)
 
         if diversity_count >= 2:
             score += 5
 
         # Check for sentence variability requirements
-        variability_keywords = [
-            "variability",
-            "mix",
-            "range",
-            "different lengths",
-            "short and long",
-        ]
-        variability_count = sum(1 for keyword in variability_keywords if keyword in prompt.lower())
+        variability_count = features.count(VARIABILITY_KEYWORDS)
 
         if variability_count > 0:
             score += 5
@@ -714,23 +836,17 @@ class ANCHORQREvaluator(LoggerMixin):
 
     def _calculate_create_compliance(
         self,
-        prompt: str,
+        prompt: str | PromptFeatures,
         step_results: dict[EvaluationStep, EvaluationResult],
     ) -> float:
         """Calculate CREATE framework compliance score."""
+        features = PromptFeatures.extract(prompt)
         compliance_score = 70.0  # Base compliance
 
         # Check CREATE component presence
-        create_components = [
-            "C - Context",
-            "R - Request",
-            "E - Examples",
-            "A - Augmentations",
-            "T - Tone",
-            "E - Evaluation",
-        ]
-        present_components = sum(1 for comp in create_components if comp in prompt)
-        compliance_score += (present_components / len(create_components)) * 30
+        missing_components = features.missing_sections(CREATE_COMPONENTS)
+        present_components = len(CREATE_COMPONENTS) - len(missing_components)
+        compliance_score += (present_components / len(CREATE_COMPONENTS)) * 30
 
         # Adjust based on evaluation results
         verification_issues = sum(
@@ -14,6 +14,7 @@ import logging
 from typing import Any, cast
 
 from src.utils.datetime_compat import UTC
+from src.utils.trigram_index import TrigramIndex
 
 from .analytics_engine import AnalyticsEngine
 from .help_system import InteractiveHelpSystem
@@ -24,6 +25,11 @@ from .user_control_system import CommandResult, UserControlSystem
 
 logger = logging.getLogger(__name__)
 
+# Search weights of the fields a command is indexed by
+NAME_WEIGHT = 1.0
+ALIAS_WEIGHT = 0.9
+TAG_WEIGHT = 0.7
+
 
 @dataclass
 class CommandMetadata:
@@ -66,6 +72,7 @@ class CommandRegistry:
             "function_control": [],  # New category for user control
         }
         self.aliases: dict[str, str] = {}
+        self._search_index = TrigramIndex()
 
     def register_command(
         self,
@@ -90,6 +97,15 @@ class CommandRegistry:
             for alias in aliases:
                 self.aliases[alias] = command_name
 
+        self._search_index.add(
+            command_name,
+            [
+                (command_name, NAME_WEIGHT),
+                *((alias, ALIAS_WEIGHT) for alias in aliases or []),
+                *((tag, TAG_WEIGHT) for tag in metadata.tags),
+            ],
+        )
+
     def get_command(self, command_name: str) -> dict[str, Any] | None:
         """Get command by name or alias"""
         # Check direct name
@@ -107,25 +123,15 @@ class CommandRegistry:
         """List all commands in a category"""
         return self.categories.get(category, [])
 
-    def search_commands(self, query: str) -> list[str]:
-        """Search commands by name, tags, or description"""
-        matching_commands = []
-        query_lower = query.lower()
-
-        for cmd_name, cmd_info in self.commands.items():
-            metadata = cmd_info["metadata"]
-
-            # Check name
-            if query_lower in cmd_name.lower():
-                matching_commands.append(cmd_name)
-                continue
-
-            # Check tags
-            if any(query_lower in tag.lower() for tag in metadata.tags):
-                matching_commands.append(cmd_name)
-                continue
+    def search_commands(self, query: str, limit: int | None = None) -> list[str]:
+        """Search commands by name, aliases, or tags, best match first.
 
-        return matching_commands
+        Matching is fuzzy, so prefixes, substrings and small typos of a
+        command's words all find it.
+        """
+        if not query.strip():
+            return list(self.commands)[:limit]
+        return [match.key for match in self._search_index.search(query, limit)]
 
 
 class ClaudeCommandIntegration:
@@ -420,8 +426,8 @@ class ClaudeCommandIntegration:
 
     def _suggest_similar_commands(self, command_name: str) -> list[str]:
         """Suggest similar commands for unknown command"""
-        # Search in command registry
-        similar_commands = self.command_registry.search_commands(command_name)
+        # Search in command registry, closest matches first
+        similar_commands = self.command_registry.search_commands(command_name, limit=5)
 
         # Add function control suggestions if relevant
         if any(keyword in command_name.lower() for keyword in ["load", "category", "tier", "optimize", "profile"]):
@@ -442,7 +448,7 @@ class ClaudeCommandIntegration:
                 "function-loading:tier-status",
             ]
 
-        return list(set(similar_commands))[:5]  # Top 5, no duplicates
+        return list(dict.fromkeys(similar_commands))[:5]  # Top 5, no duplicates
 
     # Command handlers
     async def _handle_load_category(self, args: list[str], context: dict[str, Any]) -> CommandResult:
@@ -17,10 +17,20 @@ Performance Targets:
 - < 3 seconds response time for simple prompts
 - Comprehensive error handling and logging
 - Basic timing metrics for performance monitoring
+
+Feature Extraction:
+Everything the components read from a prompt is extracted together into
+``PromptFeatures``. The prompt is case-folded once and each extraction pattern
+is only tried where one of its trigger phrases occurs, so cost grows with
+prompt length rather than with prompt length times the number of patterns.
+Results for repeated prompts are memoized per processor.
 """
 
-from dataclasses import dataclass
+from collections import OrderedDict
+import copy
+from dataclasses import dataclass, field
 from enum import Enum
+import hashlib
 import logging
 import re
 import time
@@ -39,6 +49,13 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 
+DEFAULT_RESULT_CACHE_SIZE = 128
+
+# Characters that re.IGNORECASE matches to ASCII letters but str.lower() does not
+# map to them one-for-one; folded first so trigger positions line up with the prompt
+_IGNORECASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
 # Core exceptions for create processor
 class CreateProcessorError(Exception):
     """Base exception for CreateProcessor errors."""
@@ -85,6 +102,122 @@ class CreateResponse:
     errors: list[str]
 
 
+@dataclass(frozen=True)
+class _FeatureRule:
+    """Extraction pattern anchored on literal trigger phrases."""
+
+    triggers: tuple[str, ...]
+    pattern: re.Pattern[str]
+
+    def search(self, prompt: str, folded: str | None) -> re.Match[str] | None:
+        """Find the leftmost match, as ``pattern.search(prompt)`` would.
+
+        The pattern can only match where one of its triggers starts, so it is
+        only tried at trigger positions found in the case-folded prompt.
+        """
+        if folded is None:
+            return self.pattern.search(prompt)
+        positions = {trigger: folded.find(trigger) for trigger in self.triggers}
+        while True:
+            pos = min((found for found in positions.values() if found >= 0), default=-1)
+            if pos < 0:
+                return None
+            match = self.pattern.match(prompt, pos)
+            if match:
+                return match
+            for trigger, found in positions.items():
+                if found == pos:
+                    positions[trigger] = folded.find(trigger, pos + 1)
+
+
+def _rule(triggers: list[str], rest: str) -> _FeatureRule:
+    """Build a rule matching any trigger (case-insensitively) followed by ``rest``."""
+    alternatives = "|".join(re.escape(trigger) for trigger in triggers)
+    return _FeatureRule(tuple(triggers), re.compile(f"(?:{alternatives}){rest}", re.IGNORECASE))
+
+
+# Extraction rules per feature, in priority order
+ROLE_RULES = (
+    _rule(["you are", "act as", "role:"], r"\s*((?:a\s+)?.*?)(?:\s+with|\.|,|$)"),
+    _rule(["as a"], r"\s+(.*?)(?:\s+with|\.|,|$)"),
+    _rule(["assume the role of", "playing the role of"], r"\s+(.*?)(?:\s+with|\.|,|$)"),
+)
+BACKGROUND_RULES = (
+    _rule(["background:", "context:"], r"\s*(.*?)(?:\.|$)"),
+    _rule(["given that", "considering that"], r"\s+(.*?)(?:,|\.)"),
+    _rule(["with expertise in", "specializing in"], r"\s+(.*?)(?:\.|,|$)"),
+)
+GOAL_RULES = (
+    _rule(["goal:", "objective:", "aim:", "purpose:"], r"\s*(.*?)(?:\.|$)"),
+    _rule(["my goal is to", "the goal is to"], r"\s+(.*?)(?:\.|$)"),
+    _rule(["i need to", "we need to"], r"\s+(.*?)(?:\.|$)"),
+)
+TASK_RULES = (
+    _rule(["task:", "please", "can you", "help me to"], r" (.*?)(?:\.|$)"),
+    _rule(["write", "create", "generate", "produce"], r" (.*?)(?:\.|$)"),
+)
+DELIVERABLE_RULES = (
+    _rule(["deliverable should be", "deliverable:", "output:", "result should be"], r"\s+(.*?)(?:\.|$)"),
+    _rule(["format:", "in the form of"], r"\s+(.*?)(?:\.|$)"),
+)
+EXAMPLE_RULES = (
+    _rule(["example:", "for example:", "e.g.:", "such as"], r"\s+(.*?)(?:\.|$)"),
+    _rule(["write like this:", "like this:", "similar to"], r"\s+(.*)"),  # Greedy capture for examples
+)
+TONE_RULES = (
+    _rule(["tone:", "in a", "style:"], r"\s*(?:formal|informal|casual|professional|friendly)?\s*(.*?)(?:\.|,|$)"),
+)
+FORMAT_RULES = (
+    _rule(["format:", "structure:", "as a"], r" (.*?)(?:\.|,|$)"),
+    _rule(["bullet points", "numbered list", "paragraph", "essay"], r" (.*?)(?:\.|,|$)"),
+)
+
+
+@dataclass(frozen=True)
+class PromptFeatures:
+    """Features the C.R.E.A.T.E. components read from a prompt, extracted together."""
+
+    role: str | None = None
+    background: str | None = None
+    goal: str | None = None
+    task: str | None = None
+    deliverable: str | None = None
+    example_patterns: list[str] = field(default_factory=list)
+    tone: str | None = None
+    format: str | None = None
+
+    @classmethod
+    def extract(cls, prompt: "str | PromptFeatures") -> "PromptFeatures":
+        """Extract features from a prompt, or return them if already extracted."""
+        if isinstance(prompt, PromptFeatures):
+            return prompt
+        folded: str | None = prompt.translate(_IGNORECASE_FOLD).lower()
+        if len(folded) != len(prompt):
+            folded = None  # Positions would not line up; search the prompt directly
+
+        def first(rules: tuple[_FeatureRule, ...]) -> str | None:
+            for rule in rules:
+                match = rule.search(prompt, folded)
+                if match:
+                    return match.group(1).strip()
+            return None
+
+        return cls(
+            role=first(ROLE_RULES),
+            background=first(BACKGROUND_RULES),
+            goal=first(GOAL_RULES),
+            task=first(TASK_RULES),
+            deliverable=first(DELIVERABLE_RULES),
+            example_patterns=[
+                match.group(1).strip().rstrip(".")
+                for match in (rule.search(prompt, folded) for rule in EXAMPLE_RULES)
+                if match
+            ],
+            tone=first(TONE_RULES),
+            format=first(FORMAT_RULES),
+        )
+
+
 class CreateProcessor:
     """Core processor for C.R.E.A.T.E. framework prompt enhancement.
 
@@ -96,10 +229,14 @@ class CreateProcessor:
         """Initialize the CreateProcessor.
 
         Args:
-            config: Optional configuration dictionary.
+            config: Optional configuration dictionary. ``result_cache_size`` bounds
+                the number of memoized prompt results (0 disables memoization).
         """
         self.config = config or {}
         self.logger = logger
+        self.result_cache_size = self.config.get("result_cache_size", DEFAULT_RESULT_CACHE_SIZE)
+        self._result_cache: OrderedDict[tuple[str, str], tuple[dict[str, Any], str]] = OrderedDict()
+        self.cache_stats = {"hits": 0, "misses": 0}
         self._setup_logging()
 
     def _setup_logging(self) -> None:
@@ -145,135 +282,57 @@ class CreateProcessor:
 
         return True
 
-    def _extract_context(self, prompt: str) -> dict[str, Any]:
+    def _extract_context(self, prompt: str | PromptFeatures) -> dict[str, Any]:
         """Extract context information from the prompt.
 
         Args:
-            prompt: The input prompt.
+            prompt: The input prompt, or its extracted features.
 
         Returns:
             Dictionary containing context information.
         """
-        context: dict[str, Any] = {
-            "role": None,
-            "background": None,
-            "goal": None,
+        features = PromptFeatures.extract(prompt)
+        return {
+            "role": features.role,
+            "background": features.background,
+            "goal": features.goal,
             "constraints": [],
         }
 
-        # Simple pattern matching for context extraction
-        role_patterns = [
-            r"(?:you are|act as|role:)\s*((?:a\s+)?.*?)(?:\s+with|\.|,|$)",
-            r"(?:as a)\s+(.*?)(?:\s+with|\.|,|$)",
-            r"(?:assume the role of|playing the role of)\s+(.*?)(?:\s+with|\.|,|$)",
-        ]
-
-        for pattern in role_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
-            if match:
-                context["role"] = match.group(1).strip()
-                break
-
-        # Extract background information
-        background_patterns = [
-            r"(?:background:|context:)\s*(.*?)(?:\.|$)",
-            r"(?:given that|considering that)\s+(.*?)(?:,|\.)",
-            r"(?:with expertise in|specializing in)\s+(.*?)(?:\.|,|$)",
-        ]
-
-        for pattern in background_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
-            if match:
-                context["background"] = match.group(1).strip()
-                break
-
-        # Extract goal information
-        goal_patterns = [
-            r"(?:goal:|objective:|aim:|purpose:)\s*(.*?)(?:\.|$)",
-            r"(?:my goal is to|the goal is to)\s+(.*?)(?:\.|$)",
-            r"(?:I need to|we need to)\s+(.*?)(?:\.|$)",
-        ]
-
-        for pattern in goal_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
-            if match:
-                context["goal"] = match.group(1).strip()
-                break
-
-        return context
-
-    def _generate_request_component(self, prompt: str, _context: dict[str, Any]) -> dict[str, Any]:
+    def _generate_request_component(self, prompt: str | PromptFeatures, _context: dict[str, Any]) -> dict[str, Any]:
         """Generate the Request component of C.R.E.A.T.E. framework.
 
         Args:
-            prompt: The input prompt.
+            prompt: The input prompt, or its extracted features.
             context: Extracted context information.
 
         Returns:
             Dictionary containing request component.
         """
-        request: dict[str, Any] = {
-            "task": None,
-            "deliverable": None,
+        features = PromptFeatures.extract(prompt)
+        return {
+            "task": features.task,
+            "deliverable": features.deliverable,
             "specifications": [],
             "constraints": [],
         }
 
-        # Extract task information
-        task_patterns = [
-            r"(?:task:|please|can you|help me to) (.*?)(?:\.|$)",
-            r"(?:write|create|generate|produce) (.*?)(?:\.|$)",
-        ]
-
-        for pattern in task_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
-            if match:
-                request["task"] = match.group(1).strip()
-                break
-
-        # Extract deliverable information
-        deliverable_patterns = [
-            r"(?:deliverable should be|deliverable:|output:|result should be)\s+(.*?)(?:\.|$)",
-            r"(?:format:|in the form of)\s+(.*?)(?:\.|$)",
-        ]
-
-        for pattern in deliverable_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
-            if match:
-                request["deliverable"] = match.group(1).strip()
-                break
-
-        return request
-
-    def _generate_examples_component(self, prompt: str) -> dict[str, Any]:
+    def _generate_examples_component(self, prompt: str | PromptFeatures) -> dict[str, Any]:
         """Generate the Examples component of C.R.E.A.T.E. framework.
 
         Args:
-            prompt: The input prompt.
+            prompt: The input prompt, or its extracted features.
 
         Returns:
             Dictionary containing examples component.
         """
-        examples: dict[str, Any] = {
+        features = PromptFeatures.extract(prompt)
+        return {
             "input_examples": [],
             "output_examples": [],
-            "patterns": [],
+            "patterns": list(features.example_patterns),
         }
 
-        # Look for example patterns in the prompt
-        example_patterns = [
-            r"(?:example:|for example:|e\.g\.:|such as)\s+(.*?)(?:\.|$)",
-            r"(?:write like this:|like this:|similar to)\s+(.*)",  # Greedy capture for examples
-        ]
-
-        for pattern in example_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
-            if match:
-                captured_text = match.group(1).strip().rstrip(".")
-                examples["patterns"].append(captured_text)
-
-        return examples
-
     def _generate_augmentations_component(self, domain: str | None) -> dict[str, Any]:
         """Generate the Augmentations component of C.R.E.A.T.E. framework.
 
@@ -306,47 +365,23 @@ class CreateProcessor:
 
         return augmentations
 
-    def _generate_tone_format_component(self, prompt: str) -> dict[str, Any]:
+    def _generate_tone_format_component(self, prompt: str | PromptFeatures) -> dict[str, Any]:
         """Generate the Tone & Format component of C.R.E.A.T.E. framework.
 
         Args:
-            prompt: The input prompt.
+            prompt: The input prompt, or its extracted features.
 
         Returns:
             Dictionary containing tone and format component.
         """
-        tone_format = {
-            "tone": "professional",
+        features = PromptFeatures.extract(prompt)
+        return {
+            "tone": features.tone if features.tone is not None else "professional",
             "style": "clear",
-            "format": "structured",
+            "format": features.format if features.format is not None else "structured",
             "length": "appropriate",
         }
 
-        # Extract tone indicators
-        tone_patterns = [
-            r"(?:tone:|in a|style:)\s*(?:formal|informal|casual|professional|friendly)?\s*(.*?)(?:\.|,|$)",
-        ]
-
-        for pattern in tone_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
-            if match:
-                tone_format["tone"] = match.group(1).strip()
-                break
-
-        # Extract format indicators
-        format_patterns = [
-            r"(?:format:|structure:|as a) (.*?)(?:\.|,|$)",
-            r"(?:bullet points|numbered list|paragraph|essay) (.*?)(?:\.|,|$)",
-        ]
-
-        for pattern in format_patterns:
-            match = re.search(pattern, prompt, re.IGNORECASE)
-            if match:
-                tone_format["format"] = match.group(1).strip()
-                break
-
-        return tone_format
-
     def _generate_evaluation_component(self) -> dict[str, Any]:
         """Generate the Evaluation component of C.R.E.A.T.E. framework.
 
@@ -378,16 +413,17 @@ class CreateProcessor:
         Returns:
             Dictionary containing the enhanced prompt components.
         """
-        extracted_context = self._extract_context(prompt)
+        features = PromptFeatures.extract(prompt)
+        extracted_context = self._extract_context(features)
         domain = context.get("domain", "general")
 
         # Generate each component of the C.R.E.A.T.E. framework
         return {
             "context": extracted_context,
-            "request": self._generate_request_component(prompt, extracted_context),
-            "examples": self._generate_examples_component(prompt),
+            "request": self._generate_request_component(features, extracted_context),
+            "examples": self._generate_examples_component(features),
             "augmentations": self._generate_augmentations_component(domain),
-            "tone_format": self._generate_tone_format_component(prompt),
+            "tone_format": self._generate_tone_format_component(features),
             "evaluation": self._generate_evaluation_component(),
         }
 
@@ -400,21 +436,21 @@ class CreateProcessor:
         Returns:
             Enhanced prompt string.
         """
-        sections = []
+        sections: list[str] = []
 
-        # Build each section using helper methods
-        sections.extend(self._build_context_section(components["context"]))
-        sections.extend(self._build_request_section(components["request"]))
-        sections.extend(self._build_examples_section(components["examples"]))
-        sections.extend(self._build_augmentations_section(components["augmentations"]))
-        sections.extend(self._build_tone_format_section(components["tone_format"]))
-        sections.extend(self._build_evaluation_section(components["evaluation"]))
+        # Each helper appends its section to the shared list
+        self._build_context_section(components["context"], sections)
+        self._build_request_section(components["request"], sections)
+        self._build_examples_section(components["examples"], sections)
+        self._build_augmentations_section(components["augmentations"], sections)
+        self._build_tone_format_section(components["tone_format"], sections)
+        self._build_evaluation_section(components["evaluation"], sections)
 
         return "\n\n".join(sections)
 
-    def _build_context_section(self, context: dict[str, Any]) -> list[str]:
-        """Build the context section of the prompt."""
-        sections = []
+    def _build_context_section(self, context: dict[str, Any], sections: list[str] | None = None) -> list[str]:
+        """Build the context section of the prompt, appending to ``sections`` if given."""
+        sections = [] if sections is None else sections
         if context["role"]:
             sections.append(f"## Context\nRole: {context['role']}")
             if context["background"]:
@@ -423,47 +459,50 @@ class CreateProcessor:
                 sections.append(f"Goal: {context['goal']}")
         return sections
 
-    def _build_request_section(self, request: dict[str, Any]) -> list[str]:
-        """Build the request section of the prompt."""
-        sections = []
+    def _build_request_section(self, request: dict[str, Any], sections: list[str] | None = None) -> list[str]:
+        """Build the request section of the prompt, appending to ``sections`` if given."""
+        sections = [] if sections is None else sections
         if request["task"]:
             sections.append(f"## Request\nTask: {request['task']}")
             if request["deliverable"]:
                 sections.append(f"Deliverable: {request['deliverable']}")
         return sections
 
-    def _build_examples_section(self, examples: dict[str, Any]) -> list[str]:
-        """Build the examples section of the prompt."""
-        sections = []
+    def _build_examples_section(self, examples: dict[str, Any], sections: list[str] | None = None) -> list[str]:
+        """Build the examples section of the prompt, appending to ``sections`` if given."""
+        sections = [] if sections is None else sections
         if examples["patterns"]:
             sections.append("## Examples")
-            for pattern in examples["patterns"]:
-                sections.append(f"- {pattern}")
+            sections.extend(f"- {pattern}" for pattern in examples["patterns"])
         return sections
 
-    def _build_augmentations_section(self, augmentations: dict[str, Any]) -> list[str]:
-        """Build the augmentations section of the prompt."""
-        sections = []
+    def _build_augmentations_section(
+        self,
+        augmentations: dict[str, Any],
+        sections: list[str] | None = None,
+    ) -> list[str]:
+        """Build the augmentations section of the prompt, appending to ``sections`` if given."""
+        sections = [] if sections is None else sections
         if augmentations["frameworks"]:
             sections.append("## Augmentations")
             sections.append(f"Domain: {augmentations['domain']}")
-            if augmentations["frameworks"]:
-                sections.append(f"Frameworks: {', '.join(augmentations['frameworks'])}")
+            sections.append(f"Frameworks: {', '.join(augmentations['frameworks'])}")
         return sections
 
-    def _build_tone_format_section(self, tone_format: dict[str, Any]) -> list[str]:
-        """Build the tone & format section of the prompt."""
-        return [
-            "## Tone & Format",
-            f"Tone: {tone_format['tone']}",
-            f"Format: {tone_format['format']}",
-        ]
+    def _build_tone_format_section(self, tone_format: dict[str, Any], sections: list[str] | None = None) -> list[str]:
+        """Build the tone & format section of the prompt, appending to ``sections`` if given."""
+        sections = [] if sections is None else sections
+        sections.append("## Tone & Format")
+        sections.append(f"Tone: {tone_format['tone']}")
+        sections.append(f"Format: {tone_format['format']}")
+        return sections
 
-    def _build_evaluation_section(self, evaluation: dict[str, Any]) -> list[str]:
-        """Build the evaluation section of the prompt."""
-        sections = ["## Evaluation", "Quality checks:"]
-        for check in evaluation["quality_checks"]:
-            sections.append(f"- {check}")
+    def _build_evaluation_section(self, evaluation: dict[str, Any], sections: list[str] | None = None) -> list[str]:
+        """Build the evaluation section of the prompt, appending to ``sections`` if given."""
+        sections = [] if sections is None else sections
+        sections.append("## Evaluation")
+        sections.append("Quality checks:")
+        sections.extend(f"- {check}" for check in evaluation["quality_checks"])
         return sections
 
     async def process_prompt(self, input_prompt: str, domain: str | None = None) -> CreateResponse:
@@ -480,17 +519,31 @@ class CreateProcessor:
         errors: list[str] = []
 
         try:
-            # Validate input
-            self.validate_input(input_prompt)
-
-            # Prepare context
-            context = {"domain": domain or "general"}
-
-            # Apply C.R.E.A.T.E. framework
-            components = self.apply_create_framework(input_prompt, context)
-
-            # Build enhanced prompt
-            enhanced_prompt = self._build_enhanced_prompt(components)
+            cache_key = self._result_cache_key(input_prompt, domain)
+            cached = self._result_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                # Only validated prompts are cached
+                self._result_cache.move_to_end(cache_key)
+                self.cache_stats["hits"] += 1
+                components, enhanced_prompt = copy.deepcopy(cached[0]), cached[1]
+            else:
+                # Validate input
+                self.validate_input(input_prompt)
+
+                # Prepare context
+                context = {"domain": domain or "general"}
+
+                # Apply C.R.E.A.T.E. framework
+                components = self.apply_create_framework(input_prompt, context)
+
+                # Build enhanced prompt
+                enhanced_prompt = self._build_enhanced_prompt(components)
+
+                if cache_key is not None:
+                    self.cache_stats["misses"] += 1
+                    self._result_cache[cache_key] = (copy.deepcopy(components), enhanced_prompt)
+                    if len(self._result_cache) > self.result_cache_size:
+                        self._result_cache.popitem(last=False)
 
             # Calculate processing time
             processing_time = time.time() - start_time
@@ -504,6 +557,7 @@ class CreateProcessor:
                     "enhanced_prompt_length": len(enhanced_prompt),
                     "domain": domain or "general",
                     "timestamp": time.time(),
+                    "cache_hit": cached is not None,
                 },
                 processing_time=processing_time,
                 success=True,
@@ -536,3 +590,14 @@ class CreateProcessor:
             success=False,
             errors=errors,
         )
+
+    def _result_cache_key(self, input_prompt: Any, domain: str | None) -> tuple[str, str] | None:
+        """Key memoized results by prompt hash and domain (None if memoization does not apply)."""
+        if self.result_cache_size <= 0 or not isinstance(input_prompt, str):
+            return None
+        prompt_hash = hashlib.blake2b(input_prompt.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+        return prompt_hash, domain or "general"
+
+    def clear_result_cache(self) -> None:
+        """Clear memoized prompt results."""
+        self._result_cache.clear()
@@ -14,16 +14,20 @@ Key optimizations:
 """
 
 import asyncio
-from collections import OrderedDict
-from collections.abc import Callable
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
 from contextlib import suppress
 from dataclasses import dataclass
 from functools import wraps
 import hashlib
+import inspect
 import logging
 import time
 from typing import Any, TypeVar
 
+from src.utils.metrics_registry import MetricSnapshot, get_metrics_registry, summary_snapshot
+from src.utils.quantile_sketch import QuantileSketch, RollingQuantileSketch
+
 
 # Type variables for generic caching
 T = TypeVar("T")
@@ -38,6 +42,18 @@ MAX_METRICS_COUNT = 10000
 METRICS_TRIMMED_COUNT = 5000
 RECENT_METRICS_SECONDS = 300  # 5 minutes
 
+_pool_wait = get_metrics_registry().histogram(
+    "core_connection_pool_wait_seconds",
+    "Time spent waiting to acquire a connection from a core connection pool",
+    ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+_pool_timeouts = get_metrics_registry().counter(
+    "core_connection_pool_timeouts",
+    "Connection pool acquires that timed out",
+    ("pool",),
+)
+
 
 @dataclass
 class PerformanceMetrics:
@@ -202,6 +218,7 @@ class PerformanceMonitor:
         self._total_duration = 0.0
         self._max_duration = 0.0
         self._min_duration = float("inf")
+        self._recent_durations = RollingQuantileSketch(window_seconds=RECENT_METRICS_SECONDS)
         self.slow_operation_threshold = 2.0  # Default 2 seconds
 
     @property
@@ -261,6 +278,7 @@ class PerformanceMonitor:
 
         self.metrics.append(metric)
         self.operation_count += 1
+        self._recent_durations.add(metric.duration_ms, metric.end_time)
 
         # Update duration statistics
         duration_seconds = metric.duration or 0.0
@@ -295,12 +313,16 @@ class PerformanceMonitor:
         errors = sum(1 for m in recent_metrics if m.error_occurred or not m.success)
         successes = sum(1 for m in recent_metrics if m.success)
         slow_operations = sum(1 for m in recent_metrics if m.is_slow())
+        duration_sketch = self._recent_durations.snapshot()
 
         return {
             "total_operations": len(recent_metrics),
             "avg_duration_ms": sum(durations) / len(durations) if durations else 0,
             "max_duration_ms": max(durations) if durations else 0,
             "min_duration_ms": min(durations) if durations else 0,
+            "p50_duration_ms": duration_sketch.quantile(0.5),
+            "p95_duration_ms": duration_sketch.quantile(0.95),
+            "p99_duration_ms": duration_sketch.quantile(0.99),
             "cache_hit_rate": cache_hits / len(recent_metrics) if recent_metrics else 0,
             "error_rate": errors / len(recent_metrics) if recent_metrics else 0,
             "success_rate": successes / len(recent_metrics) if recent_metrics else 0,
@@ -324,6 +346,7 @@ class PerformanceMonitor:
         self._total_duration = 0.0
         self._max_duration = 0.0
         self._min_duration = float("inf")
+        self._recent_durations.clear()
 
     def get_slow_operations(self) -> list[PerformanceMetrics]:
         """Get list of slow operations."""
@@ -465,119 +488,310 @@ def monitor_performance(operation_name: str) -> Callable[[F], F]:
     return decorator
 
 
-class AsyncBatcher:
-    """Batches async operations for better performance."""
+@dataclass
+class _BatchEntry:
+    """An item or operation waiting in an AsyncBatcher."""
+
+    item: Any
+    future: asyncio.Future
+    enqueued_at: float
+    operation: tuple[Callable[..., Any], tuple, dict] | None = None
+
 
-    def __init__(self, batch_size: int = BATCH_SIZE, flush_interval: float = 0.1) -> None:
+class AsyncBatcher:
+    """Batches async operations for better performance.
+
+    Producers only append to the pending buffer; a dedicated flush task hands a
+    batch to the processor once ``batch_size`` entries are pending or the oldest
+    entry has waited ``flush_interval`` seconds. Batches are processed one at a
+    time, in order, and each producer gets its own result or exception back
+    through a future. At most ``max_pending`` entries may be queued or in flight;
+    further producers wait, which applies back-pressure when processing falls
+    behind.
+
+    Items added with ``add_item`` are passed to the batch processor as a list. A
+    processor may return a list with one result per item, where an exception
+    instance fails only that item; any other return value resolves every item
+    with None. Operations added with ``add_operation`` are run concurrently
+    within their batch.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = 0.1,
+        max_pending: int | None = None,
+    ) -> None:
         if batch_size <= 0:
             raise ValueError("batch_size must be positive")
         if flush_interval < 0:
             raise ValueError("flush_interval must be non-negative")
+        if max_pending is not None and max_pending < batch_size:
+            raise ValueError("max_pending must be at least batch_size")
         self.batch_size = batch_size
         self.flush_interval = flush_interval  # Use flush_interval instead of max_wait_time
         self.max_wait_time = flush_interval  # Keep for backwards compatibility
-        self.pending_operations: list[tuple[Callable, tuple, dict]] = []
-        self.batches: list[Any] = []  # Add batches attribute expected by tests
-        self.batch_lock = asyncio.Lock()
+        self.max_pending = max_pending or batch_size * 4
+        self.stats = {"batches": 0, "items": 0, "size_flushes": 0, "deadline_flushes": 0, "failed_batches": 0}
+        self._pending: list[_BatchEntry] = []
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._wakeup = asyncio.Event()
+        self._process_lock = asyncio.Lock()
         self._batch_processor: Callable | None = None
         self._flush_task: asyncio.Task | None = None
         self._shutdown = False
 
+    @property
+    def batches(self) -> list[Any]:
+        """Get the items waiting for the batch processor."""
+        return [entry.item for entry in self._pending if entry.operation is None]
+
+    @property
+    def pending(self) -> int:
+        """Get the number of entries waiting to be flushed."""
+        return len(self._pending)
+
     def set_batch_processor(self, processor: Callable) -> None:
         """Set the batch processor function."""
         self._batch_processor = processor
-        # Start the flush timer if not already running
-        if self._flush_task is None and not self._shutdown:
-            self._flush_task = asyncio.create_task(self._flush_timer())
 
-    async def _flush_timer(self) -> None:
-        """Timer-based flush mechanism."""
-        while not self._shutdown:
-            await asyncio.sleep(self.flush_interval)
-            if not self._shutdown and self.batches and self._batch_processor:
-                async with self.batch_lock:
-                    if self.batches:  # Double-check with lock
-                        batch_to_process = self.batches.copy()
-                        self.batches.clear()
-                        await self._batch_processor(batch_to_process)
-
-    async def add_item(self, item: Any) -> None:
-        """Add an item to the batch."""
-        async with self.batch_lock:
-            self.batches.append(item)
-
-            if len(self.batches) >= self.batch_size and self._batch_processor:
-                batch_to_process = self.batches.copy()
-                self.batches.clear()
-                await self._batch_processor(batch_to_process)
+    async def add_item(self, item: Any) -> asyncio.Future:
+        """Add an item to the batch.
+
+        Waits only while ``max_pending`` entries are queued or in flight.
+
+        Args:
+            item: Item to pass to the batch processor
+
+        Returns:
+            asyncio.Future: Resolves to the item's result once its batch is processed
+        """
+        future = await self._enqueue(item)
+        # The caller may not await the result; don't report a failed batch as unretrieved
+        future.add_done_callback(_consume_exception)
+        return future
+
+    async def add_operation(self, operation: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Add operation to batch and wait for its result.
+
+        Args:
+            operation: Coroutine function to run with the batch
+            *args: Positional arguments for the operation
+            **kwargs: Keyword arguments for the operation
+
+        Returns:
+            Any: The operation's result
+
+        Raises:
+            Exception: Whatever the operation raised
+        """
+        return await (await self._enqueue(None, (operation, args, kwargs)))
 
     async def flush(self) -> None:
-        """Manually flush pending items."""
-        async with self.batch_lock:
-            if self.batches and self._batch_processor:
-                batch_to_process = self.batches.copy()
-                self.batches.clear()
-                await self._batch_processor(batch_to_process)
+        """Process all pending entries now and wait for them to complete."""
+        async with self._process_lock:
+            while self._pending:
+                await self._process(self._take_batch())
 
     async def shutdown(self) -> None:
         """Shutdown the batcher and flush remaining items."""
         self._shutdown = True
-        if self._flush_task:
-            self._flush_task.cancel()
-            # Wait for task to complete (ignore cancellation)
-            with suppress(asyncio.CancelledError):
-                await self._flush_task
+        if self._flush_task is not None:
+            # Let a batch in progress finish rather than cancelling the processor
+            self._wakeup.set()
+            await self._flush_task
+            self._flush_task = None
         await self.flush()
 
-    async def add_operation(self, operation: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
-        """Add operation to batch."""
-        async with self.batch_lock:
-            self.pending_operations.append((operation, args, kwargs))
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics."""
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "max_pending": self.max_pending,
+        }
 
-            if len(self.pending_operations) >= self.batch_size:
-                return await self._execute_batch()
+    async def _enqueue(
+        self,
+        item: Any,
+        operation: tuple[Callable[..., Any], tuple, dict] | None = None,
+    ) -> asyncio.Future:
+        if self._shutdown:
+            raise RuntimeError("AsyncBatcher has been shut down")
+        await self._slots.acquire()
+        loop = asyncio.get_running_loop()
+        entry = _BatchEntry(item, loop.create_future(), loop.time(), operation)
+        self._pending.append(entry)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        # Wake the flusher to start the deadline for a new batch, or to flush a full one
+        if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+        return entry.future
+
+    async def _flush_loop(self) -> None:
+        """Flush batches on size or deadline until shutdown."""
+        loop = asyncio.get_running_loop()
+        while not self._shutdown:
+            self._wakeup.clear()
+            if not self._pending:
+                await self._wakeup.wait()
+                continue
+            if len(self._pending) < self.batch_size:
+                remaining = self._pending[0].enqueued_at + self.flush_interval - loop.time()
+                if remaining > 0:
+                    with suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._wakeup.wait(), remaining)
+                    continue
+                self.stats["deadline_flushes"] += 1
+            else:
+                self.stats["size_flushes"] += 1
+            async with self._process_lock:
+                if self._pending:
+                    await self._process(self._take_batch())
+
+    def _take_batch(self) -> list[_BatchEntry]:
+        batch = self._pending[: self.batch_size]
+        del self._pending[: self.batch_size]
+        return batch
+
+    async def _process(self, batch: list[_BatchEntry]) -> None:
+        """Run one batch and resolve the futures of its entries."""
+        items = [entry for entry in batch if entry.operation is None]
+        operations = [entry for entry in batch if entry.operation is not None]
+        try:
+            if operations:
+                results = await asyncio.gather(
+                    *(_run_operation(*entry.operation) for entry in operations),  # type: ignore[misc]
+                    return_exceptions=True,
+                )
+                for entry, result in zip(operations, results, strict=True):
+                    _resolve(entry.future, result)
+            if items:
+                await self._process_items(items)
+        finally:
+            self.stats["batches"] += 1
+            self.stats["items"] += len(batch)
+            for entry in batch:
+                if not entry.future.done():
+                    entry.future.cancel()
+                self._slots.release()
+
+    async def _process_items(self, items: list[_BatchEntry]) -> None:
+        if self._batch_processor is None:
+            error = RuntimeError("No batch processor set")
+            for entry in items:
+                _resolve(entry.future, error)
+            return
+        try:
+            results = await self._batch_processor([entry.item for entry in items])
+        except Exception as e:
+            self.stats["failed_batches"] += 1
+            logging.getLogger(__name__).warning("Batch processor failed for %d items: %s", len(items), e)
+            for entry in items:
+                _resolve(entry.future, e)
+            return
+        if not isinstance(results, list) or len(results) != len(items):
+            results = [None] * len(items)
+        for entry, result in zip(items, results, strict=True):
+            _resolve(entry.future, result)
 
-            # Wait for more operations or timeout
-            await asyncio.sleep(self.max_wait_time)
 
-            if self.pending_operations:
-                return await self._execute_batch()
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    """Set a result, or an exception instance as the exception, unless the waiter gave up."""
+    if future.done():
+        return
+    if isinstance(result, BaseException):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
 
-        return None
 
-    async def _execute_batch(self) -> list[Any]:
-        """Execute batched operations."""
-        if not self.pending_operations:
-            return []
+def _consume_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+async def _run_operation(operation: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    return await operation(*args, **kwargs)
+
+
+@dataclass
+class _IdleConnection:
+    connection: Any
+    released_at: float
+
+
+class _Lease:
+    """One checkout of a pooled connection.
 
-        operations = self.pending_operations.copy()
-        self.pending_operations.clear()
+    Leases are tracked by identity rather than by connection, so a factory that
+    hands out a shared object can have it checked out more than once. Leases
+    held by a ``ConnectionContext`` are only released by that context.
+    """
 
-        # Execute all operations concurrently
-        tasks = [op(*args, **kwargs) for op, args, kwargs in operations]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+    __slots__ = ("connection", "managed")
+
+    def __init__(self, connection: Any, managed: bool = False) -> None:
+        self.connection = connection
+        self.managed = managed
 
 
 class ConnectionPool:
-    """Connection pool for vector store operations."""
+    """Connection pool for vector store operations.
+
+    At most ``max_size`` connections are checked out at once; ``acquire`` waits
+    up to ``timeout`` seconds for one to be released and then raises
+    ``TimeoutError``. Idle connections are reused most-recently-released first,
+    so surplus connections age out and are closed after ``max_idle_time``
+    seconds. If a ``health_check`` is set, idle connections are checked before
+    reuse and closed when the check fails or raises.
+    """
 
-    def __init__(self, max_size: int = 10, timeout: float = 5.0) -> None:
+    def __init__(
+        self,
+        max_size: int = 10,
+        timeout: float = 5.0,
+        max_idle_time: float = 300.0,
+        health_check: Callable[[Any], Awaitable[bool]] | None = None,
+        name: str = "default",
+    ) -> None:
         if max_size <= 0:
             raise ValueError("max_size must be positive")
         if timeout < 0:
             raise ValueError("timeout must be non-negative")
+        if max_idle_time < 0:
+            raise ValueError("max_idle_time must be non-negative")
         self.max_size = max_size  # Use max_size instead of max_connections
         self.max_connections = max_size  # Keep for backwards compatibility
         self.timeout = timeout
-        self.available_connections_queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
-        self.active_connections = 0
-        self.connection_lock = asyncio.Lock()
+        self.max_idle_time = max_idle_time
+        self.name = name
+        self.stats = {
+            "acquired": 0,
+            "created": 0,
+            "closed": 0,
+            "timeouts": 0,
+            "idle_evictions": 0,
+            "health_check_failures": 0,
+        }
+        self._health_check = health_check
         self._connection_factory: Callable | None = None
+        self._idle: deque[_IdleConnection] = deque()
+        self._checked_out: set[_Lease] = set()
+        self._slots = asyncio.Semaphore(max_size)
+        self._wait = QuantileSketch()
 
     def set_connection_factory(self, factory: Callable) -> None:
         """Set the connection factory function."""
         self._connection_factory = factory
 
+    def set_health_check(self, health_check: Callable[[Any], Awaitable[bool]] | None) -> None:
+        """Set the check run on idle connections before they are reused."""
+        self._health_check = health_check
+
     async def acquire(self) -> Any:
         """Acquire a connection from the pool."""
         return await self.acquire_connection()
@@ -591,43 +805,138 @@ class ConnectionPool:
         return ConnectionContext(self)
 
     async def close_all(self) -> None:
-        """Close all connections in the pool."""
-        async with self.connection_lock:
-            # Clear the queue
-            while not self.available_connections_queue.empty():
-                try:
-                    self.available_connections_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
-            self.active_connections = 0
+        """Close idle connections and stop tracking checked-out ones.
+
+        Connections checked out at the time are closed when they are released.
+        """
+        idle = [entry.connection for entry in self._idle]
+        self._idle.clear()
+        for _ in self._checked_out:
+            self._slots.release()
+        self._checked_out.clear()
+        for connection in idle:
+            await self._close_connection(connection)
 
     @property
     def available_connections(self) -> int:
         """Get number of available connections."""
-        return self.available_connections_queue.qsize()
+        return len(self._idle)
+
+    @property
+    def active_connections(self) -> int:
+        """Get number of connections currently checked out."""
+        return len(self._checked_out)
 
     async def acquire_connection(self) -> Any:
-        """Acquire a connection from the pool."""
-        try:
-            # Try to get existing connection
-            return self.available_connections_queue.get_nowait()
-        except asyncio.QueueEmpty:
-            # Create new connection if under limit
-            async with self.connection_lock:
-                if self.active_connections < self.max_size:
-                    self.active_connections += 1
-                    return await self._create_connection()
-                # Wait for available connection
-                return await self.available_connections_queue.get()
+        """Acquire a connection from the pool.
+
+        Returns:
+            Any: A healthy idle connection, or a new one if none is idle
+
+        Raises:
+            TimeoutError: If no connection was released within ``timeout`` seconds
+        """
+        return (await self._acquire_lease()).connection
 
     async def release_connection(self, connection: Any) -> None:
         """Release a connection back to the pool."""
-        if connection:
-            async with self.connection_lock:
-                await self.available_connections_queue.put(connection)
-                # Decrement active_connections when releasing
-                if self.active_connections > 0:
-                    self.active_connections -= 1
+        if connection is None:
+            return
+        lease = next(
+            (lease for lease in self._checked_out if lease.connection is connection and not lease.managed),
+            None,
+        )
+        await self._release_lease(lease or _Lease(connection))
+
+    async def _acquire_lease(self, managed: bool = False) -> _Lease:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        except TimeoutError:
+            self.stats["timeouts"] += 1
+            _pool_timeouts.labels(self.name).inc()
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self._wait.add(waited)
+            _pool_wait.labels(self.name).observe(waited)
+
+        try:
+            connection = await self._take_idle()
+            if connection is None:
+                connection = await self._create_connection()
+                self.stats["created"] += 1
+        except BaseException:
+            self._slots.release()
+            raise
+        lease = _Lease(connection, managed)
+        self._checked_out.add(lease)
+        self.stats["acquired"] += 1
+        return lease
+
+    async def _release_lease(self, lease: _Lease) -> None:
+        if lease not in self._checked_out:
+            # Checked out before close_all, or never from this pool
+            await self._close_connection(lease.connection)
+            return
+        self._checked_out.remove(lease)
+        self._idle.append(_IdleConnection(lease.connection, time.monotonic()))
+        self._slots.release()
+        await self._evict_idle()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics, including acquire wait times in seconds."""
+        return {
+            **self.stats,
+            "max_size": self.max_size,
+            "active": self.active_connections,
+            "idle": self.available_connections,
+            "wait": self._wait.summary(),
+        }
+
+    async def _take_idle(self) -> Any | None:
+        """Pop the most recently released idle connection that passes its health check."""
+        await self._evict_idle()
+        while self._idle:
+            connection = self._idle.pop().connection
+            if await self._is_healthy(connection):
+                return connection
+            self.stats["health_check_failures"] += 1
+            await self._close_connection(connection)
+        return None
+
+    async def _is_healthy(self, connection: Any) -> bool:
+        if self._health_check is None:
+            return True
+        try:
+            return bool(await self._health_check(connection))
+        except Exception as e:
+            logging.getLogger(__name__).debug("Connection health check failed: %s", e)
+            return False
+
+    async def _evict_idle(self) -> None:
+        """Close connections that have been idle longer than ``max_idle_time``."""
+        cutoff = time.monotonic() - self.max_idle_time
+        while self._idle and self._idle[0].released_at < cutoff:
+            self.stats["idle_evictions"] += 1
+            await self._close_connection(self._idle.popleft().connection)
+
+    async def _close_connection(self, connection: Any) -> None:
+        if any(lease.connection is connection for lease in self._checked_out) or any(
+            entry.connection is connection for entry in self._idle
+        ):
+            # A shared connection is still held by another lease or waiting for reuse
+            return
+        self.stats["closed"] += 1
+        close = getattr(connection, "close", None)
+        if not callable(close):
+            return
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logging.getLogger(__name__).debug("Error closing pooled connection: %s", e)
 
     async def _create_connection(self) -> Any:
         """Create a new connection using the factory if available."""
@@ -643,16 +952,19 @@ class ConnectionContext:
     def __init__(self, pool: ConnectionPool) -> None:
         self.pool = pool
         self.connection = None
+        self._lease: _Lease | None = None
 
     async def __aenter__(self) -> Any:
         """Acquire connection when entering context."""
-        self.connection = await self.pool.acquire()
+        self._lease = await self.pool._acquire_lease(managed=True)
+        self.connection = self._lease.connection
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Release connection when exiting context."""
-        if self.connection:
-            await self.pool.release(self.connection)  # type: ignore[unreachable]
+        if self._lease is not None:
+            lease, self._lease = self._lease, None
+            await self.pool._release_lease(lease)
 
 
 def get_performance_stats() -> dict[str, Any]:
@@ -665,6 +977,31 @@ def get_performance_stats() -> dict[str, Any]:
     }
 
 
+def _collect_optimizer_metrics() -> list[MetricSnapshot]:
+    """Expose core caches and the operation monitor to the metrics registry."""
+    cache_requests = MetricSnapshot("core_cache_requests", "counter", "Core cache lookups by result")
+    cache_size = MetricSnapshot("core_cache_entries", "gauge", "Entries currently held by core caches")
+    for cache_name, cache in (("query", _query_cache), ("hyde", _hyde_cache), ("vector", _vector_cache)):
+        cache_requests.add(cache.stats["hits"], {"cache": cache_name, "result": "hit"}, "_total")
+        cache_requests.add(cache.stats["misses"], {"cache": cache_name, "result": "miss"}, "_total")
+        cache_size.add(len(cache.cache), {"cache": cache_name})
+
+    operations = MetricSnapshot("core_operations", "counter", "Core operations tracked by the performance monitor")
+    operations.add(_performance_monitor.operation_count, suffix="_total")
+    errors = MetricSnapshot("core_operation_errors", "counter", "Core operations that reported an error")
+    errors.add(_performance_monitor.error_count, suffix="_total")
+
+    durations = summary_snapshot(
+        "core_operation_duration_milliseconds",
+        "Recent core operation durations",
+        [({}, _performance_monitor._recent_durations.snapshot())],
+    )
+    return [cache_requests, cache_size, operations, errors, durations]
+
+
+get_metrics_registry().register_collector(_collect_optimizer_metrics)
+
+
 def clear_all_caches() -> None:
     """Clear all performance caches."""
     _query_cache.clear()
@@ -700,7 +1037,7 @@ class PerformanceOptimizer:
     """Main performance optimization coordinator."""
 
     def __init__(self) -> None:
-        self.connection_pool = ConnectionPool(max_size=20)  # Use max_size instead of max_connections
+        self.connection_pool = ConnectionPool(max_size=20, name="optimizer")  # Use max_size instead of max_connections
         self.batcher = AsyncBatcher(batch_size=25, flush_interval=0.05)  # Use flush_interval
         self.logger = logging.getLogger(__name__)
         self.query_cache = _query_cache  # Reference to the global query cache
@@ -744,7 +1081,9 @@ class PerformanceOptimizer:
         return {
             "cache_stats": cache_stats,
             "connection_pool_size": self.connection_pool.active_connections,
-            "batcher_pending": len(self.batcher.pending_operations),
+            "batcher_pending": self.batcher.pending,
+            "connection_pool": self.connection_pool.get_stats(),
+            "batcher": self.batcher.get_stats(),
             # Also include individual cache stats at top level for backward compatibility
             **cache_stats,
         }
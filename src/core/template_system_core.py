@@ -2,12 +2,23 @@
 
 This module provides the essential template management functionality for Phase 1 Issue 4,
 implementing basic template loading and validation without advanced features.
+
+Templates are loaded lazily, by name, the first time they are requested. Before
+rendering, each template is compiled once into a ``RenderPlan``: its sections are
+joined into a single format string and the variables it needs are resolved up
+front, so missing required variables are reported instead of rendered as raw
+template text. Rendered output is cached by template version and a hash of the
+variables the template references.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
+import hashlib
+import json
 import logging
 from pathlib import Path
+import string
 from typing import Any
 
 from pydantic import BaseModel, Field, ValidationError
@@ -18,6 +29,22 @@ import yaml
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_RENDER_CACHE_SIZE = 256
+SECTION_SEPARATOR = "\n\n"
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_json_native(value: Any) -> bool:
+    """Check that a value is built only from JSON types, with no subclasses or non-string keys."""
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return True
+    if value_type is list:
+        return all(_is_json_native(item) for item in value)
+    if value_type is dict:
+        return all(type(key) is str and _is_json_native(item) for key, item in value.items())
+    return False
+
 
 class TemplateType(Enum):
     """Available template types."""
@@ -56,7 +83,8 @@ class TemplateManager:
     """Core template management system.
 
     This class provides basic template loading, validation, and management
-    functionality for the C.R.E.A.T.E. framework.
+    functionality for the C.R.E.A.T.E. framework. Template files are indexed
+    at construction and parsed on first use.
     """
 
     def __init__(self, templates_dir: str = "knowledge/create_agent/templates") -> None:
@@ -66,27 +94,52 @@ class TemplateManager:
             templates_dir: Directory containing template files.
         """
         self.templates_dir = Path(templates_dir)
-        self.templates: dict[str, TemplateSchema] = {}
+        self._templates: dict[str, TemplateSchema] = {}
+        self._template_files: dict[str, Path] = {}
+        self._failed: set[str] = set()
+        self._revisions: dict[str, int] = {}
         self.logger = logger
+        self._index_templates()
+
+    @property
+    def templates(self) -> dict[str, TemplateSchema]:
+        """All templates that load successfully, loading any not yet loaded."""
         self._load_templates()
+        return self._templates
 
-    def _load_templates(self) -> None:
-        """Load all templates from the templates directory."""
+    def _index_templates(self) -> None:
+        """Find the template files in the templates directory without parsing them."""
         if not self.templates_dir.exists():
             self.logger.warning("Templates directory does not exist: %s", self.templates_dir)
             return
 
         for template_file in self.templates_dir.glob("**/*.yaml"):
-            try:
-                self._load_template(template_file)
-            except Exception as e:
-                self.logger.error("Failed to load template %s: %s", template_file, e)
+            self._template_files[template_file.stem] = template_file
 
-    def _load_template(self, template_file: Path) -> None:
+    def _load_templates(self) -> None:
+        """Load every indexed template that has not been loaded yet."""
+        for name in self._template_files:
+            if name not in self._templates and name not in self._failed:
+                self._load_by_name(name)
+
+    def _load_by_name(self, name: str) -> TemplateSchema | None:
+        """Load an indexed template, remembering failures so they are not retried."""
+        template_file = self._template_files[name]
+        try:
+            return self._load_template(template_file)
+        except Exception as e:
+            self.logger.error("Failed to load template %s: %s", template_file, e)
+            self._failed.add(name)
+            return None
+
+    def _load_template(self, template_file: Path) -> TemplateSchema:
         """Load a single template file.
 
         Args:
             template_file: Path to the template file.
+
+        Returns:
+            The loaded template.
         """
         try:
             with template_file.open(encoding="utf-8") as f:
@@ -95,9 +148,11 @@ class TemplateManager:
             # Validate template structure
             template = TemplateSchema(**template_data)
             template_name = template_file.stem
-            self.templates[template_name] = template
+            self._templates[template_name] = template
+            self._revisions[template_name] = self._revisions.get(template_name, 0) + 1
 
             self.logger.info("Loaded template: %s", template_name)
+            return template
 
         except yaml.YAMLError as e:
             self.logger.error("YAML error in template %s: %s", template_file, e)
@@ -118,15 +173,47 @@ class TemplateManager:
         Returns:
             Template schema or None if not found.
         """
-        return self.templates.get(name)
+        template = self._templates.get(name)
+        if template is None and name in self._template_files and name not in self._failed:
+            template = self._load_by_name(name)
+        return template
+
+    def get_template_version(self, name: str) -> str | None:
+        """Get the version of a loaded template.
+
+        The version combines the template's metadata version with a revision
+        that changes every time the template file is loaded.
+
+        Args:
+            name: Template name.
+
+        Returns:
+            Template version or None if the template is not loaded.
+        """
+        template = self._templates.get(name)
+        if template is None:
+            return None
+        return f"{template.metadata.get('version', '')}#{self._revisions[name]}"
+
+    def reload_template(self, name: str) -> None:
+        """Forget a loaded template so its file is read again on next use.
+
+        Args:
+            name: Template name.
+        """
+        self._templates.pop(name, None)
+        self._failed.discard(name)
 
     def list_templates(self) -> list[str]:
         """List all available template names.
 
+        Templates are not loaded to list them, so a template file that fails to
+        load is listed until it is first requested.
+
         Returns:
             List of template names.
         """
-        return list(self.templates.keys())
+        return [name for name in self._template_files if name not in self._failed]
 
     def get_templates_by_type(self, template_type: TemplateType) -> list[str]:
         """Get templates by type.
@@ -213,21 +300,133 @@ class TemplateManager:
         }
 
 
+@dataclass(frozen=True)
+class RenderPlan:
+    """A template compiled for rendering.
+
+    Attributes:
+        version: Version of the template the plan was compiled from.
+        format_string: All sections joined into one ``str.format`` template.
+        fields: Names of the variables the sections reference.
+        required: Variables that must be supplied to render.
+        defaults: Values used for optional variables that are not supplied.
+    """
+
+    version: str | None
+    format_string: str
+    fields: tuple[str, ...]
+    required: frozenset[str]
+    defaults: dict[str, Any]
+
+    def check_variables(self, variables: dict[str, Any]) -> None:
+        """Check that all required variables are supplied.
+
+        Args:
+            variables: Variables to substitute.
+
+        Raises:
+            ValueError: If required variables are missing.
+        """
+        missing = self.required.difference(variables)
+        if missing:
+            raise ValueError(f"Missing required variables: {', '.join(sorted(missing))}")
+
+    def render(self, variables: dict[str, Any]) -> str:
+        """Render the plan with variables.
+
+        Args:
+            variables: Variables to substitute.
+
+        Returns:
+            Rendered template content.
+
+        Raises:
+            ValueError: If required variables are missing.
+        """
+        self.check_variables(variables)
+        if self.defaults:
+            variables = {**self.defaults, **variables}
+        return self.format_string.format_map(variables)
+
+
+def _field_names(format_string: str) -> list[str]:
+    """Get the names of the variables a format string references, including in format specs."""
+    names = []
+    for _literal, field_name, format_spec, _conversion in string.Formatter().parse(format_string):
+        if field_name is None:
+            continue
+        name = field_name.split(".", 1)[0].split("[", 1)[0]
+        if not name or name.isdigit():
+            raise ValueError(f"Positional field {{{field_name}}} is not supported; use named variables")
+        names.append(name)
+        if format_spec:
+            names.extend(_field_names(format_spec))
+    return names
+
+
+def compile_template(template: TemplateSchema, version: str | None = None) -> RenderPlan:
+    """Compile a template into a render plan.
+
+    Variables declared with ``required: true`` and variables the sections
+    reference without declaring them are required. Other referenced variables
+    fall back to their declared ``default``, or an empty string.
+
+    Args:
+        template: Template schema.
+        version: Version of the template, recorded on the plan.
+
+    Returns:
+        Render plan for the template.
+
+    Raises:
+        ValueError: If a section template is malformed.
+    """
+    sections = [str(section.get("template", "")) for section in template.structure.get("sections", [])]
+    format_string = SECTION_SEPARATOR.join(sections)
+    fields = tuple(dict.fromkeys(_field_names(format_string)))
+
+    declared = template.variables
+    required = {name for name, config in declared.items() if isinstance(config, dict) and config.get("required")}
+    required.update(name for name in fields if name not in declared)
+    defaults = {
+        name: config.get("default", "") if isinstance(config, dict) else ""
+        for name, config in declared.items()
+        if name in fields and name not in required
+    }
+    return RenderPlan(
+        version=version,
+        format_string=format_string,
+        fields=fields,
+        required=frozenset(required),
+        defaults=defaults,
+    )
+
+
 class TemplateProcessor:
     """Core template processing functionality.
 
     This class handles template rendering and variable substitution
-    for the C.R.E.A.T.E. framework.
+    for the C.R.E.A.T.E. framework. Templates are compiled once per version,
+    and rendered output is cached by template version and variables.
     """
 
-    def __init__(self, template_manager: TemplateManager) -> None:
+    def __init__(
+        self,
+        template_manager: TemplateManager,
+        render_cache_size: int = DEFAULT_RENDER_CACHE_SIZE,
+    ) -> None:
         """Initialize the template processor.
 
         Args:
             template_manager: Template manager instance.
+            render_cache_size: Maximum number of rendered outputs to cache (0 disables caching).
         """
         self.template_manager = template_manager
+        self.render_cache_size = render_cache_size
         self.logger = logger
+        self._plans: dict[str, RenderPlan] = {}
+        self._render_cache: OrderedDict[tuple[str, str | None, str], str] = OrderedDict()
+        self.cache_stats = {"hits": 0, "misses": 0, "compiles": 0}
 
     def process_template(self, name: str, variables: dict[str, Any]) -> str:
         """Process a template with variables.
@@ -240,43 +439,93 @@ class TemplateProcessor:
             Processed template content.
 
         Raises:
-            ValueError: If template not found or processing fails.
+            ValueError: If template not found, required variables are missing or processing fails.
         """
         template = self.template_manager.get_template(name)
         if not template:
             raise ValueError(f"Template not found: {name}")
 
         try:
-            # Basic variable substitution
-            return self._substitute_variables(template, variables)
+            plan = self.get_render_plan(name, template)
+            return self._render(name, plan, variables)
         except Exception as e:
             self.logger.error("Template processing failed for %s: %s", name, e)
             raise
 
-    def _substitute_variables(self, template: TemplateSchema, variables: dict[str, Any]) -> str:
-        """Substitute variables in template.
+    def get_render_plan(self, name: str, template: TemplateSchema) -> RenderPlan:
+        """Get the render plan for a template, compiling it if its version changed.
 
         Args:
+            name: Template name.
             template: Template schema.
+
+        Returns:
+            Render plan for the template.
+        """
+        version = self.template_manager.get_template_version(name)
+        plan = self._plans.get(name)
+        if plan is None or plan.version != version:
+            plan = compile_template(template, version)
+            self._plans[name] = plan
+            self.cache_stats["compiles"] += 1
+        return plan
+
+    def _render(self, name: str, plan: RenderPlan, variables: dict[str, Any]) -> str:
+        """Render a plan, serving repeat renders from the render cache.
+
+        Args:
+            name: Template name.
+            plan: Render plan for the template.
             variables: Variables to substitute.
 
         Returns:
-            Processed template content.
+            Rendered template content.
+        """
+        plan.check_variables(variables)
+        digest = self._variables_digest(plan, variables) if self.render_cache_size > 0 else None
+        if digest is None:
+            return plan.render(variables)
+
+        key = (name, plan.version, digest)
+        content = self._render_cache.get(key)
+        if content is not None:
+            self._render_cache.move_to_end(key)
+            self.cache_stats["hits"] += 1
+            return content
+
+        self.cache_stats["misses"] += 1
+        content = plan.render(variables)
+        self._render_cache[key] = content
+        if len(self._render_cache) > self.render_cache_size:
+            self._render_cache.popitem(last=False)
+        return content
+
+    @staticmethod
+    def _variables_digest(plan: RenderPlan, variables: dict[str, Any]) -> str | None:
+        """Hash the variables a plan references, or None if any is not plain JSON data.
+
+        Other objects may render differently after being mutated, or render
+        differently from a value with the same JSON encoding (a tuple and a
+        list, say), so renders that reference them are not cached.
+        """
+        referenced = {name: variables[name] for name in plan.fields if name in variables}
+        if not _is_json_native(referenced):
+            return None
+        encoded = json.dumps(referenced, sort_keys=True)
+        return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get render plan and render cache statistics.
+
+        Returns:
+            Cache statistics.
         """
-        # Simple implementation - build content from sections
-        content_parts = []
-
-        for section in template.structure.get("sections", []):
-            section_template = section.get("template", "")
-            try:
-                # Basic string formatting
-                section_content = section_template.format(**variables)
-                content_parts.append(section_content)
-            except KeyError as e:
-                self.logger.warning("Missing variable %s in template", e)
-                content_parts.append(section_template)
-
-        return "\n\n".join(content_parts)
+        return {
+            **self.cache_stats,
+            "compiled_templates": len(self._plans),
+            "cached_renders": len(self._render_cache),
+            "max_cached_renders": self.render_cache_size,
+        }
 
     def validate_variables(self, template_name: str, variables: dict[str, Any]) -> bool:
         """Validate variables against template requirements.
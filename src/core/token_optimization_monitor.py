@@ -19,6 +19,7 @@ from src.core.analytics_engine import AnalyticsEngine
 from src.utils.datetime_compat import UTC
 from src.utils.observability import create_structured_logger
 from src.utils.performance_monitor import MetricData, MetricType, PerformanceMonitor
+from src.utils.quantile_sketch import QuantileSketch
 
 
 logger = logging.getLogger(__name__)
@@ -563,14 +564,15 @@ class TokenOptimizationMonitor:
                 fallback_rates.append(session.fallback_activations / session.optimized_functions_loaded)
 
         # Calculate system health metrics
+        latency_sketch = QuantileSketch.from_values(loading_latencies)
         health_metrics = SystemHealthMetrics(
             timestamp=current_time,
             total_sessions=len(recent_sessions),
             average_token_reduction_percentage=mean(token_reductions) * 100 if token_reductions else 0.0,
             median_token_reduction_percentage=median(token_reductions) * 100 if token_reductions else 0.0,
             average_loading_latency_ms=mean(loading_latencies) if loading_latencies else 0.0,
-            p95_loading_latency_ms=self._percentile(loading_latencies, 95) if loading_latencies else 0.0,
-            p99_loading_latency_ms=self._percentile(loading_latencies, 99) if loading_latencies else 0.0,
+            p95_loading_latency_ms=latency_sketch.quantile(0.95),
+            p99_loading_latency_ms=latency_sketch.quantile(0.99),
             overall_success_rate=mean(success_rates) if success_rates else 0.0,
             task_detection_accuracy_rate=mean(task_accuracies) if task_accuracies else 0.0,
             fallback_activation_rate=mean(fallback_rates) if fallback_rates else 0.0,
@@ -618,16 +620,6 @@ class TokenOptimizationMonitor:
             **validation_criteria,
         )
 
-    def _percentile(self, values: list[float], percentile: float) -> float:
-        """Calculate percentile of values."""
-        if not values:
-            return 0.0
-
-        sorted_values = sorted(values)
-        index = int(len(sorted_values) * percentile / 100)
-        index = min(index, len(sorted_values) - 1)
-        return sorted_values[index]
-
     async def export_metrics(self, export_format: str = "json", include_raw_data: bool = False) -> dict[str, Any]:
         """Export comprehensive metrics for analysis."""
 
@@ -689,6 +681,8 @@ class TokenOptimizationMonitor:
                 success_rate = session.commands_successful / total_commands
                 success_rates.append(success_rate * 100)
 
+        loading_sketch = QuantileSketch.from_values(loading_times)
+
         return {
             "report_timestamp": datetime.now(UTC).isoformat(),
             "user_id": user_id or "system_wide",
@@ -703,8 +697,8 @@ class TokenOptimizationMonitor:
             },
             "performance_metrics": {
                 "average_loading_time_ms": mean(loading_times) if loading_times else 0.0,
-                "p95_loading_time_ms": self._percentile(loading_times, 95) if loading_times else 0.0,
-                "p99_loading_time_ms": self._percentile(loading_times, 99) if loading_times else 0.0,
+                "p95_loading_time_ms": loading_sketch.quantile(0.95),
+                "p99_loading_time_ms": loading_sketch.quantile(0.99),
             },
             "user_experience": {
                 "average_success_rate": mean(success_rates) if success_rates else 0.0,
@@ -69,6 +69,7 @@ from src.core.performance_optimizer import (
     cache_vector_search,
     monitor_performance,
 )
+from src.utils.metrics_registry import get_metrics_registry
 from src.utils.secure_random import secure_random
 
 
@@ -224,6 +225,24 @@ class HealthCheckResult(BaseModel):
     error_message: str | None = None
 
 
+# Incremented where operations complete, so exported totals never go down when a store is discarded
+_vector_store_operations = get_metrics_registry().counter(
+    "vector_store_operations",
+    "Vector store operations by type",
+    ("store", "operation"),
+)
+_vector_store_errors = get_metrics_registry().counter(
+    "vector_store_errors",
+    "Vector store operation errors",
+    ("store",),
+)
+_vector_store_latency = get_metrics_registry().counter(
+    "vector_store_latency_seconds",
+    "Total vector store operation latency",
+    ("store",),
+)
+
+
 class AbstractVectorStore(ABC):
     """
     Abstract base class for vector store implementations.
@@ -285,6 +304,23 @@ class AbstractVectorStore(ABC):
         """Get current performance metrics."""
         return self.metrics
 
+    def _record_search(self, latency: float) -> None:
+        """Record a completed search in the store's metrics and the metrics registry."""
+        self.metrics.update_search_metrics(latency)
+        _vector_store_operations.labels(type(self).__name__, "search").inc()
+        _vector_store_latency.labels(type(self).__name__).inc(latency)
+
+    def _record_insert(self, latency: float) -> None:
+        """Record a completed insert batch in the store's metrics and the metrics registry."""
+        self.metrics.update_insert_metrics(latency)
+        _vector_store_operations.labels(type(self).__name__, "insert").inc()
+        _vector_store_latency.labels(type(self).__name__).inc(latency)
+
+    def _record_error(self) -> None:
+        """Record a failed operation in the store's metrics and the metrics registry."""
+        self.metrics.increment_error_count()
+        _vector_store_errors.labels(type(self).__name__).inc()
+
     def get_connection_status(self) -> ConnectionStatus:
         """Get current connection status."""
         return self._connection_status
@@ -440,7 +476,7 @@ class EnhancedMockVectorStore(AbstractVectorStore):
 
             # Update metrics
             latency = time.time() - start_time
-            self.metrics.update_search_metrics(latency)
+            self._record_search(latency)
             self._record_operation_success()
 
             self.logger.debug(
@@ -454,7 +490,7 @@ class EnhancedMockVectorStore(AbstractVectorStore):
 
         except Exception as e:
             self._record_operation_failure()
-            self.metrics.increment_error_count()
+            self._record_error()
             self.logger.error("Mock search failed: %s", str(e))
             raise
 
@@ -492,7 +528,7 @@ class EnhancedMockVectorStore(AbstractVectorStore):
                     errors.append(f"Failed to insert document {doc.id}: {e!s}")
 
             processing_time = time.time() - start_time
-            self.metrics.update_insert_metrics(processing_time)
+            self._record_insert(processing_time)
             self._record_operation_success()
 
             batch_id = f"mock_batch_{int(time.time())}"
@@ -515,7 +551,7 @@ class EnhancedMockVectorStore(AbstractVectorStore):
 
         except Exception as e:
             self._record_operation_failure()
-            self.metrics.increment_error_count()
+            self._record_error()
             self.logger.error("Mock batch insert failed: %s", str(e))
             raise
 
@@ -864,7 +900,7 @@ class QdrantVectorStore(AbstractVectorStore):
 
             # Update metrics
             latency = time.time() - start_time
-            self.metrics.update_search_metrics(latency)
+            self._record_search(latency)
             self._record_operation_success()
 
             self.logger.debug("Qdrant search completed: %d results in %.3fs", len(unique_results), latency)
@@ -873,7 +909,7 @@ class QdrantVectorStore(AbstractVectorStore):
 
         except Exception as e:
             self._record_operation_failure()
-            self.metrics.increment_error_count()
+            self._record_error()
             self.logger.error("Qdrant search failed: %s", str(e))
             raise
 
@@ -933,7 +969,7 @@ class QdrantVectorStore(AbstractVectorStore):
                     errors.append(f"Failed to insert into collection {collection}: {e!s}")
 
             processing_time = time.time() - start_time
-            self.metrics.update_insert_metrics(processing_time)
+            self._record_insert(processing_time)
             self._record_operation_success()
 
             batch_id = f"qdrant_batch_{int(time.time())}"
@@ -949,7 +985,7 @@ class QdrantVectorStore(AbstractVectorStore):
 
         except Exception as e:
             self._record_operation_failure()
-            self.metrics.increment_error_count()
+            self._record_error()
             self.logger.error("Qdrant batch insert failed: %s", str(e))
             raise
 
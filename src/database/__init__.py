@@ -4,6 +4,7 @@ This package provides:
 - Async PostgreSQL connection management
 - SQLAlchemy models for authentication and service tokens
 - Database utilities and migration support
+- Query instrumentation with slow-query and N+1 detection
 - Session management, event logging, and user metadata storage
 """
 
@@ -18,6 +19,7 @@ from .connection import (
     get_db_session,
 )
 from .models import AuthenticationEvent, Base, ServiceToken, UserSession
+from .query_instrumentation import QueryInstrumentation, QueryScopeMiddleware, query_scope
 
 
 __all__ = [
@@ -27,10 +29,13 @@ __all__ = [
     "DatabaseError",
     "DatabaseManager",
     "DatabaseService",
+    "QueryInstrumentation",
+    "QueryScopeMiddleware",
     "ServiceToken",
     "UserSession",
     "get_database_manager",
     "get_database_manager_async",
     "get_db",
     "get_db_session",
+    "query_scope",
 ]
@@ -7,6 +7,7 @@ This module provides async database connection management with:
 - Health checks and graceful failover
 - Configuration management from environment variables
 - Performance monitoring and optimization
+- Query instrumentation with slow-query and N+1 detection
 """
 
 import asyncio
@@ -23,6 +24,8 @@ from sqlalchemy.pool import NullPool
 
 from src.config.settings import ApplicationSettings, get_settings
 
+from .query_instrumentation import QueryInstrumentation
+
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +61,7 @@ class DatabaseManager:
         settings: ApplicationSettings | None = None,
         engine: AsyncEngine | None = None,
         session_factory: async_sessionmaker[AsyncSession] | None = None,
+        instrumentation: QueryInstrumentation | None = None,
     ) -> None:
         """Initialize database manager with optional dependency injection.
 
@@ -65,6 +69,7 @@ class DatabaseManager:
             settings: Application settings (defaults to get_settings())
             engine: Pre-configured async engine for testing
             session_factory: Pre-configured session factory for testing
+            instrumentation: Query instrumentation (created from settings on initialize if None)
         """
         self._engine: AsyncEngine | None = engine
         self._session_factory: async_sessionmaker[AsyncSession] | None = session_factory
@@ -73,6 +78,9 @@ class DatabaseManager:
         self._health_check_cache: dict[str, Any] = {}
         self._health_check_ttl = 30.0  # 30 seconds cache
         self._is_initialized = bool(engine and session_factory)
+        self._instrumentation = instrumentation
+        if instrumentation is not None and engine is not None:
+            instrumentation.attach(engine)
 
     async def initialize(self) -> None:
         """Initialize database engine and connection pool.
@@ -132,6 +140,8 @@ class DatabaseManager:
                         },
                     )
 
+                self._attach_instrumentation(self._engine)
+
                 # Create session factory
                 self._session_factory = async_sessionmaker(
                     bind=self._engine,
@@ -156,6 +166,17 @@ class DatabaseManager:
                 await self._cleanup()
                 raise DatabaseConnectionError(f"Database initialization failed: {e}") from e
 
+    def _attach_instrumentation(self, engine: AsyncEngine) -> None:
+        """Attach query instrumentation to a newly created engine if enabled."""
+        if self._instrumentation is None:
+            if getattr(self._settings, "db_query_instrumentation_enabled", False) is not True:
+                return
+            self._instrumentation = QueryInstrumentation(
+                slow_query_seconds=getattr(self._settings, "db_slow_query_threshold", 0.5),
+                n_plus_one_threshold=getattr(self._settings, "db_n_plus_one_threshold", 10),
+            )
+        self._instrumentation.attach(engine)
+
     async def _build_database_url(self) -> str:
         """Build database URL from configuration with safe credential quoting."""
         # Use explicit database_url if provided (assumed complete)
@@ -405,8 +426,24 @@ class DatabaseManager:
         else:
             info["metrics_available"] = False
 
+        if self._instrumentation is not None:
+            info["wait"] = self._instrumentation.pool_wait_summary()
+
         return info
 
+    def get_query_stats(self, limit: int = 20) -> dict[str, Any]:
+        """Get per-fingerprint query statistics.
+
+        Args:
+            limit: Maximum number of fingerprints to report
+
+        Returns:
+            Query statistics, or ``{"enabled": False}`` without instrumentation
+        """
+        if self._instrumentation is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._instrumentation.get_stats(limit)}
+
     # Alias for compatibility with tests
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
         """Alias for get_session for test compatibility."""
@@ -420,6 +457,8 @@ class DatabaseManager:
     async def _cleanup(self) -> None:
         """Internal cleanup method."""
         if self._engine:
+            if self._instrumentation is not None:
+                self._instrumentation.detach()
             await self._engine.dispose()
             self._engine = None
             self._session_factory = None
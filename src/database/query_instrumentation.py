@@ -0,0 +1,399 @@
+"""SQLAlchemy query instrumentation for slow-query and N+1 detection.
+
+``QueryInstrumentation`` attaches to an engine through SQLAlchemy's cursor
+execution events and records, per statement fingerprint, a latency histogram,
+error count and slow executions. Results are exported to the metrics registry
+and summarized by ``DatabaseManager.get_query_stats``.
+
+Fingerprints:
+    Statements are normalized - comments removed, literals and bind
+    parameters replaced with ``?``, ``IN`` lists collapsed and whitespace
+    squeezed - so executions of the same query with different values share a
+    fingerprint. Normalization is cached per statement text.
+
+Pool wait:
+    Time spent acquiring a connection (waiting for a free pooled connection or
+    opening a new one) is measured separately from statement execution by
+    timing the engine's ``raw_connection``.
+
+Request scopes:
+    ``query_scope`` collects the statements executed within one unit of work;
+    ``QueryScopeMiddleware`` opens a scope per HTTP request. A fingerprint
+    executed ``n_plus_one_threshold`` times in one scope is reported once as a
+    likely N+1 pattern.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+import hashlib
+import logging
+import re
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.utils.metrics_registry import get_metrics_registry
+from src.utils.quantile_sketch import QuantileSketch
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_SECONDS = 0.5
+DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+DEFAULT_MAX_FINGERPRINTS = 500
+OVERFLOW_FINGERPRINT_ID = "other"
+
+_QUERY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_query_duration = get_metrics_registry().histogram(
+    "database_query_duration_seconds",
+    "Database statement execution time by fingerprint",
+    ("fingerprint", "operation"),
+    buckets=_QUERY_BUCKETS,
+)
+_pool_wait = get_metrics_registry().histogram(
+    "database_pool_wait_seconds",
+    "Time spent acquiring a database connection from the pool",
+    buckets=_QUERY_BUCKETS,
+)
+_query_errors = get_metrics_registry().counter(
+    "database_query_errors",
+    "Database statements that raised an error",
+    ("fingerprint",),
+)
+_slow_queries = get_metrics_registry().counter(
+    "database_slow_queries",
+    "Database statements slower than the slow query threshold",
+    ("fingerprint",),
+)
+_n_plus_one = get_metrics_registry().counter(
+    "database_n_plus_one",
+    "Request scopes that repeated a statement fingerprint past the N+1 threshold",
+    ("fingerprint",),
+)
+
+_COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_BIND_PATTERN = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+")
+_NUMBER_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_IN_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_START_TIMES_KEY = "query_instrumentation_start_times"
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_statement(statement: str) -> str:
+    """Normalize a SQL statement so executions with different values match.
+
+    Args:
+        statement: SQL text as sent to the driver
+
+    Returns:
+        str: Statement with literals and parameters replaced by ``?``
+    """
+    text = _COMMENT_PATTERN.sub(" ", statement)
+    text = _STRING_PATTERN.sub("?", text)
+    text = _BIND_PATTERN.sub("?", text)
+    text = _NUMBER_PATTERN.sub("?", text)
+    text = _WHITESPACE_PATTERN.sub(" ", text).strip()
+    return _IN_LIST_PATTERN.sub("(...)", text)
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """Short stable identifier of a fingerprint, used as a metric label."""
+    return hashlib.sha1(fingerprint.encode("utf-8"), usedforsecurity=False).hexdigest()[:12]
+
+
+@dataclass
+class FingerprintStats:
+    """Execution statistics of one statement fingerprint.
+
+    Attributes:
+        fingerprint: Normalized statement
+        fingerprint_id: Short identifier used as metric label
+        operation: First keyword of the statement (select, insert, ...)
+        count: Executions
+        errors: Executions that raised an error
+        slow: Executions slower than the slow query threshold
+        latency: Execution time distribution in seconds
+    """
+
+    fingerprint: str
+    fingerprint_id: str
+    operation: str
+    count: int = 0
+    errors: int = 0
+    slow: int = 0
+    latency: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the statistics."""
+        summary = self.latency.summary()
+        return {
+            "fingerprint": self.fingerprint,
+            "fingerprint_id": self.fingerprint_id,
+            "operation": self.operation,
+            "count": self.count,
+            "errors": self.errors,
+            "slow": self.slow,
+            "total_seconds": round(self.latency.sum, 6),
+            "p50_seconds": round(summary.get("median", 0.0), 6),
+            "p95_seconds": round(summary.get("p95", 0.0), 6),
+            "max_seconds": round(summary.get("max", 0.0), 6),
+        }
+
+
+@dataclass
+class QueryScope:
+    """Statements executed within one request or unit of work.
+
+    Attributes:
+        name: Scope label, e.g. the request path
+        executions: Executions per fingerprint
+        queries: Total statements executed
+        execution_seconds: Total statement execution time
+        pool_wait_seconds: Total time spent acquiring connections
+        n_plus_one: Fingerprints that crossed the N+1 threshold, in detection order
+    """
+
+    name: str
+    executions: dict[str, int] = field(default_factory=dict)
+    queries: int = 0
+    execution_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    n_plus_one: list[str] = field(default_factory=list)
+
+
+_current_scope: ContextVar[QueryScope | None] = ContextVar("query_scope", default=None)
+
+
+@contextmanager
+def query_scope(name: str) -> Iterator[QueryScope]:
+    """Collect the statements executed in the enclosed block (and tasks it starts).
+
+    Args:
+        name: Scope label used in N+1 reports
+
+    Yields:
+        QueryScope: The scope, updated as statements execute
+    """
+    scope = QueryScope(name)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def get_current_scope() -> QueryScope | None:
+    """Get the innermost active query scope."""
+    return _current_scope.get()
+
+
+class QueryScopeMiddleware:
+    """ASGI middleware that opens a query scope for every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with query_scope(f"{scope.get('method', '')} {scope.get('path', '')}"):
+            await self.app(scope, receive, send)
+
+
+class QueryInstrumentation:
+    """Records statement latency per fingerprint and detects slow queries and N+1 patterns."""
+
+    def __init__(
+        self,
+        slow_query_seconds: float = DEFAULT_SLOW_QUERY_SECONDS,
+        n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD,
+        max_fingerprints: int = DEFAULT_MAX_FINGERPRINTS,
+    ) -> None:
+        """
+        Initialize the instrumentation.
+
+        Args:
+            slow_query_seconds: Executions at least this long are logged and counted as slow
+            n_plus_one_threshold: Executions of one fingerprint in one scope that count as N+1
+            max_fingerprints: Fingerprints tracked individually; further ones share an overflow entry
+        """
+        self.slow_query_seconds = slow_query_seconds
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.max_fingerprints = max_fingerprints
+        self._fingerprints: dict[str, FingerprintStats] = {}
+        self._pool_wait = QuantileSketch()
+        self._lock = threading.Lock()
+        self._engines: list[tuple[Engine, Any]] = []
+        self.n_plus_one_detections = 0
+
+    def attach(self, engine: Engine | AsyncEngine) -> None:
+        """Start instrumenting ``engine``.
+
+        Args:
+            engine: Sync or async SQLAlchemy engine
+        """
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        if any(attached is sync_engine for attached, _ in self._engines):
+            return
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+
+        # Engine.raw_connection is the single point where connections are taken from the pool
+        raw_connection = sync_engine.raw_connection
+
+        def timed_raw_connection() -> Any:
+            start = time.perf_counter()
+            try:
+                return raw_connection()
+            finally:
+                self._record_pool_wait(time.perf_counter() - start)
+
+        sync_engine.raw_connection = timed_raw_connection
+        self._engines.append((sync_engine, raw_connection))
+
+    def detach(self) -> None:
+        """Stop instrumenting every attached engine."""
+        for sync_engine, _ in self._engines:
+            event.remove(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+            event.remove(sync_engine, "handle_error", self._handle_error)
+            del sync_engine.raw_connection
+        self._engines.clear()
+
+    def _before_cursor_execute(self, conn: Any, *_: Any) -> None:
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn: Any, _cursor: Any, statement: str, *_: Any) -> None:
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if start_times:
+            self._record(statement, time.perf_counter() - start_times.pop(), failed=False)
+
+    def _handle_error(self, context: Any) -> None:
+        conn = context.connection
+        start_times = conn.info.get(_START_TIMES_KEY) if conn is not None else None
+        if start_times and context.statement is not None:
+            self._record(context.statement, time.perf_counter() - start_times.pop(), failed=True)
+
+    def _stats_for(self, statement: str) -> FingerprintStats:
+        fingerprint = fingerprint_statement(statement)
+        with self._lock:
+            stats = self._fingerprints.get(fingerprint)
+            if stats is None:
+                if len(self._fingerprints) >= self.max_fingerprints:
+                    stats = self._fingerprints.get(OVERFLOW_FINGERPRINT_ID)
+                    if stats is None:
+                        stats = FingerprintStats(OVERFLOW_FINGERPRINT_ID, OVERFLOW_FINGERPRINT_ID, "other")
+                        self._fingerprints[OVERFLOW_FINGERPRINT_ID] = stats
+                    return stats
+                operation = fingerprint.split(" ", 1)[0].lower() or "other"
+                stats = FingerprintStats(fingerprint, fingerprint_id(fingerprint), operation)
+                self._fingerprints[fingerprint] = stats
+            return stats
+
+    def _record(self, statement: str, elapsed: float, failed: bool) -> None:
+        stats = self._stats_for(statement)
+        slow = elapsed >= self.slow_query_seconds
+        with self._lock:
+            stats.count += 1
+            stats.latency.add(elapsed)
+            if failed:
+                stats.errors += 1
+            if slow:
+                stats.slow += 1
+        _query_duration.labels(stats.fingerprint_id, stats.operation).observe(elapsed)
+        if failed:
+            _query_errors.labels(stats.fingerprint_id).inc()
+        if slow:
+            _slow_queries.labels(stats.fingerprint_id).inc()
+            logger.warning("Slow query (%.3fs) [%s]: %s", elapsed, stats.fingerprint_id, stats.fingerprint)
+
+        scope = _current_scope.get()
+        if scope is None:
+            return
+        scope.queries += 1
+        scope.execution_seconds += elapsed
+        executions = scope.executions.get(stats.fingerprint, 0) + 1
+        scope.executions[stats.fingerprint] = executions
+        if executions == self.n_plus_one_threshold:
+            scope.n_plus_one.append(stats.fingerprint)
+            with self._lock:
+                self.n_plus_one_detections += 1
+            _n_plus_one.labels(stats.fingerprint_id).inc()
+            logger.warning(
+                "Possible N+1 query in %s: [%s] executed %s times: %s",
+                scope.name,
+                stats.fingerprint_id,
+                executions,
+                stats.fingerprint,
+            )
+
+    def _record_pool_wait(self, elapsed: float) -> None:
+        with self._lock:
+            self._pool_wait.add(elapsed)
+        _pool_wait.observe(elapsed)
+        scope = _current_scope.get()
+        if scope is not None:
+            scope.pool_wait_seconds += elapsed
+
+    def pool_wait_summary(self) -> dict[str, float]:
+        """Summarize connection acquisition times in seconds."""
+        with self._lock:
+            return self._pool_wait.summary()
+
+    def get_stats(self, limit: int = 20) -> dict[str, Any]:
+        """Report the most expensive fingerprints and pool wait times.
+
+        Args:
+            limit: Maximum number of fingerprints to include
+
+        Returns:
+            Dict[str, Any]: Fingerprints ordered by total execution time, and summaries
+        """
+        with self._lock:
+            fingerprints = sorted(self._fingerprints.values(), key=lambda stats: stats.latency.sum, reverse=True)
+            report = [stats.to_dict() for stats in fingerprints[:limit]]
+            queries = sum(stats.count for stats in fingerprints)
+            execution_seconds = sum(stats.latency.sum for stats in fingerprints)
+            pool_wait = self._pool_wait.summary()
+            n_plus_one = self.n_plus_one_detections
+        return {
+            "queries": queries,
+            "fingerprints": len(fingerprints),
+            "execution_seconds": round(execution_seconds, 6),
+            "pool_wait": pool_wait,
+            "n_plus_one_detections": n_plus_one,
+            "slow_query_seconds": self.slow_query_seconds,
+            "top_fingerprints": report,
+        }
+
+    def reset(self) -> None:
+        """Forget all recorded statistics."""
+        with self._lock:
+            self._fingerprints.clear()
+            self._pool_wait.clear()
+            self.n_plus_one_detections = 0
+
+
+__all__ = [
+    "FingerprintStats",
+    "QueryInstrumentation",
+    "QueryScope",
+    "QueryScopeMiddleware",
+    "fingerprint_id",
+    "fingerprint_statement",
+    "get_current_scope",
+    "query_scope",
+]
@@ -7,6 +7,7 @@ for the application with comprehensive security hardening.
 Note: Security configuration uses environment variables for flexible deployment.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 import logging
@@ -15,7 +16,6 @@ from typing import Any
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.agents.discovery import AgentDiscoverySystem, AgentResourceManager, DynamicAgentLoader
 from src.api.hybrid_infrastructure_endpoints import register_hybrid_infrastructure_routes
 
 # AUTH-4 Router imports removed - complex authentication system cleaned up
@@ -38,17 +38,27 @@ from src.config.settings import (
     ConfigurationValidationError,
     get_settings,
 )
+from src.database.query_instrumentation import QueryScopeMiddleware
 
 # Hybrid infrastructure imports
 from src.mcp_integration.config_manager import MCPConfigurationManager
 
 # Security imports
-from src.security.audit_logging import AuditEventSeverity, AuditEventType, audit_logger_instance
+from src.security.audit_logging import (
+    AuditEventSeverity,
+    AuditEventType,
+    audit_logger_instance,
+    configure_audit_sink,
+    shutdown_audit_sink,
+)
 from src.security.error_handlers import setup_secure_error_handlers
 from src.security.input_validation import SecureQueryParams, SecureTextInput
 from src.security.middleware import setup_security_middleware
 from src.security.rate_limiting import RateLimits, rate_limit, setup_rate_limiting
 from src.utils.circuit_breaker import get_all_circuit_breakers
+from src.utils.lazy_import import lazy_import
+from src.utils.resource_catalog import DEFAULT_SNAPSHOT_PATH as RESOURCE_CATALOG_SNAPSHOT_PATH, get_resource_catalog
+from src.utils.startup_profiler import get_startup_profiler
 
 
 # Configure logging
@@ -58,6 +68,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Agent discovery (YAML parsing, agent base classes) is only needed once the lifespan runs
+agent_discovery_module = lazy_import("src.agents.discovery")
+
+startup_profiler = get_startup_profiler()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -76,7 +91,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     try:
         # Load and validate configuration on startup
-        settings = get_settings(validate_on_startup=True)
+        with startup_profiler.step("lifespan.settings"):
+            settings = get_settings(validate_on_startup=True)
         logger.info(
             "Application started successfully: %s v%s (%s)",
             settings.app_name,
@@ -86,25 +102,38 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         # Store settings in app state for access in endpoints
         app.state.settings = settings
+
+        # Move audit event formatting and I/O off the request path if enabled
+        with startup_profiler.step("lifespan.audit_sink"):
+            configure_audit_sink(settings)
         
         # Initialize hybrid infrastructure
         logger.info("Initializing hybrid infrastructure...")
         
         # Initialize MCP configuration manager with discovery
-        app.state.mcp_manager = MCPConfigurationManager(enable_discovery=True)
+        with startup_profiler.step("lifespan.mcp_manager"):
+            app.state.mcp_manager = MCPConfigurationManager(enable_discovery=True)
         logger.info("MCP configuration manager initialized")
         
+        # Reuse parsed commands, scripts and standards across restarts
+        get_resource_catalog(snapshot_path=RESOURCE_CATALOG_SNAPSHOT_PATH)
+
         # Initialize agent discovery and resource management
-        app.state.agent_discovery = AgentDiscoverySystem()
-        app.state.agent_resource_manager = AgentResourceManager()
-        app.state.agent_loader = DynamicAgentLoader(
-            app.state.agent_discovery,
-            app.state.agent_resource_manager,
-        )
+        with startup_profiler.step("lifespan.agent_discovery"):
+            app.state.agent_discovery = agent_discovery_module.AgentDiscoverySystem(
+                snapshot_path=agent_discovery_module.DEFAULT_SNAPSHOT_PATH,
+            )
+            app.state.agent_discovery.start_watching()
+            app.state.agent_resource_manager = agent_discovery_module.AgentResourceManager()
+            app.state.agent_loader = agent_discovery_module.DynamicAgentLoader(
+                app.state.agent_discovery,
+                app.state.agent_resource_manager,
+            )
         logger.info("Agent discovery system initialized")
         
         # Log available agents
-        available_agents = app.state.agent_discovery.get_available_agents()
+        with startup_profiler.step("lifespan.agent_scan"):
+            available_agents = app.state.agent_discovery.get_available_agents()
         logger.info(f"Found {len(available_agents)} available agents: {available_agents[:10]}...")
 
         # Log application startup audit event
@@ -162,12 +191,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             except Exception as e:
                 logger.warning(f"Failed to get resource usage during shutdown: {e}")
         
+        if hasattr(app.state, "agent_discovery"):
+            try:
+                app.state.agent_discovery.close()
+            except Exception as e:
+                logger.warning("Failed to close agent discovery during shutdown: %s", e)
+
+        if hasattr(app.state, "auth_session_manager"):
+            try:
+                await asyncio.to_thread(app.state.auth_session_manager.close)
+            except Exception as e:
+                logger.warning("Failed to close auth session manager during shutdown: %s", e)
+        
         # Log application shutdown
         audit_logger_instance.log_security_event(
             AuditEventType.ADMIN_SYSTEM_SHUTDOWN,
             "Application shutdown initiated",
             severity=AuditEventSeverity.MEDIUM,
         )
+        shutdown_audit_sink()
         logger.info("PromptCraft-Hybrid application shutdown complete")
 
 
@@ -210,9 +252,14 @@ def create_app() -> FastAPI:
     # 3. Setup security middleware (headers, logging)
     setup_security_middleware(app)
 
+    # 3.1. Group database statements per request for N+1 detection
+    app.add_middleware(QueryScopeMiddleware)
+
     # 3.5. Setup simplified authentication middleware
     try:
-        setup_auth_middleware(app)
+        auth_middleware = setup_auth_middleware(app)
+        if auth_middleware is not None:
+            app.state.auth_session_manager = auth_middleware.session_manager
         logger.info("Simplified authentication middleware configured successfully")
     except Exception as e:
         logger.warning("Authentication middleware setup failed (continuing without auth): %s", e)
@@ -244,17 +291,19 @@ def create_app() -> FastAPI:
         from src.api.auth_endpoints import audit_router, auth_router, system_router  # noqa: PLC0415
         from src.api.role_endpoints import role_router  # noqa: PLC0415
         from src.api.routers.create_core import router as create_router  # noqa: PLC0415
+        from src.api.routers.monitoring import metrics_router  # noqa: PLC0415
 
         app.include_router(auth_router)
         app.include_router(system_router)
         app.include_router(audit_router)
         app.include_router(role_router)
         app.include_router(create_router)
+        app.include_router(metrics_router)
         
         # Register hybrid infrastructure routes
         register_hybrid_infrastructure_routes(app)
 
-        logger.info("API routers configured: auth, system, audit, roles, create, hybrid-infrastructure")
+        logger.info("API routers configured: auth, system, audit, roles, create, metrics, hybrid-infrastructure")
     except ImportError as e:
         logger.warning("Some API routers could not be imported (continuing without them): %s", e)
 
@@ -264,7 +313,8 @@ def create_app() -> FastAPI:
 
 
 # Create the FastAPI application instance
-app = create_app()
+with startup_profiler.step("create_app"):
+    app = create_app()
 
 
 @app.get("/health", response_model=dict[str, Any])
@@ -65,32 +65,70 @@ Time Complexity: O(1) for connection management, O(n) for message processing
 Space Complexity: O(k) where k is the number of active MCP connections
 """
 
-from .client import MCPClient
-from .config_manager import MCPConfigurationManager
-from .docker_mcp_client import DockerMCPClient
-from .hybrid_router import (
-    HybridRouter,
-    RoutingDecision,
-    RoutingMetrics,
-    RoutingStrategy,
-)
-from .mcp_client import (
-    MCPClientFactory,
-    MCPClientInterface,
-    MCPConnectionError,
-    MCPConnectionManager,
-    MCPConnectionState,
-    MCPError,
-    MCPErrorType,
-    MCPHealthStatus,
-    MCPRateLimitError,
-    MCPServiceUnavailableError,
-    MCPTimeoutError,
-    MockMCPClient,
-    ZenMCPClient,
-)
-from .openrouter_client import OpenRouterClient
-from .parallel_executor import ParallelSubagentExecutor
+from typing import TYPE_CHECKING
+
+from src.utils.lazy_import import lazy_exports
+
+
+# Submodules are imported when one of their names is first used, so importing a
+# single submodule (e.g. config_manager) does not load the whole MCP stack
+_EXPORTS = {
+    "MCPClient": ".client",
+    "MCPConfigurationManager": ".config_manager",
+    "DockerMCPClient": ".docker_mcp_client",
+    "HybridRouter": ".hybrid_router",
+    "RoutingDecision": ".hybrid_router",
+    "RoutingMetrics": ".hybrid_router",
+    "RoutingStrategy": ".hybrid_router",
+    "MCPClientFactory": ".mcp_client",
+    "MCPClientInterface": ".mcp_client",
+    "MCPConnectionError": ".mcp_client",
+    "MCPConnectionManager": ".mcp_client",
+    "MCPConnectionState": ".mcp_client",
+    "MCPError": ".mcp_client",
+    "MCPErrorType": ".mcp_client",
+    "MCPHealthStatus": ".mcp_client",
+    "MCPRateLimitError": ".mcp_client",
+    "MCPServiceUnavailableError": ".mcp_client",
+    "MCPTimeoutError": ".mcp_client",
+    "MockMCPClient": ".mcp_client",
+    "ZenMCPClient": ".mcp_client",
+    "ModelCapabilities": ".model_registry",
+    "ModelRegistry": ".model_registry",
+    "OpenRouterClient": ".openrouter_client",
+    "ParallelSubagentExecutor": ".parallel_executor",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .client import MCPClient
+    from .config_manager import MCPConfigurationManager
+    from .docker_mcp_client import DockerMCPClient
+    from .hybrid_router import (
+        HybridRouter,
+        RoutingDecision,
+        RoutingMetrics,
+        RoutingStrategy,
+    )
+    from .mcp_client import (
+        MCPClientFactory,
+        MCPClientInterface,
+        MCPConnectionError,
+        MCPConnectionManager,
+        MCPConnectionState,
+        MCPError,
+        MCPErrorType,
+        MCPHealthStatus,
+        MCPRateLimitError,
+        MCPServiceUnavailableError,
+        MCPTimeoutError,
+        MockMCPClient,
+        ZenMCPClient,
+    )
+    from .model_registry import ModelCapabilities, ModelRegistry
+    from .openrouter_client import OpenRouterClient
+    from .parallel_executor import ParallelSubagentExecutor
 
 
 __all__ = [
@@ -22,6 +22,16 @@ Architecture:
     - Circuit breaker state
     - Performance metrics and SLA requirements
 
+Adaptive Routing:
+    When enabled, every orchestration outcome updates decaying latency and
+    error-rate estimates per backend and per model (see routing_performance).
+    The OpenRouter share of traffic then moves toward the backend with the lower
+    expected time to a successful response, by at most the configured maximum
+    shift and never above the gradual-rollout percentage. Tail latency drops as
+    soon as one backend degrades, before a circuit breaker would trip. Under a
+    primary strategy, a small exploration share keeps the secondary backend's
+    estimate fresh so a slow primary can be detected.
+
 Time Complexity: O(1) for routing decisions, O(n) for workflow orchestration
 Space Complexity: O(k) where k is the number of active connections
 """
@@ -47,12 +57,14 @@ from src.mcp_integration.mcp_client import (
     ZenMCPClient,
 )
 from src.mcp_integration.openrouter_client import OpenRouterClient
+from src.mcp_integration.routing_performance import AdaptiveRoutingConfig, BackendPerformanceTracker, adaptive_share
 from src.utils.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerState,
     get_circuit_breaker,
 )
 from src.utils.logging_mixin import LoggerMixin
+from src.utils.metrics_registry import get_metrics_registry
 
 
 # Routing constants
@@ -108,6 +120,7 @@ class RoutingMetrics:
     fallback_uses: int = 0
     average_response_time: float = 0.0
     last_updated: float = field(default_factory=time.time)
+    backend_performance: BackendPerformanceTracker = field(default_factory=BackendPerformanceTracker)
 
     @property
     def success_rate(self) -> float:
@@ -130,6 +143,21 @@ class RoutingMetrics:
             return 0.0
         return (self.fallback_uses / self.total_requests) * 100.0
 
+    def record_outcome(self, service: str, response_time: float, success: bool, responses: list[Response]) -> None:
+        """Feed a routed request's outcome into the decaying backend and model estimates.
+
+        Args:
+            service: Service that handled the request ("openrouter" or "mcp")
+            response_time: Time spent on that service in seconds
+            success: Whether the service returned responses
+            responses: Responses returned by the service, used for per-model estimates
+        """
+        self.backend_performance.record_service(service, response_time, success)
+        for response in responses:
+            model_id = response.metadata.get("model_id")
+            if model_id:
+                self.backend_performance.record_model(model_id, response.processing_time, response.success)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert metrics to dictionary for monitoring/logging."""
         return {
@@ -144,9 +172,24 @@ class RoutingMetrics:
             "fallback_rate": self.fallback_rate,
             "average_response_time": self.average_response_time,
             "last_updated": self.last_updated,
+            "backend_performance": self.backend_performance.to_dict(),
         }
 
 
+# Incremented where requests are routed, so exported totals never go down when a router is discarded or reset
+_routing_requests = get_metrics_registry().counter(
+    "routing_requests",
+    "Routed requests by backend service",
+    ("strategy", "service"),
+)
+_routing_outcomes = get_metrics_registry().counter(
+    "routing_outcomes",
+    "Routing outcomes",
+    ("strategy", "outcome"),
+)
+_OUTCOME_FIELDS = {"success": "successful_routes", "failure": "failed_routes", "fallback": "fallback_uses"}
+
+
 class HybridRouter(MCPClientInterface, LoggerMixin):
     """
     Hybrid Router for intelligent routing between OpenRouter and MCP services.
@@ -162,6 +205,7 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
         - Comprehensive metrics collection and monitoring
         - Seamless fallback between OpenRouter and MCP services
         - Load balancing and capability-based routing
+        - Optional latency- and error-aware adaptive traffic shifting
     """
 
     def __init__(
@@ -170,6 +214,8 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
         mcp_client: MCPClientInterface | None = None,
         strategy: RoutingStrategy = RoutingStrategy.OPENROUTER_PRIMARY,
         enable_gradual_rollout: bool = True,
+        enable_adaptive_routing: bool | None = None,
+        adaptive_config: AdaptiveRoutingConfig | None = None,
     ) -> None:
         """
         Initialize HybridRouter with service clients and routing configuration.
@@ -179,6 +225,9 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
             mcp_client: MCP client (if None, creates ZenMCPClient)
             strategy: Routing strategy to use
             enable_gradual_rollout: Whether to use gradual rollout configuration
+            enable_adaptive_routing: Whether to shift traffic based on backend performance
+                                     (if None, uses the hybrid_routing_adaptive_enabled setting)
+            adaptive_config: Adaptive routing bounds (if None, built from settings)
         """
         self.logger = logging.getLogger(__name__)
         self.logger.info("Initializing HybridRouter with hybrid routing capabilities")
@@ -206,8 +255,18 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
         if settings.circuit_breaker_enabled:
             self.circuit_breaker = get_circuit_breaker("openrouter", settings)
 
+        # Adaptive routing configuration
+        settings_adaptive = getattr(settings, "hybrid_routing_adaptive_enabled", False) is True
+        self.adaptive_routing = settings_adaptive if enable_adaptive_routing is None else enable_adaptive_routing
+        if adaptive_config is None and settings_adaptive:
+            adaptive_config = AdaptiveRoutingConfig(
+                half_life_seconds=settings.hybrid_routing_half_life_seconds,
+                max_shift=settings.hybrid_routing_max_traffic_shift / MAX_TRAFFIC_PERCENTAGE,
+            )
+        self.adaptive_config = adaptive_config or AdaptiveRoutingConfig()
+
         # Metrics and monitoring
-        self.metrics = RoutingMetrics()
+        self.metrics = self._new_metrics()
         self.connection_state = MCPConnectionState.DISCONNECTED
         self.error_count = 0
         self.last_successful_request: float | None = None
@@ -218,7 +277,8 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
         self.logger.info(
             f"HybridRouter initialized: strategy={self.strategy.value}, "
             f"openrouter_traffic={self.openrouter_traffic_percentage}%, "
-            f"circuit_breaker_enabled={self.circuit_breaker is not None}",
+            f"circuit_breaker_enabled={self.circuit_breaker is not None}, "
+            f"adaptive_routing={self.adaptive_routing}",
         )
 
     async def connect(self) -> bool:
@@ -433,7 +493,7 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
             # Try fallback if available
             if routing_decision.fallback_available:
                 self.logger.warning(f"Query validation failed on {routing_decision.service}, trying fallback: {e}")
-                self.metrics.fallback_uses += 1
+                self._count_outcome("fallback")
 
                 try:
                     if routing_decision.service == "openrouter":
@@ -444,7 +504,7 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
 
             # All validation attempts failed
             self.error_count += 1
-            self.metrics.failed_routes += 1
+            self._count_outcome("failure")
             raise MCPError(
                 f"Query validation failed on all services: {e}",
                 MCPErrorType.VALIDATION_ERROR,
@@ -480,40 +540,55 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
         try:
             # Execute on primary service
             if routing_decision.service == "openrouter":
-                self.metrics.openrouter_requests += 1
+                self._count_request("openrouter")
                 responses = await self.openrouter_client.orchestrate_agents(workflow_steps)
             else:
-                self.metrics.mcp_requests += 1
+                self._count_request("mcp")
                 responses = await self.mcp_client.orchestrate_agents(workflow_steps)
 
             # Update success metrics
-            self.metrics.successful_routes += 1
+            self._count_outcome("success")
             self.last_successful_request = time.time()
 
             # Update average response time
             response_time = time.time() - start_time
             self._update_average_response_time(response_time)
+            self.metrics.record_outcome(
+                routing_decision.service,
+                response_time,
+                self._responses_succeeded(responses),
+                responses,
+            )
 
             return responses
 
         except Exception as e:
             self.logger.warning(f"Orchestration failed on {routing_decision.service}: {e}")
+            self.metrics.record_outcome(routing_decision.service, time.time() - start_time, False, [])
 
             # Try fallback if available
             if routing_decision.fallback_available:
                 self.logger.info("Attempting fallback orchestration")
-                self.metrics.fallback_uses += 1
+                self._count_outcome("fallback")
+                fallback_service = "mcp" if routing_decision.service == "openrouter" else "openrouter"
+                fallback_start = time.time()
 
                 try:
-                    if routing_decision.service == "openrouter":
-                        self.metrics.mcp_requests += 1
+                    if fallback_service == "mcp":
+                        self._count_request("mcp")
                         responses = await self.mcp_client.orchestrate_agents(workflow_steps)
                     else:
-                        self.metrics.openrouter_requests += 1
+                        self._count_request("openrouter")
                         responses = await self.openrouter_client.orchestrate_agents(workflow_steps)
+                    self.metrics.record_outcome(
+                        fallback_service,
+                        time.time() - fallback_start,
+                        self._responses_succeeded(responses),
+                        responses,
+                    )
 
                     # Update success metrics for fallback
-                    self.metrics.successful_routes += 1
+                    self._count_outcome("success")
                     self.last_successful_request = time.time()
 
                     response_time = time.time() - start_time
@@ -524,10 +599,11 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
 
                 except Exception as fallback_error:
                     self.logger.error(f"Fallback orchestration also failed: {fallback_error}")
+                    self.metrics.record_outcome(fallback_service, time.time() - fallback_start, False, [])
 
             # All orchestration attempts failed
             self.error_count += 1
-            self.metrics.failed_routes += 1
+            self._count_outcome("failure")
 
             if isinstance(e, MCPError):
                 raise
@@ -581,7 +657,7 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
 
         return sorted(capabilities)
 
-    def _make_routing_decision(  # noqa: PLR0911
+    def _make_routing_decision(  # noqa: PLR0911, PLR0912
         self,
         request_id: str,
         operation: str,
@@ -602,13 +678,14 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
         if self.enable_gradual_rollout and self.openrouter_traffic_percentage > 0:
             # Use deterministic hash-based routing for consistency
             hash_value = zlib.crc32(request_id.encode()) % 100
+            traffic_percentage, label = self._rollout_traffic_percentage()
 
-            if hash_value < self.openrouter_traffic_percentage:
+            if hash_value < traffic_percentage:
                 # Route to OpenRouter based on percentage
                 if self._is_openrouter_available():
                     return RoutingDecision(
                         service="openrouter",
-                        reason=f"Gradual rollout: {hash_value} < {self.openrouter_traffic_percentage}%",
+                        reason=f"{label}: {hash_value} < {traffic_percentage}%",
                         confidence=0.9,
                         fallback_available=True,
                         request_id=request_id,
@@ -616,7 +693,7 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
                 # OpenRouter unavailable, fallback to MCP for this gradual rollout request
                 return RoutingDecision(
                     service="mcp",
-                    reason=f"Gradual rollout: {hash_value} < {self.openrouter_traffic_percentage}% but OpenRouter unavailable, using MCP fallback",
+                    reason=f"{label}: {hash_value} < {traffic_percentage}% but OpenRouter unavailable, using MCP fallback",
                     confidence=0.7,
                     fallback_available=False,
                     request_id=request_id,
@@ -624,12 +701,18 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
             # Route to MCP for remaining traffic
             return RoutingDecision(
                 service="mcp",
-                reason=f"Gradual rollout: {hash_value} >= {self.openrouter_traffic_percentage}%",
+                reason=f"{label}: {hash_value} >= {traffic_percentage}%",
                 confidence=0.9,
                 fallback_available=self._is_openrouter_available(),
                 request_id=request_id,
             )
 
+        # Shift part of a primary strategy's traffic away from a degraded primary
+        if self.adaptive_routing and self.strategy in (RoutingStrategy.OPENROUTER_PRIMARY, RoutingStrategy.MCP_PRIMARY):
+            adaptive_decision = self._make_adaptive_decision(request_id)
+            if adaptive_decision is not None:
+                return adaptive_decision
+
         # Apply routing strategy
         if self.strategy == RoutingStrategy.OPENROUTER_PRIMARY:
             if self._is_openrouter_available():
@@ -738,6 +821,86 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
             request_id=request_id,
         )
 
+    def _openrouter_share(self, baseline: float, ceiling: float) -> float:
+        """Fraction of traffic OpenRouter should receive given current backend estimates."""
+        performance = self.metrics.backend_performance
+        return adaptive_share(
+            baseline,
+            ceiling,
+            performance.service_estimate("openrouter"),
+            performance.service_estimate("mcp"),
+            self.adaptive_config,
+        )
+
+    def _rollout_traffic_percentage(self) -> tuple[int, str]:
+        """OpenRouter rollout percentage after adaptive adjustment, with a label for decision reasons.
+
+        The configured rollout percentage is a ceiling: adaptive routing can only
+        move rollout traffic back to MCP.
+        """
+        percentage = self.openrouter_traffic_percentage
+        if not self.adaptive_routing:
+            return percentage, "Gradual rollout"
+
+        rollout_share = percentage / MAX_TRAFFIC_PERCENTAGE
+        adjusted = round(self._openrouter_share(rollout_share, rollout_share) * MAX_TRAFFIC_PERCENTAGE)
+        if adjusted == percentage:
+            return percentage, "Gradual rollout"
+        return adjusted, f"Adaptive rollout (configured {percentage}%)"
+
+    @staticmethod
+    def _responses_succeeded(responses: list[Response]) -> bool:
+        """Whether a backend answered every workflow step without reporting an error."""
+        return all(response.success for response in responses)
+
+    def _make_adaptive_decision(self, request_id: str) -> RoutingDecision | None:
+        """Route a request away from the strategy's primary service if it has degraded.
+
+        While the secondary service lacks enough recent observations to be
+        compared, a small exploration share of traffic is sent to it so its
+        estimate stays current.
+
+        Returns:
+            RoutingDecision for the secondary service, or None to apply the strategy as usual
+        """
+        primary = "openrouter" if self.strategy == RoutingStrategy.OPENROUTER_PRIMARY else "mcp"
+        secondary = "mcp" if primary == "openrouter" else "openrouter"
+        baseline = 1.0 if primary == "openrouter" else 0.0
+        share = self._openrouter_share(baseline, 1.0)
+        shifted_percentage = round(abs(share - baseline) * MAX_TRAFFIC_PERCENTAGE)
+        label = f"{primary} degraded"
+
+        secondary_estimate = self.metrics.backend_performance.service_estimate(secondary)
+        secondary_samples = secondary_estimate.current_weight(time.time()) if secondary_estimate else 0.0
+        if secondary_samples < self.adaptive_config.min_samples:
+            exploration_percentage = round(self.adaptive_config.exploration_share * MAX_TRAFFIC_PERCENTAGE)
+            if exploration_percentage > shifted_percentage:
+                shifted_percentage, label = exploration_percentage, f"exploring {secondary}"
+        if shifted_percentage == 0:
+            return None
+
+        # Hash buckets below the shifted percentage go to the secondary service
+        hash_value = zlib.crc32(request_id.encode()) % 100
+        if hash_value >= shifted_percentage:
+            return None
+
+        if primary == "openrouter":
+            if not self._is_mcp_available():
+                return None
+            service, fallback_available = "mcp", self._is_openrouter_available()
+        else:
+            if not self._is_openrouter_available():
+                return None
+            service, fallback_available = "openrouter", True
+
+        return RoutingDecision(
+            service=service,
+            reason=f"Adaptive routing: {label}, {hash_value} < {shifted_percentage}% shifted to {service}",
+            confidence=0.8,
+            fallback_available=fallback_available,
+            request_id=request_id,
+        )
+
     def _is_openrouter_available(self) -> bool:
         """Check if OpenRouter is available (circuit breaker and connection)."""
         # Check circuit breaker state
@@ -777,9 +940,27 @@ class HybridRouter(MCPClientInterface, LoggerMixin):
         """Get current routing metrics for monitoring."""
         return self.metrics.to_dict()
 
+    def _count_request(self, service: str) -> None:
+        """Count a request sent to ``service`` in the router's metrics and the metrics registry."""
+        if service == "openrouter":
+            self.metrics.openrouter_requests += 1
+        else:
+            self.metrics.mcp_requests += 1
+        _routing_requests.labels(self.strategy.value, service).inc()
+
+    def _count_outcome(self, outcome: str) -> None:
+        """Count a routing outcome ("success", "failure" or "fallback")."""
+        name = _OUTCOME_FIELDS[outcome]
+        setattr(self.metrics, name, getattr(self.metrics, name) + 1)
+        _routing_outcomes.labels(self.strategy.value, outcome).inc()
+
+    def _new_metrics(self) -> RoutingMetrics:
+        """Create empty routing metrics using the configured estimate half-life."""
+        return RoutingMetrics(backend_performance=BackendPerformanceTracker(self.adaptive_config.half_life_seconds))
+
     def reset_metrics(self) -> None:
         """Reset routing metrics (useful for testing)."""
-        self.metrics = RoutingMetrics()
+        self.metrics = self._new_metrics()
         self.logger.info("Routing metrics reset")
 
     def set_traffic_percentage(self, percentage: int) -> None:
@@ -53,9 +53,19 @@ Example Usage:
     selected = registry.select_best_model("reasoning", allow_premium=False)
     ```
 
-Complexity: O(1) for model lookups, O(n) for fallback chain processing where n is chain length
+Selection Table:
+    Model selection depends only on registry state, so the registry compiles a
+    table from (user tier, task type, context-length bucket) to an ordered
+    candidate list when it loads, and rebuilds it whenever models are added,
+    removed or marked unavailable. ``select_best_model`` and
+    ``select_best_model_for_tier`` then return the first still-available
+    candidate instead of rescanning and re-filtering the fallback chains.
+
+Complexity: O(1) for model lookups and compiled selections, O(n) for fallback chain processing
+where n is chain length
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 import logging
 import os
@@ -72,6 +82,9 @@ logger = logging.getLogger(__name__)
 
 # Model registry constants
 MAX_FALLBACK_DEPTH = 10  # Maximum depth for fallback chains to prevent infinite loops
+ULTIMATE_FALLBACK_MODEL = "deepseek/deepseek-chat-v3-0324:free"  # Always a free model
+# Task types with their own selection rules; any other task type shares one table entry
+SELECTION_TASK_TYPES = frozenset({"reasoning", "analysis", "planning", "general", "vision", "complex"})
 
 
 class UserTierFilter:
@@ -215,6 +228,22 @@ class ModelCapabilities:
         return (self.cost_per_input_token + self.cost_per_output_token) * 1000
 
 
+@dataclass(frozen=True)
+class SelectionEntry:
+    """Precompiled selection result for one selection table key.
+
+    Attributes:
+        candidates: Model IDs in selection order
+        preferred: Number of leading candidates that fully match the request;
+            the remaining ones are fallbacks
+        fallback: Model returned when no candidate is available
+    """
+
+    candidates: tuple[str, ...]
+    preferred: int
+    fallback: str
+
+
 class ModelRegistryConfig(BaseModel):
     """Configuration for ModelRegistry with validation.
 
@@ -276,6 +305,10 @@ class ModelRegistry:
         self.logger = logging.getLogger(__name__ + ".ModelRegistry")
         self._models: dict[str, ModelCapabilities] = {}
         self._fallback_chains: dict[str, list[str]] = {}
+        self._context_buckets: list[int] = []
+        self._selection_table: dict[tuple[bool, str | None, int], SelectionEntry] = {}
+        self._tier_selection_table: dict[tuple[str, str | None, int], SelectionEntry] = {}
+        self._default_model = ULTIMATE_FALLBACK_MODEL
         self._config: ModelRegistryConfig = self._load_config()
 
         # Determine configuration file path
@@ -290,6 +323,7 @@ class ModelRegistry:
 
         # Load model configurations
         self._load_models()
+        self.rebuild_selection_table()
         self.logger.info(f"ModelRegistry initialized with {len(self._models)} models")
 
     def _load_config(self) -> ModelRegistryConfig:
@@ -526,7 +560,7 @@ class ModelRegistry:
             return available_models[0]
 
         # Ultimate fallback
-        return "deepseek/deepseek-chat-v3-0324:free"
+        return ULTIMATE_FALLBACK_MODEL
 
     def select_best_model(
         self,
@@ -537,7 +571,8 @@ class ModelRegistry:
         """Select the best available model for a task type.
 
         Implements smart model selection similar to smart_model_select()
-        from model_utils.sh with enhanced capability matching.
+        from model_utils.sh with enhanced capability matching. The ranking is
+        precompiled by ``rebuild_selection_table``, so this is a table lookup.
 
         Args:
             task_type: Type of task ("reasoning", "general", "vision", etc.)
@@ -547,6 +582,114 @@ class ModelRegistry:
         Returns:
             Best available model ID
         """
+        entry = self._selection_table.get((bool(allow_premium), *self._selection_key(task_type, max_tokens_needed)))
+        if entry is None:
+            entry = self._rank_models(task_type, allow_premium, max_tokens_needed)
+
+        model_id, is_fallback = self._pick_candidate(entry)
+        if is_fallback:
+            self.logger.warning(f"Using fallback model {model_id} for task '{task_type}'")
+        return model_id
+
+    def add_model(self, capabilities: ModelCapabilities) -> None:
+        """Add or replace a model and recompile the selection table.
+
+        Args:
+            capabilities: Capabilities of the model to register
+        """
+        self._models[capabilities.model_id] = capabilities
+        self.rebuild_selection_table()
+
+    def remove_model(self, model_id: str) -> bool:
+        """Remove a model and recompile the selection table.
+
+        Args:
+            model_id: Model identifier
+
+        Returns:
+            True if the model was registered
+        """
+        if self._models.pop(model_id, None) is None:
+            return False
+        self.rebuild_selection_table()
+        return True
+
+    def set_model_availability(self, model_id: str, available: bool) -> bool:
+        """Mark a model as available or unavailable for selection.
+
+        Args:
+            model_id: Model identifier
+            available: Whether the model may be selected
+
+        Returns:
+            True if the model is registered
+        """
+        capabilities = self._models.get(model_id)
+        if capabilities is None:
+            return False
+        if capabilities.enabled != available:
+            capabilities.enabled = available
+            self.rebuild_selection_table()
+        return True
+
+    def rebuild_selection_table(self) -> None:
+        """Compile model selections for every task type, user tier and context bucket.
+
+        Context-length buckets are the distinct context windows of the registered
+        models: a request needing ``n`` tokens falls in the bucket of the smallest
+        window that fits it, so every request in a bucket has the same candidates.
+        Code that modifies ``_models`` or ``_fallback_chains`` directly must call
+        this afterwards.
+        """
+        self._default_model = self.convert_model_name("deepseek")
+        context_buckets = sorted({m.context_window for m in self._models.values()})
+        # One representative token requirement per bucket; the last bucket fits no model
+        bucket_tokens = [*context_buckets, context_buckets[-1] + 1 if context_buckets else None]
+        task_types = [*sorted(SELECTION_TASK_TYPES), None]
+
+        selection_table = {
+            (allow_premium, task_type, bucket): self._rank_models(task_type or "", allow_premium, tokens)
+            for allow_premium in (False, True)
+            for task_type in task_types
+            for bucket, tokens in enumerate(bucket_tokens)
+        }
+        self._context_buckets = context_buckets
+        self._selection_table = selection_table
+
+        self._tier_selection_table = {
+            (user_tier, task_type, bucket): self._rank_models_for_tier(user_tier, task_type or "", tokens)
+            for user_tier in UserTierFilter.TIER_CATEGORY_ACCESS
+            for task_type in task_types
+            for bucket, tokens in enumerate(bucket_tokens)
+        }
+        self.logger.debug(
+            f"Compiled {len(self._selection_table) + len(self._tier_selection_table)} model selection entries",
+        )
+
+    def _selection_key(self, task_type: str, max_tokens_needed: int | None) -> tuple[str | None, int]:
+        """Map a request to its (task type, context bucket) selection table key."""
+        task_key = task_type if task_type in SELECTION_TASK_TYPES else None
+        bucket = bisect_left(self._context_buckets, max_tokens_needed) if max_tokens_needed else 0
+        return task_key, bucket
+
+    def _pick_candidate(self, entry: SelectionEntry) -> tuple[str, bool]:
+        """Return the first available candidate and whether it is a fallback."""
+        for position, model_id in enumerate(entry.candidates):
+            if self.is_model_available(model_id):
+                return model_id, position >= entry.preferred
+        return entry.fallback, True
+
+    def _rank_models(self, task_type: str, allow_premium: bool, max_tokens_needed: int | None) -> SelectionEntry:
+        """Rank the fallback chain for a task type by how well each model fits.
+
+        Args:
+            task_type: Type of task ("reasoning", "general", "vision", etc.)
+            allow_premium: Whether to consider paid models
+            max_tokens_needed: Minimum context window required
+
+        Returns:
+            Models meeting every requirement, followed by the rest of the chain
+        """
         # Map task types to categories
         task_to_category = {
             "reasoning": "free_reasoning" if not allow_premium else "premium_reasoning",
@@ -559,7 +702,7 @@ class ModelRegistry:
         category = task_to_category.get(task_type, self._config.default_category)
         candidates = self.get_fallback_chain(category)
 
-        # Apply additional filters
+        preferred = []
         for model_id in candidates:
             capabilities = self._models.get(model_id)
             if not capabilities or not capabilities.enabled:
@@ -580,19 +723,10 @@ class ModelRegistry:
             if task_type == "reasoning" and not capabilities.supports_reasoning:
                 continue
 
-            # Found suitable model
-            self.logger.debug(f"Selected {model_id} for task '{task_type}'")
-            return model_id
+            preferred.append(model_id)
 
-        # Fallback to any available model
-        for model_id in candidates:
-            capabilities = self._models.get(model_id)
-            if capabilities and capabilities.enabled:
-                self.logger.warning(f"Using fallback model {model_id} for task '{task_type}'")
-                return model_id
-
-        # Ultimate fallback
-        return self.convert_model_name("deepseek")
+        remaining = [model_id for model_id in candidates if model_id not in preferred]
+        return SelectionEntry(tuple(preferred + remaining), len(preferred), self._default_model)
 
     def get_rate_limit(self, model_id: str) -> int:
         """Get rate limit for a specific model.
@@ -651,6 +785,7 @@ class ModelRegistry:
         self._fallback_chains.clear()
         self._config = self._load_config()
         self._load_models()
+        self.rebuild_selection_table()
         self.logger.info(f"Reloaded {len(self._models)} models")
 
     def list_models_for_tier(
@@ -691,33 +826,50 @@ class ModelRegistry:
         Returns:
             Model ID string for the best available model
         """
-        # First, get the best model without tier restrictions
-        allow_premium = user_tier in ["admin", "full"]  # Only admin and full users can access premium
-        best_model = self.select_best_model(task_type, allow_premium=allow_premium, max_tokens_needed=max_tokens_needed)
+        entry = self._tier_selection_table.get((user_tier, *self._selection_key(task_type, max_tokens_needed)))
+        if entry is None:
+            entry = self._rank_models_for_tier(user_tier, task_type, max_tokens_needed)
 
-        # Then check if the user can access it
-        if UserTierFilter.can_access_model(best_model, user_tier, self):
-            return best_model
+        model_id, is_fallback = self._pick_candidate(entry)
+        if is_fallback:
+            self.logger.debug(f"Selected fallback model {model_id} for user tier {user_tier}")
+        return model_id
 
-        # If not, get a fallback chain based on tier
-        fallback_chain = self.get_fallback_chain_for_tier(user_tier, task_type)
-
-        for model_id in fallback_chain:
-            if self.is_model_available(model_id):
-                self.logger.debug(f"Selected fallback model {model_id} for user tier {user_tier}")
-                return model_id
+    def _rank_models_for_tier(self, user_tier: str, task_type: str, max_tokens_needed: int | None) -> SelectionEntry:
+        """Rank the models a user tier may use for a task type.
 
-        # Ultimate fallback - ensure it's tier-appropriate
-        ultimate_fallback = "deepseek/deepseek-chat-v3-0324:free"  # Always a free model
-        if UserTierFilter.can_access_model(ultimate_fallback, user_tier, self):
-            return ultimate_fallback
+        Args:
+            user_tier: User tier (admin, full, limited)
+            task_type: Type of task ("reasoning", "general", "vision", etc.)
+            max_tokens_needed: Minimum context window required
 
-        # This should never happen, but return first free model if it does
-        free_models = self.list_models_for_tier(user_tier, category="free_general")
-        if free_models:
-            return free_models[0].model_id
+        Returns:
+            The best model if the tier can access it, followed by the tier's fallback chain
+        """
+        # First, get the best model without tier restrictions
+        allow_premium = user_tier in ["admin", "full"]  # Only admin and full users can access premium
+        entry = self._selection_table.get((allow_premium, *self._selection_key(task_type, max_tokens_needed)))
+        if entry is None:
+            entry = self._rank_models(task_type, allow_premium, max_tokens_needed)
+        best_model, _ = self._pick_candidate(entry)
+
+        # Then check if the user can access it, otherwise use a fallback chain based on tier
+        preferred = [best_model] if UserTierFilter.can_access_model(best_model, user_tier, self) else []
+        fallback_chain = [
+            model_id
+            for model_id in self.get_fallback_chain_for_tier(user_tier, task_type)
+            if model_id not in preferred and self.is_model_available(model_id)
+        ]
 
-        return ultimate_fallback
+        # Ultimate fallback - ensure it's tier-appropriate
+        fallback = ULTIMATE_FALLBACK_MODEL
+        if not UserTierFilter.can_access_model(fallback, user_tier, self):
+            # This should never happen, but use the first free model if it does
+            free_models = self.list_models_for_tier(user_tier, category="free_general")
+            if free_models:
+                fallback = free_models[0].model_id
+
+        return SelectionEntry(tuple(preferred + fallback_chain), len(preferred), fallback)
 
     def get_fallback_chain_for_tier(self, user_tier: str, task_type: str = "general") -> list[str]:
         """Get fallback chain appropriate for user tier.
@@ -14,6 +14,7 @@ Key Features:
     - Proper authentication with API key, HTTP-Referer, and X-Title headers
     - Timeout handling and retry logic
     - Response parsing and validation
+    - Optional hedged requests to the next fallback model for tail-latency control
 
 Architecture:
     The OpenRouterClient translates MCP orchestration requests into OpenRouter API
@@ -44,6 +45,7 @@ Time Complexity: O(1) for single requests, O(n) for n parallel agent requests
 Space Complexity: O(k) where k is the number of concurrent connections
 """
 
+from collections.abc import Awaitable, Callable
 import logging
 import re
 import time
@@ -68,6 +70,7 @@ from src.mcp_integration.mcp_client import (
     WorkflowStep,
 )
 from src.mcp_integration.model_registry import get_model_registry
+from src.mcp_integration.request_hedging import HedgeOutcome, HedgingConfig, RequestHedger
 from src.utils.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerOpenError,
@@ -126,6 +129,7 @@ class OpenRouterClient(MCPClientInterface):
         max_retries: int = 3,
         site_url: str = DEFAULT_SITE_URL,
         app_name: str = DEFAULT_APP_NAME,
+        hedging: HedgingConfig | None = None,
     ) -> None:
         """
         Initialize OpenRouter client with configuration.
@@ -137,6 +141,8 @@ class OpenRouterClient(MCPClientInterface):
             max_retries: Maximum number of retry attempts
             site_url: Site URL for HTTP-Referer header
             app_name: Application name for X-Title header
+            hedging: Hedging configuration; enables hedged requests (if None, uses the
+                     openrouter_hedging_* settings)
         """
         settings = get_settings()
 
@@ -164,6 +170,14 @@ class OpenRouterClient(MCPClientInterface):
         if settings.circuit_breaker_enabled:
             self.circuit_breaker = get_circuit_breaker("openrouter", settings)
 
+        # Opt-in request hedging for tail-latency control
+        if hedging is None and getattr(settings, "openrouter_hedging_enabled", False) is True:
+            hedging = HedgingConfig(
+                percentile=settings.openrouter_hedge_percentile,
+                budget_ratio=settings.openrouter_hedge_budget_percent / 100,
+            )
+        self.hedger: RequestHedger | None = RequestHedger(hedging) if hedging is not None else None
+
         # Validate configuration
         if not self.api_key:
             logger.warning("OpenRouter API key not configured - client will be limited")
@@ -709,46 +723,7 @@ class OpenRouterClient(MCPClientInterface):
             if "frequency_penalty" in step.input_data:
                 payload["frequency_penalty"] = step.input_data["frequency_penalty"]
 
-            # Make API request
-            response = await self.session.post(
-                OPENROUTER_CHAT_ENDPOINT,
-                json=payload,
-                timeout=step.timeout_seconds,
-            )
-
-            # Handle API response
-            if response.status_code == HTTP_OK:
-                result = response.json()
-
-                # Extract response content
-                choices = result.get("choices", [])
-                if not choices:
-                    raise MCPError("No response choices returned", MCPErrorType.INVALID_RESPONSE)
-
-                content = choices[0].get("message", {}).get("content", "")
-
-                # Calculate confidence based on response quality
-                confidence = self._calculate_confidence(result, content)
-
-                processing_time = time.time() - step_start_time
-                self.last_successful_request = time.time()
-
-                return Response(
-                    agent_id=step.agent_id,
-                    content=content,
-                    metadata={
-                        "model_id": model_id,
-                        "usage": result.get("usage", {}),
-                        "step_id": step.step_id,
-                        "task_type": task_type,
-                    },
-                    confidence=confidence,
-                    processing_time=processing_time,
-                    success=True,
-                )
-
-            # Handle HTTP errors
-            await self._handle_api_error(response)
+            return await self._send_completion(step, payload, user_tier, task_type, step_start_time)
 
         except httpx.TimeoutException as e:
             self.error_count += 1
@@ -764,6 +739,149 @@ class OpenRouterClient(MCPClientInterface):
                 raise
             raise MCPServiceUnavailableError(f"OpenRouter step execution failed: {e}") from e
 
+    async def _send_completion(
+        self,
+        step: WorkflowStep,
+        payload: dict[str, Any],
+        user_tier: str,
+        task_type: str,
+        step_start_time: float,
+    ) -> Response:
+        """
+        Send a completion request, hedging it to the next fallback model if it is slow.
+
+        Args:
+            step: Workflow step being executed
+            payload: OpenRouter API payload for the selected model
+            user_tier: User tier, used to pick a hedge model the user may access
+            task_type: Task type recorded in the response metadata
+            step_start_time: Time the step started
+
+        Returns:
+            Response: Response from whichever request succeeded first
+        """
+        model_id = payload["model"]
+
+        def request(target_model: str) -> Callable[[], Awaitable[Response]]:
+            async def _request() -> Response:
+                target_payload = {**payload, "model": target_model}
+                return await self._request_completion(step, target_payload, task_type, step_start_time)
+
+            return _request
+
+        if self.hedger is None:
+            return await request(model_id)()
+
+        hedge_model = self._select_hedge_model(model_id, user_tier)
+        delay = self.hedger.hedge_delay(model_id) if hedge_model else None
+        if hedge_model is None or delay is None:
+            return await self.hedger.timed(model_id, request(model_id))
+
+        response, outcome = await self.hedger.run(
+            lambda: self.hedger.timed(model_id, request(model_id)),
+            lambda: self.hedger.timed(hedge_model, request(hedge_model)),
+            delay,
+        )
+        if outcome in (HedgeOutcome.PRIMARY_WON, HedgeOutcome.HEDGE_WON):
+            response.metadata["hedged"] = True
+            response.metadata["hedge_won"] = outcome == HedgeOutcome.HEDGE_WON
+        return response
+
+    async def _request_completion(
+        self,
+        step: WorkflowStep,
+        payload: dict[str, Any],
+        task_type: str,
+        step_start_time: float,
+    ) -> Response:
+        """
+        Send one chat completion request and convert the result to a Response.
+
+        Args:
+            step: Workflow step being executed
+            payload: OpenRouter API payload
+            task_type: Task type recorded in the response metadata
+            step_start_time: Time the step started
+
+        Returns:
+            Response: AI model response
+
+        Raises:
+            MCPError: If the API returns an error or no choices
+        """
+        response = await self.session.post(
+            OPENROUTER_CHAT_ENDPOINT,
+            json=payload,
+            timeout=step.timeout_seconds,
+        )
+
+        # Handle HTTP errors
+        if response.status_code != HTTP_OK:
+            await self._handle_api_error(response)
+
+        result = response.json()
+
+        # Extract response content
+        choices = result.get("choices", [])
+        if not choices:
+            raise MCPError("No response choices returned", MCPErrorType.INVALID_RESPONSE)
+
+        content = choices[0].get("message", {}).get("content", "")
+
+        # Calculate confidence based on response quality
+        confidence = self._calculate_confidence(result, content)
+
+        processing_time = time.time() - step_start_time
+        self.last_successful_request = time.time()
+
+        return Response(
+            agent_id=step.agent_id,
+            content=content,
+            metadata={
+                "model_id": payload["model"],
+                "usage": result.get("usage", {}),
+                "step_id": step.step_id,
+                "task_type": task_type,
+            },
+            confidence=confidence,
+            processing_time=processing_time,
+            success=True,
+        )
+
+    def _select_hedge_model(self, model_id: str, user_tier: str) -> str | None:
+        """
+        Pick the next fallback model to hedge a request to ``model_id`` with.
+
+        Args:
+            model_id: Model the original request was sent to
+            user_tier: User tier the hedge model must be accessible to
+
+        Returns:
+            Hedge model ID, or None if no fallback is available
+        """
+        capabilities = self.model_registry.get_model_capabilities(model_id)
+        if not capabilities:
+            return None
+        for candidate in capabilities.fallback_models:
+            if (
+                candidate != model_id
+                and self.model_registry.is_model_available(candidate)
+                and self.model_registry.can_user_access_model(user_tier, candidate)
+            ):
+                return candidate
+        return None
+
+    def get_hedging_stats(self) -> dict[str, Any]:
+        """
+        Get hedged request statistics.
+
+        Returns:
+            Dict[str, Any]: How often hedging fired and won, or {"enabled": False}
+        """
+        if self.hedger is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.hedger.stats()}
+
     async def _handle_api_error(self, response: httpx.Response) -> NoReturn:
         """
         Handle OpenRouter API error responses.
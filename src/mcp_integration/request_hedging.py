@@ -0,0 +1,218 @@
+"""Hedged requests for tail-latency control.
+
+A hedged request sends a duplicate to an alternative model when the original
+has not answered within a learned latency percentile for its model. The first
+successful answer wins and the other request is cancelled. Hedging trades a
+small, bounded amount of extra load for a much shorter tail: most requests
+finish before the hedge delay and are never duplicated.
+
+Budget:
+    Every primary request earns ``budget_ratio`` hedge tokens (capped at
+    ``budget_burst``) and every hedge spends one, so over time at most
+    ``budget_ratio`` extra requests are sent per primary request.
+
+Learning:
+    Per-model latencies are kept in rolling quantile sketches. A model is not
+    hedged until it has ``min_samples`` observations inside the window.
+    Requests cancelled because the other side won are recorded with their
+    elapsed time, a lower bound that keeps a slow model's percentile from
+    looking better than it is.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import Enum
+import logging
+import threading
+import time
+from typing import Any, TypeVar
+
+from src.utils.metrics_registry import get_metrics_registry
+from src.utils.quantile_sketch import RollingQuantileSketch
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_hedged_requests = get_metrics_registry().counter(
+    "openrouter_hedged_requests",
+    "OpenRouter requests by hedging outcome",
+    ("outcome",),
+)
+
+
+class HedgeOutcome(str, Enum):
+    """What happened to a request that was eligible for hedging."""
+
+    NOT_HEDGED = "not_hedged"  # Answered (or failed) before the hedge delay
+    BUDGET_EXHAUSTED = "budget_exhausted"  # Slow, but no hedge budget was left
+    PRIMARY_WON = "primary_won"  # Hedge sent, original answered first
+    HEDGE_WON = "hedge_won"  # Hedge sent and answered first
+
+
+@dataclass
+class HedgingConfig:
+    """Hedging thresholds and budget.
+
+    Attributes:
+        percentile: Latency percentile (0-100) of the primary model after which a hedge is sent
+        budget_ratio: Maximum extra requests per primary request (0.05 means at most 5% extra)
+        budget_burst: Hedge tokens that can accumulate while traffic is fast
+        min_samples: Observations required before a model's percentile is trusted
+        min_delay_seconds: Lower bound on the hedge delay
+        window_seconds: Length of the rolling latency window per model
+    """
+
+    percentile: float = 95.0
+    budget_ratio: float = 0.05
+    budget_burst: float = 10.0
+    min_samples: int = 20
+    min_delay_seconds: float = 0.05
+    window_seconds: float = 600.0
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.percentile < 100.0:
+            raise ValueError("percentile must be between 0 and 100")
+        if self.budget_ratio < 0.0:
+            raise ValueError("budget_ratio must be non-negative")
+
+
+class RequestHedger:
+    """Learns per-model latency and runs hedged request pairs within a budget."""
+
+    def __init__(self, config: HedgingConfig | None = None) -> None:
+        self.config = config or HedgingConfig()
+        self._latencies: dict[str, RollingQuantileSketch] = {}
+        self._tokens = self.config.budget_burst
+        self._lock = threading.Lock()
+
+        self.requests = 0  # Requests eligible for hedging
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self.budget_exhausted = 0
+
+    def record_latency(self, model_id: str, seconds: float) -> None:
+        """Record how long a request to ``model_id`` took."""
+        with self._lock:
+            sketch = self._latencies.get(model_id)
+            if sketch is None:
+                sketch = self._latencies[model_id] = RollingQuantileSketch(window_seconds=self.config.window_seconds)
+            sketch.add(seconds)
+
+    def hedge_delay(self, model_id: str) -> float | None:
+        """Delay after which a request to ``model_id`` should be hedged.
+
+        Returns:
+            Seconds to wait, or None while too few latencies are known
+        """
+        with self._lock:
+            sketch = self._latencies.get(model_id)
+            if sketch is None:
+                return None
+            snapshot = sketch.snapshot()
+        if snapshot.count < self.config.min_samples:
+            return None
+        return max(self.config.min_delay_seconds, snapshot.percentile(self.config.percentile))
+
+    def _earn(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.config.budget_burst, self._tokens + self.config.budget_ratio)
+
+    def _try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                self.budget_exhausted += 1
+                return False
+            self._tokens -= 1.0
+            self.hedges_fired += 1
+            return True
+
+    async def run(
+        self,
+        primary: Callable[[], Awaitable[T]],
+        hedge: Callable[[], Awaitable[T]],
+        delay: float,
+    ) -> tuple[T, HedgeOutcome]:
+        """Run ``primary`` and, if it is still pending after ``delay``, race it against ``hedge``.
+
+        Failures before the delay are raised without hedging. Once a hedge is
+        sent, the first success wins and the other request is cancelled; if both
+        fail, the primary's error is raised.
+
+        Args:
+            primary: Factory for the original request
+            hedge: Factory for the duplicate request
+            delay: Seconds to wait before hedging
+
+        Returns:
+            The winning result and the hedging outcome
+        """
+        self._earn()
+        primary_task = asyncio.ensure_future(primary())
+        tasks = [primary_task]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary_task.result(), self._count(HedgeOutcome.NOT_HEDGED)
+            if not self._try_spend():
+                return await primary_task, self._count(HedgeOutcome.BUDGET_EXHAUSTED)
+
+            logger.debug("Request still pending after %.3fs, sending hedge", delay)
+            hedge_task = asyncio.ensure_future(hedge())
+            tasks.append(hedge_task)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge_task:
+                            with self._lock:
+                                self.hedges_won += 1
+                            return task.result(), self._count(HedgeOutcome.HEDGE_WON)
+                        return task.result(), self._count(HedgeOutcome.PRIMARY_WON)
+
+            # Both failed: surface the original request's error
+            return primary_task.result(), HedgeOutcome.PRIMARY_WON
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def timed(self, model_id: str, request: Callable[[], Awaitable[T]]) -> T:
+        """Await ``request`` and record its latency for ``model_id``, including when it is cancelled."""
+        start = time.perf_counter()
+        try:
+            result = await request()
+        except asyncio.CancelledError:
+            self.record_latency(model_id, time.perf_counter() - start)
+            raise
+        self.record_latency(model_id, time.perf_counter() - start)
+        return result
+
+    def _count(self, outcome: HedgeOutcome) -> HedgeOutcome:
+        _hedged_requests.labels(outcome.value).inc()
+        return outcome
+
+    def stats(self) -> dict[str, Any]:
+        """Return how often hedging fired and won."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges_fired": self.hedges_fired,
+                "hedges_won": self.hedges_won,
+                "budget_exhausted": self.budget_exhausted,
+                "hedge_rate": self.hedges_fired / self.requests if self.requests else 0.0,
+                "hedge_win_rate": self.hedges_won / self.hedges_fired if self.hedges_fired else 0.0,
+                "models": sorted(self._latencies),
+            }
+
+
+__all__ = [
+    "HedgeOutcome",
+    "HedgingConfig",
+    "RequestHedger",
+]
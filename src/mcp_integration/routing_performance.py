@@ -0,0 +1,199 @@
+"""Decaying latency and error-rate estimates for hybrid routing.
+
+``HybridRouter`` records the outcome of every routed request in its
+``RoutingMetrics``. Those outcomes feed a ``BackendPerformanceTracker`` that keeps
+time-decayed estimates per backend service and per model, so recent behavior
+dominates and stale observations fade out after a few half-lives.
+
+Adaptive share:
+    ``adaptive_share`` turns two backend estimates into the fraction of traffic
+    that should go to OpenRouter. Each backend's cost is its expected time to a
+    successful response, ``latency / (1 - error_rate)``. Traffic moves toward the
+    cheaper backend in proportion to its relative advantage, by at most
+    ``max_shift`` of the total, and never above the rollout ceiling. Until both
+    backends have ``min_samples`` worth of recent observations the baseline
+    split is used unchanged. A backend that receives no traffic under the
+    baseline split never gathers those observations on its own, so the router
+    sends it ``exploration_share`` of traffic until it has them.
+"""
+
+from dataclasses import dataclass, field
+import math
+import threading
+import time
+from typing import Any
+
+
+# Error rates are capped so the expected cost of a failing backend stays finite
+MAX_ERROR_RATE = 0.99
+
+
+@dataclass
+class AdaptiveRoutingConfig:
+    """Bounds for adaptive traffic shifting.
+
+    Attributes:
+        half_life_seconds: Time after which an observation counts half as much
+        min_samples: Decayed observation count required before a backend estimate is trusted
+        max_shift: Largest fraction of traffic (0.0 to 1.0) moved away from the baseline split
+        exploration_share: Fraction of traffic (0.0 to 1.0) sent to a backend that lacks
+            ``min_samples`` recent observations, so it can be compared at all
+    """
+
+    half_life_seconds: float = 60.0
+    min_samples: float = 5.0
+    max_shift: float = 0.5
+    exploration_share: float = 0.05
+
+    def __post_init__(self) -> None:
+        if self.half_life_seconds <= 0:
+            raise ValueError("half_life_seconds must be positive")
+        if not 0.0 <= self.max_shift <= 1.0:
+            raise ValueError("max_shift must be between 0.0 and 1.0")
+        if not 0.0 <= self.exploration_share <= 1.0:
+            raise ValueError("exploration_share must be between 0.0 and 1.0")
+
+
+@dataclass
+class DecayingEstimate:
+    """Exponentially time-decayed mean latency and error rate.
+
+    Every observation starts with weight 1 and loses half its weight each
+    ``half_life_seconds``, so ``weight`` is the effective number of recent
+    observations behind the estimate.
+    """
+
+    half_life_seconds: float
+    latency: float = 0.0
+    error_rate: float = 0.0
+    weight: float = 0.0
+    updated_at: float = 0.0
+
+    def _decay(self, now: float) -> float:
+        elapsed = max(0.0, now - self.updated_at)
+        return math.pow(0.5, elapsed / self.half_life_seconds)
+
+    def record(self, latency: float, success: bool, now: float) -> None:
+        """Fold one observation into the estimate."""
+        previous_weight = self.weight * self._decay(now)
+        self.weight = previous_weight + 1.0
+        self.latency += (latency - self.latency) / self.weight
+        self.error_rate += ((0.0 if success else 1.0) - self.error_rate) / self.weight
+        self.updated_at = now
+
+    def current_weight(self, now: float) -> float:
+        """Effective number of observations remaining at ``now``."""
+        return self.weight * self._decay(now)
+
+    @property
+    def expected_cost(self) -> float:
+        """Expected seconds until a successful response, counting retries of failures."""
+        return self.latency / (1.0 - min(self.error_rate, MAX_ERROR_RATE))
+
+    def to_dict(self, now: float) -> dict[str, Any]:
+        """Convert the estimate to a dictionary for monitoring."""
+        return {
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+            "samples": self.current_weight(now),
+        }
+
+
+@dataclass
+class BackendPerformanceTracker:
+    """Thread-safe decaying estimates keyed by backend service and by model."""
+
+    half_life_seconds: float = 60.0
+    services: dict[str, DecayingEstimate] = field(default_factory=dict)
+    models: dict[str, DecayingEstimate] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_service(self, service: str, latency: float, success: bool, now: float | None = None) -> None:
+        """Record the outcome of one request routed to a backend service.
+
+        Args:
+            service: Backend service ("openrouter" or "mcp")
+            latency: Response time in seconds
+            success: Whether the request succeeded
+            now: Observation time (defaults to ``time.time()``)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._estimate(self.services, service).record(latency, success, now)
+
+    def record_model(self, model_id: str, latency: float, success: bool, now: float | None = None) -> None:
+        """Record the outcome of one model call within a routed request."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._estimate(self.models, model_id).record(latency, success, now)
+
+    def _estimate(self, estimates: dict[str, DecayingEstimate], key: str) -> DecayingEstimate:
+        estimate = estimates.get(key)
+        if estimate is None:
+            estimate = estimates[key] = DecayingEstimate(self.half_life_seconds)
+        return estimate
+
+    def service_estimate(self, service: str) -> DecayingEstimate | None:
+        """Get the estimate for a backend service."""
+        return self.services.get(service)
+
+    def model_estimate(self, model_id: str) -> DecayingEstimate | None:
+        """Get the estimate for a model."""
+        return self.models.get(model_id)
+
+    def to_dict(self, now: float | None = None) -> dict[str, Any]:
+        """Convert all estimates to a dictionary for monitoring."""
+        now = time.time() if now is None else now
+        with self._lock:
+            return {
+                "services": {name: estimate.to_dict(now) for name, estimate in self.services.items()},
+                "models": {name: estimate.to_dict(now) for name, estimate in self.models.items()},
+            }
+
+
+def adaptive_share(
+    baseline: float,
+    ceiling: float,
+    openrouter: DecayingEstimate | None,
+    mcp: DecayingEstimate | None,
+    config: AdaptiveRoutingConfig,
+    now: float | None = None,
+) -> float:
+    """Compute the fraction of traffic to send to OpenRouter.
+
+    Args:
+        baseline: Share the static strategy or rollout would send (0.0 to 1.0)
+        ceiling: Largest share OpenRouter may receive, e.g. the rollout percentage
+        openrouter: Current OpenRouter estimate
+        mcp: Current MCP estimate
+        config: Shifting bounds
+        now: Evaluation time (defaults to ``time.time()``)
+
+    Returns:
+        Adjusted OpenRouter share between 0.0 and ``ceiling``
+    """
+    now = time.time() if now is None else now
+    baseline = min(baseline, ceiling)
+    if openrouter is None or mcp is None:
+        return baseline
+    if openrouter.current_weight(now) < config.min_samples or mcp.current_weight(now) < config.min_samples:
+        return baseline
+
+    openrouter_cost = openrouter.expected_cost
+    mcp_cost = mcp.expected_cost
+    slower_cost = max(openrouter_cost, mcp_cost)
+    if slower_cost <= 0:
+        return baseline
+
+    shift = config.max_shift * abs(openrouter_cost - mcp_cost) / slower_cost
+    if openrouter_cost < mcp_cost:
+        return min(ceiling, baseline + shift)
+    return max(0.0, baseline - shift)
+
+
+__all__ = [
+    "AdaptiveRoutingConfig",
+    "BackendPerformanceTracker",
+    "DecayingEstimate",
+    "adaptive_share",
+]
@@ -3,6 +3,12 @@ Smart MCP Server Discovery System
 
 Intelligent discovery system for MCP servers with anti-duplication,
 resource management, and intelligent fallback strategies.
+
+Detection strategies run concurrently, each bounded by a probe timeout; the
+first strategy to produce a healthy connection wins and the others are
+cancelled. Strategies that found nothing are skipped for a short while, and
+cached connections are revalidated in the background so cache hits never
+wait on a health check.
 """
 
 import asyncio
@@ -13,6 +19,7 @@ import os
 from pathlib import Path
 import socket
 import subprocess
+import time
 
 from filelock import FileLock
 import psutil
@@ -30,6 +37,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PROBE_TIMEOUT = 3.0  # seconds per detection strategy, including its health check
+DEFAULT_NEGATIVE_CACHE_TTL = 30.0  # seconds a strategy that found nothing is skipped
+DEFAULT_HEALTH_REVALIDATE_INTERVAL = 30.0  # seconds between health checks of a cached connection
+
 
 @dataclass
 class ServerConnection:
@@ -90,14 +101,44 @@ class ResourceMonitor:
 
 class SmartMCPDiscovery(LoggerMixin):
     """Smart MCP server discovery with anti-duplication and resource management."""
-    
-    def __init__(self, config_path: Path | None = None) -> None:
+
+    # Detection strategies in priority order; a tie between probes that finish together goes to the earlier one
+    discovery_strategies = (
+        "check_known_ports",
+        "check_process_list",
+        "check_docker_containers",
+        "check_node_modules",
+        "check_lock_files",
+        "check_env_variables",
+    )
+
+    def __init__(
+        self,
+        config_path: Path | None = None,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+        negative_cache_ttl: float = DEFAULT_NEGATIVE_CACHE_TTL,
+        health_revalidate_interval: float = DEFAULT_HEALTH_REVALIDATE_INTERVAL,
+    ) -> None:
         super().__init__()
         self.config_path = config_path or Path(".mcp/discovery-config.yaml")
         self.deployment_cache: dict[str, ServerConnection] = {}
         self.resource_monitor = ResourceMonitor()
         self.cache_ttl = timedelta(minutes=5)
         self.server_requirements = self._load_server_requirements()
+        self.known_ports: dict[str, list[int]] = {
+            "zen-mcp": [8000, 8001, 8002],  # Common zen-mcp ports
+            "context7": [],  # NPX-based, no fixed port
+            "perplexity": [],
+            "sentry": [],
+        }
+        self.probe_timeout = probe_timeout
+        self.negative_cache_ttl = negative_cache_ttl
+        self.health_revalidate_interval = health_revalidate_interval
+        # (server, strategy) -> monotonic time until which the strategy is skipped
+        self._negative_cache: dict[tuple[str, str], float] = {}
+        # server -> monotonic time of the cached connection's last successful health check
+        self._last_verified: dict[str, float] = {}
+        self._revalidations: dict[str, asyncio.Task] = {}
         
         # Initialize Docker client if available
         self.docker_client = None
@@ -150,6 +191,7 @@ class SmartMCPDiscovery(LoggerMixin):
         if existing := await self.find_existing_deployment(server_name):
             self.logger.info(f"Found existing {server_name} at {existing.url}")
             self.deployment_cache[server_name] = existing
+            self._last_verified[server_name] = time.monotonic()
             return existing
         
         # 3. Check resource availability
@@ -166,8 +208,8 @@ class SmartMCPDiscovery(LoggerMixin):
         lock_path = f"/tmp/.mcp-{server_name}.lock"
         try:
             with FileLock(lock_path, timeout=30):
-                # Double-check after acquiring lock
-                if existing := await self.find_existing_deployment(server_name):
+                # Double-check after acquiring lock; another process may have just deployed it
+                if existing := await self.find_existing_deployment(server_name, use_negative_cache=False):
                     return existing
                 
                 return await self.deploy_server(server_name)
@@ -176,69 +218,163 @@ class SmartMCPDiscovery(LoggerMixin):
             raise
     
     def get_cached_connection(self, server_name: str) -> ServerConnection | None:
-        """Get cached connection if still valid."""
+        """Get cached connection if still valid.
+
+        Connections whose last health check is older than
+        ``health_revalidate_interval`` are returned immediately and revalidated
+        in the background; an unhealthy connection is evicted when the check
+        completes. Without a running event loop the check runs inline.
+        """
         if server_name not in self.deployment_cache:
             return None
-        
+
         connection = self.deployment_cache[server_name]
         if utc_now() - connection.discovered_at > self.cache_ttl:
-            del self.deployment_cache[server_name]
+            self._evict(server_name)
             return None
-        
-        # Verify connection is still healthy
-        if not self.verify_health(connection):
-            del self.deployment_cache[server_name]
-            return None
-        
+
+        last_verified = self._last_verified.get(server_name)
+        if last_verified is not None and time.monotonic() - last_verified < self.health_revalidate_interval:
+            return connection
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Verify connection is still healthy
+            if not self.verify_health(connection):
+                self._evict(server_name)
+                return None
+            self._last_verified[server_name] = time.monotonic()
+            return connection
+
+        self._schedule_revalidation(server_name, connection)
         return connection
-    
-    async def find_existing_deployment(self, server_name: str) -> ServerConnection | None:
-        """Multi-strategy detection for existing deployments."""
-        strategies = [
-            self.check_known_ports,
-            self.check_process_list,
-            self.check_docker_containers,
-            self.check_node_modules,
-            self.check_lock_files,
-            self.check_env_variables,
+
+    def _evict(self, server_name: str) -> None:
+        self.deployment_cache.pop(server_name, None)
+        self._last_verified.pop(server_name, None)
+
+    def _schedule_revalidation(self, server_name: str, connection: ServerConnection) -> None:
+        """Start a background health check for a cached connection unless one is running."""
+        if server_name in self._revalidations:
+            return
+        task = asyncio.create_task(self._revalidate(server_name, connection))
+        self._revalidations[server_name] = task
+        task.add_done_callback(lambda _: self._revalidations.pop(server_name, None))
+
+    async def _revalidate(self, server_name: str, connection: ServerConnection) -> None:
+        try:
+            healthy = await asyncio.to_thread(self.verify_health, connection)
+        except Exception as e:
+            self.logger.debug(f"Health revalidation failed for {server_name}: {e}")
+            healthy = False
+
+        if self.deployment_cache.get(server_name) is not connection:
+            return  # Replaced or evicted meanwhile
+        if healthy:
+            self._last_verified[server_name] = time.monotonic()
+        else:
+            self.logger.info(f"Cached {server_name} at {connection.url} is no longer healthy")
+            self._evict(server_name)
+
+    async def find_existing_deployment(
+        self,
+        server_name: str,
+        use_negative_cache: bool = True,
+    ) -> ServerConnection | None:
+        """Multi-strategy detection for existing deployments.
+
+        All strategies run concurrently and the first healthy connection wins;
+        the remaining probes are cancelled.
+
+        Args:
+            server_name: Server to look for
+            use_negative_cache: Skip strategies that recently found nothing
+
+        Returns:
+            ServerConnection | None: A healthy existing deployment, if any
+        """
+        now = time.monotonic()
+        names = [
+            name
+            for name in self.discovery_strategies
+            if not use_negative_cache or self._negative_cache.get((server_name, name), 0.0) <= now
         ]
-        
-        for strategy in strategies:
-            try:
-                if conn := await strategy(server_name):
-                    # Verify it's actually responding
-                    if self.verify_health(conn):
-                        return conn
-            except Exception as e:
-                self.logger.debug(f"Strategy {strategy.__name__} failed for {server_name}: {e}")
-        
+        priority = {name: index for index, name in enumerate(names)}
+        probes = {asyncio.create_task(self._run_probe(name, server_name)): name for name in names}
+        pending = set(probes)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for probe in sorted(done, key=lambda task: priority[probes[task]]):
+                    if connection := probe.result():
+                        self.logger.debug(
+                            f"Strategy {probes[probe]} found {server_name} in {time.monotonic() - now:.3f}s",
+                        )
+                        return connection
+        finally:
+            for probe in pending:
+                probe.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
         return None
+
+    async def _run_probe(self, name: str, server_name: str) -> ServerConnection | None:
+        """Run one strategy and health check the connection it finds, within the probe timeout."""
+
+        async def probe() -> ServerConnection | None:
+            # Looked up per call so strategies can be replaced on the instance
+            conn = await getattr(self, name)(server_name)
+            # Verify it's actually responding
+            if conn and await asyncio.to_thread(self.verify_health, conn):
+                return conn
+            return None
+
+        try:
+            connection = await asyncio.wait_for(probe(), self.probe_timeout)
+        except TimeoutError:
+            # Inconclusive, so not remembered as a miss
+            self.logger.debug(f"Strategy {name} timed out for {server_name} after {self.probe_timeout}s")
+            return None
+        except Exception as e:
+            self.logger.debug(f"Strategy {name} failed for {server_name}: {e}")
+            connection = None
+
+        if connection is None:
+            self._negative_cache[(server_name, name)] = time.monotonic() + self.negative_cache_ttl
+        return connection
+
+    def clear_negative_cache(self, server_name: str | None = None) -> None:
+        """Forget strategies that found nothing, for one server or all servers."""
+        if server_name is None:
+            self._negative_cache.clear()
+        else:
+            for key in [key for key in self._negative_cache if key[0] == server_name]:
+                del self._negative_cache[key]
     
     async def check_known_ports(self, server_name: str) -> ServerConnection | None:
-        """Check known ports for running servers."""
-        port_map = {
-            "zen-mcp": [8000, 8001, 8002],  # Common zen-mcp ports
-            "context7": [],  # NPX-based, no fixed port
-            "perplexity": [],
-            "sentry": [],
-        }
-        
-        ports = port_map.get(server_name, [])
-        for port in ports:
-            if not self.resource_monitor.is_port_available(port):
-                # Port is in use, check if it's our server
-                try:
-                    response = requests.get(f"http://localhost:{port}/health", timeout=5)
-                    if response.status_code == 200:
-                        return ServerConnection(
-                            url=f"http://localhost:{port}",
-                            type="external",
-                            health_status="healthy",
-                            resource_usage={"port": port},
-                            discovered_at=utc_now(),
-                        )
-                except Exception:
-                    pass
+        """Check known ports for running servers, probing all ports concurrently."""
+        ports = self.known_ports.get(server_name, [])
+        results = await asyncio.gather(*(asyncio.to_thread(self._probe_port, port) for port in ports))
+        return next((connection for connection in results if connection), None)
+
+    def _probe_port(self, port: int) -> ServerConnection | None:
+        if self.resource_monitor.is_port_available(port):
+            return None
+        # Port is in use, check if it's our server
+        try:
+            response = requests.get(f"http://localhost:{port}/health", timeout=5)
+            if response.status_code == 200:
+                return ServerConnection(
+                    url=f"http://localhost:{port}",
+                    type="external",
+                    health_status="healthy",
+                    resource_usage={"port": port},
+                    discovered_at=utc_now(),
+                )
+        except Exception:
+            pass
         return None
     
     async def check_process_list(self, server_name: str) -> ServerConnection | None:
@@ -252,7 +388,7 @@ class SmartMCPDiscovery(LoggerMixin):
         
         patterns = process_patterns.get(server_name, [])
         for pattern in patterns:
-            if self.resource_monitor.check_process_exists(pattern):
+            if await asyncio.to_thread(self.resource_monitor.check_process_exists, pattern):
                 # Try to determine the URL from process
                 url = await self.extract_url_from_process(pattern)
                 if url:
@@ -339,7 +475,7 @@ class SmartMCPDiscovery(LoggerMixin):
             return None
         
         try:
-            containers = self.docker_client.containers.list()
+            containers = await asyncio.to_thread(self.docker_client.containers.list)
             for container in containers:
                 if server_name in container.name or server_name in str(container.image):
                     # Get port mapping
@@ -7,10 +7,12 @@ a unified interface for tool invocation across the hybrid infrastructure.
 
 import asyncio
 from dataclasses import dataclass
+import hashlib
 import logging
 from pathlib import Path
 from typing import Any
 
+from src.utils.full_text_index import FullTextIndex
 from src.utils.logging_mixin import LoggerMixin
 
 from .message_router import MCPMessageRouter
@@ -43,8 +45,27 @@ class ToolExecutionResult:
 class PromptCraftToolExecutor:
     """Executes PromptCraft native tools for MCP servers."""
     
-    def __init__(self) -> None:
+    def __init__(self, search_root: str | Path = ".", search_index_path: str | Path | None = None) -> None:
+        """Initialize the executor.
+        
+        Args:
+            search_root: Directory whose Markdown documents execute_search covers
+            search_index_path: Search index database (defaults to a per-root file under ~/.cache/promptcraft)
+        """
         self.logger = logging.getLogger(f"{__name__}.PromptCraftToolExecutor")
+        self.search_root = Path(search_root)
+        self.search_index_path = Path(search_index_path) if search_index_path else None
+        self._search_index: FullTextIndex | None = None
+    
+    def _get_search_index(self) -> FullTextIndex:
+        """Open the persistent search index on first use."""
+        if self._search_index is None:
+            index_path = self.search_index_path
+            if index_path is None:
+                root_digest = hashlib.sha256(str(self.search_root.resolve()).encode()).hexdigest()[:16]
+                index_path = Path.home() / ".cache" / "promptcraft" / f"search-{root_digest}.db"
+            self._search_index = FullTextIndex(self.search_root, index_path)
+        return self._search_index
     
     async def execute_read(self, file_path: str, offset: int | None = None, limit: int | None = None) -> dict[str, Any]:
         """Execute PromptCraft Read tool functionality.
@@ -196,47 +217,21 @@ class PromptCraftToolExecutor:
     async def execute_search(self, query: str, limit: int = 10) -> dict[str, Any]:
         """Execute document search functionality.
         
+        Results are ranked with BM25 over a persistent full-text index of the
+        Markdown files under the search root.
+        
         Args:
-            query: Search query
+            query: Search query; supports "quoted phrases" and prefix* terms
             limit: Maximum number of results
             
         Returns:
             Tool execution result
         """
         try:
-            # This would integrate with PromptCraft's vector search system
-            # For now, implement a basic file search as a placeholder
-            
-            search_results = []
-            search_paths = [Path()]
-            
-            for search_path in search_paths:
-                for file_path in search_path.rglob("*.md"):
-                    try:
-                        content = file_path.read_text(encoding="utf-8")
-                        if query.lower() in content.lower():
-                            # Extract context around the match
-                            lines = content.splitlines()
-                            for i, line in enumerate(lines):
-                                if query.lower() in line.lower():
-                                    context_start = max(0, i - 2)
-                                    context_end = min(len(lines), i + 3)
-                                    context = "\n".join(lines[context_start:context_end])
-                                    
-                                    search_results.append({
-                                        "file": str(file_path),
-                                        "line": i + 1,
-                                        "context": context,
-                                    })
-                                    break
-                        
-                        if len(search_results) >= limit:
-                            break
-                    except Exception:
-                        continue
-                
-                if len(search_results) >= limit:
-                    break
+            # Query the persistent BM25 index; it picks up changed files incrementally
+            index = self._get_search_index()
+            hits = await asyncio.to_thread(index.search, query, limit)
+            search_results = [{"file": hit.path, "line": hit.line, "context": hit.context} for hit in hits]
             
             if search_results:
                 result_text = f"Found {len(search_results)} results for '{query}':\n\n"
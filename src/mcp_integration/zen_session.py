@@ -0,0 +1,254 @@
+"""Long-lived Zen MCP session shared across requests.
+
+Connecting to zen-mcp-server starts (or reuses) a server process and runs a
+health check, which is far more expensive than a routed request. A
+``ZenSession`` keeps one ``ZenStdioMCPClient`` connected for the lifetime of
+its owner and only re-verifies it when needed:
+
+- A connection that passed a health check within ``health_check_interval``
+  seconds is reused without any round-trip.
+- An older connection is health-checked before use and reconnected if the
+  check fails. Failed requests mark the connection for re-verification.
+- After a failed connect, further attempts are skipped for
+  ``reconnect_backoff`` seconds so that requests fall back immediately
+  instead of each paying the connection timeout.
+- The session is bound to the event loop it was first used on. When it is
+  used from another loop, e.g. a caller that runs each request with a fresh
+  ``asyncio.run``, the old connection is dropped and a new one is made on the
+  running loop.
+
+Model recommendations depend only on the prompt, so they are cached by a
+fingerprint of the normalized prompt text. On a cache miss the recommendation
+and the routed execution are sent concurrently; concurrent requests for the
+same prompt share one recommendation call.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any
+
+from src.core.performance_optimizer import LRUCache
+
+from .zen_stdio_client import ZenStdioMCPClient
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+DEFAULT_RECONNECT_BACKOFF = 5.0
+DEFAULT_RECOMMENDATION_CACHE_SIZE = 256
+DEFAULT_RECOMMENDATION_TTL = 600
+
+
+def prompt_fingerprint(prompt: str) -> str:
+    """Fingerprint a prompt, ignoring differences in whitespace."""
+    return hashlib.sha256(" ".join(prompt.split()).encode()).hexdigest()
+
+
+class ZenSession:
+    """Shared, health-checked connection to zen-mcp-server with cached recommendations."""
+
+    def __init__(
+        self,
+        client: ZenStdioMCPClient,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        reconnect_backoff: float = DEFAULT_RECONNECT_BACKOFF,
+        recommendation_cache_size: int = DEFAULT_RECOMMENDATION_CACHE_SIZE,
+        recommendation_ttl: int = DEFAULT_RECOMMENDATION_TTL,
+    ) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            client: Zen client to keep connected
+            health_check_interval: Seconds a passed health check is trusted
+            reconnect_backoff: Seconds to wait after a failed connect before trying again
+            recommendation_cache_size: Maximum number of cached recommendations
+            recommendation_ttl: Seconds a cached recommendation stays valid
+        """
+        self.client = client
+        self.health_check_interval = health_check_interval
+        self.reconnect_backoff = reconnect_backoff
+        self.recommendations = LRUCache(max_size=recommendation_cache_size, ttl_seconds=recommendation_ttl)
+        self.stats = {
+            "requests": 0,
+            "connects": 0,
+            "connect_failures": 0,
+            "health_checks": 0,
+            "health_check_failures": 0,
+            "resets": 0,
+            "loop_changes": 0,
+        }
+
+        self._connected = False
+        self._verified_at = float("-inf")
+        self._retry_at = float("-inf")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = asyncio.Lock()
+        self._pending_recommendations: dict[str, asyncio.Task[Any]] = {}
+
+    @property
+    def connected(self) -> bool:
+        """Whether the session holds a connection (it may still be re-verified before use)."""
+        return self._connected
+
+    async def _bind_to_running_loop(self) -> None:
+        """Rebind loop-owned state, and drop the connection, when the running loop changes."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        previous, self._loop = self._loop, loop
+        self._lock = asyncio.Lock()
+        self._pending_recommendations = {}
+        if previous is not None:
+            self.stats["loop_changes"] += 1
+            logger.info("Zen session used from a new event loop, reconnecting")
+            self._retry_at = float("-inf")
+            if self._connected:
+                await self._drop()
+
+    async def ensure_connected(self) -> bool:
+        """
+        Get a usable connection, reconnecting if necessary.
+
+        Returns:
+            True if the client is connected and healthy, False if Zen is unavailable
+        """
+        await self._bind_to_running_loop()
+        async with self._lock:
+            now = time.monotonic()
+            if self._connected:
+                if now - self._verified_at < self.health_check_interval:
+                    return True
+                if await self._check_health():
+                    self._verified_at = time.monotonic()
+                    return True
+                logger.warning("Zen session failed its health check, reconnecting")
+                await self._drop()
+
+            if now < self._retry_at:
+                return False
+
+            if await self.client.connect():
+                self.stats["connects"] += 1
+                self._connected = True
+                self._verified_at = time.monotonic()
+                return True
+
+            self.stats["connect_failures"] += 1
+            self._retry_at = time.monotonic() + self.reconnect_backoff
+            return False
+
+    async def _check_health(self) -> bool:
+        self.stats["health_checks"] += 1
+        try:
+            status = await self.client.health_check()
+            healthy = bool(status.metadata.get("server_healthy", False))
+        except Exception as e:
+            logger.debug("Zen health check raised: %s", e)
+            healthy = False
+        if not healthy:
+            self.stats["health_check_failures"] += 1
+        return healthy
+
+    async def _drop(self) -> None:
+        self._connected = False
+        self._verified_at = float("-inf")
+        try:
+            await self.client.disconnect()
+        except Exception as e:
+            logger.debug("Error while dropping zen connection: %s", e)
+
+    def invalidate(self) -> None:
+        """Re-verify the connection before its next use, e.g. after a failed request."""
+        self._verified_at = float("-inf")
+
+    async def reset(self) -> None:
+        """Disconnect now; the next request reconnects without waiting for the backoff."""
+        await self._bind_to_running_loop()
+        async with self._lock:
+            self.stats["resets"] += 1
+            self._retry_at = float("-inf")
+            await self._drop()
+
+    async def close(self) -> None:
+        """Disconnect and cancel in-flight recommendation calls."""
+        await self._bind_to_running_loop()
+        for task in list(self._pending_recommendations.values()):
+            task.cancel()
+        self._pending_recommendations.clear()
+        async with self._lock:
+            await self._drop()
+
+    async def get_recommendation(self, prompt: str) -> Any:
+        """
+        Get model recommendations for a prompt, using the cache when possible.
+
+        Args:
+            prompt: Prompt to analyze
+
+        Returns:
+            RoutingAnalysis, or None if Zen could not produce one
+        """
+        await self._bind_to_running_loop()
+        key = prompt_fingerprint(prompt)
+        cached = self.recommendations.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._pending_recommendations.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_recommendation(key, prompt))
+            self._pending_recommendations[key] = task
+            task.add_done_callback(lambda _: self._pending_recommendations.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the call shared with others
+        return await asyncio.shield(task)
+
+    async def _fetch_recommendation(self, key: str, prompt: str) -> Any:
+        try:
+            recommendation = await self.client.get_model_recommendations(prompt)
+        except Exception as e:
+            logger.warning("Zen model recommendations failed: %s", e)
+            return None
+        if recommendation is not None:
+            self.recommendations.put(key, recommendation)
+        return recommendation
+
+    async def route(self, prompt: str) -> tuple[Any, dict[str, Any]]:
+        """
+        Get recommendations for and execute a prompt over the shared connection.
+
+        A cached recommendation costs no round-trip; otherwise the recommendation
+        and the execution run concurrently.
+
+        Args:
+            prompt: Prompt to execute
+
+        Returns:
+            Tuple of (RoutingAnalysis or None, execution result from ``execute_with_routing``)
+        """
+        await self._bind_to_running_loop()
+        self.stats["requests"] += 1
+        recommendation, result = await asyncio.gather(
+            self.get_recommendation(prompt),
+            self.client.execute_with_routing(prompt),
+        )
+        if not result.get("success"):
+            self.invalidate()
+        return recommendation, result
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get session statistics."""
+        return {
+            **self.stats,
+            "connected": self._connected,
+            "recommendation_cache": self.recommendations.get_stats(),
+        }
+
+
+__all__ = [
+    "ZenSession",
+    "prompt_fingerprint",
+]
@@ -13,10 +13,14 @@ Features:
 - Risk assessment and safety monitoring
 """
 
-import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+import hashlib
+import inspect
+import json
+import logging
 from typing import Any
 
 import pandas as pd  # type: ignore[import-untyped]
@@ -28,15 +32,19 @@ from src.core.ab_testing_framework import (
     ExperimentManager,
     ExperimentModel,
     ExperimentResults,
-    MetricEventModel,
+    MetricRollupStore,
     UserAssignmentModel,
     get_experiment_manager,
 )
+from src.core.performance_optimizer import LRUCache
 from src.utils.datetime_compat import UTC
 from src.utils.observability import ObservabilityMixin
 
 logger = logging.getLogger(__name__)
 
+ARTIFACT_CACHE_SIZE = 512
+ARTIFACT_CACHE_TTL_SECONDS = 3600
+
 
 class AlertLevel(Enum):
     """Alert severity levels."""
@@ -153,6 +161,71 @@ class DashboardMetrics:
         }
 
 
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator else 0.0
+
+
+def data_watermark(data: Any) -> str:
+    """Compute a digest identifying a version of dashboard data.
+
+    Args:
+        data: JSON-serializable data an artifact is rendered from
+
+    Returns:
+        Hex digest that changes whenever the data does
+    """
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+
+def _page_data(experiment: dict[str, Any]) -> dict[str, Any]:
+    """Strip collection times, which change on every request, from dashboard data."""
+    page_data = {key: value for key, value in experiment.items() if key != "last_updated"}
+    page_data["active_alerts"] = [
+        {key: value for key, value in alert.items() if key != "timestamp"} for alert in experiment["active_alerts"]
+    ]
+    return page_data
+
+
+@dataclass
+class RenderedDashboard:
+    """Dashboard page with the ETag of the data it was rendered from."""
+
+    html: str
+    etag: str | None = None
+
+
+class DashboardArtifactCache:
+    """Rendered dashboard artifacts keyed by experiment and data watermark.
+
+    An entry stays valid for as long as the data it was rendered from is
+    unchanged, so nothing needs explicit invalidation: new data gets a new
+    watermark and superseded versions age out of the LRU.
+    """
+
+    def __init__(self, max_size: int = ARTIFACT_CACHE_SIZE, ttl_seconds: int = ARTIFACT_CACHE_TTL_SECONDS) -> None:
+        self._cache = LRUCache(max_size, ttl_seconds)
+
+    @staticmethod
+    def _key(experiment_id: str, artifact: str, watermark: str) -> str:
+        return f"{experiment_id}:{artifact}:{watermark}"
+
+    def get(self, experiment_id: str, artifact: str, watermark: str) -> str | None:
+        """Get a rendered artifact if one exists for this version of its data."""
+        return self._cache.get(self._key(experiment_id, artifact, watermark))
+
+    def put(self, experiment_id: str, artifact: str, watermark: str, content: str) -> None:
+        """Store a rendered artifact for a version of its data."""
+        self._cache.put(self._key(experiment_id, artifact, watermark), content)
+
+    def clear(self) -> None:
+        """Drop all cached artifacts."""
+        self._cache.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return self._cache.get_stats()
+
+
 class MetricsCollector(ObservabilityMixin):
     """Collects and aggregates metrics for dashboard display."""
 
@@ -241,179 +314,71 @@ class MetricsCollector(ObservabilityMixin):
             return None
 
     async def _collect_performance_timeline(self, experiment_id: str, db_session: Any) -> list[dict[str, Any]]:
-        """Collect performance metrics over time."""
+        """Collect hourly performance metrics for the last 7 days from the rollups."""
         try:
-            # Get performance events from last 7 days
             cutoff_time = datetime.now(UTC) - timedelta(days=7)
-
-            events = (
-                db_session.query(MetricEventModel)
-                .filter(
-                    MetricEventModel.experiment_id == experiment_id,
-                    MetricEventModel.event_type == "performance",
-                    MetricEventModel.timestamp >= cutoff_time,
-                )
-                .order_by(MetricEventModel.timestamp)
-                .all()
+            buckets = MetricRollupStore(db_session).timeline(
+                experiment_id,
+                cutoff_time,
+                event_types=("performance",),
+                include_latency=True,
             )
 
-            # Group by hour and calculate averages
-            timeline = {}
-            for event in events:
-                hour_key = event.timestamp.replace(minute=0, second=0, microsecond=0)
-                if hour_key not in timeline:
-                    timeline[hour_key] = {
-                        "timestamp": hour_key.strftime("%Y-%m-%dT%H:%M:%S"),
-                        "response_times": [],
-                        "token_reductions": [],
-                        "success_count": 0,
-                        "total_count": 0,
-                    }
-
-                timeline[hour_key]["total_count"] += 1
-
-                if event.response_time_ms:
-                    timeline[hour_key]["response_times"].append(event.response_time_ms)
-
-                if event.token_reduction_percentage:
-                    timeline[hour_key]["token_reductions"].append(event.token_reduction_percentage)
-
-                if event.success:
-                    timeline[hour_key]["success_count"] += 1
-
-            # Calculate averages
             result = []
-            for hour_data in timeline.values():
-                avg_response_time = (
-                    sum(hour_data["response_times"]) / len(hour_data["response_times"])
-                    if hour_data["response_times"]
-                    else 0.0
-                )
-                avg_token_reduction = (
-                    sum(hour_data["token_reductions"]) / len(hour_data["token_reductions"])
-                    if hour_data["token_reductions"]
-                    else 0.0
-                )
-                success_rate = (
-                    hour_data["success_count"] / hour_data["total_count"] if hour_data["total_count"] > 0 else 0.0
-                )
-
+            for bucket in buckets:
+                latency = bucket["response_time_sketch"]
                 result.append(
                     {
-                        "timestamp": hour_data["timestamp"],
-                        "avg_response_time_ms": avg_response_time,
-                        "avg_token_reduction": avg_token_reduction,
-                        "success_rate": success_rate * 100,
-                        "total_requests": hour_data["total_count"],
+                        "timestamp": bucket["bucket_start"].strftime("%Y-%m-%dT%H:%M:%S"),
+                        "avg_response_time_ms": _ratio(bucket["response_time_sum"], bucket["response_time_count"]),
+                        "p95_response_time_ms": latency.quantile(0.95) if latency.count else 0.0,
+                        "avg_token_reduction": _ratio(bucket["token_reduction_sum"], bucket["token_reduction_count"]),
+                        "success_rate": _ratio(bucket["success_count"], bucket["event_count"]) * 100,
+                        "total_requests": bucket["event_count"],
                     },
                 )
-
-            return sorted(result, key=lambda x: x["timestamp"])
+            return result
 
         except Exception as e:
             self.logger.error("Failed to collect performance timeline: %s", e)
             return []
 
     async def _collect_conversion_timeline(self, experiment_id: str, db_session: Any) -> list[dict[str, Any]]:
-        """Collect conversion metrics over time."""
+        """Collect hourly conversion metrics for the last 7 days from the rollups."""
         try:
-            # Get optimization events (successful token reductions are conversions)
+            # Optimization events with a token reduction of at least 70% are conversions
             cutoff_time = datetime.now(UTC) - timedelta(days=7)
-
-            events = (
-                db_session.query(MetricEventModel)
-                .filter(
-                    MetricEventModel.experiment_id == experiment_id,
-                    MetricEventModel.event_type == "optimization",
-                    MetricEventModel.timestamp >= cutoff_time,
-                )
-                .order_by(MetricEventModel.timestamp)
-                .all()
-            )
-
-            # Group by hour and calculate conversion rates
-            timeline = {}
-            for event in events:
-                hour_key = event.timestamp.replace(minute=0, second=0, microsecond=0)
-                if hour_key not in timeline:
-                    timeline[hour_key] = {
-                        "timestamp": hour_key.strftime("%Y-%m-%dT%H:%M:%S"),
-                        "conversions": 0,
-                        "total_attempts": 0,
-                    }
-
-                timeline[hour_key]["total_attempts"] += 1
-
-                # Consider successful token reduction above 70% as conversion
-                if event.token_reduction_percentage and event.token_reduction_percentage >= 70.0:
-                    timeline[hour_key]["conversions"] += 1
-
-            # Calculate conversion rates
-            result = []
-            for hour_data in timeline.values():
-                conversion_rate = (
-                    hour_data["conversions"] / hour_data["total_attempts"] if hour_data["total_attempts"] > 0 else 0.0
-                )
-
-                result.append(
-                    {
-                        "timestamp": hour_data["timestamp"],
-                        "conversion_rate": conversion_rate * 100,
-                        "conversions": hour_data["conversions"],
-                        "total_attempts": hour_data["total_attempts"],
-                    },
-                )
-
-            return sorted(result, key=lambda x: x["timestamp"])
+            buckets = MetricRollupStore(db_session).timeline(experiment_id, cutoff_time, event_types=("optimization",))
+
+            return [
+                {
+                    "timestamp": bucket["bucket_start"].strftime("%Y-%m-%dT%H:%M:%S"),
+                    "conversion_rate": _ratio(bucket["conversion_count"], bucket["event_count"]) * 100,
+                    "conversions": bucket["conversion_count"],
+                    "total_attempts": bucket["event_count"],
+                }
+                for bucket in buckets
+            ]
 
         except Exception as e:
             self.logger.error("Failed to collect conversion timeline: %s", e)
             return []
 
     async def _collect_error_timeline(self, experiment_id: str, db_session: Any) -> list[dict[str, Any]]:
-        """Collect error metrics over time."""
+        """Collect hourly error metrics for the last 7 days from the rollups."""
         try:
-            # Get all events from last 7 days
             cutoff_time = datetime.now(UTC) - timedelta(days=7)
-
-            events = (
-                db_session.query(MetricEventModel)
-                .filter(MetricEventModel.experiment_id == experiment_id, MetricEventModel.timestamp >= cutoff_time)
-                .order_by(MetricEventModel.timestamp)
-                .all()
-            )
-
-            # Group by hour and calculate error rates
-            timeline = {}
-            for event in events:
-                hour_key = event.timestamp.replace(minute=0, second=0, microsecond=0)
-                if hour_key not in timeline:
-                    timeline[hour_key] = {
-                        "timestamp": hour_key.strftime("%Y-%m-%dT%H:%M:%S"),
-                        "errors": 0,
-                        "total_events": 0,
-                    }
-
-                timeline[hour_key]["total_events"] += 1
-
-                if event.event_type == "error" or event.success is False:
-                    timeline[hour_key]["errors"] += 1
-
-            # Calculate error rates
-            result = []
-            for hour_data in timeline.values():
-                error_rate = hour_data["errors"] / hour_data["total_events"] if hour_data["total_events"] > 0 else 0.0
-
-                result.append(
-                    {
-                        "timestamp": hour_data["timestamp"],
-                        "error_rate": error_rate * 100,
-                        "error_count": hour_data["errors"],
-                        "total_events": hour_data["total_events"],
-                    },
-                )
-
-            return sorted(result, key=lambda x: x["timestamp"])
+            buckets = MetricRollupStore(db_session).timeline(experiment_id, cutoff_time)
+
+            return [
+                {
+                    "timestamp": bucket["bucket_start"].strftime("%Y-%m-%dT%H:%M:%S"),
+                    "error_rate": _ratio(bucket["error_count"], bucket["event_count"]) * 100,
+                    "error_count": bucket["error_count"],
+                    "total_events": bucket["event_count"],
+                }
+                for bucket in buckets
+            ]
 
         except Exception as e:
             self.logger.error("Failed to collect error timeline: %s", e)
@@ -825,6 +790,7 @@ class ABTestingDashboard(ObservabilityMixin):
         self.experiment_manager = experiment_manager
         self.metrics_collector = MetricsCollector(experiment_manager)
         self.visualizer = DashboardVisualizer()
+        self.artifact_cache = DashboardArtifactCache()
         self.logger = logging.getLogger(__name__)
 
         # Dashboard templates
@@ -832,34 +798,85 @@ class ABTestingDashboard(ObservabilityMixin):
 
     async def generate_dashboard_html(self, experiment_id: str) -> str:
         """Generate complete HTML dashboard for an experiment."""
+        return (await self.render_dashboard(experiment_id)).html
+
+    async def render_dashboard(self, experiment_id: str) -> RenderedDashboard:
+        """Render the dashboard page, reusing cached artifacts whose data is unchanged.
+
+        Args:
+            experiment_id: Experiment to render
+
+        Returns:
+            Page HTML with an ETag derived from its data watermark, or an error
+            page without one
+        """
         try:
             # Collect metrics
             metrics = await self.metrics_collector.collect_experiment_metrics(experiment_id)
             if not metrics:
-                return self._generate_error_dashboard("Experiment not found or no data available")
+                return RenderedDashboard(self._generate_error_dashboard("Experiment not found or no data available"))
 
-            # Generate visualizations
-            performance_chart = self.visualizer.create_performance_chart(metrics.performance_timeline)
-            variant_comparison = self.visualizer.create_variant_comparison_chart(metrics.variants)
-            conversion_funnel = self.visualizer.create_conversion_funnel(metrics)
-            significance_gauge = self.visualizer.create_statistical_significance_gauge(metrics.statistical_significance)
+            experiment = metrics.to_dict()
+            etag = f'"{data_watermark(_page_data(experiment))}"'
+            html = self.artifact_cache.get(experiment_id, "page", etag)
+            if html is not None:
+                return RenderedDashboard(html, etag)
 
-            # Prepare template data
+            # Generate visualizations
+            funnel_data = {
+                "total_users": metrics.total_users,
+                "active_users_24h": metrics.active_users_24h,
+                "success_rate": metrics.success_rate,
+                "conversion_rate": metrics.conversion_rate,
+            }
             template_data = {
-                "experiment": metrics.to_dict(),
-                "performance_chart": performance_chart,
-                "variant_comparison": variant_comparison,
-                "conversion_funnel": conversion_funnel,
-                "significance_gauge": significance_gauge,
+                "experiment": experiment,
+                "performance_chart": await self._render_artifact(
+                    experiment_id,
+                    "performance_chart",
+                    metrics.performance_timeline,
+                    self.visualizer.create_performance_chart,
+                ),
+                "variant_comparison": await self._render_artifact(
+                    experiment_id,
+                    "variant_comparison",
+                    metrics.variants,
+                    self.visualizer.create_variant_comparison_chart,
+                ),
+                "conversion_funnel": await self._render_artifact(
+                    experiment_id,
+                    "conversion_funnel",
+                    funnel_data,
+                    lambda _: self.visualizer.create_conversion_funnel(metrics),
+                ),
+                "significance_gauge": await self._render_artifact(
+                    experiment_id,
+                    "significance_gauge",
+                    metrics.statistical_significance,
+                    self.visualizer.create_statistical_significance_gauge,
+                ),
                 "last_updated": datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S UTC"),
             }
 
             # Render dashboard
-            return self.dashboard_template.render(**template_data)
+            html = self.dashboard_template.render(**template_data)
+            self.artifact_cache.put(experiment_id, "page", etag, html)
+            return RenderedDashboard(html, etag)
 
         except Exception as e:
             self.logger.error("Failed to generate dashboard for experiment %s: %s", experiment_id, e)
-            return self._generate_error_dashboard(f"Error generating dashboard: {e!s}")
+            return RenderedDashboard(self._generate_error_dashboard(f"Error generating dashboard: {e!s}"))
+
+    async def _render_artifact(self, experiment_id: str, artifact: str, data: Any, render: Callable[[Any], Any]) -> str:
+        """Render one dashboard panel, or serve it from cache if its data is unchanged."""
+        watermark = data_watermark(data)
+        content = self.artifact_cache.get(experiment_id, artifact, watermark)
+        if content is None:
+            content = render(data)
+            if inspect.isawaitable(content):
+                content = await content
+            self.artifact_cache.put(experiment_id, artifact, watermark, content)
+        return content
 
     async def get_dashboard_data(self, experiment_id: str) -> dict[str, Any] | None:
         """Get dashboard data as JSON for API endpoints."""
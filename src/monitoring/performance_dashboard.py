@@ -11,6 +11,8 @@ import contextlib
 import json
 import logging
 import time
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -130,6 +132,84 @@ class MetricsExporter:
         return await self.monitor.export_metrics(export_format="json", include_raw_data=False)
 
 
+class ClientSendQueue:
+    """Bounded queue of messages waiting to be sent to one dashboard client.
+
+    Messages are sent in order by a drain task that only runs while messages
+    are pending, so a slow client delays nobody but itself. When the queue is
+    full, its messages are coalesced into one holding the latest value of
+    each panel. A send that fails or exceeds the timeout reports the client
+    as dead and drops whatever is still queued.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_failure: Callable[[WebSocket, Exception], None],
+        max_pending: int = 4,
+        send_timeout_seconds: float = 2.0,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.websocket = websocket
+        self.on_failure = on_failure
+        self.max_pending = max_pending
+        self.send_timeout_seconds = send_timeout_seconds
+        self._pending: deque[tuple[str, dict[str, Any]]] = deque()
+        self._drain_task: asyncio.Task | None = None
+        self.stats = {"sent": 0, "coalesced": 0}
+
+    def enqueue(self, message: str, data: dict[str, Any]) -> None:
+        """Queue a message for sending.
+
+        Args:
+            message: Serialized message, shared between all clients
+            data: The message before serialization, used when coalescing
+        """
+        if len(self._pending) >= self.max_pending:
+            merged: dict[str, Any] = {}
+            for _, pending in self._pending:
+                merged.update(pending)
+            merged.update(data)
+            self._pending.clear()
+            message, data = json.dumps(merged), merged
+            self.stats["coalesced"] += 1
+
+        self._pending.append((message, data))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        """Send pending messages until the queue is empty or a send fails."""
+        while self._pending:
+            message, _ = self._pending.popleft()
+            try:
+                await asyncio.wait_for(self.websocket.send_text(message), self.send_timeout_seconds)
+            except Exception as e:
+                self._pending.clear()
+                self.on_failure(self.websocket, e)
+                with contextlib.suppress(Exception):
+                    await asyncio.wait_for(self.websocket.close(), self.send_timeout_seconds)
+                return
+            self.stats["sent"] += 1
+
+    @property
+    def pending(self) -> int:
+        """Number of messages waiting to be sent."""
+        return len(self._pending)
+
+    async def flush(self) -> None:
+        """Wait until the messages queued so far have been sent or dropped."""
+        if self._drain_task is not None:
+            await asyncio.wait([self._drain_task])
+
+    def cancel(self) -> None:
+        """Stop sending and drop pending messages."""
+        self._pending.clear()
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+
+
 class RealTimeDashboard:
     """Real-time web dashboard for monitoring."""
 
@@ -143,6 +223,14 @@ class RealTimeDashboard:
         self.update_interval_seconds = 5.0
         self._update_task: asyncio.Task | None = None
 
+        # Serialized panels from the last tick, to broadcast only what changed
+        self._panel_versions: dict[str, str] = {}
+
+        # Per-client send queues, so slow clients don't hold up the others
+        self.max_pending_messages = 4
+        self.send_timeout_seconds = 2.0
+        self._send_queues: dict[WebSocket, ClientSendQueue] = {}
+
     async def start_real_time_updates(self) -> None:
         """Start real-time dashboard updates."""
         if self._update_task and not self._update_task.done():
@@ -167,9 +255,10 @@ class RealTimeDashboard:
                 # Generate current metrics
                 dashboard_data = await self._generate_dashboard_data()
 
-                # Send to all connected clients
-                if self.connected_clients:
-                    await self._broadcast_to_clients(dashboard_data)
+                # Send the panels that changed since the last tick to all connected clients
+                changed_panels = self._changed_panels(dashboard_data)
+                if self.connected_clients and len(changed_panels) > 1:
+                    await self._broadcast_to_clients(changed_panels)
 
                 await asyncio.sleep(self.update_interval_seconds)
 
@@ -293,6 +382,31 @@ class RealTimeDashboard:
             return health_report.get(key, default)
         return getattr(health_report, key, default)
 
+    def _changed_panels(self, dashboard_data: dict[str, Any]) -> dict[str, Any]:
+        """Select the dashboard panels whose data changed since the last tick.
+
+        Alerts are compared without their timestamps, which are regenerated on
+        every tick; clients keep showing when an alert was first raised.
+
+        Args:
+            dashboard_data: Output of _generate_dashboard_data
+
+        Returns:
+            The timestamp plus every panel that changed
+        """
+        changed = {"timestamp": dashboard_data["timestamp"]}
+        for panel, value in dashboard_data.items():
+            if panel == "timestamp":
+                continue
+            compared = value
+            if panel == "alerts":
+                compared = [{key: item for key, item in alert.items() if key != "timestamp"} for alert in value]
+            version = json.dumps(compared, sort_keys=True, default=str)
+            if self._panel_versions.get(panel) != version:
+                self._panel_versions[panel] = version
+                changed[panel] = value
+        return changed
+
     async def _generate_alerts(self, health_report: Any) -> list[dict[str, Any]]:
         """Generate current alerts based on thresholds."""
 
@@ -359,32 +473,51 @@ class RealTimeDashboard:
         return alerts
 
     async def _broadcast_to_clients(self, data: dict[str, Any]) -> None:
-        """Broadcast data to all connected WebSocket clients."""
+        """Queue data for all connected WebSocket clients without waiting for the sends."""
 
         if not self.connected_clients:
             return
 
         message = json.dumps(data)
-        disconnected_clients = []
+        for client in list(self.connected_clients):
+            self._send_queue(client).enqueue(message, data)
+
+    def _send_queue(self, websocket: WebSocket) -> ClientSendQueue:
+        """Get the send queue for a client, creating it on first use."""
+        send_queue = self._send_queues.get(websocket)
+        if send_queue is None:
+            send_queue = ClientSendQueue(
+                websocket,
+                self._evict_client,
+                max_pending=self.max_pending_messages,
+                send_timeout_seconds=self.send_timeout_seconds,
+            )
+            self._send_queues[websocket] = send_queue
+        return send_queue
 
-        for client in self.connected_clients:
-            try:
-                await client.send_text(message)
-            except Exception:
-                disconnected_clients.append(client)
+    def _evict_client(self, websocket: WebSocket, error: Exception) -> None:
+        """Drop a client whose send failed or timed out."""
+        if websocket in self.connected_clients:
+            self.connected_clients.remove(websocket)
+        self._send_queues.pop(websocket, None)
+        self.logger.warning(
+            "Dropped dashboard client after failed send (%s). Total clients: %d",
+            type(error).__name__,
+            len(self.connected_clients),
+        )
 
-        # Remove disconnected clients
-        for client in disconnected_clients:
-            self.connected_clients.remove(client)
+    async def flush_clients(self) -> None:
+        """Wait until every message queued so far has been sent or dropped."""
+        await asyncio.gather(*(send_queue.flush() for send_queue in list(self._send_queues.values())))
 
     async def add_client(self, websocket: WebSocket) -> None:
         """Add a new WebSocket client."""
         await websocket.accept()
         self.connected_clients.append(websocket)
 
-        # Send initial data
+        # Send initial data ahead of any later broadcasts
         dashboard_data = await self._generate_dashboard_data()
-        await websocket.send_text(json.dumps(dashboard_data))
+        self._send_queue(websocket).enqueue(json.dumps(dashboard_data), dashboard_data)
 
         self.logger.info("Dashboard client connected. Total clients: %d", len(self.connected_clients))
 
@@ -392,6 +525,9 @@ class RealTimeDashboard:
         """Remove a WebSocket client."""
         if websocket in self.connected_clients:
             self.connected_clients.remove(websocket)
+        send_queue = self._send_queues.pop(websocket, None)
+        if send_queue is not None:
+            send_queue.cancel()
 
         self.logger.info("Dashboard client disconnected. Total clients: %d", len(self.connected_clients))
 
@@ -664,28 +800,42 @@ class RealTimeDashboard:
         }
 
         function updateDashboard(data) {
+            // Updates after the first only carry the panels that changed
+
             // Update metric cards
-            document.getElementById('token-reduction').textContent =
-                data.system_health.average_token_reduction + '%';
-            document.getElementById('success-rate').textContent =
-                data.system_health.overall_success_rate + '%';
-            document.getElementById('loading-latency').textContent =
-                data.system_health.average_loading_latency + ' ms';
-            document.getElementById('active-sessions').textContent =
-                data.system_health.concurrent_sessions;
+            if ('system_health' in data) {
+                document.getElementById('token-reduction').textContent =
+                    data.system_health.average_token_reduction + '%';
+                document.getElementById('success-rate').textContent =
+                    data.system_health.overall_success_rate + '%';
+                document.getElementById('loading-latency').textContent =
+                    data.system_health.average_loading_latency + ' ms';
+                document.getElementById('active-sessions').textContent =
+                    data.system_health.concurrent_sessions;
+            }
 
             // Update charts
-            updateTokenReductionChart(data.token_reduction_history);
-            updateLatencyChart(data.loading_latency_history);
+            if ('token_reduction_history' in data) {
+                updateTokenReductionChart(data.token_reduction_history);
+            }
+            if ('loading_latency_history' in data) {
+                updateLatencyChart(data.loading_latency_history);
+            }
 
             // Update alerts
-            updateAlerts(data.alerts);
+            if ('alerts' in data) {
+                updateAlerts(data.alerts);
+            }
 
             // Update validation status
-            updateValidationStatus(data.validation_status);
+            if ('validation_status' in data) {
+                updateValidationStatus(data.validation_status);
+            }
 
             // Update sessions table
-            updateSessionsTable(data.active_sessions);
+            if ('active_sessions' in data) {
+                updateSessionsTable(data.active_sessions);
+            }
         }
 
         function updateTokenReductionChart(history) {
@@ -8,7 +8,7 @@ Intelligent discovery system for automation scripts with hybrid approach:
 Project-level (.claude/scripts/) -> User-level (~/.claude/scripts/) fallback.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 import logging
 import os
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from src.utils.logging_mixin import LoggerMixin
+from src.utils.resource_catalog import ResourceCatalog, get_resource_catalog
 
 
 logger = logging.getLogger(__name__)
@@ -37,14 +38,44 @@ class ScriptDefinition:
     dependencies: list[str] = field(default_factory=list)
     parameters: list[str] = field(default_factory=list)
     last_updated: datetime | None = None
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["file_path"] = str(self.file_path)
+        data["last_updated"] = self.last_updated.isoformat() if self.last_updated else None
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScriptDefinition":
+        """Create ScriptDefinition from the output of ``to_dict``."""
+        last_updated = data.get("last_updated")
+        return cls(
+            **{
+                **data,
+                "file_path": Path(data["file_path"]),
+                "last_updated": datetime.fromisoformat(last_updated) if last_updated else None,
+            },
+        )
 
 
 
 class ScriptsDiscoverySystem(LoggerMixin):
-    """Discovery system for automation scripts with project-first, user-fallback approach."""
+    """Discovery system for automation scripts with project-first, user-fallback approach.
     
-    def __init__(self, project_root: Path | None = None) -> None:
+    Script files are parsed through a ResourceCatalog shared with the commands
+    and standards discovery systems, so each file is parsed once per change.
+    """
+    
+    def __init__(self, project_root: Path | None = None, catalog: ResourceCatalog | None = None) -> None:
+        """Initialize the discovery system.
+        
+        Args:
+            project_root: Project directory (defaults to the current directory)
+            catalog: Parsed resource catalog (defaults to the shared catalog)
+        """
         super().__init__()
+        self.catalog = catalog if catalog is not None else get_resource_catalog()
         self.project_root = project_root or Path.cwd()
         self.project_scripts_path = self.project_root / ".claude" / "scripts"
         self.user_scripts_path = Path.home() / ".claude" / "scripts"
@@ -190,12 +221,12 @@ class ScriptsDiscoverySystem(LoggerMixin):
         for ext, _script_type in self.script_extensions.items():
             script_file = self.project_scripts_path / f"{script_id}{ext}"
             if script_file.exists():
-                return self._create_script_definition(script_id, script_file, "project")
+                return self._load_script_definition(script_id, script_file, "project")
         
         # Try exact filename match
         script_file = self.project_scripts_path / script_id
         if script_file.exists():
-            return self._create_script_definition(script_id, script_file, "project")
+            return self._load_script_definition(script_id, script_file, "project")
         
         return None
     
@@ -208,12 +239,12 @@ class ScriptsDiscoverySystem(LoggerMixin):
         for ext, _script_type in self.script_extensions.items():
             script_file = self.user_scripts_path / f"{script_id}{ext}"
             if script_file.exists():
-                return self._create_script_definition(script_id, script_file, "user")
+                return self._load_script_definition(script_id, script_file, "user")
         
         # Try exact filename match
         script_file = self.user_scripts_path / script_id
         if script_file.exists():
-            return self._create_script_definition(script_id, script_file, "user")
+            return self._load_script_definition(script_id, script_file, "user")
             
         return None
     
@@ -222,6 +253,16 @@ class ScriptsDiscoverySystem(LoggerMixin):
         # Built-in scripts could be defined here for essential functionality
         return None
     
+    def _load_script_definition(self, script_id: str, file_path: Path, source_type: str) -> ScriptDefinition:
+        """Get the ScriptDefinition for a file from the catalog, parsing the file only if it changed."""
+        return self.catalog.load(
+            "scripts",
+            file_path,
+            lambda: self._create_script_definition(script_id, file_path, source_type),
+            ScriptDefinition.from_dict,
+            identity=(script_id, source_type),
+        )
+    
     def _create_script_definition(self, script_id: str, file_path: Path, source_type: str) -> ScriptDefinition:
         """Create a ScriptDefinition from a file path."""
         try:
@@ -345,8 +386,19 @@ class ScriptsDiscoverySystem(LoggerMixin):
                 script.category = "general"
     
     def _refresh_scripts_cache(self) -> None:
-        """Refresh the scripts cache by scanning all available sources."""
+        """Refresh the scripts cache by scanning all available sources.
+        
+        Script files are only parsed if the catalog has not seen their current
+        version, even in an earlier process.
+        """
         self.logger.debug("Refreshing scripts cache")
+        with self.catalog.timed_scan("scripts"):
+            self._scan_scripts()
+        self.catalog.save_snapshot()
+        self.logger.info(f"Refreshed scripts cache with {len(self._scripts_cache)} scripts")
+    
+    def _scan_scripts(self) -> None:
+        """Rebuild the scripts cache from the project and user script directories."""
         self._scripts_cache.clear()
         
         # Collect all script files from all sources
@@ -371,13 +423,12 @@ class ScriptsDiscoverySystem(LoggerMixin):
         for script_id, file_path in all_script_files.items():
             try:
                 source_type = "project" if self.project_scripts_path in file_path.parents else "user"
-                script = self._create_script_definition(script_id, file_path, source_type)
+                script = self._load_script_definition(script_id, file_path, source_type)
                 self._scripts_cache[script_id] = script
             except Exception as e:
                 self.logger.warning(f"Failed to process script {script_id}: {e}")
         
         self._cache_timestamp = utc_now()
-        self.logger.info(f"Refreshed scripts cache with {len(self._scripts_cache)} scripts")
     
     def _should_refresh_cache(self) -> bool:
         """Check if cache should be refreshed."""
@@ -423,6 +474,7 @@ class ScriptsDiscoverySystem(LoggerMixin):
             "scripts_by_category": scripts_by_category,
             "supported_categories": list(self.script_categories.keys()),
             "supported_types": list(self.script_extensions.values()),
+            "catalog": self.catalog.get_stats(),
         }
 
 
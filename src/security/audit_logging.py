@@ -49,6 +49,7 @@ from fastapi import Request, status
 import structlog
 
 from src.config.settings import get_settings
+from src.security.audit_sink import AuditSink, create_audit_sink
 from src.utils.datetime_compat import UTC
 
 
@@ -349,21 +350,41 @@ class AuditLogger:
     Attributes:
         settings: Application settings instance
         logger: Structured logger instance for audit events
+        sink: Optional asynchronous sink; when set, events are only enqueued
 
     Thread Safety:
         This class is thread-safe as it uses structlog's thread-safe logger
         implementation.
     """
 
-    def __init__(self) -> None:
-        """Initialize audit logger."""
+    def __init__(self, sink: AuditSink | None = None) -> None:
+        """Initialize audit logger.
+
+        Args:
+            sink: Asynchronous audit sink to enqueue events into instead of
+                formatting and writing them on the caller's thread
+        """
         self.settings = get_settings(validate_on_startup=False)
         self.logger = audit_logger
+        self.sink = sink
+
+    def attach_sink(self, sink: AuditSink | None) -> None:
+        """Route subsequent events to ``sink`` (or back to the logger if None)."""
+        self.sink = sink
+
+    def close_sink(self, timeout: float = 5.0) -> None:
+        """Flush and detach the asynchronous sink, if any."""
+        sink, self.sink = self.sink, None
+        if sink is not None:
+            sink.close(timeout)
 
     def log_event(self, event: AuditEvent) -> None:
         """Log an audit event.
 
-        Routes the event to the appropriate log level based on its severity:
+        With an asynchronous sink attached the event is only enqueued; the sink
+        serializes and writes it in the background.
+
+        Otherwise routes the event to the appropriate log level based on its severity:
         - CRITICAL -> logger.critical()
         - HIGH -> logger.error()
         - MEDIUM -> logger.warning()
@@ -378,6 +399,14 @@ class AuditLogger:
         Complexity:
             O(1) - Constant time operation for event serialization and logging
         """
+        if self.sink is not None:
+            self.sink.enqueue(event)
+            return
+
+        self._log_synchronously(event)
+
+    def _log_synchronously(self, event: AuditEvent) -> None:
+        """Format the event and write it through the configured logger."""
         event_data = event.to_dict()
 
         # Log based on severity - handle both standard and structured loggers
@@ -591,6 +620,27 @@ class AuditLogger:
 audit_logger_instance = AuditLogger()
 
 
+def configure_audit_sink(settings: Any) -> AuditSink | None:
+    """Attach an asynchronous sink to the global audit logger if enabled.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        The started sink, or None when asynchronous audit logging is disabled
+    """
+    if getattr(settings, "audit_log_async_enabled", False) is not True:
+        return None
+    sink = create_audit_sink(settings)
+    audit_logger_instance.attach_sink(sink)
+    return sink
+
+
+def shutdown_audit_sink(timeout: float = 5.0) -> None:
+    """Flush buffered audit events and detach the global sink."""
+    audit_logger_instance.close_sink(timeout)
+
+
 # Convenience functions for common audit events
 # These functions provide a simplified interface for the most common
 # security events, using the global logger instance
@@ -0,0 +1,318 @@
+"""Asynchronous, batched sink for audit events.
+
+``AuditLogger.log_event`` normally formats every event and performs handler I/O
+on the request path. When an ``AuditSink`` is attached, logging an event is a
+single enqueue into a bounded in-memory buffer; a background worker drains the
+buffer in batches, serializes events to JSON lines and hands them to a writer.
+
+Overflow policy:
+    The buffer holds at most ``capacity`` non-critical events. When it is full,
+    ``DROP_OLDEST`` evicts the oldest buffered event and ``DROP_NEWEST`` rejects
+    the incoming one. CRITICAL events are kept in a separate unbounded queue and
+    are never dropped. Dropped events are counted and reported in ``stats()``.
+
+Shutdown:
+    ``close()`` drains everything still buffered and stops the worker. It is
+    registered with ``atexit`` when the sink starts and is also called from the
+    application lifespan, so buffered events are flushed on shutdown.
+
+Writers:
+    ``JsonLinesAuditWriter`` appends JSON lines to a file, optionally gzip
+    compressed (one gzip member per batch), and rotates by size.
+"""
+
+import atexit
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+import gzip
+import heapq
+import itertools
+import json
+import logging
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from src.security.audit_logging import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 10_000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+# AuditEventSeverity.CRITICAL; compared by value to avoid a circular import
+CRITICAL_SEVERITY = "critical"
+
+
+class AuditOverflowPolicy(str, Enum):
+    """What to do with non-critical events when the buffer is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class JsonLinesAuditWriter:
+    """Append-only JSON lines file with size-based rotation.
+
+    Rotated files are renamed ``<name>.1`` .. ``<name>.<backup_count>``, oldest
+    last. With ``compress=True`` the file is gzip compressed; each batch is
+    written as its own gzip member, which standard gzip readers concatenate.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        compress: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        if compress and self.path.suffix != ".gz":
+            self.path = self.path.with_name(f"{self.path.name}.gz")
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def write_batch(self, lines: list[str]) -> None:
+        """Write serialized events, rotating first if the file is full."""
+        if not lines:
+            return
+        if self.max_bytes > 0 and self.path.exists() and self.path.stat().st_size >= self.max_bytes:
+            self._rotate()
+
+        payload = "".join(lines).encode("utf-8")
+        with self.path.open("ab") as handle:
+            handle.write(gzip.compress(payload) if self.compress else payload)
+
+    def _rotate(self) -> None:
+        if self.backup_count <= 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+
+    def close(self) -> None:
+        """Release writer resources (files are opened per batch)."""
+
+
+def serialize_audit_event(event: "AuditEvent") -> str:
+    """Serialize an audit event as a single JSON line."""
+    return json.dumps(event.to_dict(), default=str, separators=(",", ":")) + "\n"
+
+
+class AuditSink:
+    """Bounded ring buffer drained by a background batching worker.
+
+    Args:
+        writer: Object with ``write_batch(lines)`` and ``close()``
+        capacity: Maximum buffered non-critical events
+        batch_size: Maximum events serialized per write
+        flush_interval: Seconds the worker waits for a full batch before writing
+        overflow_policy: Which non-critical event to drop when full
+        serializer: Converts an event into one output line
+    """
+
+    def __init__(
+        self,
+        writer: JsonLinesAuditWriter,
+        capacity: int = DEFAULT_CAPACITY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        overflow_policy: AuditOverflowPolicy = AuditOverflowPolicy.DROP_OLDEST,
+        serializer: Callable[["AuditEvent"], str] = serialize_audit_event,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.writer = writer
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = AuditOverflowPolicy(overflow_policy)
+        self.serializer = serializer
+
+        self._events: deque[tuple[int, AuditEvent]] = deque()
+        self._critical: deque[tuple[int, AuditEvent]] = deque()
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        self._flush_requested = False
+        self._in_flight = 0
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.write_errors = 0
+
+    def start(self) -> "AuditSink":
+        """Start the background worker and register the shutdown flush."""
+        with self._condition:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+                self._worker.start()
+                atexit.register(self.close)
+        return self
+
+    def enqueue(self, event: "AuditEvent") -> bool:
+        """Buffer an event for asynchronous writing.
+
+        Returns:
+            False if the event was dropped by the overflow policy
+        """
+        with self._condition:
+            entry = (next(self._sequence), event)
+            if event.severity == CRITICAL_SEVERITY:
+                self._critical.append(entry)
+            elif len(self._events) < self.capacity:
+                self._events.append(entry)
+            elif self.overflow_policy == AuditOverflowPolicy.DROP_OLDEST:
+                self._events.popleft()
+                self._events.append(entry)
+                self.dropped += 1
+            else:
+                self.dropped += 1
+                return False
+
+            self.enqueued += 1
+            if len(self._events) + len(self._critical) >= self.batch_size:
+                self._condition.notify()
+        return True
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._events) + len(self._critical)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until everything buffered so far has been written.
+
+        Without a running worker the buffer is drained on the calling thread.
+
+        Returns:
+            True if the buffer was drained before the timeout
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self._drain_all()
+            return True
+
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: not self._events and not self._critical and not self._in_flight,
+                timeout=timeout,
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush buffered events and stop the worker."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+
+        if self._worker is not None:
+            self._worker.join(timeout)
+        # Anything enqueued after the worker exited is written here
+        self._drain_all()
+        self.writer.close()
+        atexit.unregister(self.close)
+
+    def stats(self) -> dict[str, Any]:
+        """Return buffer and throughput counters."""
+        with self._condition:
+            return {
+                "buffered": len(self._events) + len(self._critical),
+                "capacity": self.capacity,
+                "enqueued": self.enqueued,
+                "dropped": self.dropped,
+                "written": self.written,
+                "write_errors": self.write_errors,
+                "overflow_policy": self.overflow_policy.value,
+            }
+
+    def _take_batch(self) -> list["AuditEvent"]:
+        """Remove up to ``batch_size`` events in enqueue order (lock held)."""
+        critical = [self._critical.popleft() for _ in range(min(self.batch_size, len(self._critical)))]
+        remaining = self.batch_size - len(critical)
+        regular = [self._events.popleft() for _ in range(min(remaining, len(self._events)))]
+        return [event for _, event in heapq.merge(critical, regular, key=lambda entry: entry[0])]
+
+    def _write(self, batch: list["AuditEvent"]) -> None:
+        lines = []
+        for event in batch:
+            try:
+                lines.append(self.serializer(event))
+            except Exception as e:
+                self.write_errors += 1
+                logger.error("Failed to serialize audit event %s: %s", event.event_type, e)
+        try:
+            self.writer.write_batch(lines)
+            self.written += len(lines)
+        except Exception as e:
+            self.write_errors += len(lines)
+            logger.error("Failed to write %d audit events: %s", len(lines), e)
+
+    def _drain_all(self) -> None:
+        while True:
+            with self._condition:
+                batch = self._take_batch()
+            if not batch:
+                return
+            self._write(batch)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed
+                    or self._flush_requested
+                    or len(self._events) + len(self._critical) >= self.batch_size,
+                    timeout=self.flush_interval,
+                )
+                batch = self._take_batch()
+                self._in_flight = len(batch)
+                if not self._events and not self._critical:
+                    self._flush_requested = False
+                if not batch and self._closed:
+                    self._condition.notify_all()
+                    return
+
+            if batch:
+                self._write(batch)
+
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+
+def create_audit_sink(settings: Any) -> AuditSink:
+    """Create and start an audit sink from application settings."""
+    writer = JsonLinesAuditWriter(
+        settings.audit_log_path,
+        max_bytes=settings.audit_log_max_bytes,
+        backup_count=settings.audit_log_backup_count,
+        compress=settings.audit_log_compress,
+    )
+    return AuditSink(
+        writer,
+        capacity=settings.audit_log_buffer_size,
+        overflow_policy=AuditOverflowPolicy(settings.audit_log_overflow_policy),
+    ).start()
+
+
+__all__ = [
+    "AuditOverflowPolicy",
+    "AuditSink",
+    "JsonLinesAuditWriter",
+    "create_audit_sink",
+    "serialize_audit_event",
+]
@@ -45,10 +45,23 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response as StarletteResponse
 
 from src.config.settings import get_settings
+from src.utils.metrics_registry import get_metrics_registry
 
 
 logger = logging.getLogger(__name__)
 
+# Pre-registered request metrics (label children are cached per method/status pair)
+_http_requests = get_metrics_registry().counter(
+    "http_requests",
+    "HTTP requests processed",
+    ("method", "status_code"),
+)
+_http_request_duration = get_metrics_registry().histogram(
+    "http_request_duration_seconds",
+    "HTTP request processing time",
+    ("method",),
+)
+
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """Middleware to add security headers to all HTTP responses.
@@ -265,6 +278,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 getattr(getattr(request, "client", None), "host", "unknown"),
             )
 
+        # Record request metrics
+        _http_requests.labels(request.method, response.status_code).inc()
+        _http_request_duration.labels(request.method).observe(process_time)
+
         # Log response
         self._log_response(request, response, process_time)
 
@@ -8,12 +8,14 @@ Intelligent discovery system for development standards with hybrid approach:
 Project-level (.claude/standards/) -> User-level (~/.claude/standards/) fallback.
 """
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 import logging
 from pathlib import Path
+from typing import Any
 
 from src.utils.logging_mixin import LoggerMixin
+from src.utils.resource_catalog import ResourceCatalog, get_resource_catalog
 
 
 logger = logging.getLogger(__name__)
@@ -30,13 +32,43 @@ class StandardDefinition:
     content: str | None = None
     version: str | None = None
     last_updated: datetime | None = None
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["file_path"] = str(self.file_path)
+        data["last_updated"] = self.last_updated.isoformat() if self.last_updated else None
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "StandardDefinition":
+        """Create StandardDefinition from the output of ``to_dict``."""
+        last_updated = data.get("last_updated")
+        return cls(
+            **{
+                **data,
+                "file_path": Path(data["file_path"]),
+                "last_updated": datetime.fromisoformat(last_updated) if last_updated else None,
+            },
+        )
 
 
 class StandardsDiscoverySystem(LoggerMixin):
-    """Discovery system for development standards with project-first, user-fallback approach."""
+    """Discovery system for development standards with project-first, user-fallback approach.
     
-    def __init__(self, project_root: Path | None = None) -> None:
+    Standard files are parsed through a ResourceCatalog shared with the commands
+    and scripts discovery systems, so each file is parsed once per change.
+    """
+    
+    def __init__(self, project_root: Path | None = None, catalog: ResourceCatalog | None = None) -> None:
+        """Initialize the discovery system.
+        
+        Args:
+            project_root: Project directory (defaults to the current directory)
+            catalog: Parsed resource catalog (defaults to the shared catalog)
+        """
         super().__init__()
+        self.catalog = catalog if catalog is not None else get_resource_catalog()
         self.project_root = project_root or Path.cwd()
         self.project_standards_path = self.project_root / ".claude" / "standards"
         self.user_standards_path = Path.home() / ".claude" / "standards"
@@ -108,7 +140,7 @@ class StandardsDiscoverySystem(LoggerMixin):
         standard_file = self.project_standards_path / f"{standard_id}.md"
         if standard_file.exists():
             try:
-                return self._create_standard_definition(standard_id, standard_file, "project")
+                return self._load_standard_definition(standard_id, standard_file, "project")
             except Exception as e:
                 self.logger.warning("Failed to create project standard %s: %s", standard_id, e)
                 return None
@@ -123,7 +155,7 @@ class StandardsDiscoverySystem(LoggerMixin):
         standard_file = self.user_standards_path / f"{standard_id}.md"
         if standard_file.exists():
             try:
-                return self._create_standard_definition(standard_id, standard_file, "user")
+                return self._load_standard_definition(standard_id, standard_file, "user")
             except Exception as e:
                 self.logger.warning("Failed to create user standard %s: %s", standard_id, e)
                 return None
@@ -136,6 +168,16 @@ class StandardsDiscoverySystem(LoggerMixin):
         # to include standards shipped with the application
         return None
     
+    def _load_standard_definition(self, standard_id: str, file_path: Path, source_type: str) -> StandardDefinition:
+        """Get the StandardDefinition for a file from the catalog, parsing the file only if it changed."""
+        return self.catalog.load(
+            "standards",
+            file_path,
+            lambda: self._create_standard_definition(standard_id, file_path, source_type),
+            StandardDefinition.from_dict,
+            identity=(standard_id, source_type),
+        )
+    
     def _create_standard_definition(self, standard_id: str, file_path: Path, source_type: str) -> StandardDefinition:
         """Create a StandardDefinition from a file path."""
         try:
@@ -175,8 +217,19 @@ class StandardsDiscoverySystem(LoggerMixin):
             raise
     
     def _refresh_standards_cache(self) -> None:
-        """Refresh the standards cache by scanning all available sources."""
+        """Refresh the standards cache by scanning all available sources.
+        
+        Standard files are only parsed if the catalog has not seen their
+        current version, even in an earlier process.
+        """
         self.logger.debug("Refreshing standards cache")
+        with self.catalog.timed_scan("standards"):
+            self._scan_standards()
+        self.catalog.save_snapshot()
+        self.logger.info("Refreshed standards cache with %s standards", len(self._standards_cache))
+    
+    def _scan_standards(self) -> None:
+        """Rebuild the standards cache from the project and user standards directories."""
         self._standards_cache.clear()
         
         # Collect all standard IDs from all sources
@@ -207,7 +260,6 @@ class StandardsDiscoverySystem(LoggerMixin):
                 self._standards_cache[standard_id] = standard
         
         self._cache_timestamp = utc_now()
-        self.logger.info("Refreshed standards cache with %s standards", len(self._standards_cache))
     
     def _should_refresh_cache(self) -> bool:
         """Check if cache should be refreshed."""
@@ -230,6 +282,7 @@ class StandardsDiscoverySystem(LoggerMixin):
                 if self._cache_timestamp else None
             ),
             "available_standards": self.get_available_standards(),
+            "catalog": self.catalog.get_stats(),
         }
 
 
@@ -0,0 +1,331 @@
+"""
+Streaming file extraction helpers for Journey 1 uploads.
+
+Uploaded files are read incrementally so that memory stays bounded by a
+per-file byte budget rather than by the size or number of uploads:
+
+- Text files are read up to the byte budget.
+- CSV files are scanned line by line; row counts and column consistency
+  cover the whole file while only the budgeted prefix is kept.
+- JSON files within the budget are parsed as usual. Larger files are scanned
+  one top-level item at a time, so memory is bounded by the largest top-level
+  value instead of the whole document.
+
+``ExtractionCache`` keeps extracted results keyed by content hash, file name
+and byte budget, so re-uploading the same document only costs a hashing pass.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+import hashlib
+import json
+from pathlib import Path
+import threading
+from typing import Any
+
+
+DEFAULT_BYTE_BUDGET = 1024 * 1024  # 1MB of extracted content per file
+READ_CHUNK_SIZE = 64 * 1024
+CSV_SAMPLE_ROWS = 5
+JSON_PREVIEW_KEYS = 5
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(READ_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_text_prefix(path: Path, byte_budget: int) -> tuple[str, bool]:
+    """
+    Read at most ``byte_budget`` bytes of a text file.
+
+    Returns:
+        Tuple of (decoded text, whether the file was truncated)
+    """
+    with path.open("rb") as handle:
+        data = handle.read(byte_budget + 1)
+    truncated = len(data) > byte_budget
+    text = data[:byte_budget].decode("utf-8", errors="ignore")
+    # Match text-mode reads, which translate line endings
+    return text.replace("\r\n", "\n").replace("\r", "\n"), truncated
+
+
+def iter_text_chunks(path: Path) -> Iterator[str]:
+    """Yield decoded text chunks of a file."""
+    with path.open(encoding="utf-8", errors="ignore") as handle:
+        while chunk := handle.read(READ_CHUNK_SIZE):
+            yield chunk
+
+
+@dataclass
+class CsvScan:
+    """Structure of a CSV document gathered in a single pass.
+
+    Attributes:
+        total_lines: Number of lines, counted like ``content.split("\\n")``
+        columns: Header columns
+        inconsistent_columns: Whether any non-empty row has a different column count
+        sample_lines: The first rows, including the header
+        content: The document up to the byte budget
+        truncated: Whether ``content`` stops before the end of the document
+    """
+
+    total_lines: int = 0
+    columns: list[str] = field(default_factory=list)
+    inconsistent_columns: bool = False
+    sample_lines: list[str] = field(default_factory=list)
+    content: str = ""
+    truncated: bool = False
+
+
+def scan_csv(lines: Iterable[str], byte_budget: int | None = DEFAULT_BYTE_BUDGET) -> CsvScan:
+    """
+    Analyze CSV lines without holding more than ``byte_budget`` of content.
+
+    Args:
+        lines: Lines including their trailing newline, e.g. an open file
+        byte_budget: Maximum UTF-8 bytes of content to keep (None keeps everything)
+
+    Returns:
+        CsvScan: Structure of the whole document and its budgeted prefix
+    """
+    scan = CsvScan()
+    kept: list[str] = []
+    kept_bytes = 0
+    ends_with_newline = True
+
+    for raw_line in lines:
+        ends_with_newline = raw_line.endswith("\n")
+        line = raw_line[:-1] if ends_with_newline else raw_line
+        scan.total_lines += 1
+
+        if scan.total_lines == 1:
+            scan.columns = line.split(",")
+        elif not scan.inconsistent_columns and line.strip() and len(line.split(",")) != len(scan.columns):
+            scan.inconsistent_columns = True
+        if len(scan.sample_lines) < CSV_SAMPLE_ROWS:
+            scan.sample_lines.append(line)
+
+        if not scan.truncated:
+            size = len(raw_line.encode("utf-8")) if byte_budget is not None else 0
+            if byte_budget is None or kept_bytes + size <= byte_budget:
+                kept.append(raw_line)
+                kept_bytes += size
+            else:
+                scan.truncated = True
+
+    # split("\n") yields one more element than there are newlines
+    if scan.total_lines == 0 or ends_with_newline:
+        scan.total_lines += 1
+        if len(scan.sample_lines) < CSV_SAMPLE_ROWS:
+            scan.sample_lines.append("")
+        if scan.total_lines == 1:
+            scan.columns = [""]
+
+    scan.content = "".join(kept)
+    return scan
+
+
+@dataclass
+class JsonStructure:
+    """Top-level structure of a JSON document.
+
+    Attributes:
+        data_type: Python type name of the top-level value
+        length: Number of top-level keys or items (None for scalars)
+        keys: The first top-level keys of an object
+        first_item_type: Python type name of the first array item
+    """
+
+    data_type: str
+    length: int | None = None
+    keys: list[str] = field(default_factory=list)
+    first_item_type: str | None = None
+
+    @classmethod
+    def from_value(cls, data: Any) -> "JsonStructure":
+        """Describe an already parsed JSON value."""
+        if isinstance(data, dict):
+            return cls("dict", length=len(data), keys=list(data)[:JSON_PREVIEW_KEYS])
+        if isinstance(data, list):
+            return cls("list", length=len(data), first_item_type=type(data[0]).__name__ if data else None)
+        return cls(type(data).__name__)
+
+
+class _JsonStream:
+    """Decodes JSON values from text chunks, keeping only the unread part buffered."""
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self, target: int = 0) -> bool:
+        """Read chunks until ``target`` characters are unread (at least one chunk); False at end."""
+        parts = [self._buffer[self._pos :]]
+        unread = len(parts[0])
+        for chunk in self._chunks:
+            parts.append(chunk)
+            unread += len(chunk)
+            if unread >= target:
+                break
+        if len(parts) == 1:
+            return False
+        # Joined once per call, so growing the buffer copies each character a bounded number of times
+        self._buffer = "".join(parts)
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ("" at end)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos : self._pos + 1]
+
+    def expect(self, characters: str) -> str:
+        """Consume the next non-whitespace character, which must be one of ``characters``."""
+        char = self.peek()
+        if not char or char not in characters:
+            raise json.JSONDecodeError(f"Expecting one of {characters!r}", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Double the buffered text before retrying so large values decode in linear time
+                if not self._fill(2 * max(len(self._buffer) - self._pos, READ_CHUNK_SIZE)):
+                    raise
+                continue
+            # A number may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def scan_json_structure(chunks: Iterable[str]) -> JsonStructure:
+    """
+    Determine the top-level structure of a JSON document one item at a time.
+
+    Args:
+        chunks: Text chunks of the document
+
+    Returns:
+        JsonStructure: Type, size and first keys or item type
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    stream = _JsonStream(chunks)
+    opening = stream.peek()
+
+    if opening == "{":
+        stream.expect("{")
+        structure = JsonStructure("dict", length=0)
+        if stream.peek() == "}":
+            stream.expect("}")
+        else:
+            while True:
+                key = stream.value()
+                stream.expect(":")
+                stream.value()
+                structure.length += 1
+                if len(structure.keys) < JSON_PREVIEW_KEYS:
+                    structure.keys.append(key)
+                if stream.expect(",}") == "}":
+                    break
+    elif opening == "[":
+        stream.expect("[")
+        structure = JsonStructure("list", length=0)
+        if stream.peek() == "]":
+            stream.expect("]")
+        else:
+            while True:
+                item = stream.value()
+                if structure.length == 0:
+                    structure.first_item_type = type(item).__name__
+                structure.length += 1
+                if stream.expect(",]") == "]":
+                    break
+    else:
+        structure = JsonStructure(type(stream.value()).__name__)
+
+    if stream.peek():
+        raise json.JSONDecodeError("Extra data", "", 0)
+    return structure
+
+
+class ExtractionCache:
+    """Thread-safe LRU cache of extraction results keyed by content hash, file name and byte budget."""
+
+    def __init__(self, max_chars: int = 32 * 1024 * 1024) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_chars: Total characters of extracted content to retain
+        """
+        self.max_chars = max_chars
+        self._entries: OrderedDict[tuple[str, str, int], tuple[str, str]] = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, content_hash: str, file_name: str, byte_budget: int) -> tuple[str, str] | None:
+        """Get a cached (content, file_type) result extracted with ``byte_budget``."""
+        key = (content_hash, file_name, byte_budget)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, content_hash: str, file_name: str, byte_budget: int, result: tuple[str, str]) -> None:
+        """Cache a (content, file_type) result, evicting the least recently used ones."""
+        size = len(result[0])
+        if size > self.max_chars:
+            return
+        key = (content_hash, file_name, byte_budget)
+        with self._lock:
+            if previous := self._entries.pop(key, None):
+                self._chars -= len(previous[0])
+            self._entries[key] = result
+            self._chars += size
+            while self._chars > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._chars -= len(evicted[0])
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {"entries": len(self._entries), "chars": self._chars, "hits": self.hits, "misses": self.misses}
+
+
+__all__ = [
+    "DEFAULT_BYTE_BUDGET",
+    "CsvScan",
+    "ExtractionCache",
+    "JsonStructure",
+    "file_sha256",
+    "iter_text_chunks",
+    "read_text_prefix",
+    "scan_csv",
+    "scan_json_structure",
+]
@@ -6,6 +6,7 @@ with file upload support, model selection, and code snippet copying.
 """
 
 import asyncio
+import io
 import json
 import logging
 from pathlib import Path
@@ -16,6 +17,17 @@ from src.agents.create_agent import CreateAgent
 from src.core.hyde_processor import HydeProcessor
 from src.core.query_counselor import QueryCounselor
 from src.ui.components.shared.export_utils import ExportUtils
+from src.ui.journeys.file_extraction import (
+    DEFAULT_BYTE_BUDGET,
+    CsvScan,
+    ExtractionCache,
+    JsonStructure,
+    file_sha256,
+    iter_text_chunks,
+    read_text_prefix,
+    scan_csv,
+    scan_json_structure,
+)
 from src.utils.logging_mixin import LoggerMixin
 
 
@@ -55,6 +67,8 @@ class Journey1SmartTemplates(LoggerMixin):
         self.supported_file_types = [".txt", ".md", ".pdf", ".docx", ".csv", ".json"]
         self.max_file_size = 10 * 1024 * 1024  # 10MB
         self.max_files = 5
+        self.max_extract_bytes = DEFAULT_BYTE_BUDGET  # Content kept per file
+        self.extraction_cache = ExtractionCache()
 
         # Initialize real CREATE agent and processing components
         self.create_agent = CreateAgent()
@@ -85,12 +99,15 @@ Please provide a valid file path""",
             file_path_obj = Path(file_path)
             file_extension = file_path_obj.suffix.lower()
 
-            if file_extension in [".txt", ".md"]:
-                with file_path_obj.open(encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                # Clean up common formatting issues
-                content = self._clean_text_content(content)
-                return content, file_extension
+            if file_extension in [".txt", ".md", ".csv", ".json"]:
+                # Re-uploads of the same document reuse the cached extraction
+                content_hash = file_sha256(file_path_obj)
+                cache_key = (content_hash, file_path_obj.name, self.max_extract_bytes)
+                if cached := self.extraction_cache.get(*cache_key):
+                    return cached
+                result = self._extract_text_file(file_path_obj, file_extension), file_extension
+                self.extraction_cache.put(*cache_key, result)
+                return result
 
             if file_extension == ".pdf":
                 # Enhanced PDF processing with metadata
@@ -116,20 +133,6 @@ Content preview not available - please convert to text format""",
                     file_extension,
                 )
 
-            if file_extension == ".csv":
-                with file_path_obj.open(encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                # Enhanced CSV processing with structure analysis
-                processed_content = self._process_csv_content(content, file_path_obj.name)
-                return processed_content, file_extension
-
-            if file_extension == ".json":
-                with file_path_obj.open(encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                # Enhanced JSON processing with structure analysis
-                processed_content = self._process_json_content(content, file_path_obj.name)
-                return processed_content, file_extension
-
             return (
                 f"""[Unsupported file type: {file_extension}]
 File: {file_path_obj.name}
@@ -160,6 +163,44 @@ Please check file format and try again""",
                 "error",
             )
 
+    def _extract_text_file(self, file_path: Path, file_extension: str) -> str:
+        """
+        Extract a text-based file, reading at most ``max_extract_bytes`` of content.
+
+        Args:
+            file_path: Path to the file
+            file_extension: One of .txt, .md, .csv or .json
+
+        Returns:
+            Extracted content
+        """
+        if file_extension == ".csv":
+            # Structure analysis streams the whole file; only the budgeted prefix is kept
+            with file_path.open(encoding="utf-8", errors="ignore") as f:
+                scan = scan_csv(f, self.max_extract_bytes)
+            return self._format_csv_scan(scan, file_path.name)
+
+        if file_extension == ".json":
+            if file_path.stat().st_size <= self.max_extract_bytes:
+                content = file_path.read_text(encoding="utf-8", errors="ignore")
+                return self._process_json_content(content, file_path.name)
+            return self._process_large_json_file(file_path)
+
+        content, truncated = read_text_prefix(file_path, self.max_extract_bytes)
+        # Clean up common formatting issues
+        content = self._clean_text_content(content)
+        if truncated:
+            content += "\n" + self._truncation_notice(file_path)
+        return content
+
+    def _truncation_notice(self, file_path: Path) -> str:
+        """Describe how much of an oversized file was extracted."""
+        file_size = file_path.stat().st_size
+        return (
+            f"[Truncated: showing the first {self.max_extract_bytes / 1024:.0f} KB "
+            f"of {file_size / 1024:.1f} KB]"
+        )
+
     def process_files(self, files: list[Any]) -> dict[str, Any]:
         """
         Process uploaded files and extract content with enhanced integration.
@@ -182,7 +223,7 @@ Please check file format and try again""",
             }
 
         processed_files = []
-        combined_content = ""
+        content_parts: list[str] = []
         total_size = 0
         supported_files = 0
         errors = []
@@ -207,7 +248,6 @@ Please check file format and try again""",
                     "content": (
                         content[:CONTENT_PREVIEW_LENGTH] + "..." if len(content) > CONTENT_PREVIEW_LENGTH else content
                     ),
-                    "full_content": content,
                     "is_supported": is_supported,
                     "processing_status": "success" if not content.startswith("[Error") else "error",
                     "preview_lines": len(content.split("\n")) if content else 0,
@@ -219,7 +259,7 @@ Please check file format and try again""",
                 # Add to combined content with better formatting
                 separator = f"\\n\\n{'='*60}\\n"
                 file_header = f"📄 FILE: {file_info['name']} ({file_info['size_mb']:.1f}MB)\\n"
-                combined_content += f"{separator}{file_header}{'='*60}\\n{content}"
+                content_parts.append(f"{separator}{file_header}{'='*60}\\n{content}")
 
             except Exception as e:
                 logger.error("Error processing file %d: %s", i + 1, e)
@@ -232,7 +272,6 @@ Please check file format and try again""",
                     "size": 0,
                     "size_mb": 0,
                     "content": f"Error processing file: {e!s}",
-                    "full_content": "",
                     "is_supported": False,
                     "processing_status": "error",
                     "preview_lines": 0,
@@ -252,7 +291,7 @@ Please check file format and try again""",
 
         return {
             "files": processed_files,
-            "content": combined_content,
+            "content": "".join(content_parts),
             "summary": " | ".join(summary_parts) if summary_parts else "No files processed",
             "file_count": len(processed_files),
             "total_size": total_size,
@@ -1526,76 +1565,65 @@ Generate a comprehensive, professional enhanced prompt that demonstrates sophist
 
     def _process_csv_content(self, content: str, filename: str) -> str:
         """Process CSV content with structure analysis."""
-        lines = content.split("\n")
-        total_lines = len(lines)
-
-        # Try to detect headers
-        if total_lines > 0:
-            header_line = lines[0]
-            columns = header_line.split(",")
-            column_count = len(columns)
-
-            # Check for malformed CSV (inconsistent column count)
-            has_inconsistent_columns = False
-            if total_lines > 1:
-                for line in lines[1:]:
-                    if line.strip():  # Skip empty lines
-                        line_columns = len(line.split(","))
-                        if line_columns != column_count:
-                            has_inconsistent_columns = True
-                            break
-
-            # Generate summary with expected format
-            summary = f"""[CSV Data: {filename}]
+        return self._format_csv_scan(scan_csv(io.StringIO(content), byte_budget=None), filename)
+
+    def _format_csv_scan(self, scan: CsvScan, filename: str) -> str:
+        """Format a CSV structure scan with sample rows and the extracted content."""
+        columns = scan.columns
+        column_count = len(columns)
+
+        # Generate summary with expected format
+        summary = f"""[CSV Data: {filename}]
 CSV Data Structure Analysis
-- Total rows: {total_lines}
+- Total rows: {scan.total_lines}
 - Columns: {column_count}
 - Headers: {', '.join(col.strip() for col in columns[:CSV_PREVIEW_COLUMN_LIMIT])}{"..." if column_count > CSV_PREVIEW_COLUMN_LIMIT else ""}
-- {total_lines} rows detected
+- {scan.total_lines} rows detected
 - {column_count} columns detected"""
 
-            if has_inconsistent_columns:
-                summary += "\n- Warning: inconsistent column count detected"
+        if scan.inconsistent_columns:
+            summary += "\n- Warning: inconsistent column count detected"
 
-            summary += f"""
+        summary += f"""
 
 Sample Data (first 5 rows):
-{chr(10).join(lines[:5])}
+{chr(10).join(scan.sample_lines)}
 
 Full Content:
-{content}"""
-            return summary
+{scan.content}"""
+        if scan.truncated:
+            summary += f"\n[Truncated: content limited to the first {self.max_extract_bytes / 1024:.0f} KB]"
+        return summary
+
+    def _describe_json_structure(self, structure: JsonStructure) -> str:
+        """Format the structure analysis lines shared by all JSON extraction paths."""
+        if structure.data_type == "dict":
+            keys = structure.keys
+            structure_info = f"Object with {structure.length} keys: {', '.join(keys)}{'...' if structure.length > CSV_PREVIEW_COLUMN_LIMIT else ''}"
+        elif structure.data_type == "list":
+            structure_info = f"Array with {structure.length} items"
+            if structure.first_item_type:
+                structure_info += f" (first item: {structure.first_item_type})"
+        else:
+            structure_info = f"Simple {structure.data_type} value"
 
-        return f"[CSV Data: {filename}]\nContent:\n{content}"
+        # Add key count for objects
+        key_info = ""
+        if structure.data_type == "dict":
+            key_info = f"\n- {structure.length} top-level keys"
+
+        return f"""- Type: {structure.data_type}
+- Structure: {structure_info}
+- Valid JSON structure detected{key_info}"""
 
     def _process_json_content(self, content: str, filename: str) -> str:
         """Process JSON content with structure analysis."""
         try:
             data = json.loads(content)
 
-            # Analyze structure
-            data_type = type(data).__name__
-            if isinstance(data, dict):
-                keys = list(data.keys())[:CSV_PREVIEW_COLUMN_LIMIT]
-                structure_info = f"Object with {len(data)} keys: {', '.join(keys)}{'...' if len(data) > CSV_PREVIEW_COLUMN_LIMIT else ''}"
-            elif isinstance(data, list):
-                structure_info = f"Array with {len(data)} items"
-                if len(data) > 0:
-                    first_item_type = type(data[0]).__name__
-                    structure_info += f" (first item: {first_item_type})"
-            else:
-                structure_info = f"Simple {data_type} value"
-
-            # Add key count for objects
-            key_info = ""
-            if isinstance(data, dict):
-                key_info = f"\n- {len(data)} top-level keys"
-
             return f"""[JSON Data: {filename}]
 JSON Data Structure Analysis
-- Type: {data_type}
-- Structure: {structure_info}
-- Valid JSON structure detected{key_info}
+{self._describe_json_structure(JsonStructure.from_value(data))}
 
 Original Content:
 {content}
@@ -1623,6 +1651,31 @@ Error: {e!s}
 Raw Content:
 {content}"""
 
+    def _process_large_json_file(self, file_path: Path) -> str:
+        """Analyze a JSON file larger than the extraction budget without loading it whole."""
+        preview, _ = read_text_prefix(file_path, self.max_extract_bytes)
+        notice = self._truncation_notice(file_path)
+        try:
+            structure = scan_json_structure(iter_text_chunks(file_path))
+        except json.JSONDecodeError as e:
+            return f"""[JSON Data: {file_path.name}]
+JSON Data Structure Analysis
+Status: Invalid JSON format
+Error: {e!s}
+Invalid JSON syntax detected
+
+Raw Content:
+{preview}
+{notice}"""
+
+        return f"""[JSON Data: {file_path.name}]
+JSON Data Structure Analysis
+{self._describe_json_structure(structure)}
+
+Original Content:
+{preview}
+{notice}"""
+
     def validate_file_size(self, file_path: str) -> tuple[bool, str]:
         """
         Validate file size against maximum allowed size.
@@ -12,6 +12,7 @@ from typing import Any
 import gradio as gr
 
 from src.mcp_integration.openrouter_client import OpenRouterClient
+from src.mcp_integration.zen_session import ZenSession
 from src.mcp_integration.zen_stdio_client import ZenStdioMCPClient
 from src.utils.logging_mixin import LoggerMixin
 
@@ -41,6 +42,7 @@ class Journey2IntelligentSearch(LoggerMixin):
         super().__init__()
         self.openrouter_client = OpenRouterClient()
         self.zen_client = ZenStdioMCPClient()
+        self.zen_session = ZenSession(self.zen_client)  # Connection shared by every request
         self.mcp_enabled = True  # Enable MCP routing by default
         self._routing_metadata: dict[str, Any] = {}  # Track routing decisions
 
@@ -78,12 +80,12 @@ class Journey2IntelligentSearch(LoggerMixin):
             try:
                 self.logger.info("🚀 Attempting zen MCP intelligent routing...")
 
-                # Connect to zen MCP server
-                zen_connected = await self.zen_client.connect()
+                # Reuse the shared zen MCP connection
+                zen_connected = await self.zen_session.ensure_connected()
 
                 if zen_connected:
-                    # Try to get model recommendations first
-                    recommendations = await self.zen_client.get_model_recommendations(enhanced_prompt)
+                    # Recommendations come from the cache or run alongside the execution
+                    recommendations, result = await self.zen_session.route(enhanced_prompt)
 
                     if recommendations:
                         self.logger.info(
@@ -94,9 +96,6 @@ class Journey2IntelligentSearch(LoggerMixin):
                         routing_metadata["task_type"] = recommendations.task_type
                         routing_metadata["complexity_level"] = recommendations.complexity_level
 
-                    # Execute with zen routing
-                    result = await self.zen_client.execute_with_routing(enhanced_prompt)
-
                     if result["success"]:
                         # Convert zen result to Response format
                         from src.mcp_integration.mcp_client import Response
@@ -116,8 +115,6 @@ class Journey2IntelligentSearch(LoggerMixin):
                         routing_metadata["cost_optimized"] = result["result"]["routing_metadata"].get(
                             "cost_optimized", False,
                         )
-
-                        await self.zen_client.disconnect()
                         routing_metadata["routing_time_ms"] = (time.time() - routing_start) * 1000
 
                         self.logger.info("✅ Zen MCP routing successful!")
@@ -129,15 +126,12 @@ class Journey2IntelligentSearch(LoggerMixin):
                     self.logger.warning("⚠️ Could not connect to zen MCP server")
                     routing_metadata["error_details"] = "Connection failed"
 
-                # Ensure cleanup on failure
-                await self.zen_client.disconnect()
-
             except Exception as e:
                 self.logger.error("❌ Zen MCP routing error: %s", e)
                 routing_metadata["error_details"] = str(e)
-                # Ensure cleanup on exception
+                # Drop the shared connection so the next request starts from a clean one
                 try:
-                    await self.zen_client.disconnect()
+                    await self.zen_session.reset()
                 except Exception as e:
                     self.logger.debug("Error during zen client disconnect: %s", e)
 
@@ -11,7 +11,8 @@ Implements comprehensive file upload, OpenRouter model selection,
 and code snippet copying functionality.
 """
 
-from collections import defaultdict, deque
+import asyncio
+from collections.abc import Coroutine
 import gzip
 import json
 import logging
@@ -19,6 +20,7 @@ import mimetypes
 import os
 from pathlib import Path
 import tarfile
+import threading
 import time
 from typing import Any
 import zipfile
@@ -36,6 +38,12 @@ from src.ui.admin.tier_management_interface import TierManagementInterface
 from src.ui.components.shared.export_utils import ExportUtils
 from src.ui.journeys.journey1_smart_templates import Journey1SmartTemplates
 from src.utils.logging_mixin import LoggerMixin
+from src.utils.rate_limit_store import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RateWindow,
+    create_rate_limit_backend,
+)
 
 
 # Configure logging
@@ -63,9 +71,12 @@ class RateLimiter:
     """
     Rate limiter to prevent DoS attacks through request flooding.
 
-    Implements sliding window rate limiting with separate limits for:
+    Implements sliding-window-counter rate limiting with separate limits for:
     - General requests per minute/hour
     - File uploads per hour
+
+    Checks are O(1) per session. State lives in a pluggable backend, so limits
+    can be shared between workers (see ``src.utils.rate_limit_store``).
     """
 
     def __init__(
@@ -73,44 +84,22 @@ class RateLimiter:
         max_requests_per_minute: int = 30,
         max_requests_per_hour: int = 200,
         max_file_uploads_per_hour: int = 50,
+        backend: RateLimitBackend | None = None,
     ) -> None:
         self.max_requests_per_minute = max_requests_per_minute
         self.max_requests_per_hour = max_requests_per_hour
         self.max_file_uploads_per_hour = max_file_uploads_per_hour
+        self.backend = backend or InMemoryRateLimitBackend()
 
-        # Track requests per session using sliding windows
-        self.request_windows: dict[str, deque] = defaultdict(deque)
-        self.file_upload_windows: dict[str, deque] = defaultdict(deque)
-
-        # Cleanup old entries periodically
-        self.last_cleanup = time.time()
-        self.cleanup_interval = 300  # 5 minutes
-
-    def _cleanup_old_entries(self) -> None:
-        """Remove old entries to prevent memory leaks."""
-        current_time = time.time()
-        if current_time - self.last_cleanup < self.cleanup_interval:
-            return
-
-        cutoff_time = current_time - 3600  # Remove entries older than 1 hour
-
-        # Clean request windows
-        for session_id in list(self.request_windows.keys()):
-            window = self.request_windows[session_id]
-            while window and window[0] < cutoff_time:
-                window.popleft()
-            if not window:
-                del self.request_windows[session_id]
+    @property
+    def request_limits(self) -> tuple[RateWindow, RateWindow]:
+        """Per-minute and per-hour request windows for the current limits."""
+        return RateWindow(60, self.max_requests_per_minute), RateWindow(3600, self.max_requests_per_hour)
 
-        # Clean file upload windows
-        for session_id in list(self.file_upload_windows.keys()):
-            window = self.file_upload_windows[session_id]
-            while window and window[0] < cutoff_time:
-                window.popleft()
-            if not window:
-                del self.file_upload_windows[session_id]
-
-        self.last_cleanup = current_time
+    @property
+    def file_upload_limits(self) -> tuple[RateWindow]:
+        """Hourly file upload window for the current limit."""
+        return (RateWindow(3600, self.max_file_uploads_per_hour),)
 
     def check_request_rate(self, session_id: str) -> bool:
         """
@@ -122,29 +111,7 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limited
         """
-        self._cleanup_old_entries()
-
-        current_time = time.time()
-        window = self.request_windows[session_id]
-
-        # Remove requests older than 1 hour
-        while window and window[0] < current_time - 3600:
-            window.popleft()
-
-        # Count requests in last minute and hour
-        minute_cutoff = current_time - 60
-        requests_last_minute = sum(1 for timestamp in window if timestamp > minute_cutoff)
-        requests_last_hour = len(window)
-
-        # Check limits
-        if requests_last_minute >= self.max_requests_per_minute:
-            return False
-        if requests_last_hour >= self.max_requests_per_hour:
-            return False
-
-        # Record this request
-        window.append(current_time)
-        return True
+        return self.backend.hit(f"request:{session_id}", self.request_limits, time.time())
 
     def check_file_upload_rate(self, session_id: str) -> bool:
         """
@@ -156,41 +123,22 @@ class RateLimiter:
         Returns:
             True if upload is allowed, False if rate limited
         """
-        self._cleanup_old_entries()
-
-        current_time = time.time()
-        window = self.file_upload_windows[session_id]
-
-        # Remove uploads older than 1 hour
-        while window and window[0] < current_time - 3600:
-            window.popleft()
-
-        # Check hourly limit
-        if len(window) >= self.max_file_uploads_per_hour:
-            return False
-
-        # Record this upload
-        window.append(current_time)
-        return True
+        return self.backend.hit(f"upload:{session_id}", self.file_upload_limits, time.time())
 
     def get_rate_limit_status(self, session_id: str) -> dict[str, Any]:
         """Get current rate limit status for a session."""
         current_time = time.time()
-
-        # Request window
-        request_window = self.request_windows.get(session_id, deque())
-        minute_cutoff = current_time - 60
-        requests_last_minute = sum(1 for timestamp in request_window if timestamp > minute_cutoff)
-        requests_last_hour = len(request_window)
-
-        # File upload window
-        upload_window = self.file_upload_windows.get(session_id, deque())
-        uploads_last_hour = len(upload_window)
+        requests_last_minute, requests_last_hour = self.backend.counts(
+            f"request:{session_id}",
+            self.request_limits,
+            current_time,
+        )
+        (uploads_last_hour,) = self.backend.counts(f"upload:{session_id}", self.file_upload_limits, current_time)
 
         return {
-            "requests_last_minute": requests_last_minute,
-            "requests_last_hour": requests_last_hour,
-            "uploads_last_hour": uploads_last_hour,
+            "requests_last_minute": round(requests_last_minute),
+            "requests_last_hour": round(requests_last_hour),
+            "uploads_last_hour": round(uploads_last_hour),
             "limits": {
                 "max_requests_per_minute": self.max_requests_per_minute,
                 "max_requests_per_hour": self.max_requests_per_hour,
@@ -234,12 +182,17 @@ class MultiJourneyInterface(LoggerMixin):
             max_requests_per_minute=30,  # 30 requests per minute per session
             max_requests_per_hour=200,  # 200 requests per hour per session
             max_file_uploads_per_hour=50,  # 50 file uploads per hour per session
+            backend=create_rate_limit_backend(self.settings),
         )
 
         # Session management for tests (server-side session tracking)
         self.session_states = {}
         self.active_sessions = {}
 
+        # Journey 2 requests share one event loop so its Zen session stays connected between them
+        self._journey2_loop: asyncio.AbstractEventLoop | None = None
+        self._journey2_loop_lock = threading.Lock()
+
         # Initialize Admin Interface (gracefully handle configuration errors in tests)
         try:
             self.admin_interface = TierManagementInterface()
@@ -248,6 +201,27 @@ class MultiJourneyInterface(LoggerMixin):
             # Create a simple development admin interface for local use
             self.admin_interface = self._create_dev_admin_interface()
 
+    def _run_on_journey2_loop(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run a coroutine on the long-lived Journey 2 event loop and wait for its result.
+
+        Gradio calls handlers from worker threads. The loop runs in its own daemon
+        thread and is started on first use, so loop-bound state such as the Zen
+        session's connection survives across requests.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        with self._journey2_loop_lock:
+            if self._journey2_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="journey2-event-loop", daemon=True).start()
+                self._journey2_loop = loop
+        return asyncio.run_coroutine_threadsafe(coro, self._journey2_loop).result()
+
     def _create_dev_admin_interface(self):
         """Create a simple development admin interface when auth fails."""
 
@@ -867,7 +841,7 @@ class MultiJourneyInterface(LoggerMixin):
                 # Create admin interface - it creates its own Tab internally
                 # Skip admin interface creation during pytest to avoid Gradio compatibility issues
                 admin_tab = self.admin_interface.create_admin_interface()
-                
+
                 # Setup admin tab visibility based on user context
                 self._setup_admin_visibility(admin_tab, user_context)
 
@@ -1522,8 +1496,8 @@ class MultiJourneyInterface(LoggerMixin):
         """Create Journey 2: Intelligent Search interface with zen routing."""
         from src.ui.journeys.journey2_intelligent_search import Journey2IntelligentSearch
 
-        # Initialize Journey 2 processor
-        journey2_processor = Journey2IntelligentSearch()
+        # Initialize Journey 2 processor, kept for the lifetime of the interface
+        self.journey2_processor = journey2_processor = Journey2IntelligentSearch()
 
         with gr.Column():
             # Journey Header
@@ -1656,132 +1630,18 @@ class MultiJourneyInterface(LoggerMixin):
                             "❌ Please provide a prompt to execute.",
                         )
 
-                    # Import zen client for routing
-                    from src.mcp_integration.mcp_client import ZenMCPClient
-
-                    # Initialize zen client
-                    zen_client = ZenMCPClient()
-
-                    # Prepare execution request
-                    start_time = time.time()
-
-                    # Determine model based on mode
-                    if model_mode == "custom":
-                        selected_model = custom_model_selection
-                    elif model_mode == "free_mode":
-                        selected_model = "deepseek/deepseek-chat:free"
-                    elif model_mode == "premium":
-                        selected_model = "anthropic/claude-3-5-sonnet-20241022"
-                    else:  # standard
-                        selected_model = "openai/gpt-4o-mini"
-
-                    # Execute through zen routing
-                    import asyncio
-
-                    async def execute_async():
-                        try:
-                            # Get routing recommendation first
-                            routing_analysis = await zen_client.get_model_recommendations(prompt)
-
-                            if routing_analysis and routing_analysis.primary_recommendation:
-                                recommended_model = routing_analysis.primary_recommendation.model_id
-                                routing_reason = routing_analysis.primary_recommendation.reasoning
-                            else:
-                                # Fallback to direct execution
-                                recommended_model = selected_model
-                                routing_reason = "Direct execution (zen routing unavailable)"
-
-                            # Execute with routing
-                            execution_result = await zen_client.execute_with_routing(prompt)
-
-                            if execution_result and execution_result.get("success"):
-                                response_content = execution_result["result"]["content"]
-                                actual_model = execution_result["result"].get("model_used", recommended_model)
-                                response_time = execution_result["result"].get(
-                                    "response_time",
-                                    time.time() - start_time,
-                                )
-                                estimated_cost = execution_result["result"].get("estimated_cost", 0.0)
-
-                                return (
-                                    response_content,
-                                    f"""
-                                    <div class="model-attribution">
-                                        <strong>🤖 Model Used:</strong> {actual_model} |
-                                        <strong>⏱️ Response Time:</strong> {response_time:.2f}s |
-                                        <strong>💰 Cost:</strong> ${estimated_cost:.4f} |
-                                        <strong>🎯 Routing:</strong> {routing_reason}
-                                    </div>
-                                    """,
-                                    f"""
-                                    <div class="execution-stats">
-                                        <h4>📊 Zen Routing Statistics</h4>
-                                        <ul>
-                                            <li><strong>Recommended Model:</strong> {recommended_model}</li>
-                                            <li><strong>Actual Model:</strong> {actual_model}</li>
-                                            <li><strong>Temperature:</strong> {temp}</li>
-                                            <li><strong>Max Tokens:</strong> {max_tok}</li>
-                                            <li><strong>Response Length:</strong> {len(response_content)} characters</li>
-                                            <li><strong>Processing Time:</strong> {response_time:.2f} seconds</li>
-                                            <li><strong>Cost Optimization:</strong> {'✅ Optimized' if estimated_cost == 0.0 else '💰 Premium'}</li>
-                                        </ul>
-                                    </div>
-                                    """,
-                                    "",  # No error
-                                )
-                            error_msg = (
-                                execution_result.get("error", "Unknown execution error")
-                                if execution_result
-                                else "No response received"
-                            )
-                            return (
-                                "",
-                                '<div class="model-attribution"><strong>❌ Execution Failed</strong></div>',
-                                "",
-                                f"❌ Zen routing execution failed: {error_msg}",
-                            )
-
-                        except Exception as zen_error:
-                            # Fallback to direct OpenRouter execution
-                            self.logger.warning("Zen routing failed, falling back to direct execution: %s", zen_error)
-
-                            try:
-                                # Use Journey 2 processor as fallback
-                                fallback_result = await journey2_processor.execute_prompt(
-                                    prompt,
-                                    model_mode,
-                                    custom_model_selection,
-                                    temp,
-                                    max_tok,
-                                    "full",
-                                )
-
-                                if fallback_result[3]:  # Error message exists
-                                    return fallback_result
-
-                                # Add fallback notice to attribution
-                                attribution_with_fallback = fallback_result[1].replace(
-                                    '<div class="model-attribution">',
-                                    '<div class="model-attribution"><strong>⚠️ Fallback Mode:</strong> Zen routing unavailable | ',
-                                )
-
-                                return (
-                                    fallback_result[0],  # response
-                                    attribution_with_fallback,  # attribution with fallback notice
-                                    fallback_result[2],  # stats
-                                    "",  # Clear error since fallback worked
-                                )
-
-                            except Exception as fallback_error:
-                                return (
-                                    "",
-                                    '<div class="model-attribution"><strong>❌ All Methods Failed</strong></div>',
-                                    "",
-                                    f"❌ Both zen routing and fallback failed: {fallback_error}",
-                                )
-
-                    # Run async execution
-                    return asyncio.run(execute_async())
+                    # Zen routing with OpenRouter fallback, on the shared Journey 2 loop so the
+                    # processor's Zen session stays connected between requests
+                    return self._run_on_journey2_loop(
+                        journey2_processor.execute_prompt(
+                            prompt,
+                            model_mode,
+                            custom_model_selection,
+                            temp,
+                            max_tok,
+                            "full",
+                        ),
+                    )
 
                 except Exception as e:
                     self.logger.error("Journey 2 execution error: %s", e)
@@ -11,6 +11,9 @@ Modules:
     secure_random: Cryptographically secure random number generation
     logging_mixin: Standardized logging mixins for consistent logging across components
     setup_validator: Startup validation utilities to ensure proper configuration
+    quantile_sketch: Constant-memory, mergeable quantile sketches for latency metrics
+    metrics_registry: Unified metrics registry with OpenMetrics exposition
+    rate_limit_store: Sliding-window-counter rate limiting with shared storage backends
 
 Architecture:
     The utilities are organized into focused modules that provide specific capabilities:
@@ -18,6 +18,7 @@ import logging
 import threading
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from src.utils.metrics_registry import MetricSnapshot, get_metrics_registry
 from src.utils.observability import get_metrics_collector, trace_agent_operation
 from src.utils.secure_random import secure_jitter
 from src.utils.time_utils import utc_now
@@ -761,6 +762,34 @@ def get_all_circuit_breakers() -> dict[str, CircuitBreaker]:
         return _circuit_breakers.copy()
 
 
+def _collect_circuit_breaker_metrics() -> list[MetricSnapshot]:
+    """Expose registered circuit breakers to the metrics registry."""
+    states = MetricSnapshot("circuit_breaker_state", "gauge", "Current circuit breaker state (1 for the active state)")
+    requests = MetricSnapshot("circuit_breaker_requests", "counter", "Circuit breaker requests by outcome")
+    consecutive_failures = MetricSnapshot(
+        "circuit_breaker_consecutive_failures",
+        "gauge",
+        "Consecutive failures recorded by the circuit breaker",
+    )
+
+    for name, circuit_breaker in get_all_circuit_breakers().items():
+        metrics = circuit_breaker.metrics
+        for state in CircuitBreakerState:
+            states.add(
+                1 if metrics.current_state == state else 0,
+                {"name": name, "state": state.value},
+            )
+        requests.add(metrics.successful_requests, {"name": name, "outcome": "success"}, "_total")
+        requests.add(metrics.failed_requests, {"name": name, "outcome": "failure"}, "_total")
+        requests.add(metrics.rejected_requests, {"name": name, "outcome": "rejected"}, "_total")
+        consecutive_failures.add(metrics.consecutive_failures, {"name": name})
+
+    return [states, requests, consecutive_failures]
+
+
+get_metrics_registry().register_collector(_collect_circuit_breaker_metrics)
+
+
 async def start_all_health_monitoring() -> None:
     """Start health monitoring for all registered circuit breakers."""
     circuit_breakers = get_all_circuit_breakers()
@@ -0,0 +1,312 @@
+"""Persistent full-text index over a directory of documents.
+
+``FullTextIndex`` keeps an on-disk SQLite FTS5 inverted index of every file
+matching a glob pattern under a root directory. Queries are ranked with BM25
+and support quoted phrases (``"circuit breaker"``) and prefix terms
+(``retr*``). Each hit carries the character offsets of its first match, the
+matching line number and a few lines of context.
+
+Incremental updates:
+    ``refresh`` walks the tree and compares each file's mtime and size with
+    the values stored at indexing time. Only changed files are read; a file
+    whose content hash is unchanged (e.g. after ``touch``) is not reindexed.
+    Deleted files are removed. The walk runs without holding the index lock;
+    only applying the resulting changes blocks queries. The first ``search``
+    refreshes before querying. After that, a ``search`` on an index older
+    than ``refresh_interval`` seconds starts a refresh in a background thread
+    and answers from the current index, so queries only pay for the lookup.
+"""
+
+from dataclasses import dataclass
+import hashlib
+import logging
+from pathlib import Path
+import re
+import sqlite3
+import threading
+import time
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+CONTEXT_LINES = 2
+
+_QUERY_TOKEN_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """A ranked search result.
+
+    Attributes:
+        path: Path of the matching document as discovered under the root
+        score: BM25 relevance score (higher is more relevant)
+        start: Character offset of the first match in the document
+        end: Character offset just past the first match
+        line: 1-based line number of the first match
+        context: Lines around the first match
+    """
+
+    path: str
+    score: float
+    start: int
+    end: int
+    line: int
+    context: str
+
+
+@dataclass(frozen=True)
+class _QueryTerm:
+    words: tuple[str, ...]
+    prefix: bool = False
+
+    def to_match(self) -> str:
+        phrase = '"' + " ".join(self.words) + '"'
+        return phrase + "*" if self.prefix else phrase
+
+    def to_pattern(self) -> str:
+        pattern = r"\W+".join(re.escape(word) for word in self.words)
+        return rf"\b{pattern}\w*" if self.prefix else rf"\b{pattern}\b"
+
+
+def _parse_query(query: str) -> list[_QueryTerm]:
+    """Split a user query into phrase and prefix terms.
+
+    Quoted text becomes a phrase; a trailing ``*`` makes the last word a
+    prefix. Punctuation is dropped the same way the FTS tokenizer drops it,
+    so user input can never produce FTS syntax.
+    """
+    terms = []
+    for match in _QUERY_TOKEN_PATTERN.finditer(query):
+        phrase, word = match.groups()
+        text = phrase if phrase is not None else word
+        words = tuple(_WORD_PATTERN.findall(text.lower()))
+        if words:
+            prefix = phrase is None and text.endswith("*")
+            terms.append(_QueryTerm(words, prefix))
+    return terms
+
+
+class FullTextIndex:
+    """BM25-ranked, incrementally updated full-text index backed by SQLite FTS5."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        index_path: str | Path,
+        pattern: str = "*.md",
+        refresh_interval: float = 30.0,
+    ) -> None:
+        """
+        Open (or create) the index for ``root``.
+
+        Args:
+            root: Directory whose documents are indexed
+            index_path: SQLite database file holding the index
+            pattern: Glob pattern, relative to ``root``, of files to index
+            refresh_interval: Minimum seconds between automatic refreshes in ``search``
+        """
+        self.root = Path(root)
+        self.index_path = Path(index_path)
+        self.pattern = pattern
+        self.refresh_interval = refresh_interval
+        self._last_refresh: float | None = None
+        self._lock = threading.Lock()  # Guards the connection
+        self._refresh_lock = threading.Lock()  # One tree walk at a time
+        self._background_refresh = False
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self._conn.executescript("DROP TABLE IF EXISTS documents; DROP TABLE IF EXISTS documents_fts;")
+        self._conn.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(content, tokenize='unicode61');
+            PRAGMA user_version = {SCHEMA_VERSION};
+            """,
+        )
+        self._conn.commit()
+
+    def refresh(self, force: bool = True) -> dict[str, int]:
+        """
+        Bring the index up to date with the files under the root.
+
+        Args:
+            force: Refresh even if the last refresh was within ``refresh_interval``
+
+        Returns:
+            Dict[str, int]: Counts of indexed, unchanged and removed documents
+        """
+        with self._refresh_lock:
+            now = time.monotonic()
+            if not force and self._last_refresh is not None and now - self._last_refresh < self.refresh_interval:
+                return {"indexed": 0, "unchanged": 0, "removed": 0}
+            with self._lock:
+                existing = {
+                    row[0]: row[1:]
+                    for row in self._conn.execute("SELECT path, id, mtime_ns, size, sha256 FROM documents")
+                }
+            touched, changed, removed, unchanged = self._scan(existing)
+            with self._lock, self._conn:
+                self._apply(touched, changed, removed)
+            self._last_refresh = now
+        stats = {"indexed": len(changed), "unchanged": unchanged, "removed": len(removed)}
+        if changed or removed:
+            logger.debug("Search index refreshed for %s: %s", self.root, stats)
+        return stats
+
+    def _scan(
+        self,
+        existing: dict[str, tuple[int, int, int, str]],
+    ) -> tuple[list[tuple[int, int, int]], list[tuple[int | None, str, int, int, str, str]], list[int], int]:
+        """Walk the tree and work out the changes against the indexed ``existing`` rows."""
+        seen: set[str] = set()
+        touched: list[tuple[int, int, int]] = []
+        changed: list[tuple[int | None, str, int, int, str, str]] = []
+        unchanged = 0
+
+        for path in self.root.rglob(self.pattern):
+            key = str(path)
+            try:
+                stat = path.stat()
+                if not path.is_file():
+                    continue
+                seen.add(key)
+                row = existing.get(key)
+                if row and row[1] == stat.st_mtime_ns and row[2] == stat.st_size:
+                    unchanged += 1
+                    continue
+
+                data = path.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if row and row[3] == digest:
+                    touched.append((stat.st_mtime_ns, stat.st_size, row[0]))
+                    unchanged += 1
+                    continue
+                content = data.decode("utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug("Skipping %s in search index: %s", key, e)
+                seen.discard(key)
+                continue
+            changed.append((row[0] if row else None, key, stat.st_mtime_ns, stat.st_size, digest, content))
+
+        removed = [existing[key][0] for key in existing.keys() - seen]
+        return touched, changed, removed, unchanged
+
+    def _apply(
+        self,
+        touched: list[tuple[int, int, int]],
+        changed: list[tuple[int | None, str, int, int, str, str]],
+        removed: list[int],
+    ) -> None:
+        """Write the changes found by ``_scan``; the caller holds the lock and the transaction."""
+        self._conn.executemany("UPDATE documents SET mtime_ns = ?, size = ? WHERE id = ?", touched)
+        for existing_id, key, mtime_ns, size, digest, content in changed:
+            if existing_id is not None:
+                doc_id = existing_id
+                self._conn.execute(
+                    "UPDATE documents SET mtime_ns = ?, size = ?, sha256 = ? WHERE id = ?",
+                    (mtime_ns, size, digest, doc_id),
+                )
+                self._conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+            else:
+                doc_id = self._conn.execute(
+                    "INSERT INTO documents (path, mtime_ns, size, sha256) VALUES (?, ?, ?, ?)",
+                    (key, mtime_ns, size, digest),
+                ).lastrowid
+            self._conn.execute("INSERT INTO documents_fts (rowid, content) VALUES (?, ?)", (doc_id, content))
+        for doc_id in removed:
+            self._conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+            self._conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+
+    def _refresh_in_background(self) -> None:
+        """Start a background refresh unless one is already running."""
+        with self._lock:
+            if self._background_refresh:
+                return
+            self._background_refresh = True
+        threading.Thread(target=self._run_background_refresh, name="full-text-index-refresh", daemon=True).start()
+
+    def _run_background_refresh(self) -> None:
+        try:
+            self.refresh(force=False)
+        except sqlite3.Error as e:
+            logger.warning("Background search index refresh for %s failed: %s", self.root, e)
+        finally:
+            with self._lock:
+                self._background_refresh = False
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        """
+        Find the documents matching every term of ``query``, best first.
+
+        Args:
+            query: Words, "quoted phrases" and prefix* terms
+            limit: Maximum number of hits
+
+        Returns:
+            List[SearchHit]: Hits ordered by descending BM25 score
+        """
+        terms = _parse_query(query)
+        if not terms or limit <= 0:
+            return []
+        if self._last_refresh is None:
+            self.refresh(force=False)
+        elif time.monotonic() - self._last_refresh >= self.refresh_interval:
+            self._refresh_in_background()
+
+        match = " AND ".join(term.to_match() for term in terms)
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT documents.path, bm25(documents_fts) AS rank, documents_fts.content
+                FROM documents_fts JOIN documents ON documents.id = documents_fts.rowid
+                WHERE documents_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+                """,
+                (match, limit),
+            ).fetchall()
+
+        highlight = re.compile("|".join(term.to_pattern() for term in terms), re.IGNORECASE)
+        return [self._hit(path, -rank, content, highlight) for path, rank, content in rows]
+
+    @staticmethod
+    def _hit(path: str, score: float, content: str, highlight: re.Pattern[str]) -> SearchHit:
+        match = highlight.search(content)
+        start, end = match.span() if match else (0, 0)
+        line_index = content.count("\n", 0, start)
+        lines = content.splitlines()
+        context = "\n".join(lines[max(0, line_index - CONTEXT_LINES) : line_index + CONTEXT_LINES + 1])
+        return SearchHit(path=path, score=score, start=start, end=end, line=line_index + 1, context=context)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the number of indexed documents and the index location."""
+        with self._lock:
+            documents = self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        return {"documents": documents, "root": str(self.root), "index_path": str(self.index_path)}
+
+    def close(self) -> None:
+        """Close the underlying database connection, waiting for a running refresh."""
+        with self._refresh_lock, self._lock:
+            self._conn.close()
+
+
+__all__ = [
+    "FullTextIndex",
+    "SearchHit",
+]
@@ -0,0 +1,113 @@
+"""Deferred imports for heavy subsystems.
+
+Processes that only serve the API or health checks should not pay for
+subsystems they never touch. Two helpers defer an import until first use:
+
+- ``lazy_import`` returns a module proxy that imports the real module on
+  first attribute access.
+- ``lazy_exports`` builds a package-level ``__getattr__`` (PEP 562) so that a
+  package can keep re-exporting names from its submodules while importing
+  each submodule only when one of its names is first used.
+
+Deferred imports are recorded by the startup profiler, so the cost moved off
+the startup path stays visible.
+"""
+
+from collections.abc import Callable
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any
+
+from src.utils.startup_profiler import get_startup_profiler
+
+
+def _import_deferred(name: str) -> ModuleType:
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with get_startup_profiler().time_import(name, lazy=True):
+        return importlib.import_module(name)
+
+
+class LazyModule(ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = _import_deferred(self.__name__)
+            self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the real module has been imported."""
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Get a proxy for module ``name`` that imports it on first use.
+
+    Args:
+        name: Absolute module name
+
+    Returns:
+        LazyModule: Proxy forwarding attribute access to the module
+    """
+    return LazyModule(name)
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package with deferred re-exports.
+
+    Resolved names are cached in the package namespace, so each name costs
+    the ``__getattr__`` call only once.
+
+    Args:
+        package: Name of the package, usually ``__name__``
+        exports: Exported name to the module defining it (relative names resolve against ``package``)
+
+    Returns:
+        Tuple of (``__getattr__``, ``__dir__``) to assign at package level
+    """
+
+    def module_getattr(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        if module_name.startswith("."):
+            module_name = importlib.util.resolve_name(module_name, package)
+        value = getattr(_import_deferred(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted(set(sys.modules[package].__dict__) | set(exports))
+
+    return module_getattr, module_dir
+
+
+__all__ = [
+    "LazyModule",
+    "lazy_exports",
+    "lazy_import",
+]
@@ -0,0 +1,431 @@
+"""Unified metrics registry with OpenMetrics exposition.
+
+This module provides a process-wide registry of counters, gauges and histograms
+plus pull-style collectors for the existing monitors (performance monitor, agent
+metrics, circuit breakers, vector stores, hybrid router). The registry renders
+everything in the OpenMetrics text format so every worker can be scraped from a
+single ``/metrics`` endpoint.
+
+Design:
+- Metric families are registered once; each distinct label tuple gets a child
+  object whose rendered label string is built at creation time
+- Hot-path updates (``inc``/``set``/``observe``) are plain attribute updates with
+  no lock and no allocation; only child creation is serialized
+- Collectors are called at scrape time, so monitors that already keep their own
+  state pay nothing per request
+- ``render`` is a generator that yields the exposition line by line, which lets
+  the endpoint stream the response instead of building one large string
+
+Note:
+    Hot-path updates are not serialized across threads. Under the GIL a
+    concurrent increment can very rarely be lost; this is the trade-off for a
+    lock-free fast path and is negligible for monitoring purposes. Updates from
+    a single event loop are always exact.
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+import logging
+import math
+import threading
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for OpenMetrics."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for OpenMetrics."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _render_labels(labels: Iterable[tuple[str, str]]) -> str:
+    """Render label pairs as ``{a="b",c="d"}`` (empty string for no labels)."""
+    rendered = ",".join(f'{name}="{_escape_label_value(str(value))}"' for name, value in labels)
+    return f"{{{rendered}}}" if rendered else ""
+
+
+class CounterChild:
+    """Monotonic counter for a single label tuple."""
+
+    __slots__ = ("label_str", "value")
+
+    def __init__(self, label_str: str) -> None:
+        self.label_str = label_str
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter.
+
+        Args:
+            amount: Non-negative amount to add.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        self.value += amount
+
+
+class GaugeChild:
+    """Gauge for a single label tuple."""
+
+    __slots__ = ("label_str", "value")
+
+    def __init__(self, label_str: str) -> None:
+        self.label_str = label_str
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge to ``value``."""
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge by ``amount``."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge by ``amount``."""
+        self.value -= amount
+
+
+class HistogramChild:
+    """Fixed-bucket histogram for a single label tuple."""
+
+    __slots__ = ("bucket_counts", "count", "label_str", "sum", "upper_bounds")
+
+    def __init__(self, label_str: str, upper_bounds: tuple[float, ...]) -> None:
+        self.label_str = label_str
+        self.upper_bounds = upper_bounds
+        self.bucket_counts = [0] * (len(upper_bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        self.bucket_counts[bisect_left(self.upper_bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class MetricFamily:
+    """A named metric with a fixed set of label names."""
+
+    metric_type = "unknown"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> Any:
+        """Get (or create) the child for a label tuple.
+
+        Args:
+            *values: Label values in the order of ``labelnames``.
+
+        Returns:
+            Child metric for the label tuple.
+        """
+        child = self._children.get(values)
+        if child is not None:
+            return child
+
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {len(values)} values")
+
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                label_str = _render_labels(zip(self.labelnames, (str(v) for v in values), strict=True))
+                child = self._new_child(label_str)
+                self._children[values] = child
+        return child
+
+    def clear(self) -> None:
+        """Remove all children."""
+        with self._lock:
+            self._children.clear()
+
+    def render(self) -> Iterator[str]:
+        """Yield the OpenMetrics lines for this family."""
+        yield f"# TYPE {self.name} {self.metric_type}\n"
+        if self.documentation:
+            yield f"# HELP {self.name} {self.documentation}\n"
+        for child in list(self._children.values()):
+            yield from self._render_child(child)
+
+    def _new_child(self, label_str: str) -> Any:
+        raise NotImplementedError
+
+    def _render_child(self, child: Any) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(MetricFamily):
+    """Counter metric family."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name.removesuffix("_total"), documentation, labelnames)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+    def _new_child(self, label_str: str) -> CounterChild:
+        return CounterChild(label_str)
+
+    def _render_child(self, child: CounterChild) -> Iterator[str]:
+        yield f"{self.name}_total{child.label_str} {_format_value(child.value)}\n"
+
+
+class Gauge(MetricFamily):
+    """Gauge metric family."""
+
+    metric_type = "gauge"
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self.labels().set(value)
+
+    def _new_child(self, label_str: str) -> GaugeChild:
+        return GaugeChild(label_str)
+
+    def _render_child(self, child: GaugeChild) -> Iterator[str]:
+        yield f"{self.name}{child.label_str} {_format_value(child.value)}\n"
+
+
+class Histogram(MetricFamily):
+    """Histogram metric family with fixed bucket boundaries."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.upper_bounds = tuple(sorted(bound for bound in buckets if not math.isinf(bound)))
+        self._bound_strs = (*(_format_value(bound) for bound in self.upper_bounds), "+Inf")
+
+    def observe(self, value: float) -> None:
+        """Record an observation on the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def _new_child(self, label_str: str) -> HistogramChild:
+        return HistogramChild(label_str, self.upper_bounds)
+
+    def _render_child(self, child: HistogramChild) -> Iterator[str]:
+        prefix = child.label_str[1:-1] + "," if child.label_str else ""
+        cumulative = 0
+        for le, bucket_count in zip(self._bound_strs, child.bucket_counts, strict=True):
+            cumulative += bucket_count
+            yield f'{self.name}_bucket{{{prefix}le="{le}"}} {cumulative}\n'
+        yield f"{self.name}_count{child.label_str} {child.count}\n"
+        yield f"{self.name}_sum{child.label_str} {_format_value(child.sum)}\n"
+
+
+@dataclass
+class MetricSnapshot:
+    """Point-in-time metric family produced by a collector.
+
+    Attributes:
+        name: Family name (without ``_total`` for counters).
+        metric_type: OpenMetrics type (counter, gauge, summary, ...).
+        documentation: Help text.
+        samples: ``(suffix, labels, value)`` tuples, e.g. ``("_total", {"name": "x"}, 3)``.
+    """
+
+    name: str
+    metric_type: str
+    documentation: str = ""
+    samples: list[tuple[str, dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, labels: dict[str, str] | None = None, suffix: str = "") -> None:
+        """Append a sample to the snapshot."""
+        self.samples.append((suffix, labels or {}, value))
+
+
+Collector = Callable[[], Iterable[MetricSnapshot]]
+
+
+class MetricsRegistry:
+    """Registry of metric families and scrape-time collectors."""
+
+    def __init__(self, namespace: str = "promptcraft") -> None:
+        """Initialize registry.
+
+        Args:
+            namespace: Prefix applied to every metric name.
+        """
+        self.namespace = namespace
+        self._families: dict[str, MetricFamily] = {}
+        self._collectors: list[Collector] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Register (or fetch) a counter family."""
+        return self._register(Counter(self._full_name(name), documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Register (or fetch) a gauge family."""
+        return self._register(Gauge(self._full_name(name), documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Register (or fetch) a histogram family."""
+        return self._register(Histogram(self._full_name(name), documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Collector) -> None:
+        """Register a callable invoked at scrape time.
+
+        Args:
+            collector: Callable returning metric snapshots.
+        """
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def unregister_collector(self, collector: Collector) -> None:
+        """Remove a previously registered collector."""
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def get_family(self, name: str) -> MetricFamily | None:
+        """Get a registered family by (unprefixed) name."""
+        return self._families.get(self._full_name(name).removesuffix("_total"))
+
+    def render(self) -> Iterator[str]:
+        """Yield the full OpenMetrics exposition, ending with ``# EOF``."""
+        for family in list(self._families.values()):
+            yield from family.render()
+
+        for snapshot in self._collect():
+            yield from self._render_snapshot(snapshot)
+
+        yield "# EOF\n"
+
+    def render_text(self) -> str:
+        """Render the full exposition as a single string."""
+        return "".join(self.render())
+
+    def _register(self, family: Any) -> Any:
+        with self._lock:
+            existing = self._families.get(family.name)
+            if existing is not None:
+                if type(existing) is not type(family) or existing.labelnames != family.labelnames:
+                    raise ValueError(f"Metric {family.name} already registered with a different definition")
+                return existing
+            self._families[family.name] = family
+            return family
+
+    def _full_name(self, name: str) -> str:
+        return f"{self.namespace}_{name}" if self.namespace else name
+
+    def _collect(self) -> list[MetricSnapshot]:
+        """Run collectors and merge snapshots that share a family name."""
+        merged: dict[str, MetricSnapshot] = {}
+        for collector in list(self._collectors):
+            try:
+                snapshots = list(collector())
+            except Exception as e:
+                logger.warning("Metrics collector %s failed: %s", getattr(collector, "__name__", collector), e)
+                continue
+            for snapshot in snapshots:
+                name = self._full_name(snapshot.name)
+                if name in self._families:
+                    continue
+                target = merged.setdefault(name, MetricSnapshot(name, snapshot.metric_type, snapshot.documentation))
+                target.samples.extend(snapshot.samples)
+        return list(merged.values())
+
+    @staticmethod
+    def _render_snapshot(snapshot: MetricSnapshot) -> Iterator[str]:
+        yield f"# TYPE {snapshot.name} {snapshot.metric_type}\n"
+        if snapshot.documentation:
+            yield f"# HELP {snapshot.name} {snapshot.documentation}\n"
+        for suffix, labels, value in snapshot.samples:
+            yield f"{snapshot.name}{suffix}{_render_labels(labels.items())} {_format_value(value)}\n"
+
+
+def summary_snapshot(
+    name: str,
+    documentation: str,
+    series: Iterable[tuple[dict[str, str], Any]],
+    quantiles: tuple[float, ...] = (0.5, 0.95, 0.99),
+) -> MetricSnapshot:
+    """Build a summary snapshot from quantile sketches.
+
+    Args:
+        name: Family name.
+        documentation: Help text.
+        series: ``(labels, sketch)`` pairs; sketches need ``count``, ``sum`` and ``quantile``.
+        quantiles: Quantiles to expose.
+
+    Returns:
+        Summary metric snapshot.
+    """
+    snapshot = MetricSnapshot(name, "summary", documentation)
+    for labels, sketch in series:
+        for q in quantiles if sketch.count else ():
+            snapshot.add(sketch.quantile(q), {**labels, "quantile": _format_value(q)})
+        snapshot.add(sketch.count, labels, "_count")
+        snapshot.add(sketch.sum, labels, "_sum")
+    return snapshot
+
+
+# Global registry instance
+_metrics_registry: MetricsRegistry | None = None
+_metrics_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global metrics registry instance.
+
+    Returns:
+        Global metrics registry.
+    """
+    global _metrics_registry  # noqa: PLW0603
+    if _metrics_registry is None:
+        with _metrics_registry_lock:
+            if _metrics_registry is None:
+                _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+
+__all__ = [
+    "OPENMETRICS_CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricSnapshot",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "summary_snapshot",
+]
@@ -15,6 +15,8 @@ import threading
 import time
 from typing import Any
 
+from src.utils.metrics_registry import MetricSnapshot, get_metrics_registry, summary_snapshot
+from src.utils.quantile_sketch import DEFAULT_WINDOW_SECONDS, QuantileSketch, RollingQuantileSketch
 from src.utils.time_utils import utc_timestamp
 
 
@@ -296,8 +298,12 @@ class ObservabilityMixin:
 class AgentMetrics:
     """Agent system metrics collection."""
 
-    def __init__(self) -> None:
-        """Initialize metrics collection."""
+    def __init__(self, duration_window_seconds: float = DEFAULT_WINDOW_SECONDS) -> None:
+        """Initialize metrics collection.
+
+        Args:
+            duration_window_seconds: Sliding window covered by duration statistics.
+        """
         self.metrics = {
             "agent_executions_total": 0,
             "agent_executions_success": 0,
@@ -308,6 +314,8 @@ class AgentMetrics:
             "agent_cache_hits": 0,
             "agent_cache_misses": 0,
         }
+        self.duration_window_seconds = duration_window_seconds
+        self._duration_sketches: dict[str, RollingQuantileSketch] = {}
         self._lock = threading.Lock()
 
     def increment_counter(self, metric_name: str, value: int = 1) -> None:
@@ -325,6 +333,7 @@ class AgentMetrics:
                 metric_value = self.metrics[metric_name]
                 if isinstance(metric_value, list):
                     metric_value.append(duration)
+                    self._duration_sketch(metric_name).add(duration)
 
                     # Keep only last N measurements to prevent memory bloat
                     max_measurements = 1000
@@ -336,30 +345,52 @@ class AgentMetrics:
         with self._lock:
             snapshot = self.metrics.copy()
 
-            # Calculate duration statistics
+            # Calculate duration statistics over the sliding window
             durations_value = snapshot.get("agent_execution_duration_seconds", [])
-            if isinstance(durations_value, list) and durations_value:
-                durations = durations_value  # type: list[float]
+            rolling = self._duration_sketches.get("agent_execution_duration_seconds")
+            sketch = rolling.snapshot() if rolling is not None else None
+            if isinstance(durations_value, list) and durations_value and sketch is not None and sketch.count:
                 snapshot["agent_execution_duration_stats"] = {
-                    "count": len(durations),
-                    "avg": sum(durations) / len(durations),
-                    "min": min(durations),
-                    "max": max(durations),
-                    "p95": self._percentile(durations, 95),
-                    "p99": self._percentile(durations, 99),
+                    "count": sketch.count,
+                    "avg": sketch.mean,
+                    "min": sketch.min,
+                    "max": sketch.max,
+                    "p95": sketch.quantile(0.95),
+                    "p99": sketch.quantile(0.99),
                 }
 
             return snapshot
 
-    def _percentile(self, values: list[float], percentile: float) -> float:
-        """Calculate percentile of values."""
-        if not values:
-            return 0.0
+    def get_duration_sketch(self, metric_name: str) -> QuantileSketch:
+        """Get a mergeable copy of a duration metric's distribution.
+
+        Args:
+            metric_name: Duration metric name.
+
+        Returns:
+            Quantile sketch of the durations inside the sliding window.
+        """
+        with self._lock:
+            sketch = self._duration_sketches.get(metric_name)
+            return sketch.snapshot() if sketch is not None else QuantileSketch()
+
+    def merge_duration_sketch(self, metric_name: str, sketch: QuantileSketch) -> None:
+        """Merge a duration sketch recorded by another worker.
+
+        Args:
+            metric_name: Duration metric name.
+            sketch: Sketch to merge.
+        """
+        with self._lock:
+            if isinstance(self.metrics.get(metric_name), list):
+                self._duration_sketch(metric_name).merge_snapshot(sketch)
 
-        sorted_values = sorted(values)
-        index = int(len(sorted_values) * percentile / 100)
-        index = min(index, len(sorted_values) - 1)
-        return sorted_values[index]
+    def _duration_sketch(self, metric_name: str) -> RollingQuantileSketch:
+        """Get the windowed sketch for a duration metric, creating it on first use."""
+        sketch = self._duration_sketches.get(metric_name)
+        if sketch is None:
+            sketch = self._duration_sketches[metric_name] = RollingQuantileSketch(self.duration_window_seconds)
+        return sketch
 
 
 # Global instances
@@ -383,6 +414,25 @@ def get_metrics_collector() -> "AgentMetrics":
     return _metrics_collector
 
 
+def _collect_agent_metrics() -> list[MetricSnapshot]:
+    """Expose the global agent metrics to the metrics registry."""
+    metrics = get_metrics_collector()
+    snapshots = []
+    with metrics._lock:
+        for metric_name, value in metrics.metrics.items():
+            if isinstance(value, int):
+                snapshot = MetricSnapshot(metric_name.removesuffix("_total"), "counter")
+                snapshot.add(value, suffix="_total")
+                snapshots.append(snapshot)
+        sketches = [(name, sketch.snapshot()) for name, sketch in metrics._duration_sketches.items()]
+
+    snapshots.extend(summary_snapshot(name, "Agent duration distribution", [({}, sketch)]) for name, sketch in sketches)
+    return snapshots
+
+
+get_metrics_registry().register_collector(_collect_agent_metrics)
+
+
 def trace_agent_operation(operation_name: str) -> Callable:
     """Decorator for tracing agent operations.
 
@@ -10,11 +10,13 @@ import contextlib
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
-from statistics import mean, median
 import sys
 import time
 from typing import Any
 
+from src.utils.metrics_registry import MetricSnapshot, get_metrics_registry, summary_snapshot
+from src.utils.quantile_sketch import QuantileSketch, RollingQuantileSketch
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -62,19 +64,28 @@ class PerformanceMetrics:
 class PerformanceMonitor:
     """Core performance monitoring system."""
 
-    def __init__(self, max_samples: int = 1000) -> None:
+    def __init__(self, max_samples: int = 1000, timer_window_seconds: float | None = None) -> None:
         """Initialize performance monitor.
 
         Args:
             max_samples: Maximum number of samples to keep in memory.
+            timer_window_seconds: Optional sliding window for timer statistics.
+                When unset, timers summarize every observation since the last reset.
         """
         self.max_samples = max_samples
+        self.timer_window_seconds = timer_window_seconds
         self.metrics: dict[str, deque] = defaultdict(lambda: deque(maxlen=max_samples))
         self.counters: dict[str, int] = defaultdict(int)
         self.gauges: dict[str, float] = defaultdict(float)
-        self.timers: dict[str, list[float]] = defaultdict(list)
+        self.timers: dict[str, QuantileSketch | RollingQuantileSketch] = defaultdict(self._new_timer_sketch)
         self.logger = logger
 
+    def _new_timer_sketch(self) -> QuantileSketch | RollingQuantileSketch:
+        """Create the constant-memory sketch backing a timer."""
+        if self.timer_window_seconds is not None:
+            return RollingQuantileSketch(window_seconds=self.timer_window_seconds)
+        return QuantileSketch()
+
     def record_metric(self, metric: MetricData) -> None:
         """Record a metric.
 
@@ -90,7 +101,7 @@ class PerformanceMonitor:
         elif metric.metric_type == MetricType.HISTOGRAM:
             self.metrics[metric.name].append(metric.value)
         elif metric.metric_type == MetricType.TIMER:
-            self.timers[metric.name].append(metric.value)
+            self.timers[metric.name].add(metric.value)
 
         # Keep general metrics history
         self.metrics[f"{metric.name}_history"].append(
@@ -130,20 +141,7 @@ class PerformanceMonitor:
         Returns:
             Dictionary with histogram statistics.
         """
-        values = list(self.metrics[name])
-        if not values:
-            return {}
-
-        sorted_values = sorted(values)
-        return {
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "mean": mean(values),
-            "median": median(values),
-            "p95": self._percentile(sorted_values, 95),
-            "p99": self._percentile(sorted_values, 99),
-        }
+        return QuantileSketch.from_values(self.metrics[name]).summary()
 
     def get_timer_stats(self, name: str) -> dict[str, float]:
         """Get timer statistics.
@@ -154,36 +152,40 @@ class PerformanceMonitor:
         Returns:
             Dictionary with timer statistics.
         """
-        values = self.timers.get(name, [])
-        if not values:
+        sketch = self.timers.get(name)
+        if sketch is None:
             return {}
 
-        sorted_values = sorted(values)
-        return {
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "mean": mean(values),
-            "median": median(values),
-            "p95": self._percentile(sorted_values, 95),
-            "p99": self._percentile(sorted_values, 99),
-        }
+        return sketch.summary()
 
-    def _percentile(self, sorted_values: list[float], percentile: float) -> float:
-        """Calculate percentile from sorted values.
+    def get_timer_sketch(self, name: str) -> QuantileSketch:
+        """Get a mergeable snapshot of a timer's distribution.
 
         Args:
-            sorted_values: Sorted list of values.
-            percentile: Percentile to calculate (0-100).
+            name: Timer name.
 
         Returns:
-            Percentile value.
+            Quantile sketch covering the timer's observations.
         """
-        if not sorted_values:
-            return 0.0
+        sketch = self.timers.get(name)
+        if sketch is None:
+            return QuantileSketch()
+        if isinstance(sketch, RollingQuantileSketch):
+            return sketch.snapshot()
+        return sketch.copy()
 
-        index = int((percentile / 100) * (len(sorted_values) - 1))
-        return sorted_values[index]
+    def merge_timer(self, name: str, sketch: QuantileSketch) -> None:
+        """Merge a timer sketch recorded elsewhere (e.g. another worker).
+
+        Args:
+            name: Timer name.
+            sketch: Sketch to merge into the local timer.
+        """
+        timer = self.timers[name]
+        if isinstance(timer, RollingQuantileSketch):
+            timer.merge_snapshot(sketch)
+        else:
+            timer.merge(sketch)
 
     def get_all_metrics(self) -> dict[str, Any]:
         """Get all current metrics.
@@ -480,6 +482,27 @@ def get_resource_monitor() -> SystemResourceMonitor:
     return global_resource_monitor
 
 
+def _collect_performance_monitor_metrics() -> list[MetricSnapshot]:
+    """Expose the global performance monitor to the metrics registry."""
+    counters = MetricSnapshot("monitor_events", "counter", "Performance monitor counters")
+    for name, value in list(global_monitor.counters.items()):
+        counters.add(value, {"name": name}, "_total")
+
+    gauges = MetricSnapshot("monitor_gauge", "gauge", "Performance monitor gauges")
+    for name, value in list(global_monitor.gauges.items()):
+        gauges.add(value, {"name": name})
+
+    timers = summary_snapshot(
+        "monitor_timer",
+        "Performance monitor timer distributions",
+        [({"name": name}, global_monitor.get_timer_sketch(name)) for name in list(global_monitor.timers)],
+    )
+    return [counters, gauges, timers]
+
+
+get_metrics_registry().register_collector(_collect_performance_monitor_metrics)
+
+
 def track_performance(operation_name: str, labels: dict[str, str] | None = None) -> PerformanceTracker:
     """Create a performance tracker for an operation.
 
@@ -0,0 +1,508 @@
+"""Constant-memory streaming quantile sketches for latency metrics.
+
+This module provides a mergeable, relative-error quantile sketch in the style of
+DDSketch, together with a rolling-window variant for "recent" percentiles. It
+replaces the pattern of keeping every observation in a list and sorting it on
+each read, which grows without bound and costs O(n log n) per percentile query.
+
+Key properties:
+- O(1) record: each value is mapped to a logarithmic bucket and counted
+- Bounded memory: bucket count is capped by ``max_bins`` regardless of volume
+- Relative accuracy: quantiles are within ``relative_accuracy`` of the true value
+- Exact for small samples: the first ``exact_limit`` values are kept verbatim
+- Mergeable: sketches from different workers can be combined losslessly and
+  serialized with ``to_dict``/``from_dict`` for transport
+
+The sketches are not internally synchronized; owners that record from several
+threads are expected to guard them with their own lock, as the existing
+monitors already do.
+"""
+
+from collections.abc import Iterable
+import math
+import time
+from typing import Any
+
+
+# Sketch defaults
+DEFAULT_RELATIVE_ACCURACY = 0.01  # 1% relative error on reported quantiles
+DEFAULT_MAX_BINS = 2048
+DEFAULT_EXACT_LIMIT = 128
+MIN_INDEXABLE_VALUE = 1e-9  # Magnitudes below this are counted in the zero bucket
+DEFAULT_WINDOW_SECONDS = 300.0
+DEFAULT_WINDOW_SLOTS = 10
+
+
+class QuantileSketch:
+    """Mergeable relative-error quantile sketch (DDSketch-style).
+
+    Values are counted in logarithmically sized buckets so that any reported
+    quantile is within ``relative_accuracy`` of the exact answer. Count, sum,
+    minimum and maximum are tracked exactly.
+    """
+
+    __slots__ = (
+        "_compensation",
+        "_count",
+        "_exact",
+        "_gamma",
+        "_log_gamma",
+        "_max",
+        "_min",
+        "_negative",
+        "_positive",
+        "_sum",
+        "_zero_count",
+        "exact_limit",
+        "max_bins",
+        "relative_accuracy",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS,
+        exact_limit: int = DEFAULT_EXACT_LIMIT,
+    ) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles (0-1).
+            max_bins: Maximum number of buckets kept per sign before collapsing.
+            exact_limit: Number of raw values kept for exact small-sample answers.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_bins < 1:
+            raise ValueError("max_bins must be positive")
+        if exact_limit < 0:
+            raise ValueError("exact_limit must be non-negative")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.exact_limit = exact_limit
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._exact: list[float] | None = []
+
+    @classmethod
+    def from_values(cls, values: Iterable[float], **kwargs: Any) -> "QuantileSketch":
+        """Build a sketch from an iterable of values in a single linear pass.
+
+        Args:
+            values: Values to record.
+            **kwargs: Sketch construction parameters.
+
+        Returns:
+            Populated sketch.
+        """
+        sketch = cls(**kwargs)
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    @property
+    def count(self) -> int:
+        """Get number of recorded values."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Get sum of recorded values."""
+        return self._sum + self._compensation
+
+    @property
+    def min(self) -> float:
+        """Get smallest recorded value (0.0 when empty)."""
+        return self._min if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Get largest recorded value (0.0 when empty)."""
+        return self._max if self._count else 0.0
+
+    @property
+    def mean(self) -> float:
+        """Get arithmetic mean of recorded values (0.0 when empty)."""
+        return self.sum / self._count if self._count else 0.0
+
+    @property
+    def bin_count(self) -> int:
+        """Get number of non-empty buckets currently held."""
+        return len(self._positive) + len(self._negative) + (1 if self._zero_count else 0)
+
+    def add(self, value: float) -> None:
+        """Record a single value.
+
+        Args:
+            value: Observation to record.
+        """
+        value = float(value)
+        if math.isnan(value):
+            return
+
+        self._count += 1
+        self._add_to_sum(value)
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+        if self._exact is not None:
+            if len(self._exact) < self.exact_limit:
+                self._exact.append(value)
+            else:
+                self._exact = None
+
+        if value > MIN_INDEXABLE_VALUE:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + 1
+            if len(self._positive) > self.max_bins:
+                self._collapse(self._positive)
+        elif value < -MIN_INDEXABLE_VALUE:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + 1
+            if len(self._negative) > self.max_bins:
+                self._collapse(self._negative)
+        else:
+            self._zero_count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile ``q``.
+
+        Args:
+            q: Quantile to estimate (0-1).
+
+        Returns:
+            Estimated value, or 0.0 if the sketch is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if self._count == 0:
+            return 0.0
+
+        rank = int(q * (self._count - 1) + 0.5)
+
+        if self._exact is not None:
+            return sorted(self._exact)[rank]
+
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return self._clamp(-self._value(key))
+
+        seen += self._zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._clamp(self._value(key))
+
+        return self.max
+
+    def percentile(self, percentile: float) -> float:
+        """Estimate the value at ``percentile`` (0-100).
+
+        Args:
+            percentile: Percentile to estimate.
+
+        Returns:
+            Estimated value, or 0.0 if the sketch is empty.
+        """
+        return self.quantile(percentile / 100)
+
+    def summary(self) -> dict[str, float]:
+        """Get summary statistics in the shape used by the monitors.
+
+        Returns:
+            Dictionary with count, min, max, mean, median, p95 and p99, or an
+            empty dictionary if nothing has been recorded.
+        """
+        if self._count == 0:
+            return {}
+
+        return {
+            "count": self._count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "median": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch into this one.
+
+        Args:
+            other: Sketch with the same relative accuracy.
+
+        Raises:
+            ValueError: If the sketches use different bucket mappings.
+        """
+        if not math.isclose(self._gamma, other._gamma):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        if other._count == 0:
+            return
+
+        for key, bucket_count in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + bucket_count
+        for key, bucket_count in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + bucket_count
+        while len(self._positive) > self.max_bins:
+            self._collapse(self._positive)
+        while len(self._negative) > self.max_bins:
+            self._collapse(self._negative)
+
+        self._zero_count += other._zero_count
+        self._count += other._count
+        self._add_to_sum(other._sum)
+        self._add_to_sum(other._compensation)
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+        if self._exact is not None and other._exact is not None and self._count <= self.exact_limit:
+            self._exact.extend(other._exact)
+        else:
+            self._exact = None
+
+    def copy(self) -> "QuantileSketch":
+        """Create an independent copy of this sketch."""
+        clone = QuantileSketch(self.relative_accuracy, self.max_bins, self.exact_limit)
+        clone.merge(self)
+        return clone
+
+    def clear(self) -> None:
+        """Remove all recorded values."""
+        self._positive.clear()
+        self._negative.clear()
+        self._zero_count = 0
+        self._count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._exact = []
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the sketch for transport between workers.
+
+        Returns:
+            JSON-compatible dictionary.
+        """
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "exact_limit": self.exact_limit,
+            "positive": [[key, bucket_count] for key, bucket_count in self._positive.items()],
+            "negative": [[key, bucket_count] for key, bucket_count in self._negative.items()],
+            "zero_count": self._zero_count,
+            "count": self._count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "exact": list(self._exact) if self._exact is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Restore a sketch serialized with ``to_dict``.
+
+        Args:
+            data: Serialized sketch.
+
+        Returns:
+            Restored sketch.
+        """
+        sketch = cls(
+            relative_accuracy=data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY),
+            max_bins=data.get("max_bins", DEFAULT_MAX_BINS),
+            exact_limit=data.get("exact_limit", DEFAULT_EXACT_LIMIT),
+        )
+        sketch._positive = {int(key): int(bucket_count) for key, bucket_count in data.get("positive", [])}
+        sketch._negative = {int(key): int(bucket_count) for key, bucket_count in data.get("negative", [])}
+        sketch._zero_count = int(data.get("zero_count", 0))
+        sketch._count = int(data.get("count", 0))
+        sketch._sum = float(data.get("sum", 0.0))
+        if sketch._count:
+            sketch._min = float(data["min"])
+            sketch._max = float(data["max"])
+        exact = data.get("exact")
+        sketch._exact = [float(value) for value in exact] if exact is not None else None
+        return sketch
+
+    def _key(self, magnitude: float) -> int:
+        """Map a positive magnitude to its bucket index."""
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        """Get the representative value of a bucket."""
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def _clamp(self, value: float) -> float:
+        """Clamp an estimate to the exact observed range."""
+        return min(max(value, self._min), self._max)
+
+    def _add_to_sum(self, value: float) -> None:
+        """Add to the running sum using Neumaier compensated summation."""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def _collapse(self, store: dict[int, int]) -> None:
+        """Fold the lowest-magnitude bucket into its neighbour to bound memory."""
+        lowest, second = sorted(store)[:2]
+        store[second] += store.pop(lowest)
+
+
+class RollingQuantileSketch:
+    """Quantile sketch over a sliding time window.
+
+    The window is split into fixed-width slots, each holding its own
+    ``QuantileSketch``. Recording touches only the current slot; queries merge
+    the slots still inside the window, so old observations age out without
+    any per-value bookkeeping.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        slots: int = DEFAULT_WINDOW_SLOTS,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS,
+        exact_limit: int = DEFAULT_EXACT_LIMIT,
+    ) -> None:
+        """Initialize rolling sketch.
+
+        Args:
+            window_seconds: Length of the sliding window in seconds.
+            slots: Number of sub-sketches the window is divided into.
+            relative_accuracy: Relative accuracy of each sub-sketch.
+            max_bins: Maximum buckets per sub-sketch.
+            exact_limit: Raw values kept per merged snapshot for exact answers.
+        """
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        if slots < 1:
+            raise ValueError("slots must be positive")
+
+        self.window_seconds = window_seconds
+        self.slots = slots
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.exact_limit = exact_limit
+        self._slot_width = window_seconds / slots
+        self._sketches = [self._new_sketch() for _ in range(slots)]
+        self._epochs = [-1] * slots
+
+    @property
+    def count(self) -> int:
+        """Get number of values currently inside the window."""
+        return self.snapshot().count
+
+    def add(self, value: float, timestamp: float | None = None) -> None:
+        """Record a value at ``timestamp`` (defaults to now).
+
+        Args:
+            value: Observation to record.
+            timestamp: Observation time in seconds since the epoch.
+        """
+        index = self._slot(self._epoch(timestamp))
+        if index is not None:
+            self._sketches[index].add(value)
+
+    def snapshot(self, now: float | None = None) -> QuantileSketch:
+        """Merge the live slots into a single sketch.
+
+        Args:
+            now: Reference time in seconds since the epoch (defaults to now).
+
+        Returns:
+            Sketch covering the current window.
+        """
+        current = self._epoch(now)
+        merged = self._new_sketch()
+        for index, epoch in enumerate(self._epochs):
+            if current - self.slots < epoch <= current:
+                merged.merge(self._sketches[index])
+        return merged
+
+    def quantile(self, q: float, now: float | None = None) -> float:
+        """Estimate the value at quantile ``q`` over the current window."""
+        return self.snapshot(now).quantile(q)
+
+    def summary(self, now: float | None = None) -> dict[str, float]:
+        """Get summary statistics over the current window."""
+        return self.snapshot(now).summary()
+
+    def merge(self, other: "RollingQuantileSketch") -> None:
+        """Merge another rolling sketch with the same slot layout.
+
+        Args:
+            other: Rolling sketch with identical window and slot count.
+
+        Raises:
+            ValueError: If the slot layouts differ.
+        """
+        if other.slots != self.slots or not math.isclose(other.window_seconds, self.window_seconds):
+            raise ValueError("Cannot merge rolling sketches with different windows")
+
+        for index, epoch in enumerate(other._epochs):
+            if epoch < 0:
+                continue
+            if self._epochs[index] < epoch:
+                self._sketches[index].clear()
+                self._epochs[index] = epoch
+            if self._epochs[index] == epoch:
+                self._sketches[index].merge(other._sketches[index])
+
+    def merge_snapshot(self, sketch: QuantileSketch, timestamp: float | None = None) -> None:
+        """Merge a plain sketch into the slot covering ``timestamp``.
+
+        Args:
+            sketch: Sketch to merge, typically a snapshot from another worker.
+            timestamp: Time the snapshot was taken (defaults to now).
+        """
+        index = self._slot(self._epoch(timestamp))
+        if index is not None:
+            self._sketches[index].merge(sketch)
+
+    def clear(self) -> None:
+        """Remove all recorded values."""
+        for sketch in self._sketches:
+            sketch.clear()
+        self._epochs = [-1] * self.slots
+
+    def _slot(self, epoch: int) -> int | None:
+        """Get the slot for ``epoch``, recycling it if it holds an older epoch.
+
+        Returns None for a late value whose slot already holds a newer epoch,
+        so it cannot wipe the newer data.
+        """
+        index = epoch % self.slots
+        if self._epochs[index] < epoch:
+            self._sketches[index].clear()
+            self._epochs[index] = epoch
+        return index if self._epochs[index] == epoch else None
+
+    def _epoch(self, timestamp: float | None) -> int:
+        """Map a timestamp to its absolute slot number."""
+        return int((time.time() if timestamp is None else timestamp) // self._slot_width)
+
+    def _new_sketch(self) -> QuantileSketch:
+        return QuantileSketch(self.relative_accuracy, self.max_bins, self.exact_limit)
+
+
+__all__ = ["QuantileSketch", "RollingQuantileSketch"]
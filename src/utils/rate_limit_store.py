@@ -0,0 +1,314 @@
+"""Sliding-window-counter rate limiting with pluggable shared storage.
+
+Each limit is a ``RateWindow`` (``limit`` hits per ``seconds``). A key keeps two
+fixed buckets per window - the current and the previous one - and estimates the
+hits in the trailing window as::
+
+    previous * (1 - elapsed_fraction_of_current_bucket) + current
+
+which makes checks O(1) in time and memory per key regardless of traffic, unlike
+a log of timestamps. Several windows (e.g. per-minute and per-hour) are checked
+together and a hit is only recorded when all of them allow it.
+
+Backends:
+    - ``InMemoryRateLimitBackend``: per-process state with amortized idle-key eviction.
+    - ``RedisRateLimitBackend``: shared state for multi-worker deployments, using only
+      ``INCR``/``DECR``/``EXPIRE``/``GET`` so any Redis-protocol server works.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any
+
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Keys idle for this many times their longest window hold no information
+IDLE_HORIZON_MULTIPLIER = 2
+DEFAULT_EVICTION_BATCH = 4
+DEFAULT_REDIS_PREFIX = "promptcraft:ratelimit"
+# After a Redis failure, skip the server entirely for this long before retrying
+DEFAULT_REDIS_COOLDOWN_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class RateWindow:
+    """A single rate limit: at most ``limit`` hits per ``seconds``."""
+
+    seconds: int
+    limit: int
+
+    def __post_init__(self) -> None:
+        if self.seconds <= 0:
+            raise ValueError("seconds must be positive")
+        if self.limit < 0:
+            raise ValueError("limit must be non-negative")
+
+
+def sliding_window_estimate(previous: float, current: float, window: RateWindow, now: float) -> float:
+    """Estimate hits in the trailing window from two adjacent fixed buckets."""
+    elapsed_fraction = (now % window.seconds) / window.seconds
+    return previous * (1.0 - elapsed_fraction) + current
+
+
+class RateLimitBackend(ABC):
+    """Storage for sliding-window counters."""
+
+    @abstractmethod
+    def hit(self, key: str, windows: Sequence[RateWindow], now: float) -> bool:
+        """Record a hit for ``key`` if every window allows it.
+
+        Args:
+            key: Rate limited identity (e.g. ``"request:<session_id>"``)
+            windows: Limits that must all allow the hit
+            now: Current Unix timestamp
+
+        Returns:
+            True if the hit was allowed and recorded, False if rate limited
+        """
+
+    @abstractmethod
+    def counts(self, key: str, windows: Sequence[RateWindow], now: float) -> list[float]:
+        """Return the estimated hits in each window without recording a hit."""
+
+    def evict_idle(self, now: float) -> int:
+        """Drop state for keys that have been idle long enough to be empty.
+
+        Returns:
+            Number of keys evicted
+        """
+        return 0
+
+
+class _KeyState:
+    """Per-key bucket counters, one ``[bucket, previous, current]`` triple per window."""
+
+    __slots__ = ("buckets", "expires_at")
+
+    def __init__(self, window_count: int) -> None:
+        self.buckets = [[0, 0, 0] for _ in range(window_count)]
+        self.expires_at = 0.0
+
+
+def _roll(bucket: list[int], window: RateWindow, now: float) -> tuple[int, int, int]:
+    """Advance a ``[bucket, previous, current]`` triple to the bucket containing ``now``."""
+    index = int(now // window.seconds)
+    bucket_index, previous, current = bucket
+    if index == bucket_index:
+        return index, previous, current
+    if index == bucket_index + 1:
+        return index, current, 0
+    return index, 0, 0
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Thread-safe, per-process sliding-window-counter storage.
+
+    Keys are kept in least-recently-used order, so eviction only ever inspects
+    the oldest keys: each ``hit`` evicts at most ``eviction_batch`` idle keys,
+    which keeps memory bounded without a periodic full sweep.
+    """
+
+    def __init__(self, eviction_batch: int = DEFAULT_EVICTION_BATCH) -> None:
+        self.eviction_batch = eviction_batch
+        self._states: OrderedDict[str, _KeyState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._states
+
+    def hit(self, key: str, windows: Sequence[RateWindow], now: float) -> bool:
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or len(state.buckets) != len(windows):
+                state = _KeyState(len(windows))
+
+            rolled = [_roll(bucket, window, now) for bucket, window in zip(state.buckets, windows, strict=True)]
+            allowed = all(
+                sliding_window_estimate(previous, current, window, now) + 1 <= window.limit
+                for (_, previous, current), window in zip(rolled, windows, strict=True)
+            )
+
+            for bucket, (index, previous, current) in zip(state.buckets, rolled, strict=True):
+                bucket[0], bucket[1], bucket[2] = index, previous, current + 1 if allowed else current
+
+            state.expires_at = now + IDLE_HORIZON_MULTIPLIER * max(window.seconds for window in windows)
+            self._states[key] = state
+            self._states.move_to_end(key)
+            self._evict_idle_locked(now, self.eviction_batch)
+
+        return allowed
+
+    def counts(self, key: str, windows: Sequence[RateWindow], now: float) -> list[float]:
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or len(state.buckets) != len(windows):
+                return [0.0] * len(windows)
+            estimates = []
+            for bucket, window in zip(state.buckets, windows, strict=True):
+                _, previous, current = _roll(bucket, window, now)
+                estimates.append(sliding_window_estimate(previous, current, window, now))
+            return estimates
+
+    def evict_idle(self, now: float) -> int:
+        with self._lock:
+            return self._evict_idle_locked(now, self.eviction_batch)
+
+    def _evict_idle_locked(self, now: float, budget: int) -> int:
+        evicted = 0
+        while evicted < budget and self._states:
+            key, state = next(iter(self._states.items()))
+            if state.expires_at > now:
+                break
+            del self._states[key]
+            evicted += 1
+        return evicted
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Sliding-window-counter storage shared through a Redis-protocol server.
+
+    Each bucket is a plain integer key with a TTL of two windows, so idle keys
+    expire server-side. A hit increments the current buckets first and rolls
+    them back if any window is exceeded, which keeps concurrent workers from
+    over-admitting without server-side scripting.
+
+    If the server is unreachable, limits fall back to a per-process
+    ``InMemoryRateLimitBackend`` so the UI keeps working with local limits.
+    A failure also starts a cooldown during which the server is not contacted
+    at all, so an outage costs one socket timeout and one warning per cooldown
+    rather than per request.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str = DEFAULT_REDIS_PREFIX,
+        cooldown_seconds: float = DEFAULT_REDIS_COOLDOWN_SECONDS,
+    ) -> None:
+        self.client = client
+        self.prefix = prefix
+        self.cooldown_seconds = cooldown_seconds
+        self._fallback = InMemoryRateLimitBackend()
+        self._unavailable_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether the server is outside its failure cooldown."""
+        return time.monotonic() >= self._unavailable_until
+
+    def _mark_unavailable(self, error: Exception) -> None:
+        if self.available:
+            logger.warning(
+                "Shared rate limit storage unavailable, using local limits for %.0fs: %s",
+                self.cooldown_seconds,
+                error,
+            )
+        self._unavailable_until = time.monotonic() + self.cooldown_seconds
+
+    def _bucket_key(self, key: str, window: RateWindow, index: int) -> str:
+        return f"{self.prefix}:{key}:{window.seconds}:{index}"
+
+    def hit(self, key: str, windows: Sequence[RateWindow], now: float) -> bool:
+        if not self.available:
+            return self._fallback.hit(key, windows, now)
+
+        current_keys = []
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for window in windows:
+                index = int(now // window.seconds)
+                current_key = self._bucket_key(key, window, index)
+                current_keys.append(current_key)
+                pipe.incr(current_key)
+                pipe.expire(current_key, IDLE_HORIZON_MULTIPLIER * window.seconds)
+                pipe.get(self._bucket_key(key, window, index - 1))
+            results = pipe.execute()
+
+            allowed = True
+            for position, window in enumerate(windows):
+                current = int(results[3 * position])
+                previous = int(results[3 * position + 2] or 0)
+                if sliding_window_estimate(previous, current, window, now) > window.limit:
+                    allowed = False
+
+            if not allowed:
+                pipe = self.client.pipeline(transaction=False)
+                for current_key in current_keys:
+                    pipe.decr(current_key)
+                pipe.execute()
+            return allowed
+        except Exception as e:
+            self._mark_unavailable(e)
+            return self._fallback.hit(key, windows, now)
+
+    def counts(self, key: str, windows: Sequence[RateWindow], now: float) -> list[float]:
+        if not self.available:
+            return self._fallback.counts(key, windows, now)
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for window in windows:
+                index = int(now // window.seconds)
+                pipe.get(self._bucket_key(key, window, index))
+                pipe.get(self._bucket_key(key, window, index - 1))
+            results = pipe.execute()
+        except Exception as e:
+            self._mark_unavailable(e)
+            return self._fallback.counts(key, windows, now)
+
+        return [
+            sliding_window_estimate(int(results[2 * position + 1] or 0), int(results[2 * position] or 0), window, now)
+            for position, window in enumerate(windows)
+        ]
+
+    def evict_idle(self, now: float) -> int:
+        # Bucket keys expire server-side; only the local fallback needs trimming
+        return self._fallback.evict_idle(now)
+
+
+def create_rate_limit_backend(settings: Any) -> RateLimitBackend:
+    """Create the rate limit backend for the given settings.
+
+    Production uses Redis so limits are shared across workers; other
+    environments keep per-process in-memory state.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Configured rate limit backend
+    """
+    if getattr(settings, "environment", "dev") == "prod" and redis is not None:
+        client = redis.Redis(
+            host=getattr(settings, "redis_host", "localhost"),
+            port=getattr(settings, "redis_port", 6379),
+            db=getattr(settings, "redis_db", 0),
+            socket_timeout=1.0,
+        )
+        logger.info("Using Redis storage for UI rate limiting")
+        return RedisRateLimitBackend(client)
+    return InMemoryRateLimitBackend()
+
+
+__all__ = [
+    "InMemoryRateLimitBackend",
+    "RateLimitBackend",
+    "RateWindow",
+    "RedisRateLimitBackend",
+    "create_rate_limit_backend",
+    "sliding_window_estimate",
+]
@@ -0,0 +1,295 @@
+"""
+Shared catalog of parsed resource definitions.
+
+The commands, scripts and standards discovery systems all parse small files
+from project and user ``.claude`` directories. ``ResourceCatalog`` caches the
+parsed definition of every such file, revalidated with a single ``stat``, so a
+file is parsed once per change no matter how many discovery systems or
+refreshes ask for it. Entries are keyed by resource kind, absolute path and
+the identity the definition is parsed with (e.g. resource id and source type),
+so the same file seen under another id or source is parsed separately.
+
+Snapshots:
+    Persistence is opt-in: pass ``snapshot_path`` to ``ResourceCatalog`` or
+    ``get_resource_catalog``. ``save_snapshot`` then writes every cached
+    definition, with the mtime, size and mode of the file it came from, to a
+    compact JSON file. A new process loads the snapshot and reuses the
+    definition of every unchanged file without reading it. Mode is compared
+    along with mtime and size because scripts record whether they are
+    executable. Snapshot entries are decoded on first use, by the caller that
+    knows their type, and entries for files that no longer exist are dropped
+    on save.
+
+Timings:
+    Discovery systems wrap their refreshes in ``timed_scan`` so the catalog
+    reports how long each kind of resource takes to scan, next to how many
+    files were parsed and how long parsing took.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_PATH = Path.home() / ".cache" / "promptcraft" / "resource-catalog.json"
+SNAPSHOT_VERSION = 2
+
+T = TypeVar("T")
+
+
+_EntryKey = tuple[str, tuple[str, ...], str]  # (kind, identity, absolute path)
+
+
+@dataclass
+class _CatalogEntry:
+    mtime_ns: int
+    size: int
+    mode: int
+    definition: Any = None
+    encoded: dict[str, Any] | None = None  # Snapshot form, until first decoded
+
+
+@dataclass
+class _ScanTimings:
+    count: int = 0
+    last_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+
+class ResourceCatalog:
+    """Cache of parsed resource definitions shared by the discovery systems."""
+
+    def __init__(self, snapshot_path: Path | None = None) -> None:
+        """
+        Initialize the catalog and load its snapshot, if any.
+
+        Args:
+            snapshot_path: File the catalog is persisted to (None disables snapshots)
+        """
+        self.snapshot_path = snapshot_path
+        self._entries: dict[_EntryKey, _CatalogEntry] = {}
+        self._scans: dict[str, _ScanTimings] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+
+        self.hits = 0
+        self.parses = 0
+        self.parse_seconds = 0.0
+        self.snapshot_entries = 0
+
+        if snapshot_path is not None:
+            self.snapshot_entries = self.load_snapshot()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def enable_snapshot(self, snapshot_path: Path) -> None:
+        """Persist the catalog to ``snapshot_path`` from now on, loading it if it exists."""
+        with self._lock:
+            if self.snapshot_path == snapshot_path:
+                return
+            self.snapshot_path = snapshot_path
+            self._dirty = bool(self._entries)
+        self.snapshot_entries = self.load_snapshot()
+
+    def load(
+        self,
+        kind: str,
+        path: Path,
+        parse: Callable[[], T],
+        decode: Callable[[dict[str, Any]], T],
+        identity: tuple[str, ...] = (),
+    ) -> T:
+        """
+        Get the definition in ``path``, parsing the file only if it changed.
+
+        Args:
+            kind: Resource kind, e.g. ``"commands"``; each kind has its own entries
+            path: Resource file
+            parse: Parses the file into a definition
+            decode: Rebuilds a definition from the ``to_dict()`` form stored in snapshots
+            identity: Arguments ``parse`` depends on besides the file, e.g. resource id and source type
+
+        Returns:
+            The parsed definition
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            # Not a file on disk; nothing to key a cache entry on
+            return parse()
+        key = (kind, identity, str(path.absolute()))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.mtime_ns, entry.size, entry.mode) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+                stat.st_mode,
+            ):
+                if entry.encoded is not None:
+                    entry.definition = decode(entry.encoded)
+                    entry.encoded = None
+                self.hits += 1
+                return entry.definition
+
+        start = time.perf_counter()
+        definition = parse()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._entries[key] = _CatalogEntry(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                mode=stat.st_mode,
+                definition=definition,
+            )
+            self._dirty = True
+            self.parses += 1
+            self.parse_seconds += elapsed
+        return definition
+
+    @contextmanager
+    def timed_scan(self, kind: str) -> Iterator[None]:
+        """Record how long the enclosed scan of ``kind`` resources takes."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                timings = self._scans.setdefault(kind, _ScanTimings())
+                timings.count += 1
+                timings.last_seconds = elapsed
+                timings.total_seconds += elapsed
+
+    def load_snapshot(self) -> int:
+        """
+        Load cached definitions from the snapshot file.
+
+        Returns:
+            int: Number of definitions loaded
+        """
+        if self.snapshot_path is None or not self.snapshot_path.is_file():
+            return 0
+        try:
+            snapshot = json.loads(self.snapshot_path.read_text())
+            if snapshot.get("version") != SNAPSHOT_VERSION:
+                return 0
+            entries = {
+                (item["kind"], tuple(item["identity"]), item["path"]): _CatalogEntry(
+                    mtime_ns=item["mtime_ns"],
+                    size=item["size"],
+                    mode=item["mode"],
+                    encoded=item["definition"],
+                )
+                for item in snapshot["entries"]
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable resource catalog snapshot %s: %s", self.snapshot_path, e)
+            return 0
+
+        with self._lock:
+            for key, entry in entries.items():
+                self._entries.setdefault(key, entry)
+        return len(entries)
+
+    def save_snapshot(self) -> bool:
+        """
+        Write the cached definitions to the snapshot file if anything changed.
+
+        Returns:
+            bool: True if a snapshot was written
+        """
+        if self.snapshot_path is None:
+            return False
+        with self._lock:
+            if not self._dirty:
+                return False
+            # Entries are kept only while their file exists
+            for key in [key for key in self._entries if not Path(key[2]).exists()]:
+                del self._entries[key]
+            try:
+                entries = [
+                    {
+                        "kind": kind,
+                        "identity": list(identity),
+                        "path": path,
+                        "mtime_ns": entry.mtime_ns,
+                        "size": entry.size,
+                        "mode": entry.mode,
+                        "definition": entry.encoded if entry.encoded is not None else entry.definition.to_dict(),
+                    }
+                    for (kind, identity, path), entry in self._entries.items()
+                ]
+                content = json.dumps({"version": SNAPSHOT_VERSION, "entries": entries}, separators=(",", ":"))
+            except (TypeError, ValueError, AttributeError) as e:
+                logger.warning("Failed to encode resource catalog snapshot: %s", e)
+                return False
+            self._dirty = False
+
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(content)
+            temp_path.replace(self.snapshot_path)
+        except OSError as e:
+            logger.warning("Failed to write resource catalog snapshot %s: %s", self.snapshot_path, e)
+            return False
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics and scan timings."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "snapshot_entries": self.snapshot_entries,
+                "hits": self.hits,
+                "parses": self.parses,
+                "parse_seconds": self.parse_seconds,
+                "scans": {
+                    kind: {
+                        "count": timings.count,
+                        "last_seconds": timings.last_seconds,
+                        "total_seconds": timings.total_seconds,
+                    }
+                    for kind, timings in self._scans.items()
+                },
+            }
+
+
+_catalog: ResourceCatalog | None = None
+
+
+def get_resource_catalog(snapshot_path: Path | None = None) -> ResourceCatalog:
+    """
+    Get the process-wide ResourceCatalog.
+
+    Args:
+        snapshot_path: Opt in to persisting the catalog there, e.g. ``DEFAULT_SNAPSHOT_PATH``;
+            None leaves persistence as it is (off unless enabled earlier)
+
+    Returns:
+        ResourceCatalog: The shared catalog
+    """
+    global _catalog  # noqa: PLW0603
+    if _catalog is None:
+        _catalog = ResourceCatalog(snapshot_path=snapshot_path)
+    elif snapshot_path is not None:
+        _catalog.enable_snapshot(snapshot_path)
+    return _catalog
+
+
+__all__ = [
+    "DEFAULT_SNAPSHOT_PATH",
+    "ResourceCatalog",
+    "get_resource_catalog",
+]
@@ -0,0 +1,237 @@
+"""Startup profiling for application cold starts.
+
+``StartupProfiler`` records two kinds of timings:
+
+- Module imports: ``install_import_timer`` adds a meta path finder that times
+  the execution of every module under the profiled packages (``src`` by
+  default). Each module gets a cumulative time, which includes the third-party
+  packages it imports, and a self time, which excludes nested profiled modules.
+  Modules loaded on first use through ``src.utils.lazy_import`` are recorded
+  with the time they were actually loaded. The ``src`` package installs the
+  timer on import only when ``PROMPTCRAFT_PROFILE_IMPORTS`` is set in the
+  process environment.
+- Startup steps: ``step`` times named phases such as the lifespan handlers.
+
+The finder only wraps ``exec_module`` on the loader instance of each profiled
+module, so loader types and module metadata are unchanged.
+"""
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec, PathFinder
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any
+
+
+DEFAULT_PACKAGES = ("src",)
+
+
+@dataclass
+class ImportTiming:
+    """Time taken to import one module.
+
+    Attributes:
+        module: Module name
+        cumulative_seconds: Time to execute the module, including its imports
+        self_seconds: Cumulative time minus nested profiled imports
+        started_at: Seconds since the profiler was created
+        lazy: Whether the module was loaded on first use instead of at startup
+    """
+
+    module: str
+    cumulative_seconds: float
+    self_seconds: float
+    started_at: float
+    lazy: bool = False
+
+
+@dataclass
+class StepTiming:
+    """Time taken by one named startup step.
+
+    Attributes:
+        name: Step name
+        seconds: Duration
+        started_at: Seconds since the profiler was created
+        failed: Whether the step raised
+    """
+
+    name: str
+    seconds: float
+    started_at: float
+    failed: bool = False
+
+
+class _ImportTimer(MetaPathFinder):
+    """Finds profiled modules with the path finder and times their execution."""
+
+    def __init__(self, profiler: "StartupProfiler", packages: Sequence[str]) -> None:
+        self._profiler = profiler
+        self._packages = tuple(packages)
+        self._prefixes = tuple(f"{package}." for package in packages)
+
+    def _is_profiled(self, fullname: str) -> bool:
+        return fullname in self._packages or fullname.startswith(self._prefixes)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        if not self._is_profiled(fullname):
+            return None
+        spec = PathFinder.find_spec(fullname, path, target)
+        loader = spec.loader if spec is not None else None
+        exec_module = getattr(loader, "exec_module", None)
+        if exec_module is None:
+            return spec
+
+        profiler = self._profiler
+
+        def timed_exec_module(module: ModuleType) -> None:
+            with profiler.time_import(fullname):
+                exec_module(module)
+
+        loader.exec_module = timed_exec_module  # type: ignore[union-attr]
+        return spec
+
+
+class StartupProfiler:
+    """Collects module import and startup step timings."""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._imports: dict[str, ImportTiming] = {}
+        self._steps: list[StepTiming] = []
+        self._finder: _ImportTimer | None = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _elapsed(self, now: float) -> float:
+        return now - self._origin
+
+    def install_import_timer(self, packages: Sequence[str] = DEFAULT_PACKAGES) -> None:
+        """Time the imports of modules in ``packages`` from now on."""
+        if self._finder is None:
+            self._finder = _ImportTimer(self, packages)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall_import_timer(self) -> None:
+        """Stop timing imports."""
+        if self._finder is not None:
+            if self._finder in sys.meta_path:
+                sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    @contextmanager
+    def time_import(self, module: str, lazy: bool = False) -> Iterator[None]:
+        """Record the import of ``module`` performed in the enclosed block.
+
+        Args:
+            module: Module name
+            lazy: Whether this is a deferred, first-use import
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        # Imports triggered by a deferred import are deferred too
+        lazy = lazy or bool(stack and stack[-1][1])
+        stack.append([0.0, lazy])  # Time spent in nested profiled imports, laziness
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cumulative = time.perf_counter() - start
+            nested, _ = stack.pop()
+            if stack:
+                stack[-1][0] += cumulative
+            timing = ImportTiming(module, cumulative, cumulative - nested, self._elapsed(start), lazy)
+            with self._lock:
+                previous = self._imports.get(module)
+                # A deferred import wraps the module's own execution; keep the outer, complete timing
+                if previous is None or previous.cumulative_seconds < cumulative:
+                    self._imports[module] = timing
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Record the duration of a named startup step."""
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            timing = StepTiming(name, time.perf_counter() - start, self._elapsed(start), failed)
+            with self._lock:
+                self._steps.append(timing)
+
+    def imports(self) -> list[ImportTiming]:
+        """Get the recorded imports in load order."""
+        with self._lock:
+            return sorted(self._imports.values(), key=lambda timing: timing.started_at)
+
+    def steps(self) -> list[StepTiming]:
+        """Get the recorded steps in completion order."""
+        with self._lock:
+            return list(self._steps)
+
+    def report(self, limit: int = 25) -> dict[str, Any]:
+        """Summarize startup cost.
+
+        Args:
+            limit: Number of modules to list, by descending self time
+
+        Returns:
+            Dict[str, Any]: Totals, the most expensive modules, lazily loaded modules and steps
+        """
+        imports = self.imports()
+        eager = [timing for timing in imports if not timing.lazy]
+        return {
+            "import_timer_installed": self._finder is not None,
+            "modules_imported": len(eager),
+            "import_seconds": round(sum(timing.self_seconds for timing in eager), 6),
+            "slowest_imports": [
+                {
+                    "module": timing.module,
+                    "self_ms": round(timing.self_seconds * 1000, 3),
+                    "cumulative_ms": round(timing.cumulative_seconds * 1000, 3),
+                }
+                for timing in sorted(eager, key=lambda timing: timing.self_seconds, reverse=True)[:limit]
+            ],
+            "lazy_imports": [
+                {
+                    "module": timing.module,
+                    "cumulative_ms": round(timing.cumulative_seconds * 1000, 3),
+                    "loaded_at_s": round(timing.started_at, 3),
+                }
+                for timing in imports
+                if timing.lazy
+            ],
+            "steps": [
+                {"name": step.name, "ms": round(step.seconds * 1000, 3), "failed": step.failed} for step in self.steps()
+            ],
+        }
+
+
+_startup_profiler = StartupProfiler()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get the process-wide startup profiler."""
+    return _startup_profiler
+
+
+__all__ = [
+    "ImportTiming",
+    "StartupProfiler",
+    "StepTiming",
+    "get_startup_profiler",
+]
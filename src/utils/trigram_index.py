@@ -0,0 +1,232 @@
+"""In-memory fuzzy search over short text fields.
+
+``TrigramIndex`` indexes the words of a few short fields per entry (names,
+aliases, tags, one-line descriptions) and answers queries with ranked,
+typo-tolerant matches.
+
+Matching:
+    Words are broken into trigrams padded like PostgreSQL's pg_trgm (two
+    leading spaces, one trailing), and each query word is looked up in a
+    trigram posting list over the indexed vocabulary. An indexed word
+    matches a query word exactly, as a prefix, as a substring, or fuzzily:
+    when the Jaccard similarity of their trigram sets reaches
+    ``min_similarity``, or when a query word of four or more characters is
+    within a small edit distance (transpositions count as one edit).
+
+Ranking:
+    An entry matches when every query word matches one of its words. Its
+    score is the mean, over query words, of the best match score times the
+    weight of the field the word came from. Exact matches score 1.0 and
+    fuzzy matches always rank below substring matches.
+
+Entries are added, replaced and removed one at a time, so callers can keep
+the index current as their sources change instead of rebuilding it.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+import re
+
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.9
+SUBSTRING_SCORE = 0.8
+FUZZY_SCALE = 0.75
+MIN_EDIT_WORD_LENGTH = 4
+LONG_WORD_LENGTH = 8  # Words this long tolerate two edits, shorter ones one
+
+
+def trigrams(word: str) -> frozenset[str]:
+    """Get the padded trigrams of a lowercase word."""
+    padded = f"  {word} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Compute the optimal string alignment distance between two words.
+
+    Args:
+        a: First word
+        b: Second word
+        limit: Largest distance of interest
+
+    Returns:
+        The distance, or ``limit + 1`` as soon as it is known to exceed ``limit``
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before_previous: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, char_b in enumerate(b, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                current[j] = min(current[j], before_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+@dataclass(frozen=True)
+class IndexMatch:
+    """A ranked search result.
+
+    Attributes:
+        key: Key the entry was indexed under
+        score: Relevance between 0 and 1 (higher is more relevant)
+    """
+
+    key: str
+    score: float
+
+
+class TrigramIndex:
+    """Ranked, typo-tolerant word search over indexed entries."""
+
+    def __init__(self, min_similarity: float = 0.3) -> None:
+        """
+        Create an empty index.
+
+        Args:
+            min_similarity: Trigram Jaccard similarity at which words match fuzzily
+        """
+        self.min_similarity = min_similarity
+        self._entries: dict[str, dict[str, float]] = {}  # key -> {word: field weight}
+        self._word_keys: dict[str, set[str]] = {}
+        self._word_trigrams: dict[str, frozenset[str]] = {}
+        self._trigram_words: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def add(self, key: str, fields: Iterable[tuple[str, float]]) -> None:
+        """
+        Index an entry, replacing any previous entry with the same key.
+
+        Args:
+            key: Key returned in search results
+            fields: (text, weight) pairs; a word found in several fields keeps its highest weight
+        """
+        self.remove(key)
+        words: dict[str, float] = {}
+        for text, weight in fields:
+            for word in WORD_PATTERN.findall(text.lower()):
+                words[word] = max(weight, words.get(word, 0.0))
+        self._entries[key] = words
+
+        for word in words:
+            keys = self._word_keys.get(word)
+            if keys is None:
+                keys = self._word_keys[word] = set()
+                self._word_trigrams[word] = trigrams(word)
+                for gram in self._word_trigrams[word]:
+                    self._trigram_words.setdefault(gram, set()).add(word)
+            keys.add(key)
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove an entry.
+
+        Returns:
+            bool: Whether the key was indexed
+        """
+        words = self._entries.pop(key, None)
+        if words is None:
+            return False
+
+        for word in words:
+            keys = self._word_keys[word]
+            keys.discard(key)
+            if keys:
+                continue
+            del self._word_keys[word]
+            for gram in self._word_trigrams.pop(word):
+                gram_words = self._trigram_words[gram]
+                gram_words.discard(word)
+                if not gram_words:
+                    del self._trigram_words[gram]
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self._word_keys.clear()
+        self._word_trigrams.clear()
+        self._trigram_words.clear()
+
+    def search(self, query: str, limit: int | None = None) -> list[IndexMatch]:
+        """
+        Find the entries matching every word of ``query``, best first.
+
+        Args:
+            query: Words to look for; punctuation separates words
+            limit: Maximum number of matches
+
+        Returns:
+            List[IndexMatch]: Matches by descending score, ties broken by key
+        """
+        query_words = list(dict.fromkeys(WORD_PATTERN.findall(query.lower())))
+        if not query_words:
+            return []
+
+        scores: dict[str, float] = {}
+        for position, query_word in enumerate(query_words):
+            best: dict[str, float] = {}
+            for word, word_score in self._match_word(query_word).items():
+                for key in self._word_keys[word]:
+                    score = word_score * self._entries[key][word]
+                    if score > best.get(key, 0.0):
+                        best[key] = score
+            if position == 0:
+                scores = best
+            else:
+                scores = {key: scores[key] + score for key, score in best.items() if key in scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [IndexMatch(key, score / len(query_words)) for key, score in ranked]
+
+    def _match_word(self, query_word: str) -> dict[str, float]:
+        """Score every indexed word that matches a query word."""
+        query_trigrams = trigrams(query_word)
+        shared: Counter[str] = Counter()
+        for gram in query_trigrams:
+            shared.update(self._trigram_words.get(gram, ()))
+
+        max_edits = 2 if len(query_word) >= LONG_WORD_LENGTH else 1
+        matches = {}
+        for word, count in shared.items():
+            if word == query_word:
+                matches[word] = EXACT_SCORE
+            elif word.startswith(query_word):
+                matches[word] = PREFIX_SCORE
+            elif query_word in word:
+                matches[word] = SUBSTRING_SCORE
+            else:
+                similarity = count / (len(query_trigrams) + len(self._word_trigrams[word]) - count)
+                if len(query_word) >= MIN_EDIT_WORD_LENGTH:
+                    distance = edit_distance(query_word, word, max_edits)
+                    if distance <= max_edits:
+                        similarity = max(similarity, 1 - distance / max(len(query_word), len(word)))
+                if similarity >= self.min_similarity:
+                    matches[word] = similarity * FUZZY_SCALE
+        return matches
+
+
+__all__ = [
+    "IndexMatch",
+    "TrigramIndex",
+    "edit_distance",
+    "trigrams",
+]
@@ -507,7 +507,7 @@ class TestRateLimiterIntegration:
             rate_limiter.check_request_rate(session_id)
 
         # Force cleanup
-        rate_limiter._cleanup_old_entries()
+        rate_limiter.backend.evict_idle(time.time())
 
         # Verify cleanup doesn't break functionality
         assert rate_limiter.check_request_rate("new_session") is True
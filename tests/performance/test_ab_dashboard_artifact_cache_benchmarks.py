@@ -0,0 +1,89 @@
+"""Benchmarks for serving A/B dashboard pages from the artifact cache.
+
+Metrics collection is stubbed to return a week of hourly buckets, so the
+timings cover what the cache saves: building the plotly charts and rendering
+the page template. The real ``DashboardVisualizer`` produces the charts.
+"""
+
+from datetime import datetime, timedelta
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.monitoring.ab_testing_dashboard import ABTestingDashboard, DashboardMetrics
+from src.utils.datetime_compat import UTC
+
+
+HOURS = 7 * 24
+REPEATS = 5
+MIN_SPEEDUP = 10.0
+
+
+def week_of_metrics() -> DashboardMetrics:
+    """Dashboard metrics with a full week of hourly timeline buckets."""
+    start = datetime(2024, 3, 1, tzinfo=UTC)
+    timeline = [
+        {
+            "timestamp": (start + timedelta(hours=hour)).strftime("%Y-%m-%dT%H:%M:%S"),
+            "avg_response_time_ms": 100.0 + hour % 40,
+            "avg_token_reduction": 60.0 + hour % 15,
+            "success_rate": 95.0 + hour % 5,
+        }
+        for hour in range(HOURS)
+    ]
+    return DashboardMetrics(
+        experiment_id="exp",
+        experiment_name="Benchmark Experiment",
+        status="active",
+        total_users=5000,
+        active_users_24h=1200,
+        conversion_rate=42.0,
+        statistical_significance=91.5,
+        avg_response_time_ms=120.0,
+        avg_token_reduction=67.0,
+        success_rate=97.0,
+        error_rate=3.0,
+        variants={
+            "control": {"users": 2500, "success_rate": 96.0, "avg_response_time_ms": 125.0},
+            "treatment": {"users": 2500, "success_rate": 98.0, "avg_response_time_ms": 115.0},
+        },
+        performance_timeline=timeline,
+        conversion_timeline=[],
+        error_timeline=[],
+        active_alerts=[],
+        recommendations=["Continue experiment"],
+        risk_level="low",
+        confidence_level="medium",
+    )
+
+
+async def best_render_seconds(dashboard: ABTestingDashboard) -> tuple[float, str | None]:
+    """Best-of time to render the dashboard page, with the page's ETag."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        rendered = await dashboard.render_dashboard("exp")
+        best = min(best, time.perf_counter() - start)
+    return best, rendered.etag
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+async def test_unchanged_data_is_served_from_cache():
+    """Repeat views of unchanged data skip chart building and template rendering."""
+    dashboard = ABTestingDashboard(Mock())
+    dashboard.metrics_collector.collect_experiment_metrics = AsyncMock(side_effect=lambda _: week_of_metrics())
+
+    cold = float("inf")
+    for _ in range(REPEATS):
+        dashboard.artifact_cache.clear()
+        start = time.perf_counter()
+        cold_etag = (await dashboard.render_dashboard("exp")).etag
+        cold = min(cold, time.perf_counter() - start)
+    warm, warm_etag = await best_render_seconds(dashboard)
+    print(f"\ndashboard page: rendered {cold * 1000:.1f}ms, cached {warm * 1000:.2f}ms")
+
+    assert cold_etag is not None
+    assert warm_etag == cold_etag
+    assert cold / warm >= MIN_SPEEDUP
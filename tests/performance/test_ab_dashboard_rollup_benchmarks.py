@@ -0,0 +1,88 @@
+"""Benchmarks for A/B dashboard timelines served from metric rollups.
+
+The same seven days of buckets are filled with a small and a large number of
+raw events. Timelines read only the rollup rows, whose latency sketches stop
+growing once their bins fill, so collecting them should take about as long
+for either volume.
+"""
+
+from datetime import datetime, timedelta
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.ab_testing_framework import BaseModel, MetricEventModel, MetricRollupStore
+from src.monitoring.ab_testing_dashboard import MetricsCollector
+from src.utils.datetime_compat import UTC
+
+
+HOURS = 7 * 24 - 2  # Stays inside the dashboard window while the test runs
+SMALL_VOLUME = HOURS * 24
+LARGE_VOLUME = HOURS * 144
+REPEATS = 5
+MAX_VOLUME_RATIO = 2.0
+EVENT_TYPES = ("performance", "optimization", "error")
+
+
+def populated_session(events: int):
+    """Create a database with ``events`` raw events spread over the last week, plus their rollups."""
+    engine = create_engine("sqlite:///:memory:")
+    BaseModel.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    start = datetime.now(UTC).replace(tzinfo=None, minute=0, second=0, microsecond=0) - timedelta(hours=HOURS - 1)
+    session.bulk_insert_mappings(
+        MetricEventModel,
+        [
+            {
+                "id": f"event-{i}",
+                "experiment_id": "exp",
+                "user_id": f"user-{i % 50}",
+                "variant": "treatment" if i % 2 else "control",
+                "event_type": EVENT_TYPES[i % 3],
+                "event_name": "benchmark",
+                "timestamp": start + timedelta(hours=i % HOURS, seconds=i % 3600),
+                "response_time_ms": 50.0 + i % 400,
+                "token_reduction_percentage": float(i % 100),
+                "success": i % 17 != 0,
+            }
+            for i in range(events)
+        ],
+    )
+    assert MetricRollupStore(session).rebuild() == events
+    session.commit()
+    return session
+
+
+async def dashboard_timelines_seconds(collector: MetricsCollector, session) -> float:
+    """Best-of time to collect all three dashboard timelines."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        performance = await collector._collect_performance_timeline("exp", session)
+        conversion = await collector._collect_conversion_timeline("exp", session)
+        errors = await collector._collect_error_timeline("exp", session)
+        best = min(best, time.perf_counter() - start)
+    assert len(performance) == len(conversion) == len(errors) == HOURS
+    return best
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+async def test_timeline_cost_is_independent_of_event_volume():
+    """Six times the events does not make the dashboard timelines slower."""
+    collector = MetricsCollector(experiment_manager=None)
+    small = populated_session(SMALL_VOLUME)
+    large = populated_session(LARGE_VOLUME)
+
+    small_seconds = await dashboard_timelines_seconds(collector, small)
+    large_seconds = await dashboard_timelines_seconds(collector, large)
+    print(
+        f"\ntimelines: {SMALL_VOLUME} events {small_seconds * 1000:.1f}ms, "
+        f"{LARGE_VOLUME} events {large_seconds * 1000:.1f}ms",
+    )
+    small.close()
+    large.close()
+
+    assert large_seconds / small_seconds < MAX_VOLUME_RATIO
@@ -0,0 +1,93 @@
+"""Benchmarks for ANCHOR-QR evaluation of long prompts.
+
+A CREATE prompt padded to tens of thousands of words stands in for a long,
+document-grounded prompt. Running each step on the raw prompt text, so every
+step scans the prompt itself, is timed as the reference for the shared
+feature pass.
+"""
+
+import time
+
+import pytest
+
+from src.core.anchor_qr_evaluator import ANCHORQREvaluator, EvaluationStep, RigorLevel
+
+
+PARAGRAPHS = 2000
+REPEATS = 5
+MIN_CACHED_SPEEDUP = 10.0
+CONTEXT = {"query": "Summarize the quarterly operations review"}
+
+
+def long_prompt() -> str:
+    """A CREATE prompt with a long body of reference material."""
+    body = "\n".join(
+        f"Paragraph {index}: the operations team reviewed region {index % 40} and recorded the figures."
+        for index in range(PARAGRAPHS)
+    )
+    return (
+        "# C - Context\nYou are a careful analyst.\n"
+        f"{body}\n"
+        "# R - Request\nVerify each claim and cite the source for every figure.\n"
+        "# E - Examples\nCompare two regions step by step.\n"
+        "# A - Augmentations\nNote anything uncertain and keep within scope.\n"
+        "# T - Tone\nProfessional and specific.\n"
+        "# E - Evaluation\nDoes the response meet the success criteria?\n"
+    )
+
+
+def best_seconds(run) -> float:
+    """Best-of time for a callable."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+def test_shared_features_and_cache_speed_up_long_prompts():
+    """One feature pass beats per-step scans, and repeat evaluations come from the cache."""
+    prompt = long_prompt()
+    evaluator = ANCHORQREvaluator(cache_size=0)
+
+    def per_step_scans():
+        for step in EvaluationStep:
+            evaluator._evaluate_step(step, prompt, CONTEXT, RigorLevel.STANDARD)
+
+    per_step = best_seconds(per_step_scans)
+    shared = best_seconds(lambda: evaluator.evaluate_prompt(prompt, CONTEXT))
+    cached_evaluator = ANCHORQREvaluator()
+    expected = cached_evaluator.evaluate_prompt(prompt, CONTEXT)
+    cached = best_seconds(lambda: cached_evaluator.evaluate_prompt(prompt, CONTEXT))
+    print(
+        f"\n{len(prompt.split())} words: per-step scans {per_step * 1000:.2f}ms, "
+        f"shared features {shared * 1000:.2f}ms, cached {cached * 1000:.3f}ms",
+    )
+
+    assert cached_evaluator.evaluate_prompt(prompt, CONTEXT).overall_score == expected.overall_score
+    assert shared < per_step
+    assert shared / cached >= MIN_CACHED_SPEEDUP
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+def test_early_exit_skips_steps_on_failing_long_prompt():
+    """A long prompt that cannot pass stops evaluating once the outcome is settled."""
+    prompt = "Tell me about the figures. " * 5000
+    context = {"query": ""}
+    full = ANCHORQREvaluator(cache_size=0)
+    early = ANCHORQREvaluator(cache_size=0, early_exit=True)
+
+    result = early.evaluate_prompt(prompt, context)
+    print(
+        f"\nfailing prompt: full {best_seconds(lambda: full.evaluate_prompt(prompt, context)) * 1000:.2f}ms, "
+        f"early exit {best_seconds(lambda: early.evaluate_prompt(prompt, context)) * 1000:.2f}ms "
+        f"({len(result.skipped_steps)} steps skipped)",
+    )
+
+    assert result.skipped_steps
+    assert result.is_passing is False
+    assert full.evaluate_prompt(prompt, context).is_passing is False
@@ -0,0 +1,91 @@
+"""Benchmarks for fuzzy command search and incremental command discovery.
+
+A registry of a few thousand generated commands stands in for a large
+project: names are built from a shared vocabulary so queries match many
+commands, as real prefixes like ``quality-`` or ``test-`` do. Discovery
+runs against real command files in a temporary directory.
+"""
+
+from itertools import product
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.commands.discovery import CommandsDiscoverySystem
+from src.core.claude_integration import CommandMetadata, CommandRegistry
+from src.utils.resource_catalog import ResourceCatalog
+
+
+AREAS = ["quality", "test", "deploy", "security", "docs", "release", "data", "infra", "agent", "cache"]
+ACTIONS = ["lint", "format", "check", "build", "scan", "sync", "audit", "report", "migrate", "review"]
+TARGETS = ["api", "cli", "web", "core", "jobs", "auth", "ui", "db", "queue", "search"]
+VARIANTS = ["fast", "full", "dry", "ci", "local"]
+QUERIES = ["quality", "lint", "secrity scan", "deploy web", "migrat db", "audit", "reprot"]
+REPEATS = 20
+MAX_SEARCH_SECONDS = 0.001
+DISCOVERY_FILES = 300
+
+
+def command_names() -> list[str]:
+    """Generated command names, five thousand of them."""
+    return ["-".join(parts) for parts in product(AREAS, ACTIONS, TARGETS, VARIANTS)]
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+def test_registry_search_is_sub_millisecond():
+    """Ranked fuzzy search over thousands of commands stays under a millisecond per query."""
+    registry = CommandRegistry()
+    for name in command_names():
+        area, action, *_ = name.split("-")
+        metadata = CommandMetadata(
+            name=name,
+            category="meta",
+            complexity="low",
+            estimated_time="< 1 minute",
+            tags=[area, action],
+        )
+        registry.register_command(name, MagicMock(), metadata)
+
+    worst = 0.0
+    for query in QUERIES:
+        best = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            results = registry.search_commands(query, limit=10)
+            best = min(best, time.perf_counter() - start)
+        worst = max(worst, best)
+        assert results, query
+    print(f"\n{len(registry.commands)} commands: slowest query {worst * 1000:.3f}ms")
+
+    assert registry.search_commands("secrity scan", limit=1)[0].startswith("security-scan-")
+    assert worst < MAX_SEARCH_SECONDS
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+def test_unchanged_commands_are_not_rediscovered(tmp_path):
+    """Refreshing discovery with no file changes re-reads no command files."""
+    discovery = CommandsDiscoverySystem(project_root=tmp_path / "project", catalog=ResourceCatalog())
+    discovery.user_commands_path = tmp_path / "user" / "commands"
+    discovery.project_commands_path.mkdir(parents=True)
+    for name in command_names()[:DISCOVERY_FILES]:
+        (discovery.project_commands_path / f"{name}.md").write_text(f"---\ndescription: Runs {name}\n---\n")
+
+    start = time.perf_counter()
+    discovery._refresh_commands_cache()
+    full_seconds = time.perf_counter() - start
+
+    with patch.object(discovery, "discover_command", wraps=discovery.discover_command) as mock_discover:
+        start = time.perf_counter()
+        discovery._refresh_commands_cache()
+        incremental_seconds = time.perf_counter() - start
+    print(
+        f"\n{DISCOVERY_FILES} command files: full refresh {full_seconds * 1000:.1f}ms, "
+        f"unchanged refresh {incremental_seconds * 1000:.1f}ms",
+    )
+
+    mock_discover.assert_not_called()
+    assert len(discovery._commands_cache) == DISCOVERY_FILES + 1  # Plus the built-in help command
+    assert incremental_seconds < full_seconds
@@ -0,0 +1,94 @@
+"""Benchmarks for CreateProcessor feature extraction and memoized results.
+
+Prompts up to the 50,000 character validation limit are built from a role
+statement followed by plain reference text, so most extraction patterns find
+nothing and must rule out the whole prompt. Running every pattern's
+``re.search`` over the prompt, as the components used to, is timed as the
+reference. The speedup ratios depend on the machine, so these cases are
+marked ``perf`` and ``slow`` and stay out of the default suite.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.create_processor_core import (
+    BACKGROUND_RULES,
+    DELIVERABLE_RULES,
+    EXAMPLE_RULES,
+    FORMAT_RULES,
+    GOAL_RULES,
+    ROLE_RULES,
+    TASK_RULES,
+    TONE_RULES,
+    CreateProcessor,
+    PromptFeatures,
+)
+
+
+SIZES = [5_000, 25_000, 50_000]
+REPEATS = 5
+MIN_EXTRACTION_SPEEDUP = 5.0
+MIN_MEMOIZED_SPEEDUP = 5.0
+ALL_RULES = (
+    *ROLE_RULES,
+    *BACKGROUND_RULES,
+    *GOAL_RULES,
+    *TASK_RULES,
+    *DELIVERABLE_RULES,
+    *EXAMPLE_RULES,
+    *TONE_RULES,
+    *FORMAT_RULES,
+)
+
+
+def large_prompt(size: int) -> str:
+    """A prompt of ``size`` characters that mostly contains no extraction triggers."""
+    sentence = "The operations team reviewed region seven and recorded the quarterly figures. "
+    return ("You are a reviewer. " + sentence * (size // len(sentence) + 1))[:size]
+
+
+def best_seconds(run) -> float:
+    """Best-of time for a callable."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.perf
+@pytest.mark.slow
+@pytest.mark.performance
+@pytest.mark.benchmark
+def test_feature_extraction_beats_per_pattern_scans():
+    """One feature pass is several times faster than scanning once per pattern."""
+    for size in SIZES:
+        prompt = large_prompt(size)
+        per_pattern = best_seconds(lambda prompt=prompt: [rule.pattern.search(prompt) for rule in ALL_RULES])
+        shared = best_seconds(lambda prompt=prompt: PromptFeatures.extract(prompt))
+        print(f"\n{size} chars: per-pattern scans {per_pattern * 1000:.2f}ms, feature pass {shared * 1000:.2f}ms")
+
+        assert PromptFeatures.extract(prompt).role == "a reviewer"
+        assert per_pattern / shared >= MIN_EXTRACTION_SPEEDUP
+
+
+@pytest.mark.perf
+@pytest.mark.slow
+@pytest.mark.performance
+@pytest.mark.benchmark
+def test_repeated_prompts_are_memoized():
+    """Processing the same large prompt again is served from the result cache."""
+    prompt = large_prompt(SIZES[-1])
+    uncached = CreateProcessor({"result_cache_size": 0})
+    cached = CreateProcessor()
+    asyncio.run(cached.process_prompt(prompt, "technical"))
+
+    cold = best_seconds(lambda: asyncio.run(uncached.process_prompt(prompt, "technical")))
+    warm = best_seconds(lambda: asyncio.run(cached.process_prompt(prompt, "technical")))
+    print(f"\n{len(prompt)} chars: processed {cold * 1000:.2f}ms, memoized {warm * 1000:.2f}ms")
+
+    assert cached.cache_stats["hits"] == REPEATS
+    assert cold / warm >= MIN_MEMOIZED_SPEEDUP
@@ -0,0 +1,104 @@
+"""Benchmarks for RealTimeDashboard WebSocket fan-out with slow clients.
+
+Hundreds of simulated clients share one event loop: most accept a message
+immediately, some take a while per send and a few never complete a send at
+all. The baseline awaits each client in turn, as broadcasts used to; with
+per-client send queues the update loop only pays for serializing and queueing
+each message once.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.monitoring.performance_dashboard import RealTimeDashboard
+
+
+CLIENTS = 300
+SLOW_EVERY = 10  # Every 10th client is slow
+STALLED_EVERY = 50  # Every 50th client never finishes a send
+SLOW_SEND_SECONDS = 0.02
+SEND_TIMEOUT_SECONDS = 0.2
+TICKS = 20
+TICK_SECONDS = 0.01
+MAX_BROADCAST_SECONDS = 0.01
+MAX_FAST_CLIENT_LAG_SECONDS = 0.05
+
+
+class SimulatedClient:
+    """WebSocket stand-in that records what it receives and when."""
+
+    def __init__(self, index: int) -> None:
+        self.stalled = index % STALLED_EVERY == 0
+        self.slow = not self.stalled and index % SLOW_EVERY == 0
+        self.received: list[tuple[str, float]] = []
+        self.closed = False
+
+    async def send_text(self, message: str) -> None:
+        if self.stalled:
+            await asyncio.Event().wait()
+        if self.slow:
+            await asyncio.sleep(SLOW_SEND_SECONDS)
+        self.received.append((message, time.perf_counter()))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def sequential_broadcast(clients: list[SimulatedClient], message: str) -> None:
+    """Send one message to each client in turn, as broadcasts used to."""
+    for client in clients:
+        await client.send_text(message)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+async def test_slow_clients_do_not_hold_up_broadcasts():
+    """Broadcast cost and fast-client lag stay flat while slow clients fall behind or are evicted."""
+    clients = [SimulatedClient(index) for index in range(CLIENTS)]
+    fast = [client for client in clients if not client.slow and not client.stalled]
+    slow = [client for client in clients if client.slow]
+
+    start = time.perf_counter()
+    await sequential_broadcast([client for client in clients if not client.stalled], "{}")
+    sequential_seconds = time.perf_counter() - start
+    for client in clients:
+        client.received.clear()
+
+    dashboard = RealTimeDashboard(Mock())
+    dashboard.send_timeout_seconds = SEND_TIMEOUT_SECONDS
+    dashboard.connected_clients = list(clients)
+
+    broadcast_seconds = []
+    sent_at = {}
+    for tick in range(TICKS):
+        data = {"timestamp": tick, "system_health": {"total_sessions": tick}}
+        start = time.perf_counter()
+        await dashboard._broadcast_to_clients(data)
+        broadcast_seconds.append(time.perf_counter() - start)
+        sent_at[tick] = start
+        await asyncio.sleep(TICK_SECONDS)
+    await dashboard.flush_clients()
+
+    lag = max(
+        received - sent_at[json.loads(message)["timestamp"]] for client in fast for message, received in client.received
+    )
+    print(
+        f"\n{CLIENTS} clients: sequential broadcast {sequential_seconds * 1000:.1f}ms, "
+        f"queued broadcast {max(broadcast_seconds) * 1000:.2f}ms, fast client lag {lag * 1000:.1f}ms",
+    )
+
+    # Fast clients get every tick, sharing one serialization of each message
+    assert all(len(client.received) == TICKS for client in fast)
+    assert len({id(client.received[0][0]) for client in fast}) == 1
+    assert lag < MAX_FAST_CLIENT_LAG_SECONDS
+    # Slow clients end on the latest tick, with missed ticks coalesced
+    assert all(client.received[-1][0] == fast[0].received[-1][0] for client in slow)
+    assert all(len(client.received) < TICKS for client in slow)
+    # Stalled clients are evicted
+    assert len(dashboard.connected_clients) == len(fast) + len(slow)
+    assert all(client.closed for client in clients if client.stalled)
+    assert max(broadcast_seconds) < MAX_BROADCAST_SECONDS < sequential_seconds
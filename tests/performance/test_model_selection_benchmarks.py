@@ -0,0 +1,201 @@
+"""Micro-benchmarks for precompiled model selection.
+
+``ModelRegistry`` compiles a (user tier, task type, context bucket) selection
+table when it loads. These benchmarks compare table lookups against ranking the
+fallback chains on every call, which is what selection did before compilation,
+under a request mix of thousands of selections.
+
+``reference_select_best_model`` and ``reference_select_best_model_for_tier`` are
+frozen copies of that uncompiled selection logic. They do not use the selection
+table, so they serve as an independent oracle for the compiled lookups.
+"""
+
+import itertools
+import random
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.mcp_integration.model_registry import ModelCapabilities, ModelRegistry, UserTierFilter
+
+
+SELECTION_COUNT = 20_000
+MIN_SELECTIONS_PER_SECOND = 10_000
+MIN_SPEEDUP = 3.0
+
+CATEGORIES = ["free_general", "free_reasoning", "premium_reasoning", "premium_analysis", "large_context"]
+CONTEXT_WINDOWS = [8192, 32768, 131072, 1000000]
+TASK_TYPES = ["general", "reasoning", "analysis", "planning", "vision", "complex", "summarization"]
+USER_TIERS = ["admin", "full", "limited"]
+
+
+def _build_registry(model_count: int = 40) -> ModelRegistry:
+    """Create a registry with a deterministic set of free and premium models."""
+    rng = random.Random(31)
+    with patch("src.mcp_integration.model_registry.get_settings", return_value=Mock()):
+        registry = ModelRegistry()
+
+    chains: dict[str, list[str]] = {category: [] for category in CATEGORIES}
+    for index in range(model_count):
+        free = index % 2 == 0
+        category = CATEGORIES[index % len(CATEGORIES)]
+        model_id = f"bench/model-{index}" + (":free" if free else "")
+        registry._models[model_id] = ModelCapabilities(
+            model_id=model_id,
+            display_name=f"Benchmark Model {index}",
+            provider="bench",
+            category=category,
+            context_window=rng.choice(CONTEXT_WINDOWS),
+            max_tokens_per_request=4096,
+            rate_limit_requests_per_minute=60,
+            cost_per_input_token=None if free else 0.000001,
+            cost_per_output_token=None if free else 0.000002,
+            supports_vision=rng.random() < 0.3,
+            supports_reasoning=rng.random() < 0.5,
+        )
+        for chain_category in rng.sample(CATEGORIES, 2):
+            chains[chain_category].append(model_id)
+
+    registry._fallback_chains = chains
+    registry._config.max_fallback_depth = 10
+    registry.rebuild_selection_table()
+    return registry
+
+
+def reference_select_best_model(
+    registry: ModelRegistry,
+    task_type: str,
+    allow_premium: bool = False,
+    max_tokens_needed: int | None = None,
+) -> str:
+    """Rank the fallback chain on every call, as selection did before compilation."""
+    task_to_category = {
+        "reasoning": "free_reasoning" if not allow_premium else "premium_reasoning",
+        "analysis": "free_general" if not allow_premium else "premium_analysis",
+        "planning": "large_context",
+        "general": "free_general",
+        "vision": "free_general",
+    }
+    candidates = registry.get_fallback_chain(task_to_category.get(task_type, registry._config.default_category))
+
+    for model_id in candidates:
+        capabilities = registry._models.get(model_id)
+        if not capabilities or not capabilities.enabled:
+            continue
+        if not allow_premium and not capabilities.is_free:
+            continue
+        if max_tokens_needed and capabilities.context_window < max_tokens_needed:
+            continue
+        if task_type == "vision" and not capabilities.supports_vision:
+            continue
+        if task_type == "reasoning" and not capabilities.supports_reasoning:
+            continue
+        return model_id
+
+    for model_id in candidates:
+        capabilities = registry._models.get(model_id)
+        if capabilities and capabilities.enabled:
+            return model_id
+
+    return registry.convert_model_name("deepseek")
+
+
+def reference_select_best_model_for_tier(
+    registry: ModelRegistry,
+    user_tier: str,
+    task_type: str,
+    max_tokens_needed: int | None = None,
+) -> str:
+    """Tier-aware selection as it was before compilation."""
+    allow_premium = user_tier in ["admin", "full"]
+    best_model = reference_select_best_model(registry, task_type, allow_premium, max_tokens_needed)
+    if UserTierFilter.can_access_model(best_model, user_tier, registry):
+        return best_model
+
+    for model_id in registry.get_fallback_chain_for_tier(user_tier, task_type):
+        if registry.is_model_available(model_id):
+            return model_id
+
+    ultimate_fallback = "deepseek/deepseek-chat-v3-0324:free"
+    if UserTierFilter.can_access_model(ultimate_fallback, user_tier, registry):
+        return ultimate_fallback
+
+    free_models = registry.list_models_for_tier(user_tier, category="free_general")
+    if free_models:
+        return free_models[0].model_id
+    return ultimate_fallback
+
+
+def _request_mix(count: int = SELECTION_COUNT) -> list[tuple[str, str, int | None]]:
+    """Deterministic (user tier, task type, tokens needed) requests."""
+    rng = random.Random(7)
+    token_choices = [None, 2000, 16000, 64000, 500000]
+    combinations = list(itertools.product(USER_TIERS, TASK_TYPES, token_choices))
+    return [rng.choice(combinations) for _ in range(count)]
+
+
+def _selections_per_second(select, requests: list[tuple[str, str, int | None]]) -> float:
+    start = time.perf_counter()
+    for user_tier, task_type, tokens in requests:
+        select(user_tier, task_type, tokens)
+    return len(requests) / (time.perf_counter() - start)
+
+
+@pytest.fixture(scope="module")
+def registry() -> ModelRegistry:
+    return _build_registry()
+
+
+class TestModelSelectionBenchmarks:
+    """Benchmarks for compiled model selection."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    def test_compiled_tier_selection_benchmark(self, benchmark, registry):
+        """Benchmark a batch of tier-aware selections."""
+        requests = _request_mix(1000)
+
+        def select_batch():
+            return [registry.select_best_model_for_tier(*request) for request in requests]
+
+        result = benchmark(select_batch)
+        assert len(result) == len(requests)
+
+    @pytest.mark.performance
+    def test_compiled_selection_matches_reference(self, registry):
+        """Compiled lookups return what the uncompiled selection logic returns."""
+        for user_tier, task_type, tokens in set(_request_mix(2000)):
+            expected = reference_select_best_model_for_tier(registry, user_tier, task_type, tokens)
+            assert registry.select_best_model_for_tier(user_tier, task_type, tokens) == expected
+        for allow_premium, task_type, tokens in itertools.product((False, True), TASK_TYPES, [None, 2000, 500000]):
+            expected = reference_select_best_model(registry, task_type, allow_premium, tokens)
+            assert registry.select_best_model(task_type, allow_premium, tokens) == expected
+
+    def test_compiled_selection_tracks_availability_changes(self):
+        """Compiled lookups still match the reference after models are disabled."""
+        registry = _build_registry()
+        for model_id in list(registry._models)[::3]:
+            registry.set_model_availability(model_id, False)
+
+        for user_tier, task_type, tokens in set(_request_mix(500)):
+            expected = reference_select_best_model_for_tier(registry, user_tier, task_type, tokens)
+            assert registry.select_best_model_for_tier(user_tier, task_type, tokens) == expected
+
+    @pytest.mark.performance
+    @pytest.mark.perf
+    @pytest.mark.slow
+    def test_compiled_selection_throughput(self, registry):
+        """Compiled selection sustains thousands of selections per second and beats re-ranking."""
+        requests = _request_mix()
+
+        def rank_on_demand(user_tier: str, task_type: str, tokens: int | None) -> str:
+            return reference_select_best_model_for_tier(registry, user_tier, task_type, tokens)
+
+        compiled_rate = _selections_per_second(registry.select_best_model_for_tier, requests)
+        on_demand_rate = _selections_per_second(rank_on_demand, requests[: SELECTION_COUNT // 10])
+
+        assert compiled_rate >= MIN_SELECTIONS_PER_SECOND, f"{compiled_rate:.0f} selections/s"
+        assert (
+            compiled_rate >= on_demand_rate * MIN_SPEEDUP
+        ), f"compiled {compiled_rate:.0f}/s vs on-demand {on_demand_rate:.0f}/s"
@@ -0,0 +1,371 @@
+"""End-to-end benchmarks for the query pipeline entry points.
+
+Unlike ``test_core_benchmarks.py``, these benchmarks drive the real project code
+(``HydeProcessor.process_query``, ``QueryCounselor.process_query_with_hyde``,
+``TaskDetectionSystem.detect_categories``, ``DynamicFunctionLoader.load_functions_for_query``
+and the vector store search path). Only the network edges are replaced: OpenRouter/Zen MCP
+by an in-process model client and Qdrant by an ``EnhancedMockVectorStore`` without simulated
+latency, seeded with a deterministic corpus.
+
+Each case is parametrized over corpus size, concurrency and cache state, records the latency
+distribution in a ``QuantileSketch`` and the peak allocation with ``tracemalloc``, and is compared
+against ``pipeline_benchmark_baseline.json``. A case fails when its p95 latency or peak allocation
+exceeds the baseline by more than the configured factor. Every case collects at least
+``MIN_LATENCY_SAMPLES`` latencies so the p95 is not simply the slowest call.
+
+The baseline holds absolute timings from the machine that recorded it, so these cases are marked
+``perf`` and ``slow`` and only run when selected explicitly (``pytest -m perf``). Refresh the
+baseline on the machine that runs them.
+
+Environment variables:
+    PROMPTCRAFT_BENCHMARK_THRESHOLD: Allowed regression factor (default from the baseline file).
+    PROMPTCRAFT_UPDATE_BENCHMARK_BASELINE: Set to ``1`` to rewrite the baseline from this run.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+import math
+import os
+from pathlib import Path
+import random
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from src.core.dynamic_function_loader import DynamicFunctionLoader
+from src.core.hyde_processor import DEFAULT_EMBEDDING_DIMENSIONS, HydeProcessor, HydeProcessorConfig
+from src.core.performance_optimizer import clear_all_caches
+from src.core.query_counselor import QueryCounselor
+from src.core.task_detection import TaskDetectionSystem
+from src.core.vector_store import EnhancedMockVectorStore, SearchParameters, SearchStrategy, VectorDocument
+from src.mcp_integration.hybrid_router import HybridRouter, RoutingStrategy
+from src.mcp_integration.mcp_client import Response, WorkflowStep
+from src.utils.quantile_sketch import QuantileSketch
+
+
+BASELINE_PATH = Path(__file__).parent / "pipeline_benchmark_baseline.json"
+DEFAULT_THRESHOLD = 2.0
+# Absolute slack so sub-millisecond cases do not fail on scheduler noise
+LATENCY_SLACK_MS = 5.0
+ALLOCATION_SLACK_KIB = 256.0
+MIN_LATENCY_SAMPLES = 200
+
+CORPUS_SIZES = [100, 1000]
+CONCURRENCY_LEVELS = [1, 8]
+CACHE_STATES = ["cold", "warm"]
+
+BENCHMARK_QUERIES = [
+    "How do I implement JWT authentication in a FastAPI service with refresh tokens?",
+    "Explain the trade-offs between vector databases for semantic search",
+    "Write a Python function that retries HTTP requests with exponential backoff",
+    "What are the best practices for structuring a CI pipeline with caching?",
+    "Debug a memory leak in an asyncio application that uses connection pools",
+    "Review this SQL query for performance problems and missing indexes",
+    "Generate unit tests for a rate limiter using a sliding window",
+    "Compare Docker multi-stage builds with single-stage images for Python apps",
+]
+
+DETECTION_CONTEXT = {
+    "project_type": "python",
+    "file_extensions": [".py", ".toml"],
+    "has_git_repo": True,
+    "recent_commands": ["git status", "pytest"],
+}
+
+
+class StubModelClient:
+    """In-process stand-in for the OpenRouter and Zen MCP clients."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def validate_query(self, query: str) -> dict[str, Any]:
+        """Accept every query unchanged."""
+        return {"is_valid": True, "sanitized_query": query, "potential_issues": []}
+
+    async def orchestrate_agents(self, workflow_steps: list[WorkflowStep]) -> list[Response]:
+        """Return one deterministic response per workflow step."""
+        self.requests += 1
+        await asyncio.sleep(0)
+        return [
+            Response(
+                agent_id=step.agent_id,
+                content=f"Stub response for {step.input_data.get('query', '')} ({step.step_id})",
+                confidence=0.85,
+                processing_time=0.0,
+            )
+            for step in workflow_steps
+        ]
+
+
+class PipelineBenchmark:
+    """Runs an async operation under load and records latency and allocations."""
+
+    def __init__(self, name: str, concurrency: int, samples: int = MIN_LATENCY_SAMPLES) -> None:
+        self.name = name
+        self.concurrency = concurrency
+        self.rounds = math.ceil(samples / concurrency)
+        self.latencies_ms = QuantileSketch()
+        self.peak_alloc_kib = 0.0
+
+    async def run(
+        self,
+        operation: Callable[[str], Awaitable[Any]],
+        before_round: Callable[[], None] | None = None,
+    ) -> dict[str, float]:
+        """Measure ``operation`` over ``rounds`` rounds of ``concurrency`` concurrent calls.
+
+        Latency is measured without tracing; allocations are measured in a separate traced
+        round so ``tracemalloc`` overhead does not inflate the latency distribution.
+        """
+
+        async def timed(query: str) -> None:
+            start = time.perf_counter()
+            await operation(query)
+            self.latencies_ms.add((time.perf_counter() - start) * 1000)
+
+        # One unmeasured round absorbs lazy imports and other first-call costs
+        if before_round is not None:
+            before_round()
+        await asyncio.gather(*(operation(query) for query in BENCHMARK_QUERIES[: self.concurrency]))
+
+        for round_index in range(self.rounds):
+            if before_round is not None:
+                before_round()
+            queries = [
+                BENCHMARK_QUERIES[(round_index * self.concurrency + i) % len(BENCHMARK_QUERIES)]
+                for i in range(self.concurrency)
+            ]
+            await asyncio.gather(*(timed(query) for query in queries))
+
+        if before_round is not None:
+            before_round()
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            baseline_size, _ = tracemalloc.get_traced_memory()
+            await asyncio.gather(
+                *(operation(BENCHMARK_QUERIES[i % len(BENCHMARK_QUERIES)]) for i in range(self.concurrency)),
+            )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.peak_alloc_kib = max(0, peak - baseline_size) / 1024
+
+        return self.results()
+
+    def results(self) -> dict[str, float]:
+        """Return the recorded metrics in baseline format."""
+        return {
+            "samples": self.latencies_ms.count,
+            "p50_ms": round(self.latencies_ms.quantile(0.5), 3),
+            "p95_ms": round(self.latencies_ms.quantile(0.95), 3),
+            "p99_ms": round(self.latencies_ms.quantile(0.99), 3),
+            "mean_ms": round(self.latencies_ms.mean, 3),
+            "peak_alloc_kib": round(self.peak_alloc_kib, 1),
+        }
+
+
+def _load_baseline() -> dict[str, Any]:
+    if BASELINE_PATH.exists():
+        return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    return {"threshold": DEFAULT_THRESHOLD, "cases": {}}
+
+
+def _update_baseline_requested() -> bool:
+    return os.getenv("PROMPTCRAFT_UPDATE_BENCHMARK_BASELINE", "").lower() in ("1", "true", "yes")
+
+
+def assert_within_baseline(case_id: str, results: dict[str, float]) -> None:
+    """Compare ``results`` with the stored baseline, or record them when updating."""
+    baseline = _load_baseline()
+
+    if _update_baseline_requested():
+        baseline.setdefault("threshold", DEFAULT_THRESHOLD)
+        baseline.setdefault("cases", {})[case_id] = results
+        baseline["cases"] = dict(sorted(baseline["cases"].items()))
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        return
+
+    expected = baseline["cases"].get(case_id)
+    if expected is None:
+        pytest.skip(f"No baseline recorded for {case_id}; run with PROMPTCRAFT_UPDATE_BENCHMARK_BASELINE=1")
+
+    threshold = float(os.getenv("PROMPTCRAFT_BENCHMARK_THRESHOLD", baseline.get("threshold", DEFAULT_THRESHOLD)))
+    latency_limit = expected["p95_ms"] * threshold + LATENCY_SLACK_MS
+    allocation_limit = expected["peak_alloc_kib"] * threshold + ALLOCATION_SLACK_KIB
+
+    assert results["p95_ms"] <= latency_limit, (
+        f"{case_id}: p95 latency {results['p95_ms']:.2f}ms regressed past {latency_limit:.2f}ms "
+        f"(baseline {expected['p95_ms']:.2f}ms x{threshold})"
+    )
+    assert results["peak_alloc_kib"] <= allocation_limit, (
+        f"{case_id}: peak allocation {results['peak_alloc_kib']:.1f}KiB regressed past {allocation_limit:.1f}KiB "
+        f"(baseline {expected['peak_alloc_kib']:.1f}KiB x{threshold})"
+    )
+
+
+async def _build_vector_store(corpus_size: int) -> EnhancedMockVectorStore:
+    """Create a latency-free mock Qdrant seeded with a deterministic corpus."""
+    store = EnhancedMockVectorStore({"simulate_latency": False, "error_rate": 0.0, "initialize_sample_data": False})
+    await store.connect()
+
+    rng = random.Random(corpus_size)
+    documents = [
+        VectorDocument(
+            id=f"doc_{index}",
+            content=f"Benchmark document {index} about {BENCHMARK_QUERIES[index % len(BENCHMARK_QUERIES)]}",
+            embedding=[rng.uniform(0.0, 0.004) for _ in range(DEFAULT_EMBEDDING_DIMENSIONS)],
+            metadata={"category": f"category_{index % 5}"},
+        )
+        for index in range(corpus_size)
+    ]
+    await store.insert_documents(documents)
+    return store
+
+
+def _build_hybrid_router() -> HybridRouter:
+    stub = StubModelClient()
+    return HybridRouter(
+        openrouter_client=stub,
+        mcp_client=stub,
+        strategy=RoutingStrategy.OPENROUTER_PRIMARY,
+        enable_gradual_rollout=False,
+    )
+
+
+def _cache_hook(cache_state: str, clear: Callable[[], None]) -> Callable[[], None] | None:
+    return clear if cache_state == "cold" else None
+
+
+async def _prime(operation: Callable[[str], Awaitable[Any]]) -> None:
+    for query in BENCHMARK_QUERIES:
+        await operation(query)
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+@pytest.mark.perf
+@pytest.mark.slow
+@pytest.mark.parametrize("cache_state", CACHE_STATES)
+@pytest.mark.parametrize("concurrency", CONCURRENCY_LEVELS)
+@pytest.mark.parametrize("corpus_size", CORPUS_SIZES)
+class TestRetrievalPipelineBenchmarks:
+    """Benchmarks for entry points that search the vector store."""
+
+    async def test_hyde_process_query(self, corpus_size, concurrency, cache_state):
+        """Benchmark HydeProcessor.process_query end to end."""
+        store = await _build_vector_store(corpus_size)
+        processor = HydeProcessor(HydeProcessorConfig(vector_store=store, hybrid_router=_build_hybrid_router()))
+        clear_all_caches()
+        if cache_state == "warm":
+            await _prime(processor.process_query)
+
+        benchmark = PipelineBenchmark("hyde_process_query", concurrency)
+        results = await benchmark.run(processor.process_query, _cache_hook(cache_state, clear_all_caches))
+
+        ranked = await processor.process_query(BENCHMARK_QUERIES[0])
+        assert ranked.ranking_method != "error"
+        assert_within_baseline(
+            f"hyde_process_query[corpus={corpus_size},concurrency={concurrency},cache={cache_state}]",
+            results,
+        )
+
+    async def test_query_counselor_process_query_with_hyde(self, corpus_size, concurrency, cache_state):
+        """Benchmark QueryCounselor.process_query_with_hyde end to end."""
+        store = await _build_vector_store(corpus_size)
+        router = _build_hybrid_router()
+        processor = HydeProcessor(HydeProcessorConfig(vector_store=store, hybrid_router=router))
+        counselor = QueryCounselor(mcp_client=router, hyde_processor=processor)
+        clear_all_caches()
+        if cache_state == "warm":
+            await _prime(counselor.process_query_with_hyde)
+
+        benchmark = PipelineBenchmark("query_counselor_process_query_with_hyde", concurrency)
+        results = await benchmark.run(counselor.process_query_with_hyde, _cache_hook(cache_state, clear_all_caches))
+
+        response = await counselor.process_query_with_hyde(BENCHMARK_QUERIES[0])
+        assert response.agents_used
+        assert_within_baseline(
+            f"query_counselor_process_query_with_hyde"
+            f"[corpus={corpus_size},concurrency={concurrency},cache={cache_state}]",
+            results,
+        )
+
+    async def test_vector_store_search(self, corpus_size, concurrency, cache_state):
+        """Benchmark a raw vector store search over the seeded corpus."""
+        store = await _build_vector_store(corpus_size)
+        rng = random.Random(0)
+        embedding = [rng.uniform(0.0, 0.004) for _ in range(DEFAULT_EMBEDDING_DIMENSIONS)]
+
+        async def search(_query: str) -> None:
+            await store.search(
+                SearchParameters(embeddings=[embedding], limit=10, strategy=SearchStrategy.SEMANTIC),
+            )
+
+        clear_all_caches()
+        if cache_state == "warm":
+            await _prime(search)
+
+        benchmark = PipelineBenchmark("vector_store_search", concurrency)
+        results = await benchmark.run(search, _cache_hook(cache_state, clear_all_caches))
+
+        assert store.metrics.search_count > 0
+        assert_within_baseline(
+            f"vector_store_search[corpus={corpus_size},concurrency={concurrency},cache={cache_state}]",
+            results,
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+@pytest.mark.perf
+@pytest.mark.slow
+@pytest.mark.parametrize("cache_state", CACHE_STATES)
+@pytest.mark.parametrize("concurrency", CONCURRENCY_LEVELS)
+class TestDetectionPipelineBenchmarks:
+    """Benchmarks for task detection and dynamic function loading."""
+
+    async def test_task_detection_detect_categories(self, concurrency, cache_state):
+        """Benchmark TaskDetectionSystem.detect_categories."""
+        detection = TaskDetectionSystem()
+
+        async def detect(query: str) -> None:
+            await detection.detect_categories(query, DETECTION_CONTEXT)
+
+        if cache_state == "warm":
+            await _prime(detect)
+
+        benchmark = PipelineBenchmark("task_detection_detect_categories", concurrency)
+        results = await benchmark.run(detect, _cache_hook(cache_state, detection.cache.clear))
+
+        result = await detection.detect_categories(BENCHMARK_QUERIES[0], DETECTION_CONTEXT)
+        assert result.categories
+        assert_within_baseline(
+            f"task_detection_detect_categories[concurrency={concurrency},cache={cache_state}]",
+            results,
+        )
+
+    async def test_dynamic_function_loader_load_functions_for_query(self, concurrency, cache_state):
+        """Benchmark a full DynamicFunctionLoader session per query."""
+        loader = DynamicFunctionLoader()
+
+        async def load(query: str) -> None:
+            session_id = await loader.create_loading_session("benchmark_user", query)
+            await loader.load_functions_for_query(session_id)
+            await loader.end_loading_session(session_id)
+
+        if cache_state == "warm":
+            await _prime(load)
+
+        benchmark = PipelineBenchmark("dynamic_function_loader_load_functions_for_query", concurrency)
+        results = await benchmark.run(load, _cache_hook(cache_state, loader.task_detection.cache.clear))
+
+        assert not loader.active_sessions
+        assert_within_baseline(
+            f"dynamic_function_loader_load_functions_for_query[concurrency={concurrency},cache={cache_state}]",
+            results,
+        )
@@ -0,0 +1,76 @@
+"""Benchmarks for the persistent full-text search index.
+
+A synthetic knowledge base of tens of thousands of Markdown documents is
+indexed once per module; queries then hit only the index, so their latency
+should stay in the low milliseconds regardless of corpus size.
+"""
+
+import random
+import statistics
+import time
+
+import pytest
+
+from src.utils.full_text_index import FullTextIndex
+
+
+DOCUMENT_COUNT = 20_000
+WORDS_PER_DOCUMENT = 60
+MAX_MEDIAN_QUERY_MS = 5.0
+MAX_P95_QUERY_MS = 20.0
+
+VOCABULARY = [f"term{index}" for index in range(5000)]
+# Like stop words, a term in nearly every document makes BM25 score every match, so
+# the mix uses the selective terms real queries are made of
+QUERIES = ["term25", "term42 term4242", '"term7 term8"', "term12*", "term4999", "term3 term30 term300"]
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    rng = random.Random(34)
+    root = tmp_path_factory.mktemp("knowledge")
+    for directory in range(20):
+        (root / f"section{directory}").mkdir()
+    for document in range(DOCUMENT_COUNT):
+        # Zipf-like term frequencies, as in natural text
+        words = [
+            VOCABULARY[min(int(rng.paretovariate(1.0)) - 1, len(VOCABULARY) - 1)] for _ in range(WORDS_PER_DOCUMENT)
+        ]
+        (root / f"section{document % 20}" / f"doc{document}.md").write_text(" ".join(words))
+
+    full_text_index = FullTextIndex(root, tmp_path_factory.mktemp("index") / "search.db", refresh_interval=3600)
+    full_text_index.refresh()
+    yield full_text_index
+    full_text_index.close()
+
+
+class TestSearchIndexBenchmarks:
+    """Benchmarks for indexed document search."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    def test_search_benchmark(self, benchmark, index):
+        """Benchmark a mix of term, phrase and prefix queries."""
+        results = benchmark(lambda: [index.search(query) for query in QUERIES])
+        assert len(results) == len(QUERIES)
+
+    @pytest.mark.performance
+    def test_search_latency(self, index):
+        """Queries over tens of thousands of documents answer in milliseconds."""
+        latencies = []
+        for _ in range(20):
+            for query in QUERIES:
+                start = time.perf_counter()
+                index.search(query)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        latencies.sort()
+        median = statistics.median(latencies)
+        p95 = latencies[int(len(latencies) * 0.95)]
+        assert median <= MAX_MEDIAN_QUERY_MS, f"median {median:.2f} ms"
+        assert p95 <= MAX_P95_QUERY_MS, f"p95 {p95:.2f} ms"
+
+    @pytest.mark.performance
+    def test_unchanged_refresh_reads_no_files(self, index):
+        """A refresh over an unchanged tree only stats files."""
+        assert index.refresh() == {"indexed": 0, "unchanged": DOCUMENT_COUNT, "removed": 0}
@@ -0,0 +1,177 @@
+"""Benchmarks for SmartMCPDiscovery against local fake servers and processes.
+
+A cold discovery races every detection strategy. Here a known port accepts
+connections but never answers and another answers its health check slowly,
+while the environment variable strategy points at a healthy server. A fake
+``zen-mcp-server`` process is also running, whose default URL is not
+serving. Sequential probing would wait on each of these in turn; concurrent
+probing returns as soon as the healthy server answers.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.mcp_integration.smart_discovery import SmartMCPDiscovery
+
+
+PROBE_TIMEOUT = 1.0
+SLOW_HEALTH_SECONDS = 0.3
+MAX_COLD_DISCOVERY_SECONDS = 0.5
+MAX_CACHE_HIT_MS = 0.5
+CACHE_HITS = 1000
+MAX_REPEAT_MISS_MS = 0.5
+
+
+@contextmanager
+def health_server(delay: float = 0.0) -> Iterator[int]:
+    """Serve ``/health`` on a free local port, answering after ``delay`` seconds."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            time.sleep(delay)
+            self.send_response(200 if self.path == "/health" else 404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def hanging_server() -> Iterator[int]:
+    """Listen on a free local port without ever answering."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("localhost", 0))
+    sock.listen(16)
+    try:
+        yield sock.getsockname()[1]
+    finally:
+        # Resets queued connections so abandoned probe threads finish promptly
+        sock.close()
+
+
+@contextmanager
+def fake_process(name: str) -> Iterator[subprocess.Popen]:
+    """Run a sleeping process with ``name`` on its command line."""
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)", name])  # noqa: S603
+    try:
+        yield process
+    finally:
+        process.kill()
+        process.wait()
+
+
+@pytest.fixture
+def discovery():
+    with patch("docker.from_env", side_effect=Exception("Docker not available")):
+        return SmartMCPDiscovery(probe_timeout=PROBE_TIMEOUT, health_revalidate_interval=0.0)
+
+
+class TestSmartDiscoveryBenchmarks:
+    """Latency benchmarks for concurrent discovery."""
+
+    @pytest.mark.benchmark
+    async def test_cold_discovery_returns_with_first_healthy_server(self, discovery):
+        """Hung and slow probes do not delay discovery of a healthy server."""
+        with (
+            hanging_server() as hung_port,
+            health_server(delay=SLOW_HEALTH_SECONDS) as slow_port,
+            health_server() as healthy_port,
+            fake_process("zen-mcp-server"),
+            patch.dict(os.environ, {"ZEN_MCP_URL": f"http://localhost:{healthy_port}"}),
+        ):
+            discovery.known_ports["zen-mcp"] = [hung_port, slow_port]
+
+            start = time.perf_counter()
+            connection = await discovery.find_existing_deployment("zen-mcp")
+            elapsed = time.perf_counter() - start
+
+        print(f"\nCold discovery: {elapsed * 1000:.1f}ms")
+        assert connection is not None
+        assert connection.url == f"http://localhost:{healthy_port}"
+        assert elapsed < MAX_COLD_DISCOVERY_SECONDS
+
+    @pytest.mark.benchmark
+    async def test_cache_hits_do_not_wait_for_health_checks(self, discovery):
+        """Cache hits return immediately while a slow health check runs in the background."""
+        with (
+            health_server(delay=SLOW_HEALTH_SECONDS) as slow_port,
+            patch.dict(os.environ, {"ZEN_MCP_URL": f"http://localhost:{slow_port}"}),
+        ):
+            for name in ("check_known_ports", "check_process_list"):
+                setattr(discovery, name, _nothing)
+            with patch.object(discovery.resource_monitor, "get_available_memory", return_value=4096):
+                connection = await discovery.discover_server("zen-mcp")
+
+            start = time.perf_counter()
+            for _ in range(CACHE_HITS):
+                assert discovery.get_cached_connection("zen-mcp") is connection
+            per_hit_ms = (time.perf_counter() - start) * 1000 / CACHE_HITS
+            revalidations = list(discovery._revalidations.values())
+            for revalidation in revalidations:
+                await revalidation
+
+        print(f"\nCache hit: {per_hit_ms:.4f}ms")
+        assert per_hit_ms < MAX_CACHE_HIT_MS
+        assert len(revalidations) == 1
+        assert discovery.deployment_cache["zen-mcp"] is connection
+
+    @pytest.mark.benchmark
+    async def test_negative_cache_makes_repeat_misses_free(self, discovery):
+        """A server that cannot be found is not probed again within the negative cache TTL."""
+        with (
+            fake_process("zen-mcp-server"),
+            patch.dict(os.environ, {"ZEN_MCP_URL": "", "PROMPTCRAFT_ZEN_MCP_SERVER_URL": ""}),
+        ):
+            # The fake process is found, but nothing is serving at its URL
+            discovery.known_ports["zen-mcp"] = []
+            discovery.extract_url_from_process = _url_for_port(_closed_port())
+
+            start = time.perf_counter()
+            assert await discovery.find_existing_deployment("zen-mcp") is None
+            cold = time.perf_counter() - start
+
+            start = time.perf_counter()
+            assert await discovery.find_existing_deployment("zen-mcp") is None
+            warm = time.perf_counter() - start
+
+        print(f"\nMiss: cold {cold * 1000:.1f}ms, repeat {warm * 1000:.3f}ms")
+        assert len(discovery._negative_cache) == len(SmartMCPDiscovery.discovery_strategies)
+        assert warm * 1000 < MAX_REPEAT_MISS_MS < cold * 1000
+
+
+async def _nothing(server_name):
+    return None
+
+
+def _closed_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def _url_for_port(port):
+    async def extract_url_from_process(pattern):
+        return f"http://localhost:{port}"
+
+    return extract_url_from_process
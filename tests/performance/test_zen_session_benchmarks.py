@@ -0,0 +1,155 @@
+"""Benchmarks for Journey 2 zen routing against a local stub Zen server.
+
+The stub stands in for the zen MCP stdio client returned by ``create_client``
+and answers each call after a fixed latency: starting the server process and
+completing the handshake dominates, followed by execution and route
+analysis. The real ``ZenStdioMCPClient`` and ``Journey2IntelligentSearch``
+code run on top of it.
+
+The baseline repeats what every request used to do: connect, analyze,
+execute and disconnect in sequence. With a shared session a request only
+executes, with the recommendation served from cache or analyzed alongside.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.mcp_integration.zen_client import AnalysisResult, ExecutionResult, MCPHealthCheck
+from src.mcp_integration.zen_stdio_client import ZenStdioMCPClient
+from src.ui.journeys.journey2_intelligent_search import Journey2IntelligentSearch
+
+
+CONNECT_SECONDS = 0.04
+HEALTH_SECONDS = 0.005
+ANALYZE_SECONDS = 0.015
+EXECUTE_SECONDS = 0.025
+REQUESTS = 20
+PROMPTS = ("Explain binary search", "Summarize the release notes")
+MIN_SPEEDUP = 2.0
+
+WORKFLOW_STEP = {
+    "step_id": "journey2_execute",
+    "agent_id": "journey2_search",
+    "input_data": {"query": ""},
+    "timeout_seconds": 30.0,
+}
+
+
+class StubZenServer:
+    """Zen stdio client stand-in with fixed per-call latency."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    async def health_check(self) -> MCPHealthCheck:
+        self._count("health_check")
+        await asyncio.sleep(HEALTH_SECONDS)
+        return MCPHealthCheck(healthy=True, latency_ms=HEALTH_SECONDS * 1000, server_version="stub")
+
+    async def analyze_route(self, request) -> AnalysisResult:
+        self._count("analyze_route")
+        await asyncio.sleep(ANALYZE_SECONDS)
+        return AnalysisResult(
+            success=True,
+            analysis={"task_type": "analysis", "complexity_level": "medium"},
+            recommendations={"primary": {"model_id": "stub/model", "model_name": "Stub Model", "tier": "free"}},
+            processing_time=ANALYZE_SECONDS,
+        )
+
+    async def smart_execute(self, request) -> ExecutionResult:
+        self._count("smart_execute")
+        await asyncio.sleep(EXECUTE_SECONDS)
+        return ExecutionResult(
+            success=True,
+            response={"content": f"answer to {request.prompt}", "model_used": "stub/model"},
+            execution_metadata={"task_type": "analysis", "cost_optimized": True},
+            processing_time=EXECUTE_SECONDS,
+        )
+
+    async def disconnect(self) -> None:
+        self._count("disconnect")
+
+
+@pytest.fixture
+def stub_server():
+    """Serve zen connections from a stub server with simulated latency."""
+    server = StubZenServer()
+
+    async def create_client(**_):
+        server._count("connect")
+        await asyncio.sleep(CONNECT_SECONDS)
+        return server
+
+    with patch("src.mcp_integration.zen_stdio_client.create_client", create_client):
+        yield server
+
+
+async def per_request_connection(client: ZenStdioMCPClient, prompt: str) -> dict:
+    """Route one prompt the way every request used to."""
+    assert await client.connect()
+    await client.get_model_recommendations(prompt)
+    result = await client.execute_with_routing(prompt)
+    await client.disconnect()
+    return result
+
+
+async def timed(requests) -> list[float]:
+    """Run request coroutine factories in sequence, returning each latency in seconds."""
+    latencies = []
+    for request in requests:
+        start = time.perf_counter()
+        await request()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+async def test_shared_session_reduces_per_request_latency(stub_server):
+    """A shared session with cached recommendations is much faster per request."""
+    prompts = [PROMPTS[i % len(PROMPTS)] for i in range(REQUESTS)]
+
+    client = ZenStdioMCPClient()
+    baseline = await timed([lambda prompt=prompt: per_request_connection(client, prompt) for prompt in prompts])
+
+    stub_server.calls.clear()
+    journey = Journey2IntelligentSearch()
+
+    async def routed(prompt: str) -> None:
+        _, metadata = await journey._execute_with_intelligent_routing(prompt, "full", WORKFLOW_STEP)
+        assert metadata["routing_method"] == "zen_mcp"
+        assert metadata["recommended_model"] == "Stub Model"
+
+    shared = await timed([lambda prompt=prompt: routed(prompt) for prompt in prompts])
+    await journey.zen_session.close()
+
+    baseline_ms = sum(baseline) / len(baseline) * 1000
+    shared_ms = sum(shared) / len(shared) * 1000
+    warm_ms = sum(shared[len(PROMPTS) :]) / (REQUESTS - len(PROMPTS)) * 1000
+    print(f"\nper-request connection: {baseline_ms:.1f}ms, shared session: {shared_ms:.1f}ms (warm {warm_ms:.1f}ms)")
+
+    assert stub_server.calls["connect"] == 1
+    assert stub_server.calls["analyze_route"] == len(PROMPTS)
+    assert stub_server.calls["smart_execute"] == REQUESTS
+    assert baseline_ms / shared_ms >= MIN_SPEEDUP
+    # Warm requests cost one execution, not connect + analyze + execute
+    assert warm_ms < (EXECUTE_SECONDS + ANALYZE_SECONDS) * 1000
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+async def test_cold_request_overlaps_recommendation(stub_server):
+    """A cache miss costs the slower of analysis and execution, not their sum."""
+    journey = Journey2IntelligentSearch()
+    assert await journey.zen_session.ensure_connected()
+
+    (latency,) = await timed([lambda: journey._execute_with_intelligent_routing("New prompt", "full", WORKFLOW_STEP)])
+    await journey.zen_session.close()
+
+    assert latency < EXECUTE_SECONDS + ANALYZE_SECONDS
@@ -0,0 +1,159 @@
+"""Tests for the parsed agent definition index."""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from src.agents.definition_index import AgentDefinitionIndex
+from src.agents.discovery import AgentDefinition, AgentDiscoverySystem
+
+
+AGENT_YAML = """
+metadata:
+  id: {agent_id}
+  version: "1.0.0"
+  description: {description}
+  category: testing
+runtime:
+  model: haiku
+tools:
+  required: [read]
+implementation:
+  type: markdown
+  source: "You are a test agent."
+"""
+
+
+def _write_agent(path, agent_id="test_agent", description="First version"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(AGENT_YAML.format(agent_id=agent_id, description=description))
+    return path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def parser():
+    return Mock(side_effect=AgentDefinition.from_yaml)
+
+
+class TestAgentDefinitionIndex:
+    """Test AgentDefinitionIndex caching and invalidation."""
+
+    def test_watched_definitions_are_parsed_once(self, tmp_path, parser):
+        """A watched definition is served from memory until a change is reported."""
+        agent_file = _write_agent(tmp_path / "agents" / "test_agent.yaml")
+        index = AgentDefinitionIndex(AgentDefinition.from_dict, use_watcher=False, poll_interval=3600)
+        index.watch([tmp_path / "agents"])
+
+        first = index.load(agent_file, parser)
+        assert index.load(agent_file, parser) is first
+        assert parser.call_count == 1
+
+        # A touch without content change is not reparsed
+        _bump_mtime(agent_file)
+        index.invalidate(agent_file)
+        assert index.load(agent_file, parser) is first
+        assert parser.call_count == 1
+
+        _write_agent(agent_file, description="Second version")
+        index.invalidate(agent_file)
+        assert index.load(agent_file, parser).description == "Second version"
+        assert index.get_stats()["parses"] == 2
+
+    def test_polling_detects_changes(self, tmp_path, parser):
+        """Without a watcher, mtime polling invalidates changed definitions."""
+        agent_file = _write_agent(tmp_path / "agents" / "test_agent.yaml")
+        index = AgentDefinitionIndex(AgentDefinition.from_dict, use_watcher=False, poll_interval=0.0)
+        changes = []
+        index.add_listener(changes.append)
+        index.watch([tmp_path / "agents"])
+        index.load(agent_file, parser)
+
+        _write_agent(agent_file, description="A much longer second version")
+
+        assert index.load(agent_file, parser).description == "A much longer second version"
+        assert changes == [str(agent_file)]
+        assert index.get_stats()["mode"] == "polling"
+
+    def test_unwatched_definitions_are_revalidated(self, tmp_path, parser):
+        """Definitions outside watched directories are checked with stat on each load."""
+        agent_file = _write_agent(tmp_path / "test_agent.yaml")
+        index = AgentDefinitionIndex(AgentDefinition.from_dict, use_watcher=False)
+
+        index.load(agent_file, parser)
+        _write_agent(agent_file, description="Changed without notification")
+
+        assert index.load(agent_file, parser).description == "Changed without notification"
+
+    def test_snapshot_cold_start_skips_parsing(self, tmp_path, parser):
+        """A new index loaded from a snapshot reuses definitions of unchanged files."""
+        snapshot_path = tmp_path / "cache" / "agents.json"
+        agent_file = _write_agent(tmp_path / "agents" / "test_agent.yaml")
+        warm = AgentDefinitionIndex(AgentDefinition.from_dict, snapshot_path=snapshot_path, use_watcher=False)
+        definition = warm.load(agent_file, parser)
+        assert warm.save_snapshot() is True
+        assert warm.save_snapshot() is False
+
+        cold = AgentDefinitionIndex(AgentDefinition.from_dict, snapshot_path=snapshot_path, use_watcher=False)
+
+        assert len(cold) == 1
+        assert cold.load(agent_file, parser) == definition
+        assert parser.call_count == 1
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path):
+        """An unreadable snapshot starts an empty index."""
+        snapshot_path = tmp_path / "agents.json"
+        snapshot_path.write_text("{not json")
+
+        assert len(AgentDefinitionIndex(AgentDefinition.from_dict, snapshot_path=snapshot_path)) == 0
+
+
+class TestDiscoveryWithIndex:
+    """Test AgentDiscoverySystem using the definition index."""
+
+    def test_changed_definition_invalidates_discovered_agent(self, tmp_path, monkeypatch):
+        """Rediscovery after a file change returns the new definition."""
+        monkeypatch.chdir(tmp_path)
+        agent_file = _write_agent(tmp_path / ".agents" / "core" / "test_agent.yaml")
+        discovery = AgentDiscoverySystem(snapshot_path=tmp_path / "agents.json")
+        discovery.definition_index.use_watcher = False
+        discovery.definition_index.poll_interval = 0.0
+        discovery.definition_index.watch([tmp_path / ".agents"])
+
+        assert discovery.discover_agent("test_agent").description == "First version"
+        assert (tmp_path / "agents.json").exists()
+
+        _write_agent(agent_file, description="Edited on disk")
+
+        assert discovery.discover_agent("test_agent").description == "Edited on disk"
+
+    def test_snapshot_and_watcher_are_opt_in(self, tmp_path, monkeypatch):
+        """A default discovery system neither persists snapshots nor starts a watcher."""
+        monkeypatch.chdir(tmp_path)
+        _write_agent(tmp_path / ".agents" / "core" / "test_agent.yaml")
+        discovery = AgentDiscoverySystem()
+
+        discovery.discover_agent("test_agent")
+
+        assert discovery.definition_index.snapshot_path is None
+        assert discovery.definition_index.get_stats()["watched_directories"] == []
+
+    def test_close_stops_watcher_and_saves_snapshot(self, tmp_path, monkeypatch):
+        """close() stops the watcher started by start_watching() and writes the snapshot."""
+        monkeypatch.chdir(tmp_path)
+        _write_agent(tmp_path / ".agents" / "core" / "test_agent.yaml")
+        discovery = AgentDiscoverySystem(snapshot_path=tmp_path / "agents.json")
+        discovery.start_watching()
+        observer = discovery.definition_index._observer
+        discovery.definition_index.load(tmp_path / ".agents" / "core" / "test_agent.yaml", AgentDefinition.from_yaml)
+
+        discovery.close()
+
+        assert discovery.definition_index._observer is None
+        assert observer is None or not observer.is_alive()
+        assert (tmp_path / "agents.json").exists()
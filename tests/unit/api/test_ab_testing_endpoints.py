@@ -12,7 +12,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 import pytest
-from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+)
 
 from src.api.ab_testing_endpoints import (
     CreateExperimentRequest,
@@ -20,6 +26,7 @@ from src.api.ab_testing_endpoints import (
     UserAssignmentRequest,
     router,
 )
+from src.monitoring.ab_testing_dashboard import RenderedDashboard
 
 
 class TestCreateExperimentRequest:
@@ -176,6 +183,7 @@ class TestABTestingEndpoints:
 
         # Mock the database session context manager
         mock_db_session = MagicMock()
+        mock_db_session.get.return_value = None  # No existing metric rollups
 
         # Set up query chain for experiments
         if mock_experiments:
@@ -429,6 +437,24 @@ class TestABTestingEndpoints:
         data = response.json()
         assert data["total_users"] == 1000
 
+    @patch("src.api.ab_testing_endpoints.get_dashboard_instance")
+    def test_get_experiment_dashboard_etag(self, mock_get_dashboard):
+        """Dashboard pages carry an ETag and revalidate to 304 while data is unchanged."""
+        mock_dashboard = AsyncMock()
+        mock_dashboard.render_dashboard.return_value = RenderedDashboard("<html>dashboard</html>", '"v1"')
+        mock_get_dashboard.return_value = mock_dashboard
+
+        response = self.client.get("/api/v1/ab-testing/dashboard/exp123")
+        revalidated = self.client.get("/api/v1/ab-testing/dashboard/exp123", headers={"If-None-Match": '"v1"'})
+        stale = self.client.get("/api/v1/ab-testing/dashboard/exp123", headers={"If-None-Match": '"v0"'})
+
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["etag"] == '"v1"'
+        assert revalidated.status_code == HTTP_304_NOT_MODIFIED
+        assert revalidated.content == b""
+        assert stale.status_code == HTTP_200_OK
+        assert stale.text == "<html>dashboard</html>"
+
     @patch("src.api.ab_testing_endpoints.get_experiment_manager_dependency")
     def test_get_experiment_results(self, mock_dependency):
         """Test getting experiment results."""
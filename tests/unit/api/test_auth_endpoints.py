@@ -567,6 +567,19 @@ class TestSystemEndpoints:
         assert data["status"] == "healthy"
         assert "timestamp" in data
 
+    def test_startup_profile_admin(self, app, client, mock_jwt_user):
+        """Test GET /system/startup-profile endpoint returns the profiler report."""
+        app.dependency_overrides[require_admin_role] = lambda: mock_jwt_user
+
+        response = client.get("/api/v1/system/startup-profile?limit=5")
+        app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert set(data) >= {"import_timer_installed", "slowest_imports", "lazy_imports", "steps"}
+        assert len(data["slowest_imports"]) <= 5
+
 
 class TestAuditEndpoints:
     """Test cases for audit endpoints."""
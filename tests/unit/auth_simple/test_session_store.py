@@ -0,0 +1,268 @@
+"""Unit tests for pluggable session storage."""
+
+from datetime import datetime
+import threading
+from unittest.mock import Mock, patch
+
+from fastapi import HTTPException, Request
+import pytest
+
+from src.auth_simple.middleware import CloudflareAccessMiddleware, SimpleSessionManager
+from src.auth_simple.session_store import (
+    InMemorySessionBackend,
+    RedisSessionBackend,
+    SessionRefresh,
+    SqliteSessionBackend,
+    create_session_backend,
+    decode_session,
+    encode_session,
+)
+from src.auth_simple.whitelist import EmailWhitelistValidator, UserTier
+from src.utils.datetime_compat import UTC
+
+
+class FakeRedis:
+    """Minimal Redis-protocol fake supporting the commands the backend uses."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.commands = 0
+
+    def set(self, key, value, px=None, xx=False):
+        self.commands += 1
+        if xx and key not in self.data:
+            return None
+        self.data[key] = value
+        self.ttls[key] = px
+        return True
+
+    def get(self, key):
+        self.commands += 1
+        return self.data.get(key)
+
+    def delete(self, key):
+        self.commands += 1
+        self.ttls.pop(key, None)
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and applies them on execute, like redis-py pipelines."""
+
+    def __init__(self, server: FakeRedis) -> None:
+        self.server = server
+        self.queued = []
+
+    def set(self, *args, **kwargs):
+        self.queued.append((args, kwargs))
+
+    def execute(self):
+        round_trips = self.server.commands + 1
+        results = [self.server.set(*args, **kwargs) for args, kwargs in self.queued]
+        self.server.commands = round_trips
+        return results
+
+
+def _session(email: str = "user@example.com") -> dict:
+    now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+    return {"email": email, "is_admin": False, "user_tier": "full", "created_at": now, "last_accessed": now}
+
+
+class TestInMemorySessionBackend:
+    """Test cases for InMemorySessionBackend."""
+
+    def test_sweep_removes_expired_sessions_on_write(self):
+        """Sessions that are never looked up again are removed by later writes."""
+        backend = InMemorySessionBackend()
+        backend.create("old", _session(), expires_at=100.0, now=0.0)
+        backend.create("new", _session(), expires_at=300.0, now=200.0)
+
+        assert "old" not in backend.sessions
+        assert "new" in backend.sessions
+
+    def test_refreshed_sessions_survive_sweep(self):
+        """A stale heap entry is requeued with the refreshed expiry."""
+        backend = InMemorySessionBackend()
+        backend.create("a", _session(), expires_at=100.0, now=0.0)
+        backend.refresh([SessionRefresh("a", backend.sessions["a"], 400.0)], now=50.0)
+
+        assert backend.purge_expired(now=200.0) == 0
+        assert backend.get("a", now=200.0) is not None
+        assert backend.purge_expired(now=500.0) == 1
+        assert backend.sessions == {}
+
+    def test_get_expired_session(self):
+        """Expired sessions are removed on lookup."""
+        backend = InMemorySessionBackend()
+        backend.create("a", _session(), expires_at=100.0, now=0.0)
+
+        assert backend.get("a", now=100.0) is not None
+        assert backend.get("a", now=100.5) is None
+        assert backend.delete("a") is False
+
+
+class TestSqliteSessionBackend:
+    """Test cases for SqliteSessionBackend."""
+
+    def test_sessions_are_shared_between_workers(self, tmp_path):
+        """Every connection to the database sees the same sessions."""
+        first = SqliteSessionBackend(tmp_path / "sessions.db")
+        second = SqliteSessionBackend(tmp_path / "sessions.db")
+        first.create("a", _session(), expires_at=100.0, now=0.0)
+
+        assert second.get("a", now=50.0) == _session()
+        assert second.delete("a") is True
+        assert first.get("a", now=50.0) is None
+
+    def test_refresh_extends_expiry_without_resurrecting(self, tmp_path):
+        """Batched refreshes extend live sessions and skip deleted ones."""
+        backend = SqliteSessionBackend(tmp_path / "sessions.db")
+        backend.create("a", _session(), expires_at=100.0, now=0.0)
+        backend.create("b", _session(), expires_at=100.0, now=0.0)
+        backend.delete("b")
+
+        backend.refresh([SessionRefresh("a", _session(), 300.0), SessionRefresh("b", _session(), 300.0)], now=90.0)
+
+        assert backend.get("a", now=200.0) is not None
+        assert backend.get("b", now=90.0) is None
+        assert backend.purge_expired(now=400.0) == 1
+
+
+class TestRedisSessionBackend:
+    """Test cases for RedisSessionBackend."""
+
+    def test_lifecycle(self):
+        """Sessions are stored with their remaining lifetime as TTL."""
+        server = FakeRedis()
+        backend = RedisSessionBackend(server)
+        backend.create("a", _session(), expires_at=100.0, now=40.0)
+
+        assert server.ttls["promptcraft:session:a"] == 60000
+        assert backend.get("a", now=50.0) == _session()
+
+        backend.delete("a")
+        backend.refresh([SessionRefresh("a", _session(), 200.0)], now=60.0)
+        assert backend.get("a", now=60.0) is None
+
+    def test_refresh_is_one_round_trip(self):
+        """A batch of refreshes is sent in one pipeline."""
+        server = FakeRedis()
+        backend = RedisSessionBackend(server)
+        for session_id in ("a", "b", "c"):
+            backend.create(session_id, _session(), expires_at=100.0, now=0.0)
+        server.commands = 0
+
+        backend.refresh([SessionRefresh(session_id, _session(), 200.0) for session_id in "abc"], now=50.0)
+
+        assert server.commands == 1
+        assert server.ttls["promptcraft:session:b"] == 150000
+
+
+class TestSharedSessionManager:
+    """Test cases for SimpleSessionManager with a shared backend."""
+
+    def test_workers_share_sessions_with_batched_refresh(self, tmp_path):
+        """Another worker can serve the session; sliding expiry is written on flush."""
+        worker_a = SimpleSessionManager(session_timeout=60, backend=SqliteSessionBackend(tmp_path / "s.db"))
+        worker_b = SimpleSessionManager(session_timeout=60, backend=SqliteSessionBackend(tmp_path / "s.db"))
+        try:
+            with patch("src.auth_simple.middleware.datetime") as mock_datetime:
+                mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+                session_id = worker_a.create_session("user@example.com", False, "full")
+
+                mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0, 50, tzinfo=UTC)
+                for _ in range(3):
+                    assert worker_b.get_session(session_id)["email"] == "user@example.com"
+                assert worker_b.flush_refreshes() == 1
+
+                mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 1, 30, tzinfo=UTC)
+                session = worker_a.get_session(session_id)
+
+            assert session["last_accessed"] == datetime(2024, 1, 1, 12, 1, 30, tzinfo=UTC)
+            assert worker_a.sessions == {}
+            assert worker_a.invalidate_session(session_id) is True
+            assert worker_b.get_session(session_id) is None
+        finally:
+            worker_a.close()
+            worker_b.close()
+
+
+class TestMiddlewareWithSharedBackend:
+    """Test cases for CloudflareAccessMiddleware over a shared session backend."""
+
+    @staticmethod
+    def _middleware(session_manager: SimpleSessionManager) -> CloudflareAccessMiddleware:
+        validator = Mock(spec=EmailWhitelistValidator)
+        validator.is_authorized.return_value = True
+        validator.get_user_tier.return_value = UserTier.FULL
+        middleware = CloudflareAccessMiddleware(
+            app=None,
+            whitelist_validator=validator,
+            session_manager=session_manager,
+        )
+        middleware.cloudflare_auth.extract_user_from_request = Mock(return_value=Mock(email="user@example.com"))
+        return middleware
+
+    @staticmethod
+    def _request(session_id: str | None = None) -> Mock:
+        request = Mock(spec=Request)
+        request.state = Mock()
+        request.cookies = {"session_id": session_id} if session_id else {}
+        return request
+
+    @pytest.mark.asyncio
+    async def test_backend_calls_run_off_the_event_loop(self, tmp_path):
+        """Storage I/O for a shared backend happens in a worker thread."""
+        session_manager = SimpleSessionManager(backend=SqliteSessionBackend(tmp_path / "s.db"))
+        middleware = self._middleware(session_manager)
+        threads = []
+        backend_get = session_manager.backend.get
+
+        def recording_get(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return backend_get(*args, **kwargs)
+
+        session_manager.backend.get = recording_get
+        try:
+            request = self._request()
+            await middleware._authenticate_request(request)
+            await middleware._authenticate_request(self._request(request.state.user["session_id"]))
+        finally:
+            session_manager.close()
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_fails_closed(self):
+        """A session lookup that cannot reach storage rejects the request."""
+        server = FakeRedis()
+        server.get = Mock(side_effect=ConnectionError("redis down"))
+        session_manager = SimpleSessionManager(backend=RedisSessionBackend(server))
+        middleware = self._middleware(session_manager)
+        request = self._request("existing")
+        try:
+            with pytest.raises(HTTPException) as exc_info:
+                await middleware._authenticate_request(request)
+        finally:
+            session_manager.close()
+
+        assert exc_info.value.status_code == 503
+        assert not isinstance(request.state.user, dict)
+
+
+def test_encode_session_round_trip():
+    """Timestamps survive serialization."""
+    assert decode_session(encode_session(_session())) == _session()
+
+
+def test_create_session_backend(tmp_path):
+    """Backends are created by name."""
+    assert isinstance(create_session_backend("memory"), InMemorySessionBackend)
+    assert isinstance(create_session_backend("sqlite", str(tmp_path / "s.db")), SqliteSessionBackend)
+    with pytest.raises(ValueError, match="Unknown session backend"):
+        create_session_backend("memcached")
@@ -15,6 +15,7 @@ Test Coverage for src/commands/discovery.py:
 """
 
 from datetime import datetime, timedelta
+import os
 from pathlib import Path
 import tempfile
 from unittest.mock import Mock, patch
@@ -22,6 +23,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from src.commands.discovery import CommandDefinition, CommandsDiscoverySystem, CommandsManager
+from src.utils.resource_catalog import ResourceCatalog
 
 
 class TestCommandDefinition:
@@ -530,6 +532,89 @@ This is a test command.
             assert "_README" not in discovery_system._commands_cache  # Should be skipped
             assert discovery_system._cache_timestamp is not None
 
+    @pytest.fixture
+    def file_discovery_system(self, tmp_path):
+        """Create a CommandsDiscoverySystem over project and user command files in a temp directory."""
+        system = CommandsDiscoverySystem(project_root=tmp_path / "project", catalog=ResourceCatalog())
+        system.user_commands_path = tmp_path / "user" / "commands"
+        system.project_commands_path.mkdir(parents=True)
+        system.user_commands_path.mkdir(parents=True)
+        
+        commands = {
+            "quality-lint": "Runs linting checks for code quality",
+            "quality-format": "Formats code with black",
+            "test-coverage": "Checks test coverage metrics",
+            "deploy-staging": "Deploys the current branch to staging",
+        }
+        for command_id, description in commands.items():
+            (system.project_commands_path / f"{command_id}.md").write_text(
+                f"---\ndescription: {description}\n---\n\n# {command_id}\n",
+            )
+        return system
+
+    def test_refresh_commands_cache_unchanged_files_not_rediscovered(self, file_discovery_system):
+        """Test a refresh with no file changes keeps every cached command."""
+        file_discovery_system._refresh_commands_cache()
+        cached = dict(file_discovery_system._commands_cache)
+        assert set(cached) == {"quality-lint", "quality-format", "test-coverage", "deploy-staging", "help"}
+        
+        with patch.object(file_discovery_system, "discover_command") as mock_discover:
+            file_discovery_system._refresh_commands_cache()
+        
+        mock_discover.assert_not_called()
+        assert file_discovery_system._commands_cache == cached
+
+    def test_refresh_commands_cache_changed_files(self, file_discovery_system):
+        """Test a refresh rediscovers modified and added commands and drops deleted ones."""
+        file_discovery_system._refresh_commands_cache()
+        commands_path = file_discovery_system.project_commands_path
+        
+        lint_file = commands_path / "quality-lint.md"
+        lint_file.write_text("---\ndescription: Lints with ruff\n---\n")
+        stat = lint_file.stat()
+        os.utime(lint_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (commands_path / "deploy-staging.md").unlink()
+        (file_discovery_system.user_commands_path / "user-notes.md").write_text("# Notes\n")
+        
+        with patch.object(
+            file_discovery_system, "discover_command", wraps=file_discovery_system.discover_command,
+        ) as mock_discover:
+            file_discovery_system._refresh_commands_cache()
+        
+        assert sorted(call.args[0] for call in mock_discover.call_args_list) == ["quality-lint", "user-notes"]
+        cache = file_discovery_system._commands_cache
+        assert cache["quality-lint"].description == "Lints with ruff"
+        assert cache["user-notes"].source_type == "user"
+        assert "deploy-staging" not in cache
+
+    def test_search_commands_ranked_and_typo_tolerant(self, file_discovery_system):
+        """Test search ranks closer matches first and tolerates typos."""
+        results = file_discovery_system.search_commands("quality")
+        assert [command.command_id for command in results] == ["quality-format", "quality-lint"]
+        
+        results = file_discovery_system.search_commands("covrage")
+        assert [command.command_id for command in results] == ["test-coverage"]
+        
+        results = file_discovery_system.search_commands("lint code")
+        assert results[0].command_id == "quality-lint"
+        
+        assert len(file_discovery_system.search_commands("quality", limit=1)) == 1
+        assert len(file_discovery_system.search_commands("")) == 5
+
+    def test_search_commands_index_follows_refresh(self, file_discovery_system):
+        """Test search results reflect commands added and removed by a refresh."""
+        assert [command.command_id for command in file_discovery_system.search_commands("deploy")] == [
+            "deploy-staging",
+        ]
+        
+        (file_discovery_system.project_commands_path / "deploy-staging.md").unlink()
+        (file_discovery_system.project_commands_path / "deploy-production.md").write_text("# Deploy\n")
+        file_discovery_system._refresh_commands_cache()
+        
+        assert [command.command_id for command in file_discovery_system.search_commands("deploy")] == [
+            "deploy-production",
+        ]
+
     def test_get_discovery_status(self, discovery_system):
         """Test get_discovery_status returns comprehensive status information."""
         # Setup mock cache with diverse commands
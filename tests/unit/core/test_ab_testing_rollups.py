@@ -0,0 +1,202 @@
+"""Unit tests for A/B testing metric rollups."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.core.ab_testing_framework import (
+    BaseModel,
+    ExperimentManager,
+    MetricEvent,
+    MetricEventModel,
+    MetricRollupModel,
+    MetricRollupStore,
+    MetricsCollector,
+)
+from src.utils.datetime_compat import UTC
+
+
+HOUR = datetime(2024, 3, 5, 14, tzinfo=UTC).replace(tzinfo=None)  # Rollup buckets are naive UTC
+DAY = HOUR.replace(hour=0)
+
+
+@pytest.fixture
+def db_session():
+    """In-memory database session."""
+    engine = create_engine("sqlite:///:memory:")
+    BaseModel.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def make_event(minutes: float, **fields) -> MetricEvent:
+    """Create a performance event ``minutes`` after HOUR."""
+    defaults = {"event_type": "performance", "response_time_ms": 100.0, "success": True}
+    return MetricEvent(
+        experiment_id="exp",
+        user_id="user",
+        variant=fields.pop("variant", "control"),
+        event_name="query_processing",
+        timestamp=HOUR + timedelta(minutes=minutes),
+        **{**defaults, **fields},
+    )
+
+
+def rollup_rows(db_session) -> dict[tuple, tuple]:
+    """Get rollup aggregates keyed by (granularity, bucket_start, variant, event_type)."""
+    return {
+        (row.granularity, row.bucket_start, row.variant, row.event_type): (
+            row.event_count,
+            row.success_count,
+            row.error_count,
+            row.conversion_count,
+            row.response_time_count,
+            row.response_time_sum,
+            row.token_reduction_count,
+            row.token_reduction_sum,
+            row.response_time_sketch["count"] if row.response_time_sketch else 0,
+        )
+        for row in db_session.query(MetricRollupModel).all()
+    }
+
+
+class TestMetricRollupStore:
+    """Test cases for MetricRollupStore."""
+
+    def test_bucket_start(self):
+        """Buckets are UTC hours and days; aware timestamps are converted."""
+        timestamp = datetime(2024, 3, 5, 23, 40, 12, tzinfo=UTC)
+        naive = timestamp.replace(tzinfo=None)
+
+        assert MetricRollupStore.bucket_start(timestamp, "hour") == naive.replace(minute=0, second=0)
+        assert MetricRollupStore.bucket_start(naive, "day") == DAY
+        with pytest.raises(ValueError, match="granularity"):
+            MetricRollupStore.bucket_start(timestamp, "week")
+
+    def test_recording_updates_hourly_and_daily_rollups(self, db_session):
+        """Each event is added to one hourly and one daily row, in the event's transaction."""
+        collector = MetricsCollector(db_session)
+        collector.record_event(make_event(5, response_time_ms=120.0, token_reduction_percentage=75.0))
+        collector.record_event(make_event(50, response_time_ms=80.0, token_reduction_percentage=40.0, success=False))
+        collector.record_event(make_event(70, event_type="error", response_time_ms=None, success=False))
+
+        rows = rollup_rows(db_session)
+
+        assert rows[("hour", HOUR, "control", "performance")] == (2, 1, 1, 1, 2, 200.0, 2, 115.0, 2)
+        assert rows[("hour", HOUR + timedelta(hours=1), "control", "error")] == (1, 0, 1, 0, 0, 0.0, 0, 0.0, 0)
+        assert rows[("day", DAY, "control", "performance")][0] == 2
+        assert len(rows) == 4
+
+    def test_rebuild_matches_incremental_rollups(self, db_session):
+        """Rebuilding from raw events reproduces the incrementally maintained rows."""
+        collector = MetricsCollector(db_session)
+        for minute in range(0, 180, 7):
+            collector.record_event(
+                make_event(
+                    minute,
+                    variant="treatment" if minute % 2 else "control",
+                    response_time_ms=50.0 + minute,
+                    token_reduction_percentage=float(minute % 100),
+                    success=minute % 5 != 0,
+                ),
+            )
+        incremental = rollup_rows(db_session)
+
+        events = MetricRollupStore(db_session).rebuild("exp")
+        db_session.commit()
+
+        assert events == 26
+        assert rollup_rows(db_session) == incremental
+
+    def test_timeline_merges_variants(self, db_session):
+        """Timeline buckets combine variants and merge latency sketches."""
+        collector = MetricsCollector(db_session)
+        for minute, variant in [(1, "control"), (2, "treatment"), (3, "treatment"), (65, "control")]:
+            collector.record_event(make_event(minute, variant=variant, response_time_ms=float(minute)))
+        store = MetricRollupStore(db_session)
+
+        hourly = store.timeline("exp", HOUR + timedelta(minutes=30), include_latency=True)
+        daily = store.timeline("exp", HOUR, granularity="day", event_types=("performance",))
+
+        assert [bucket["bucket_start"] for bucket in hourly] == [HOUR, HOUR + timedelta(hours=1)]
+        assert hourly[0]["event_count"] == 3
+        assert hourly[0]["response_time_sketch"].max == 3.0
+        assert [(bucket["bucket_start"], bucket["event_count"]) for bucket in daily] == [(DAY, 4)]
+        assert "response_time_sketch" not in daily[0]
+        assert store.timeline("exp", HOUR, event_types=("optimization",)) == []
+
+    def test_concurrently_created_bucket_is_retried(self, tmp_path):
+        """A writer that loses the race to create a bucket updates the winner's row and keeps its event."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'ab.db'}")
+        BaseModel.metadata.create_all(engine)
+        make_session = sessionmaker(bind=engine)
+        with make_session() as first, make_session() as second:
+            real_get = second.get
+            stale_reads = 2
+
+            def get_before_first_commits(*args, **kwargs):
+                # The first lookups happen before the other writer commits its new buckets
+                nonlocal stale_reads
+                if stale_reads:
+                    stale_reads -= 1
+                    return None
+                return real_get(*args, **kwargs)
+
+            second.get = get_before_first_commits
+            assert MetricsCollector(first).record_event(make_event(1))
+            assert MetricsCollector(second).record_event(make_event(2))
+
+            assert second.query(MetricEventModel).count() == 2
+            assert rollup_rows(second)[("hour", HOUR, "control", "performance")][0] == 2
+            assert rollup_rows(second)[("day", DAY, "control", "performance")][0] == 2
+        engine.dispose()
+
+    def test_rollup_failure_keeps_raw_event(self, db_session, monkeypatch):
+        """An event is committed even if its rollups cannot be written; rebuild repairs them."""
+
+        def fail(self, key, event):
+            raise IntegrityError("INSERT INTO ab_metric_rollups", {}, Exception("conflict"))
+
+        monkeypatch.setattr(MetricRollupStore, "_add_to_bucket", fail)
+        assert MetricsCollector(db_session).record_event(make_event(1))
+        monkeypatch.undo()
+
+        assert db_session.query(MetricEventModel).count() == 1
+        assert rollup_rows(db_session) == {}
+        assert MetricRollupStore(db_session).rebuild("exp") == 1
+
+    def test_existing_events_are_backfilled(self, tmp_path):
+        """Opening a database that predates rollups builds them from its events."""
+        db_url = f"sqlite:///{tmp_path / 'ab.db'}"
+        engine = create_engine(db_url)
+        BaseModel.metadata.create_all(engine)
+        with sessionmaker(bind=engine)() as session:
+            for minute in range(3):
+                event = make_event(minute)
+                session.add(
+                    MetricEventModel(
+                        id=f"event-{minute}",
+                        experiment_id=event.experiment_id,
+                        user_id=event.user_id,
+                        variant=event.variant,
+                        event_type=event.event_type,
+                        event_name=event.event_name,
+                        timestamp=event.timestamp,
+                        response_time_ms=event.response_time_ms,
+                        success=event.success,
+                    ),
+                )
+            session.commit()
+        engine.dispose()
+
+        manager = ExperimentManager(db_url=db_url)
+
+        with manager.get_db_session() as session:
+            (bucket,) = MetricRollupStore(session).timeline("exp", HOUR)
+        assert bucket["event_count"] == 3
+        manager.engine.dispose()
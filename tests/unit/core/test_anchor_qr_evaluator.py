@@ -18,11 +18,13 @@ from src.core.anchor_qr_evaluator import (
     MIN_LEXICAL_DIVERSITY,
     MIN_SENTENCE_VARIABILITY,
     MINIMUM_WORD_COUNT_COMPLEX,
+    VERIFICATION_KEYWORDS,
     ANCHORQREvaluator,
     ComprehensiveEvaluation,
     DiagnosticFlag,
     EvaluationResult,
     EvaluationStep,
+    PromptFeatures,
     RigorLevel,
 )
 
@@ -793,3 +795,106 @@ class TestIntegration:
             assert result.rigor_level == rigor
             assert len(result.step_results) == 6
             assert 0 <= result.overall_score <= 100
+
+
+class TestEvaluationModes:
+    """Test shared features, concurrent steps, early exit and caching."""
+
+    def prompt(self):
+        """A prompt that covers every CREATE section and most step keywords."""
+        return """
+        # C - Context
+        You are an experienced analyst. Consider each perspective and approach step by step.
+
+        # R - Request
+        Verify and validate every claim, cite each source and reference the documentation.
+        Keep the analysis consistent and logical, and state your confidence and accuracy.
+
+        # E - Examples
+        Compare and contrast two alternative methods with measurable evidence.
+
+        # A - Augmentations
+        Flag anything uncertain or unknown. Respect the scope and safety constraints.
+
+        # T - Tone
+        Professional, business-ready and specific. Use actionable steps you can implement.
+
+        # E - Evaluation
+        Does the response meet the success criteria? Ensure that it is checked and confirmed.
+        """
+
+    def test_prompt_features_are_extracted_once(self):
+        """Test features pass through extraction unchanged."""
+        features = PromptFeatures.extract("Verify the Source. # C - Context")
+
+        assert PromptFeatures.extract(features) is features
+        assert {"verify", "source"} <= features.keywords
+        assert features.count(VERIFICATION_KEYWORDS) == 1
+        assert features.missing_sections(["# C - Context", "# R - Request"]) == ["# R - Request"]
+
+    def test_concurrent_steps_match_sequential(self):
+        """Test running steps concurrently gives the same evaluation."""
+        context = {"query": "Analyze customers"}
+        sequential = ANCHORQREvaluator().evaluate_prompt(self.prompt(), context, RigorLevel.ADVANCED)
+        concurrent = ANCHORQREvaluator(max_workers=4).evaluate_prompt(self.prompt(), context, RigorLevel.ADVANCED)
+
+        assert list(concurrent.step_results) == list(EvaluationStep)
+        assert concurrent.overall_score == sequential.overall_score
+        assert concurrent.all_flags == sequential.all_flags
+
+    def test_early_exit_skips_steps_for_failing_prompt(self):
+        """Test early exit stops once the prompt can no longer pass."""
+        evaluator = ANCHORQREvaluator(early_exit=True)
+
+        result = evaluator.evaluate_prompt("Just help me with stuff.", {"query": ""}, RigorLevel.BASIC)
+
+        assert result.skipped_steps
+        assert len(result.step_results) + len(result.skipped_steps) == len(EvaluationStep)
+        assert result.is_passing is False
+        assert evaluator.get_cache_stats()["early_exits"] == 1
+
+    def test_early_exit_runs_every_step_for_passing_prompt(self):
+        """Test early exit does not change the result of a prompt that can pass."""
+        context = {"query": "Analyze customers"}
+        full = ANCHORQREvaluator().evaluate_prompt(self.prompt(), context, RigorLevel.BASIC)
+        early = ANCHORQREvaluator(early_exit=True).evaluate_prompt(self.prompt(), context, RigorLevel.BASIC)
+
+        assert early.skipped_steps == []
+        assert early.overall_score == full.overall_score
+
+    def test_repeat_evaluation_is_cached(self):
+        """Test repeat evaluations are served from the cache as independent copies."""
+        evaluator = ANCHORQREvaluator()
+        context = {"query": "Analyze customers", "preferences": {"style": "formal"}}
+
+        with patch.object(evaluator, "_run_steps", wraps=evaluator._run_steps) as mock_run:
+            first = evaluator.evaluate_prompt(self.prompt(), context)
+            first.critical_issues.append("mutated")
+            second = evaluator.evaluate_prompt(self.prompt(), {"query": "Other query"})
+
+        assert mock_run.call_count == 1
+        assert "mutated" not in second.critical_issues
+        assert second.overall_score == first.overall_score
+        assert evaluator.get_cache_stats()["hits"] == 1
+
+    def test_cache_key_includes_rigor_and_context(self):
+        """Test rigor level and the context fields steps read are part of the cache key."""
+        evaluator = ANCHORQREvaluator()
+
+        evaluator.evaluate_prompt(self.prompt(), {"query": "q"}, RigorLevel.BASIC)
+        evaluator.evaluate_prompt(self.prompt(), {"query": "q"}, RigorLevel.ADVANCED)
+        evaluator.evaluate_prompt(self.prompt(), {"query": ""}, RigorLevel.BASIC)
+        evaluator.evaluate_prompt(self.prompt(), {"query": "q", "query_analysis": {"complexity": "complex"}})
+
+        assert evaluator.get_cache_stats()["hits"] == 0
+        assert evaluator.get_cache_stats()["size"] == 4
+
+    def test_cache_can_be_disabled(self):
+        """Test a zero cache size evaluates every time."""
+        evaluator = ANCHORQREvaluator(cache_size=0)
+
+        evaluator.evaluate_prompt(self.prompt(), {"query": "q"})
+        evaluator.evaluate_prompt(self.prompt(), {"query": "q"})
+
+        assert evaluator.get_cache_stats()["size"] == 0
+        assert evaluator.get_cache_stats()["hits"] == 0
@@ -246,6 +246,29 @@ class TestCommandRegistry:
         results = registry.search_commands("nonexistent-term")
         assert results == []
 
+    def test_search_commands_ranked_and_typo_tolerant(self):
+        """Test search ranks name matches over tag matches and tolerates typos."""
+        registry = CommandRegistry()
+        for name, aliases, tags in [
+            ("load-category", ["lc"], ["loading"]),
+            ("list-categories", None, ["category"]),
+            ("optimize-for", ["opt"], ["performance"]),
+        ]:
+            metadata = CommandMetadata(
+                name=name,
+                category="function_control",
+                complexity="low",
+                estimated_time="< 1 minute",
+                tags=tags,
+            )
+            registry.register_command(name, MagicMock(), metadata, aliases=aliases)
+
+        assert registry.search_commands("category") == ["load-category", "list-categories"]
+        assert registry.search_commands("optimzie") == ["optimize-for"]
+        assert registry.search_commands("opt") == ["optimize-for"]
+        assert registry.search_commands("category", limit=1) == ["load-category"]
+        assert registry.search_commands("") == ["load-category", "list-categories", "optimize-for"]
+
 
 class TestClaudeCommandIntegration:
     """Test ClaudeCommandIntegration functionality."""
@@ -18,6 +18,7 @@ from src.core.create_processor_core import (
     CreateResponse,
     Domain,
     ProcessingError,
+    PromptFeatures,
     ValidationError,
 )
 
@@ -928,6 +929,107 @@ class TestCreateRequestResponse:
         assert response.errors == errors
 
 
+@pytest.mark.unit
+class TestPromptFeatures:
+    """Test cases for single-pass prompt feature extraction."""
+
+    def test_extract_all_features(self):
+        """Test every component feature is extracted from one prompt."""
+        features = PromptFeatures.extract(
+            "You are a data analyst with SQL skills. Background: quarterly sales review. "
+            "My goal is to find trends. Please summarize the figures. Output: a short memo. "
+            "For example: revenue by region. Tone: calm and warm.",
+        )
+
+        assert features.role == "a data analyst"
+        assert features.background == "quarterly sales review"
+        assert features.goal == "find trends"
+        assert features.task == "summarize the figures"
+        assert features.deliverable == "a short memo"
+        assert features.example_patterns == ["revenue by region"]
+        assert features.tone == "calm and warm"
+
+    def test_extract_returns_existing_features(self):
+        """Test already-extracted features pass through unchanged."""
+        features = PromptFeatures.extract("Act as a reviewer.")
+
+        assert PromptFeatures.extract(features) is features
+
+    def test_pattern_priority_is_preserved(self):
+        """Test earlier patterns win even when later patterns match earlier in the text."""
+        features = PromptFeatures.extract("Write a poem. Task: draft the outline.")
+
+        assert features.task == "draft the outline"
+
+    def test_case_insensitive_special_characters(self):
+        """Test characters that only match case-insensitively still trigger extraction."""
+        assert PromptFeatures.extract("Plea\u017fe review the code.").task == "review the code"
+        assert PromptFeatures.extract("İn a calm voice, explain.").tone == "calm voice"
+
+    def test_components_consume_shared_features(self):
+        """Test applying the framework extracts features only once."""
+        processor = CreateProcessor()
+
+        with patch.object(PromptFeatures, "extract", wraps=PromptFeatures.extract) as mock_extract:
+            processor.apply_create_framework("You are a tutor. Please explain fractions.", {"domain": "academic"})
+
+        assert mock_extract.call_count == 5
+        assert all(isinstance(call.args[0], PromptFeatures) for call in mock_extract.call_args_list[1:])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCreateProcessorResultCache:
+    """Test cases for memoized prompt results."""
+
+    async def test_repeated_prompt_is_served_from_cache(self):
+        """Test a repeated prompt skips validation and framework application."""
+        processor = CreateProcessor()
+        prompt = "You are a tutor. Please explain fractions."
+
+        first = await processor.process_prompt(prompt, "academic")
+        first.framework_components["context"]["role"] = "mutated"
+        with patch.object(processor, "apply_create_framework") as mock_apply:
+            second = await processor.process_prompt(prompt, "academic")
+
+        mock_apply.assert_not_called()
+        assert second.enhanced_prompt == first.enhanced_prompt
+        assert second.framework_components["context"]["role"] == "a tutor"
+        assert second.metadata["cache_hit"] is True
+        assert processor.cache_stats == {"hits": 1, "misses": 1}
+
+    async def test_domain_is_part_of_cache_key(self):
+        """Test the same prompt in another domain is processed again."""
+        processor = CreateProcessor()
+        prompt = "You are a tutor. Please explain fractions."
+
+        academic = await processor.process_prompt(prompt, "academic")
+        legal = await processor.process_prompt(prompt, "legal")
+
+        assert legal.metadata["cache_hit"] is False
+        assert legal.enhanced_prompt != academic.enhanced_prompt
+
+    async def test_invalid_prompts_are_not_cached(self):
+        """Test failed validation is repeated rather than memoized."""
+        processor = CreateProcessor()
+
+        for _ in range(2):
+            response = await processor.process_prompt("<script>alert(1)</script>")
+            assert response.success is False
+
+        assert processor.cache_stats["hits"] == 0
+
+    async def test_cache_can_be_disabled(self):
+        """Test a zero result_cache_size processes every prompt."""
+        processor = CreateProcessor({"result_cache_size": 0})
+
+        await processor.process_prompt("Please explain fractions.")
+        response = await processor.process_prompt("Please explain fractions.")
+
+        assert response.metadata["cache_hit"] is False
+        assert processor.cache_stats == {"hits": 0, "misses": 0}
+
+
 @pytest.mark.unit
 class TestDomainEnum:
     """Test cases for Domain enum."""
@@ -0,0 +1,304 @@
+"""Concurrency stress tests for AsyncBatcher and ConnectionPool."""
+
+import asyncio
+import itertools
+import random
+import time
+
+import pytest
+
+from src.core.performance_optimizer import AsyncBatcher, ConnectionPool
+
+
+class FakeConnection:
+    """Connection with an async close and a reuse guard."""
+
+    _ids = itertools.count()
+
+    def __init__(self) -> None:
+        self.id = next(self._ids)
+        self.closed = False
+        self.in_use = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    """Small pool handing out FakeConnections."""
+    connection_pool = ConnectionPool(max_size=4, timeout=1.0, name="test")
+
+    async def create_connection():
+        return FakeConnection()
+
+    connection_pool.set_connection_factory(create_connection)
+    return connection_pool
+
+
+class TestAsyncBatcherConcurrency:
+    """Stress tests for AsyncBatcher."""
+
+    async def test_producers_are_not_serialized_behind_the_flush_window(self):
+        """Hundreds of concurrent producers complete in a few flush windows, not one window each."""
+        batcher = AsyncBatcher(batch_size=50, flush_interval=0.05, max_pending=500)
+
+        async def double(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(batcher.add_operation(double, i) for i in range(400)))
+        elapsed = time.perf_counter() - start
+        await batcher.shutdown()
+
+        assert results == [i * 2 for i in range(400)]
+        assert batcher.stats["batches"] == 8
+        assert elapsed < 1.0
+
+    async def test_back_pressure_bounds_pending_items(self):
+        """Producers wait once max_pending items are queued or being processed."""
+        batcher = AsyncBatcher(batch_size=4, flush_interval=0.01, max_pending=8)
+        release = asyncio.Event()
+        processed: list[list[int]] = []
+
+        async def process(batch):
+            await release.wait()
+            processed.append(batch)
+            return [item * 10 for item in batch]
+
+        batcher.set_batch_processor(process)
+        producers = [asyncio.create_task(batcher.add_item(i)) for i in range(20)]
+        await asyncio.sleep(0.05)
+
+        assert sum(producer.done() for producer in producers) == 8
+
+        release.set()
+        futures = await asyncio.gather(*producers)
+        results = await asyncio.gather(*futures)
+        await batcher.shutdown()
+
+        assert results == [i * 10 for i in range(20)]
+        assert [item for batch in processed for item in batch] == list(range(20))
+        assert all(len(batch) <= 4 for batch in processed)
+
+    async def test_batches_are_processed_one_at_a_time(self):
+        """The processor never runs concurrently with itself, even with manual flushes."""
+        batcher = AsyncBatcher(batch_size=5, flush_interval=0.001)
+        running = 0
+        max_running = 0
+
+        async def process(batch):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(random.uniform(0, 0.005))  # noqa: S311
+            running -= 1
+
+        batcher.set_batch_processor(process)
+
+        async def produce(offset):
+            for i in range(25):
+                await batcher.add_item(offset + i)
+                if i % 7 == 0:
+                    await batcher.flush()
+
+        await asyncio.gather(*(produce(offset) for offset in range(0, 200, 25)))
+        await batcher.shutdown()
+
+        assert max_running == 1
+        assert batcher.stats["items"] == 200
+        assert batcher.pending == 0
+
+    async def test_per_item_results_and_exceptions(self):
+        """A processor can fail individual items; a failed batch fails all of its items."""
+        batcher = AsyncBatcher(batch_size=3, flush_interval=0.01)
+
+        async def process(batch):
+            if "explode" in batch:
+                raise RuntimeError("batch failed")
+            return [ValueError(item) if item == "bad" else item.upper() for item in batch]
+
+        batcher.set_batch_processor(process)
+
+        good, bad, other = [await batcher.add_item(item) for item in ("good", "bad", "other")]
+        assert await good == "GOOD"
+        assert await other == "OTHER"
+        with pytest.raises(ValueError, match="bad"):
+            await bad
+
+        failed = [await batcher.add_item(item) for item in ("a", "explode")]
+        await batcher.flush()
+        for future in failed:
+            with pytest.raises(RuntimeError, match="batch failed"):
+                await future
+        assert batcher.stats["failed_batches"] == 1
+        await batcher.shutdown()
+
+    async def test_cancelled_caller_does_not_affect_batch(self):
+        """A caller that stops waiting does not cancel the other operations in its batch."""
+        batcher = AsyncBatcher(batch_size=10, flush_interval=0.05)
+
+        async def slow(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        impatient = asyncio.create_task(batcher.add_operation(slow, "impatient"))
+        patient = asyncio.create_task(batcher.add_operation(slow, "patient"))
+        await asyncio.sleep(0)
+        impatient.cancel()
+
+        assert await patient == "patient"
+        assert impatient.cancelled()
+        await batcher.shutdown()
+
+    async def test_shutdown_flushes_pending_items(self):
+        """Shutdown processes items still waiting for their deadline."""
+        batcher = AsyncBatcher(batch_size=100, flush_interval=60.0)
+        processed: list[str] = []
+
+        async def process(batch):
+            processed.extend(batch)
+
+        batcher.set_batch_processor(process)
+        futures = [await batcher.add_item(item) for item in ("a", "b")]
+        await batcher.shutdown()
+
+        assert processed == ["a", "b"]
+        assert all(future.done() for future in futures)
+
+
+class TestConnectionPoolConcurrency:
+    """Stress tests for ConnectionPool."""
+
+    async def test_concurrent_workers_never_exceed_max_size(self, pool):
+        """Many workers share at most max_size connections, each held by one worker at a time."""
+        in_use = 0
+        max_in_use = 0
+
+        async def worker():
+            nonlocal in_use, max_in_use
+            for _ in range(20):
+                async with pool.get_connection() as connection:
+                    assert not connection.in_use
+                    connection.in_use = True
+                    in_use += 1
+                    max_in_use = max(max_in_use, in_use)
+                    await asyncio.sleep(random.uniform(0, 0.002))  # noqa: S311
+                    in_use -= 1
+                    connection.in_use = False
+
+        await asyncio.gather(*(worker() for _ in range(50)))
+
+        stats = pool.get_stats()
+        assert max_in_use == pool.max_size
+        assert stats["created"] == pool.max_size
+        assert stats["acquired"] == 1000
+        assert stats["active"] == 0
+        assert stats["idle"] == pool.max_size
+        assert stats["wait"]["count"] == 1000
+        assert stats["wait"]["max"] > 0
+
+    async def test_acquire_times_out_when_exhausted(self, pool):
+        """Acquire waits at most ``timeout`` seconds for a release."""
+        pool.timeout = 0.05
+        connections = [await pool.acquire() for _ in range(pool.max_size)]
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            await pool.acquire()
+
+        assert time.perf_counter() - start >= 0.05
+        assert pool.get_stats()["timeouts"] == 1
+
+        # A release hands the connection to the next waiter
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        await pool.release(connections[0])
+        assert await waiter is connections[0]
+
+    async def test_unhealthy_idle_connections_are_replaced(self, pool):
+        """Idle connections failing the health check are closed and not handed out."""
+
+        async def health_check(connection):
+            return connection.id % 2 == 0
+
+        pool.set_health_check(health_check)
+        first, second = await pool.acquire(), await pool.acquire()
+        await pool.release(first)
+        await pool.release(second)
+
+        connections = [await pool.acquire(), await pool.acquire()]
+
+        unhealthy = first if first.id % 2 else second
+        assert unhealthy.closed
+        assert unhealthy not in connections
+        assert pool.get_stats()["health_check_failures"] == 1
+
+    async def test_idle_connections_are_evicted(self, pool):
+        """Connections idle longer than max_idle_time are closed instead of reused."""
+        pool.max_idle_time = 0.02
+        connection = await pool.acquire()
+        await pool.release(connection)
+        await asyncio.sleep(0.05)
+
+        replacement = await pool.acquire()
+
+        assert connection.closed
+        assert replacement is not connection
+        assert pool.get_stats()["idle_evictions"] == 1
+
+    async def test_close_all_with_checked_out_connections(self, pool):
+        """Connections out during close_all are closed on release and their capacity is reclaimed."""
+        held = [await pool.acquire() for _ in range(pool.max_size)]
+        idle = held.pop()
+        await pool.release(idle)
+
+        await pool.close_all()
+
+        assert idle.closed
+        fresh = [await pool.acquire() for _ in range(pool.max_size)]
+        for connection in held:
+            await pool.release(connection)
+            assert connection.closed
+        assert pool.active_connections == pool.max_size
+        assert not any(connection.closed for connection in fresh)
+
+    async def test_factory_failure_releases_capacity(self, pool):
+        """A connection that fails to open does not leak a pool slot."""
+        attempts = 0
+
+        async def flaky_factory():
+            nonlocal attempts
+            attempts += 1
+            if attempts <= pool.max_size:
+                raise ConnectionError("refused")
+            return FakeConnection()
+
+        pool.set_connection_factory(flaky_factory)
+        for _ in range(pool.max_size):
+            with pytest.raises(ConnectionError):
+                await pool.acquire()
+
+        assert isinstance(await pool.acquire(), FakeConnection)
+
+    async def test_shared_connection_is_tracked_per_checkout(self, pool):
+        """A factory handing out one shared object gets a slot per checkout, and it stays open while held."""
+        shared = FakeConnection()
+
+        async def shared_factory():
+            return shared
+
+        pool.set_connection_factory(shared_factory)
+        pool.max_idle_time = 0
+        first = await pool.acquire()
+        async with pool.get_connection() as second:
+            assert second is first
+            assert pool.active_connections == 2
+
+            await pool.release(first)
+            assert pool.active_connections == 1
+            assert not shared.closed
+
+        assert pool.active_connections == 0
+        assert pool.get_stats()["acquired"] == 2
@@ -23,95 +23,63 @@ class TestAsyncBatcherCoverageGaps:
         await batcher.shutdown()
 
     async def test_add_operation_method(self, async_batcher):
-        """Test add_operation method with 0% coverage."""
+        """Test add_operation returns the caller's own result."""
 
-        # Create async operations for testing
         async def mock_op1(*args, **kwargs):
             return f"result1-{args[0] if args else 'no-args'}"
 
-        async def mock_op2(*args, **kwargs):
-            return f"result2-{args[0] if args else 'no-args'}"
-
-        # Test adding single operation (should timeout and execute)
+        # A single operation is flushed when the interval expires
         result1 = await async_batcher.add_operation(mock_op1, "arg1")
 
-        # Verify first operation result (batch executed due to timeout)
-        assert result1 == ["result1-arg1"]
-
-        # Test adding operation that triggers batch size limit
-        # Add operations up to batch size
-        async def simple_op(*args, **kwargs):
-            return f"batch-{args[0] if args else 'default'}"
-
-        # Fill up to batch size - 1
-        for i in range(async_batcher.batch_size - 1):
-            async_batcher.pending_operations.append((simple_op, (f"item{i}",), {}))
-
-        # This should trigger immediate batch execution
-        result2 = await async_batcher.add_operation(mock_op2, "trigger")
+        assert result1 == "result1-arg1"
+        assert async_batcher.stats["deadline_flushes"] == 1
 
-        # Verify batch was executed
-        assert len(result2) == async_batcher.batch_size  # batch_size operations total
+    async def test_add_operation_concurrent_callers(self, async_batcher):
+        """Test concurrent callers share a batch and each get their own result."""
 
-    async def test_execute_batch_method(self, async_batcher):
-        """Test _execute_batch method with 0% coverage."""
-
-        # Create async mock operations that accept arguments
-        async def mock_op1(*args, **kwargs):
-            return f"result1-{args[0] if args else 'no-args'}"
+        async def simple_op(value, suffix=""):
+            return f"batch-{value}{suffix}"
 
-        async def mock_op2(*args, **kwargs):
-            return f"result2-{args[0] if args else 'no-args'}"
+        results = await asyncio.gather(
+            *(async_batcher.add_operation(simple_op, f"item{i}", suffix="!") for i in range(async_batcher.batch_size)),
+        )
 
-        # Add operations directly to pending list
-        async_batcher.pending_operations = [(mock_op1, ("arg1",), {}), (mock_op2, ("arg2",), {})]
+        assert results == [f"batch-item{i}!" for i in range(async_batcher.batch_size)]
+        assert async_batcher.stats["batches"] == 1
+        assert async_batcher.stats["size_flushes"] == 1
 
-        # Execute batch
-        results = await async_batcher._execute_batch()
+    async def test_flush_without_pending(self, async_batcher):
+        """Test flush with no pending entries."""
+        await async_batcher.flush()
 
-        # Verify batch execution
-        assert len(results) == 2
-        assert results[0] == "result1-arg1"
-        assert results[1] == "result2-arg2"
-        assert async_batcher.pending_operations == []
-
-    async def test_execute_batch_empty(self, async_batcher):
-        """Test _execute_batch with empty operations."""
-        # Test with no pending operations
-        results = await async_batcher._execute_batch()
-
-        # Should return empty list
-        assert results == []
+        assert async_batcher.pending == 0
+        assert async_batcher.stats["batches"] == 0
 
     async def test_add_operation_batch_size_trigger(self, async_batcher):
-        """Test add_operation triggering batch execution when batch_size reached."""
+        """Test a full batch is flushed without waiting for the interval."""
+        async_batcher.flush_interval = 10.0
 
-        # Create async mock operations
         async def mock_op_async():
             return "async_result"
 
-        # Add operations up to batch size
-        for _ in range(3):  # batch_size is 3
-            async_batcher.pending_operations.append((mock_op_async, (), {}))
-
-        # This should trigger batch execution
-        await async_batcher.add_operation(mock_op_async)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(async_batcher.add_operation(mock_op_async) for _ in range(3))),
+            timeout=1.0,
+        )
 
-        # Verify batch was executed (pending operations cleared)
-        assert len(async_batcher.pending_operations) == 0
+        assert results == ["async_result"] * 3
+        assert async_batcher.pending == 0
 
-    async def test_add_operation_timeout_trigger(self, async_batcher):
-        """Test add_operation triggering batch execution on timeout."""
+    async def test_add_operation_after_shutdown(self, async_batcher):
+        """Test operations are rejected once the batcher is shut down."""
 
-        # Create async mock operation
         async def mock_op_async():
             return "timeout_result"
 
-        # Add single operation (below batch_size)
-        result = await async_batcher.add_operation(mock_op_async)
+        await async_batcher.shutdown()
 
-        # Should execute after timeout (max_wait_time)
-        assert result is not None or len(async_batcher.pending_operations) == 0
+        with pytest.raises(RuntimeError, match="shut down"):
+            await async_batcher.add_operation(mock_op_async)
 
 
 class TestPerformanceOptimizerCoverageGaps:
@@ -283,10 +251,9 @@ class TestAsyncBatcherAdvanced:
     """Test advanced AsyncBatcher functionality."""
 
     async def test_batcher_with_exceptions(self):
-        """Test AsyncBatcher handling operations that raise exceptions."""
+        """Test each caller gets its own operation's exception or result."""
         batcher = AsyncBatcher(batch_size=2, flush_interval=0.1)
 
-        # Create operations that raise exceptions
         async def failing_op():
             raise ValueError("Operation failed")
 
@@ -294,39 +261,32 @@ class TestAsyncBatcherAdvanced:
             return "success"
 
         try:
-            # Add operations to pending list
-            batcher.pending_operations = [(failing_op, (), {}), (succeeding_op, (), {})]
+            results = await asyncio.gather(
+                batcher.add_operation(failing_op),
+                batcher.add_operation(succeeding_op),
+                return_exceptions=True,
+            )
 
-            # Execute batch
-            results = await batcher._execute_batch()
-
-            # Should handle both success and failure
-            assert len(results) == 2
             assert isinstance(results[0], ValueError)
             assert results[1] == "success"
+            assert batcher.stats["batches"] == 1
 
         finally:
             await batcher.shutdown()
 
     async def test_batcher_large_batch(self):
-        """Test AsyncBatcher with large batch size."""
+        """Test operations beyond the batch size are split into full batches."""
         batcher = AsyncBatcher(batch_size=100, flush_interval=0.1)
 
         async def mock_operation(value):
             return f"processed_{value}"
 
         try:
-            # Add many operations
-            operations = [(mock_operation, (i,), {}) for i in range(50)]
-            batcher.pending_operations = operations
-
-            # Execute batch
-            results = await batcher._execute_batch()
+            results = await asyncio.gather(*(batcher.add_operation(mock_operation, i) for i in range(250)))
 
-            # Verify all operations processed
-            assert len(results) == 50
-            for i, result in enumerate(results):
-                assert result == f"processed_{i}"
+            assert results == [f"processed_{i}" for i in range(250)]
+            assert batcher.stats["batches"] == 3
+            assert batcher.stats["size_flushes"] == 2
 
         finally:
             await batcher.shutdown()
@@ -369,15 +329,11 @@ async def test_async_batcher_configurations(batch_size, flush_interval):
         return "test_result"
 
     try:
-        # Add operation to pending list
-        batcher.pending_operations = [(test_operation, (), {})]
-
-        # Execute batch
-        results = await batcher._execute_batch()
+        result = await batcher.add_operation(test_operation)
 
         # Verify configuration works
-        assert len(results) == 1
-        assert results[0] == "test_result"
+        assert result == "test_result"
+        assert batcher.max_pending == batch_size * 4
 
     finally:
         await batcher.shutdown()
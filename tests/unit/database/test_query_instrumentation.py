@@ -0,0 +1,155 @@
+"""Unit tests for SQLAlchemy query instrumentation."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.database.connection import DatabaseManager
+from src.database.query_instrumentation import (
+    QueryInstrumentation,
+    fingerprint_statement,
+    get_current_scope,
+    query_scope,
+)
+from src.utils.metrics_registry import get_metrics_registry
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """File-backed aiosqlite engine with a small table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"))
+        await conn.execute(text("INSERT INTO users (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+    yield engine
+    await engine.dispose()
+
+
+class TestFingerprintStatement:
+    """Test cases for fingerprint_statement."""
+
+    def test_literals_and_parameters_are_normalized(self):
+        """Statements differing only in values share a fingerprint."""
+        first = fingerprint_statement("SELECT * FROM users WHERE id = 1 AND name = 'bob' -- lookup")
+        second = fingerprint_statement("SELECT *\n  FROM users WHERE id = :id_1 AND name = $2")
+
+        assert first == second == "SELECT * FROM users WHERE id = ? AND name = ?"
+
+    def test_in_lists_and_casts(self):
+        """IN lists of any length collapse; PostgreSQL casts are kept."""
+        assert fingerprint_statement("SELECT id FROM t WHERE id IN (?, ?, ?) AND x = %(x)s::text") == (
+            "SELECT id FROM t WHERE id IN (...) AND x = ?::text"
+        )
+        assert fingerprint_statement("SELECT id FROM t2 WHERE id IN (1, 2)") == "SELECT id FROM t2 WHERE id IN (...)"
+
+
+class TestQueryInstrumentation:
+    """Test cases for QueryInstrumentation on an aiosqlite engine."""
+
+    async def test_records_latency_per_fingerprint(self, engine):
+        """Executions with different parameters are aggregated under one fingerprint."""
+        instrumentation = QueryInstrumentation()
+        instrumentation.attach(engine)
+
+        async with engine.connect() as conn:
+            for user_id in (1, 2, 3):
+                await conn.execute(text("SELECT name FROM users WHERE id = :id"), {"id": user_id})
+
+        stats = instrumentation.get_stats()
+        top = stats["top_fingerprints"][0]
+        assert stats["queries"] == 3
+        assert top["fingerprint"] == "SELECT name FROM users WHERE id = ?"
+        assert top["operation"] == "select"
+        assert top["count"] == 3
+        assert top["p95_seconds"] >= top["p50_seconds"] > 0
+        assert stats["pool_wait"]["count"] == 1
+
+        exposition = get_metrics_registry().render_text()
+        assert f'promptcraft_database_query_duration_seconds_count{{fingerprint="{top["fingerprint_id"]}"' in exposition
+
+    async def test_errors_and_slow_queries(self, engine):
+        """Failed statements count as errors; slow ones are counted and logged."""
+        instrumentation = QueryInstrumentation(slow_query_seconds=0.0)
+        instrumentation.attach(engine)
+
+        async with engine.connect() as conn:
+            with pytest.raises(Exception, match="no such table"):
+                await conn.execute(text("SELECT * FROM missing"))
+
+        (top,) = instrumentation.get_stats()["top_fingerprints"]
+        assert top["errors"] == 1
+        assert top["slow"] == 1
+
+    async def test_n_plus_one_detected_once_per_scope(self, engine):
+        """Repeating a fingerprint in one scope is flagged once, pool wait is kept apart."""
+        instrumentation = QueryInstrumentation(n_plus_one_threshold=3)
+        instrumentation.attach(engine)
+
+        with query_scope("GET /users") as scope:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT id FROM users"))
+                for user_id in range(5):
+                    await conn.execute(text("SELECT name FROM users WHERE id = :id"), {"id": user_id})
+
+        assert get_current_scope() is None
+        assert scope.queries == 6
+        assert scope.n_plus_one == ["SELECT name FROM users WHERE id = ?"]
+        assert scope.pool_wait_seconds > 0
+        assert scope.execution_seconds > 0
+        assert instrumentation.get_stats()["n_plus_one_detections"] == 1
+
+    async def test_scopes_are_isolated_between_tasks(self, engine):
+        """Concurrent requests each count their own statements."""
+        instrumentation = QueryInstrumentation(n_plus_one_threshold=3)
+        instrumentation.attach(engine)
+
+        async def request(repeats: int):
+            with query_scope("request") as scope:
+                async with engine.connect() as conn:
+                    for _ in range(repeats):
+                        await conn.execute(text("SELECT 1"))
+            return scope
+
+        light, heavy = await asyncio.gather(request(2), request(4))
+
+        assert (light.queries, light.n_plus_one) == (2, [])
+        assert (heavy.queries, heavy.n_plus_one) == (4, ["SELECT ?"])
+
+    async def test_detach(self, engine):
+        """Detached engines are no longer instrumented."""
+        instrumentation = QueryInstrumentation()
+        instrumentation.attach(engine)
+        instrumentation.detach()
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        assert instrumentation.get_stats()["queries"] == 0
+
+
+class TestDatabaseManagerInstrumentation:
+    """Test cases for DatabaseManager query statistics."""
+
+    async def test_query_and_pool_stats(self, engine, mock_settings):
+        """Injected instrumentation is attached and reported."""
+        instrumentation = QueryInstrumentation()
+        manager = DatabaseManager(
+            settings=mock_settings,
+            engine=engine,
+            session_factory=async_sessionmaker(bind=engine, class_=AsyncSession),
+            instrumentation=instrumentation,
+        )
+
+        async with manager.get_session() as session:
+            await session.execute(text("SELECT count(*) FROM users"))
+
+        stats = manager.get_query_stats()
+        assert stats["enabled"] is True
+        assert stats["top_fingerprints"][0]["fingerprint"] == "SELECT count(*) FROM users"
+        assert (await manager.get_pool_status())["wait"]["count"] == 1
+
+    def test_disabled_without_instrumentation(self, mock_settings):
+        """Managers without instrumentation report it as disabled."""
+        assert DatabaseManager(settings=mock_settings).get_query_stats() == {"enabled": False}
@@ -0,0 +1,266 @@
+"""Unit tests for hedged OpenRouter requests.
+
+The client tests run against a local fake OpenRouter server that delays
+completions per model, so hedging is exercised over real HTTP connections.
+"""
+
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.config.settings import ApplicationSettings
+from src.mcp_integration.mcp_client import WorkflowStep
+from src.mcp_integration.model_registry import ModelCapabilities, ModelRegistry
+from src.mcp_integration.openrouter_client import OpenRouterClient
+from src.mcp_integration.request_hedging import HedgeOutcome, HedgingConfig, RequestHedger
+
+
+SLOW_MODEL = "slow/model:free"
+FAST_MODEL = "fast/model:free"
+
+
+def _hedger(**overrides) -> RequestHedger:
+    config = {"min_samples": 3, "min_delay_seconds": 0.01, "budget_ratio": 1.0, "budget_burst": 1.0}
+    config.update(overrides)
+    return RequestHedger(HedgingConfig(**config))
+
+
+async def _answer(value: str, delay: float) -> str:
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail(delay: float) -> str:
+    await asyncio.sleep(delay)
+    raise RuntimeError("request failed")
+
+
+class FakeOpenRouterServer:
+    """Minimal HTTP/1.1 server answering /models and /chat/completions with per-model delays."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.requests: list[str] = []
+        self.cancelled: list[str] = []
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self) -> "FakeOpenRouterServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while request_line := await reader.readline():
+                method, path, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, value = line.decode().split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                if method == "GET" and path.endswith("/models"):
+                    payload = {"data": [{"id": model} for model in self.delays]}
+                else:
+                    model = json.loads(body)["model"]
+                    self.requests.append(model)
+                    # Answer after the model's delay unless the client hangs up first
+                    try:
+                        if await asyncio.wait_for(reader.read(1), timeout=self.delays[model]) == b"":
+                            self.cancelled.append(model)
+                            return
+                    except TimeoutError:
+                        pass
+                    payload = {
+                        "choices": [{"message": {"content": f"answer from {model}"}, "finish_reason": "stop"}],
+                        "usage": {"total_tokens": 10},
+                    }
+
+                data = json.dumps(payload).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(data)}\r\n\r\n".encode()
+                    + data,
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _client(base_url: str, hedging: HedgingConfig | None) -> OpenRouterClient:
+    settings = Mock(spec=ApplicationSettings)
+    settings.openrouter_api_key = None
+    settings.openrouter_base_url = base_url
+    settings.circuit_breaker_enabled = False
+
+    registry = Mock(spec=ModelRegistry)
+    registry.select_best_model_for_tier.return_value = SLOW_MODEL
+    registry.get_model_capabilities.return_value = Mock(spec=ModelCapabilities, fallback_models=[FAST_MODEL])
+    registry.is_model_available.return_value = True
+    registry.can_user_access_model.return_value = True
+
+    with (
+        patch("src.mcp_integration.openrouter_client.get_settings", return_value=settings),
+        patch("src.mcp_integration.openrouter_client.get_model_registry", return_value=registry),
+    ):
+        return OpenRouterClient(api_key="test-key", hedging=hedging)
+
+
+def _step(index: int) -> WorkflowStep:
+    return WorkflowStep(
+        step_id=f"step-{index}",
+        agent_id="test_agent",
+        input_data={"query": "What is hedging?", "user_tier": "full"},
+        timeout_seconds=5.0,
+    )
+
+
+class TestRequestHedger:
+    """Test cases for RequestHedger."""
+
+    def test_delay_requires_min_samples(self):
+        """No delay is learned until enough latencies are recorded."""
+        hedger = _hedger(min_samples=3, min_delay_seconds=0.0)
+        hedger.record_latency("model", 0.1)
+        hedger.record_latency("model", 0.2)
+
+        assert hedger.hedge_delay("model") is None
+        assert hedger.hedge_delay("unknown") is None
+
+        hedger.record_latency("model", 0.3)
+        assert hedger.hedge_delay("model") == pytest.approx(0.3, rel=0.05)
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        """A primary answering before the delay never sends a hedge."""
+        hedger = _hedger()
+        hedge_calls = []
+
+        result, outcome = await hedger.run(
+            lambda: _answer("primary", 0.0),
+            lambda: hedge_calls.append(1) or _answer("hedge", 0.0),
+            delay=0.5,
+        )
+
+        assert (result, outcome) == ("primary", HedgeOutcome.NOT_HEDGED)
+        assert hedge_calls == []
+        assert hedger.stats()["hedges_fired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_primary_is_cancelled(self):
+        """The first success wins and the slower request is cancelled."""
+        hedger = _hedger()
+        primary = asyncio.Event()
+
+        async def slow_primary() -> str:
+            try:
+                await asyncio.sleep(5.0)
+            except asyncio.CancelledError:
+                primary.set()
+                raise
+            return "primary"
+
+        result, outcome = await hedger.run(slow_primary, lambda: _answer("hedge", 0.0), delay=0.01)
+
+        assert (result, outcome) == ("hedge", HedgeOutcome.HEDGE_WON)
+        assert primary.is_set()
+        assert hedger.stats()["hedge_win_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_falls_back_to_primary(self):
+        """A hedge that fails does not hide a successful primary."""
+        hedger = _hedger()
+
+        result, outcome = await hedger.run(lambda: _answer("primary", 0.05), lambda: _fail(0.0), delay=0.01)
+
+        assert (result, outcome) == ("primary", HedgeOutcome.PRIMARY_WON)
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises(self):
+        """If both requests fail, the error is raised."""
+        with pytest.raises(RuntimeError, match="request failed"):
+            await _hedger().run(lambda: _fail(0.03), lambda: _fail(0.0), delay=0.01)
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_extra_requests(self):
+        """Hedges stop once the budget is spent and resume as primaries earn tokens."""
+        hedger = _hedger(budget_ratio=0.5, budget_burst=1.0)
+
+        outcomes = [
+            (await hedger.run(lambda: _answer("primary", 0.03), lambda: _answer("hedge", 0.0), delay=0.01))[1]
+            for _ in range(4)
+        ]
+
+        assert outcomes == [
+            HedgeOutcome.HEDGE_WON,
+            HedgeOutcome.BUDGET_EXHAUSTED,
+            HedgeOutcome.HEDGE_WON,
+            HedgeOutcome.BUDGET_EXHAUSTED,
+        ]
+        stats = hedger.stats()
+        assert stats["hedge_rate"] == 0.5
+        assert stats["budget_exhausted"] == 2
+
+    def test_invalid_config(self):
+        """Percentile bounds are validated."""
+        with pytest.raises(ValueError, match="percentile"):
+            HedgingConfig(percentile=100.0)
+
+
+class TestOpenRouterClientHedging:
+    """Test cases for hedged requests in OpenRouterClient against a fake server."""
+
+    @pytest.mark.asyncio
+    async def test_slow_model_is_hedged_to_fallback(self):
+        """Once the slow model's percentile is learned, a slow request is answered by the fallback."""
+        async with FakeOpenRouterServer({SLOW_MODEL: 0.05, FAST_MODEL: 0.0}) as server:
+            client = _client(server.base_url, _hedger(min_delay_seconds=0.01, budget_burst=5.0).config)
+            await client.connect()
+            try:
+                # Warm up the slow model's latency percentile without hedging
+                for index in range(3):
+                    response = await client._execute_single_step(_step(index))
+                    assert response.metadata["model_id"] == SLOW_MODEL
+                    assert "hedged" not in response.metadata
+
+                server.delays[SLOW_MODEL] = 1.0
+                response = await client._execute_single_step(_step(3))
+                await asyncio.sleep(0.05)
+            finally:
+                await client.disconnect()
+
+        assert response.metadata["model_id"] == FAST_MODEL
+        assert response.metadata["hedged"] is True
+        assert response.metadata["hedge_won"] is True
+        assert response.content == f"answer from {FAST_MODEL}"
+        assert server.cancelled == [SLOW_MODEL]
+        stats = client.get_hedging_stats()
+        assert stats["hedges_fired"] == 1
+        assert stats["hedges_won"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hedging_disabled_by_default(self):
+        """Without a hedging config, requests go only to the selected model."""
+        async with FakeOpenRouterServer({SLOW_MODEL: 0.02, FAST_MODEL: 0.0}) as server:
+            client = _client(server.base_url, None)
+            await client.connect()
+            try:
+                response = await client._execute_single_step(_step(0))
+            finally:
+                await client.disconnect()
+
+        assert response.metadata["model_id"] == SLOW_MODEL
+        assert server.requests == [SLOW_MODEL]
+        assert client.get_hedging_stats() == {"enabled": False}
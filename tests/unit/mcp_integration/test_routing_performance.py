@@ -0,0 +1,80 @@
+"""Unit tests for decaying routing performance estimates."""
+
+import pytest
+
+from src.mcp_integration.routing_performance import (
+    AdaptiveRoutingConfig,
+    BackendPerformanceTracker,
+    DecayingEstimate,
+    adaptive_share,
+)
+
+
+def _estimate(latency: float, error_rate: float = 0.0, samples: int = 10, now: float = 0.0) -> DecayingEstimate:
+    estimate = DecayingEstimate(half_life_seconds=60.0)
+    failures = round(samples * error_rate)
+    for index in range(samples):
+        estimate.record(latency, index >= failures, now)
+    return estimate
+
+
+class TestDecayingEstimate:
+    """Test cases for DecayingEstimate."""
+
+    def test_recent_observations_dominate(self):
+        """Older observations lose half their weight each half-life."""
+        estimate = DecayingEstimate(half_life_seconds=10.0)
+        estimate.record(1.0, True, now=0.0)
+        estimate.record(3.0, False, now=10.0)
+
+        # The first observation carries weight 0.5 against 1.0 for the second
+        assert estimate.latency == pytest.approx((0.5 * 1.0 + 3.0) / 1.5)
+        assert estimate.error_rate == pytest.approx(1.0 / 1.5)
+        assert estimate.current_weight(now=20.0) == pytest.approx(0.75)
+
+    def test_expected_cost_includes_failures(self):
+        """A backend failing half its requests costs twice its latency."""
+        assert _estimate(1.0, error_rate=0.5).expected_cost == pytest.approx(2.0)
+
+
+class TestBackendPerformanceTracker:
+    """Test cases for BackendPerformanceTracker."""
+
+    def test_services_and_models_are_tracked_separately(self):
+        """Service and model outcomes update independent estimates."""
+        tracker = BackendPerformanceTracker(half_life_seconds=30.0)
+        tracker.record_service("openrouter", 0.8, True, now=0.0)
+        tracker.record_model("test/model:free", 0.5, False, now=0.0)
+
+        assert tracker.service_estimate("openrouter").latency == 0.8
+        assert tracker.model_estimate("test/model:free").error_rate == 1.0
+        assert tracker.service_estimate("mcp") is None
+        assert set(tracker.to_dict(now=0.0)["models"]) == {"test/model:free"}
+
+
+class TestAdaptiveShare:
+    """Test cases for adaptive_share."""
+
+    config = AdaptiveRoutingConfig(min_samples=5.0, max_shift=0.5)
+
+    def test_baseline_without_estimates(self):
+        """Missing or stale estimates keep the baseline split."""
+        assert adaptive_share(1.0, 1.0, None, _estimate(1.0), self.config, now=0.0) == 1.0
+        # After ten half-lives the estimates no longer have enough weight
+        assert adaptive_share(1.0, 1.0, _estimate(5.0), _estimate(1.0), self.config, now=600.0) == 1.0
+
+    def test_shift_is_proportional_and_bounded(self):
+        """Traffic moves by max_shift times the relative advantage."""
+        share = adaptive_share(1.0, 1.0, _estimate(4.0), _estimate(1.0), self.config, now=0.0)
+
+        assert share == pytest.approx(1.0 - 0.5 * 0.75)
+
+    def test_ceiling_is_honored(self):
+        """A faster OpenRouter never receives more than the ceiling."""
+        assert adaptive_share(0.2, 0.3, _estimate(0.1), _estimate(10.0), self.config, now=0.0) == 0.3
+        assert adaptive_share(0.5, 0.3, None, None, self.config, now=0.0) == 0.3
+
+    def test_invalid_config(self):
+        """Bounds are validated."""
+        with pytest.raises(ValueError, match="max_shift"):
+            AdaptiveRoutingConfig(max_shift=1.5)
@@ -22,7 +22,8 @@ import json
 import os
 from pathlib import Path
 import tempfile
-from unittest.mock import Mock, patch
+import time
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -762,6 +763,152 @@ class TestSmartMCPDiscovery:
         assert url is None
 
 
+class TestConcurrentDiscovery:
+    """Test concurrent probing, negative caching and background revalidation."""
+
+    @pytest.fixture
+    def discovery_system(self):
+        """Discovery with short timeouts and every strategy finding nothing by default."""
+        with patch("docker.from_env", side_effect=Exception("Docker not available")):
+            discovery = SmartMCPDiscovery(probe_timeout=0.2)
+
+        async def nothing(server_name):
+            return None
+
+        for name in SmartMCPDiscovery.discovery_strategies:
+            setattr(discovery, name, nothing)
+        return discovery
+
+    @staticmethod
+    def _connection(url="http://localhost:8000"):
+        return ServerConnection(
+            url=url,
+            type="external",
+            health_status="healthy",
+            resource_usage={},
+            discovered_at=utc_now(),
+        )
+
+    async def test_first_healthy_probe_wins_and_cancels_the_rest(self, discovery_system):
+        """A fast strategy returns without waiting for slow ones, which are cancelled."""
+        connection = self._connection()
+        cancelled = asyncio.Event()
+
+        async def slow(server_name):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fast(server_name):
+            await asyncio.sleep(0.01)
+            return connection
+
+        discovery_system.check_known_ports = slow
+        discovery_system.check_env_variables = fast
+
+        with patch.object(discovery_system, "verify_health", return_value=True):
+            result = await asyncio.wait_for(discovery_system.find_existing_deployment("zen-mcp"), timeout=1.0)
+
+        assert result is connection
+        assert cancelled.is_set()
+
+    async def test_simultaneous_results_prefer_strategy_priority(self, discovery_system):
+        """When several probes finish together, the earlier strategy wins."""
+        by_port, by_env = self._connection("http://localhost:8001"), self._connection("http://localhost:8002")
+
+        async def ports(server_name):
+            return by_port
+
+        async def env(server_name):
+            return by_env
+
+        discovery_system.check_known_ports = ports
+        discovery_system.check_env_variables = env
+
+        with patch.object(discovery_system, "verify_health", return_value=True):
+            assert await discovery_system.find_existing_deployment("zen-mcp") is by_port
+
+    async def test_probe_timeout_is_not_negatively_cached(self, discovery_system):
+        """A hung strategy is abandoned after the probe timeout and retried next time."""
+        calls = 0
+
+        async def hung(server_name):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(10)
+
+        discovery_system.check_known_ports = hung
+
+        for _ in range(2):
+            assert await asyncio.wait_for(discovery_system.find_existing_deployment("zen-mcp"), timeout=1.0) is None
+        assert calls == 2
+
+    async def test_negative_cache_skips_recent_misses(self, discovery_system):
+        """Strategies that found nothing are skipped until the negative cache expires or is bypassed."""
+        calls = []
+
+        async def miss(server_name):
+            calls.append(server_name)
+
+        async def unhealthy(server_name):
+            calls.append(server_name)
+            return self._connection()
+
+        discovery_system.check_known_ports = miss
+        discovery_system.check_lock_files = unhealthy
+
+        with patch.object(discovery_system, "verify_health", return_value=False):
+            await discovery_system.find_existing_deployment("zen-mcp")
+            await discovery_system.find_existing_deployment("zen-mcp")
+            assert calls == ["zen-mcp", "zen-mcp"]
+
+            await discovery_system.find_existing_deployment("zen-mcp", use_negative_cache=False)
+            assert len(calls) == 4
+
+            discovery_system.clear_negative_cache("zen-mcp")
+            await discovery_system.find_existing_deployment("zen-mcp")
+            assert len(calls) == 6
+
+    async def test_cache_hit_revalidates_in_background(self, discovery_system):
+        """A stale cached connection is returned at once and evicted once found unhealthy."""
+        connection = self._connection()
+        discovery_system.deployment_cache["zen-mcp"] = connection
+        checked = asyncio.Event()
+
+        def slow_unhealthy(conn):
+            time.sleep(0.1)
+            return False
+
+        with patch.object(discovery_system, "verify_health", side_effect=slow_unhealthy):
+            start = time.perf_counter()
+            assert discovery_system.get_cached_connection("zen-mcp") is connection
+            assert discovery_system.get_cached_connection("zen-mcp") is connection
+            assert time.perf_counter() - start < 0.05
+
+            revalidation = discovery_system._revalidations["zen-mcp"]
+            revalidation.add_done_callback(lambda _: checked.set())
+            await checked.wait()
+
+        assert "zen-mcp" not in discovery_system.deployment_cache
+        assert discovery_system.get_cached_connection("zen-mcp") is None
+
+    async def test_recently_verified_cache_hit_skips_health_check(self, discovery_system):
+        """Connections verified within the revalidation interval are not checked again."""
+        connection = self._connection()
+        with patch.object(discovery_system, "verify_health", return_value=True) as verify:
+            discovery_system.check_env_variables = AsyncMock(return_value=connection)
+            with patch.object(discovery_system.resource_monitor, "get_available_memory", return_value=4096):
+                assert await discovery_system.discover_server("zen-mcp") is connection
+            verify.reset_mock()
+
+            assert discovery_system.get_cached_connection("zen-mcp") is connection
+
+        verify.assert_not_called()
+        assert discovery_system._revalidations == {}
+
+
 class TestResourceError:
     """Test ResourceError exception."""
 
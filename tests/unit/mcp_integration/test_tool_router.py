@@ -82,9 +82,9 @@ class TestPromptCraftToolExecutor:
     """Test PromptCraftToolExecutor."""
     
     @pytest.fixture
-    def executor(self):
+    def executor(self, tmp_path):
         """Create executor fixture."""
-        return PromptCraftToolExecutor()
+        return PromptCraftToolExecutor(search_index_path=tmp_path / "index" / "search.db")
     
     def test_executor_initialization(self, executor):
         """Test executor initialization."""
@@ -280,6 +280,26 @@ class TestPromptCraftToolExecutor:
             result = await executor.execute_search("test", limit=3)
         
         assert result["resultCount"] <= 3
+    
+    @pytest.mark.asyncio
+    async def test_execute_search_ranks_with_index(self, tmp_path):
+        """Test search ranks indexed documents and sees file changes."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("# Retries\nretry retry with backoff")
+        (docs / "b.md").write_text("A single retry note")
+        executor = PromptCraftToolExecutor(search_root=docs, search_index_path=tmp_path / "search.db")
+        
+        result = await executor.execute_search("retry")
+        
+        content_text = result["content"][0]["text"]
+        assert result["resultCount"] == 2
+        assert content_text.index("a.md:2") < content_text.index("b.md:1")
+        
+        (docs / "c.md").write_text("Circuit breaker recovery")
+        executor._get_search_index().refresh()
+        result = await executor.execute_search('"circuit breaker"')
+        assert result["resultCount"] == 1
 
 
 class TestMCPToolRouter:
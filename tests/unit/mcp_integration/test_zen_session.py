@@ -0,0 +1,187 @@
+"""Unit tests for the shared Zen MCP session."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.mcp_integration.mcp_client import MCPError
+from src.mcp_integration.zen_session import ZenSession, prompt_fingerprint
+
+
+def make_client(connect: bool = True, healthy: bool = True) -> MagicMock:
+    """Create a ZenStdioMCPClient stand-in."""
+    client = MagicMock()
+    client.connect = AsyncMock(return_value=connect)
+    client.disconnect = AsyncMock(return_value=True)
+    client.health_check = AsyncMock(return_value=MagicMock(metadata={"server_healthy": healthy}))
+    client.get_model_recommendations = AsyncMock(return_value=MagicMock(task_type="general"))
+    client.execute_with_routing = AsyncMock(return_value={"success": True, "result": {"content": "ok"}})
+    return client
+
+
+class TestPromptFingerprint:
+    """Test cases for prompt_fingerprint."""
+
+    def test_whitespace_is_ignored(self):
+        """Prompts differing only in whitespace share a fingerprint."""
+        assert prompt_fingerprint("  explain\n  recursion ") == prompt_fingerprint("explain recursion")
+        assert prompt_fingerprint("explain recursion") != prompt_fingerprint("explain iteration")
+
+
+class TestZenSession:
+    """Test cases for ZenSession."""
+
+    async def test_connection_is_reused(self):
+        """A verified connection is reused without a health check."""
+        client = make_client()
+        session = ZenSession(client)
+
+        assert await session.ensure_connected()
+        assert await session.ensure_connected()
+
+        client.connect.assert_awaited_once()
+        client.health_check.assert_not_awaited()
+        assert session.get_stats()["connects"] == 1
+
+    async def test_stale_connection_is_health_checked(self):
+        """After the interval the connection is re-verified, not reconnected."""
+        client = make_client()
+        session = ZenSession(client, health_check_interval=0.0)
+
+        assert await session.ensure_connected()
+        assert await session.ensure_connected()
+
+        client.connect.assert_awaited_once()
+        client.health_check.assert_awaited_once()
+
+    async def test_unhealthy_connection_is_replaced(self):
+        """A failed health check disconnects and reconnects."""
+        client = make_client(healthy=False)
+        session = ZenSession(client, health_check_interval=0.0)
+        await session.ensure_connected()
+
+        client.health_check.side_effect = MCPError("Not connected to server")
+        assert await session.ensure_connected()
+
+        client.disconnect.assert_awaited_once()
+        assert client.connect.await_count == 2
+        assert session.get_stats()["health_check_failures"] == 1
+
+    async def test_failed_connect_backs_off(self):
+        """Requests after a failed connect fail fast until the backoff expires."""
+        client = make_client(connect=False)
+        session = ZenSession(client, reconnect_backoff=60.0)
+
+        assert not await session.ensure_connected()
+        assert not await session.ensure_connected()
+        client.connect.assert_awaited_once()
+
+        await session.reset()
+        client.connect.return_value = True
+        assert await session.ensure_connected()
+        assert session.connected
+
+    async def test_recommendations_are_cached_by_fingerprint(self):
+        """Repeated prompts only execute; the recommendation comes from the cache."""
+        client = make_client()
+        session = ZenSession(client)
+
+        first, _ = await session.route("Summarize this article")
+        second, result = await session.route("Summarize   this article")
+
+        assert first is second
+        assert result["success"] is True
+        client.get_model_recommendations.assert_awaited_once_with("Summarize this article")
+        assert client.execute_with_routing.await_count == 2
+        assert session.get_stats()["recommendation_cache"]["hits"] == 1
+
+    async def test_recommendation_overlaps_execution(self):
+        """On a cache miss both calls are in flight at the same time."""
+        client = make_client()
+        in_flight = 0
+        peak = 0
+
+        async def slow(*_):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"success": True, "result": {}}
+
+        client.get_model_recommendations.side_effect = slow
+        client.execute_with_routing.side_effect = slow
+
+        await ZenSession(client).route("prompt")
+
+        assert peak == 2
+
+    async def test_concurrent_requests_share_one_recommendation(self):
+        """Identical prompts in flight together make a single recommendation call."""
+        client = make_client()
+
+        async def slow_recommendation(_):
+            await asyncio.sleep(0.01)
+            return MagicMock()
+
+        client.get_model_recommendations.side_effect = slow_recommendation
+        session = ZenSession(client)
+
+        results = await asyncio.gather(*(session.route("same prompt") for _ in range(5)))
+
+        client.get_model_recommendations.assert_awaited_once()
+        assert len({id(recommendation) for recommendation, _ in results}) == 1
+
+    async def test_failures_are_not_cached(self):
+        """Failed recommendations are retried and failed executions trigger re-verification."""
+        client = make_client()
+        client.get_model_recommendations.side_effect = [RuntimeError("boom"), None, MagicMock()]
+        client.execute_with_routing.return_value = {"success": False, "error": "down", "result": None}
+        session = ZenSession(client)
+        await session.ensure_connected()
+
+        for _ in range(3):
+            recommendation, result = await session.route("prompt")
+
+        assert recommendation is not None
+        assert result["success"] is False
+        assert client.get_model_recommendations.await_count == 3
+
+        await session.ensure_connected()
+        client.health_check.assert_awaited_once()
+
+    async def test_close_disconnects(self):
+        """Closing the session disconnects the client."""
+        client = make_client()
+        session = ZenSession(client)
+        await session.ensure_connected()
+
+        await session.close()
+
+        assert not session.connected
+        client.disconnect.assert_awaited_once()
+
+
+def test_session_reconnects_on_a_new_event_loop():
+    """A session reused from a fresh asyncio.run drops the old loop's connection and reconnects."""
+    client = make_client()
+    session = ZenSession(client)
+
+    assert asyncio.run(session.ensure_connected())
+    asyncio.run(session.route("prompt"))
+    assert asyncio.run(session.ensure_connected())
+
+    assert client.connect.await_count == 2
+    client.disconnect.assert_awaited_once()
+    assert session.get_stats()["loop_changes"] == 2
+
+
+@pytest.mark.parametrize("interval", [0.0, 30.0])
+async def test_route_does_not_connect(interval):
+    """Routing uses whatever connection exists; connecting is ensure_connected's job."""
+    client = make_client()
+
+    await ZenSession(client, health_check_interval=interval).route("prompt")
+
+    client.connect.assert_not_awaited()
@@ -1,5 +1,6 @@
 """Comprehensive test suite for Performance Dashboard."""
 
+import asyncio
 import json
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
@@ -10,6 +11,7 @@ from fastapi.testclient import TestClient
 
 from src.monitoring.performance_dashboard import (
     AlertManager,
+    ClientSendQueue,
     MetricsExporter,
     RealTimeDashboard,
     create_dashboard_app,
@@ -417,6 +419,7 @@ class TestRealTimeDashboard:
 
         data = {"test": "data"}
         await dashboard._broadcast_to_clients(data)
+        await dashboard.flush_clients()
 
         expected_message = json.dumps(data)
         mock_client1.send_text.assert_called_once_with(expected_message)
@@ -433,6 +436,7 @@ class TestRealTimeDashboard:
 
         data = {"test": "data"}
         await dashboard._broadcast_to_clients(data)
+        await dashboard.flush_clients()
 
         # Client1 should still receive the message
         expected_message = json.dumps(data)
@@ -442,12 +446,81 @@ class TestRealTimeDashboard:
         assert mock_client2 not in dashboard.connected_clients
         assert len(dashboard.connected_clients) == 1
 
+    @pytest.mark.asyncio
+    async def test_changed_panels(self, dashboard):
+        """Only panels whose data changed since the last tick are selected."""
+        data = await dashboard._generate_dashboard_data()
+        assert dashboard._changed_panels(data) == data
+
+        data = await dashboard._generate_dashboard_data()
+        data["alerts"] = [{**alert, "timestamp": "later"} for alert in data["alerts"]]
+        assert dashboard._changed_panels(data) == {"timestamp": data["timestamp"]}
+
+        data["system_health"] = {**data["system_health"], "total_sessions": 51}
+        assert dashboard._changed_panels(data) == {
+            "timestamp": data["timestamp"],
+            "system_health": data["system_health"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_update_loop_broadcasts_changed_panels(self, dashboard):
+        """Ticks broadcast changed panels and skip clients when nothing changed."""
+        client = AsyncMock()
+        dashboard.connected_clients = [client]
+        ticks = 0
+
+        async def sleep(_):
+            nonlocal ticks
+            ticks += 1
+            if ticks == 1:
+                dashboard.monitor.function_metrics[MockFunctionTier("tier9")] = MockTierMetrics()
+            if ticks == 3:
+                raise asyncio.CancelledError
+
+        with patch("asyncio.sleep", side_effect=sleep):
+            await dashboard._update_loop()
+        await dashboard.flush_clients()
+
+        first, second = (json.loads(call.args[0]) for call in client.send_text.call_args_list)
+        assert "system_health" in first
+        assert set(second) == {"timestamp", "tier_performance"}
+
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_for_slow_clients(self, dashboard):
+        """A stalled client is evicted after the send timeout without delaying the others."""
+        dashboard.send_timeout_seconds = 0.05
+        stalled = AsyncMock()
+        stalled.send_text.side_effect = asyncio.Event().wait
+        fast = AsyncMock()
+        dashboard.connected_clients = [stalled, fast]
+
+        await dashboard._broadcast_to_clients({"tick": 1})
+        await asyncio.sleep(0)
+        fast.send_text.assert_called_once_with('{"tick": 1}')
+
+        await dashboard.flush_clients()
+        assert dashboard.connected_clients == [fast]
+        stalled.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_remove_client_cancels_pending_sends(self, dashboard):
+        """Messages queued for a removed client are dropped."""
+        mock_websocket = AsyncMock()
+        dashboard.connected_clients = [mock_websocket]
+        await dashboard._broadcast_to_clients({"tick": 1})
+
+        await dashboard.remove_client(mock_websocket)
+        await asyncio.sleep(0)
+
+        mock_websocket.send_text.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_add_client(self, dashboard):
         """Test adding a WebSocket client."""
         mock_websocket = AsyncMock()
 
         await dashboard.add_client(mock_websocket)
+        await dashboard.flush_clients()
 
         mock_websocket.accept.assert_called_once()
         assert mock_websocket in dashboard.connected_clients
@@ -493,11 +566,68 @@ class TestRealTimeDashboard:
             # This is a bit hacky but tests the core logic
             dashboard_data = await dashboard._generate_dashboard_data()
             await dashboard._broadcast_to_clients(dashboard_data)
+            await dashboard.flush_clients()
 
             # Verify client received data
             dashboard.connected_clients[0].send_text.assert_called_once()
 
 
+class TestClientSendQueue:
+    """Test ClientSendQueue class."""
+
+    @pytest.mark.asyncio
+    async def test_messages_are_sent_in_order(self):
+        """Queued messages are sent in order by a background task."""
+        websocket = AsyncMock()
+        send_queue = ClientSendQueue(websocket, Mock())
+
+        send_queue.enqueue("first", {"a": 1})
+        send_queue.enqueue("second", {"b": 2})
+        await send_queue.flush()
+
+        assert [call.args[0] for call in websocket.send_text.call_args_list] == ["first", "second"]
+        assert send_queue.stats["sent"] == 2
+        assert send_queue.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_coalesces_to_latest_panels(self):
+        """A full queue collapses into one message with the latest value of each panel."""
+        websocket = AsyncMock()
+        send_queue = ClientSendQueue(websocket, Mock(), max_pending=2)
+
+        send_queue.enqueue("1", {"timestamp": 1, "alerts": []})
+        send_queue.enqueue("2", {"timestamp": 2, "system_health": {"total_sessions": 1}})
+        send_queue.enqueue("3", {"timestamp": 3, "alerts": ["new"]})
+        assert send_queue.pending == 1
+        await send_queue.flush()
+
+        (message,) = [json.loads(call.args[0]) for call in websocket.send_text.call_args_list]
+        assert message == {"timestamp": 3, "alerts": ["new"], "system_health": {"total_sessions": 1}}
+        assert send_queue.stats["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_send_reports_client(self):
+        """A failed send reports the client and drops the rest of the queue."""
+        websocket = AsyncMock()
+        error = RuntimeError("closed")
+        websocket.send_text.side_effect = error
+        on_failure = Mock()
+        send_queue = ClientSendQueue(websocket, on_failure)
+
+        send_queue.enqueue("first", {})
+        send_queue.enqueue("second", {})
+        await send_queue.flush()
+
+        on_failure.assert_called_once_with(websocket, error)
+        websocket.send_text.assert_called_once()
+        assert send_queue.pending == 0
+
+    def test_max_pending_must_be_positive(self):
+        """A queue must hold at least one message."""
+        with pytest.raises(ValueError, match="max_pending"):
+            ClientSendQueue(AsyncMock(), Mock(), max_pending=0)
+
+
 class TestAlertManager:
     """Test AlertManager class."""
 
@@ -969,6 +1099,7 @@ class TestComplexScenarios:
             # Generate and broadcast data
             data = await dashboard._generate_dashboard_data()
             await dashboard._broadcast_to_clients(data)
+            await dashboard.flush_clients()
 
             # All clients should receive the data
             for client in mock_clients:
@@ -0,0 +1,185 @@
+"""Unit tests for the asynchronous audit sink."""
+
+import gzip
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.security.audit_logging import (
+    AuditEvent,
+    AuditEventSeverity,
+    AuditEventType,
+    AuditLogger,
+    audit_logger_instance,
+    configure_audit_sink,
+    shutdown_audit_sink,
+)
+from src.security.audit_sink import AuditOverflowPolicy, AuditSink, JsonLinesAuditWriter
+
+
+class RecordingWriter:
+    """Writer that keeps batches in memory."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.closed = False
+
+    def write_batch(self, lines: list[str]) -> None:
+        self.batches.append(lines)
+
+    def close(self) -> None:
+        self.closed = True
+
+    @property
+    def events(self) -> list[dict]:
+        return [json.loads(line) for batch in self.batches for line in batch]
+
+
+def _event(message: str, severity: AuditEventSeverity = AuditEventSeverity.LOW) -> AuditEvent:
+    return AuditEvent(AuditEventType.API_REQUEST, severity, message)
+
+
+class TestAuditSink:
+    """Test cases for AuditSink."""
+
+    def test_events_are_written_in_order_on_flush(self):
+        """Buffered events are serialized as JSON lines in enqueue order."""
+        writer = RecordingWriter()
+        sink = AuditSink(writer, batch_size=2).start()
+        try:
+            sink.enqueue(_event("first"))
+            sink.enqueue(_event("second", AuditEventSeverity.CRITICAL))
+            sink.enqueue(_event("third"))
+
+            assert sink.flush(timeout=5.0) is True
+        finally:
+            sink.close()
+
+        assert [event["message"] for event in writer.events] == ["first", "second", "third"]
+        assert all(len(batch) <= 2 for batch in writer.batches)
+        assert writer.closed is True
+
+    def test_drop_oldest_never_drops_critical(self):
+        """Full buffers evict the oldest non-critical event and keep critical ones."""
+        writer = RecordingWriter()
+        sink = AuditSink(writer, capacity=2, overflow_policy=AuditOverflowPolicy.DROP_OLDEST)
+
+        sink.enqueue(_event("old"))
+        sink.enqueue(_event("alert", AuditEventSeverity.CRITICAL))
+        sink.enqueue(_event("middle"))
+        sink.enqueue(_event("new"))
+        sink.flush()
+
+        assert [event["message"] for event in writer.events] == ["alert", "middle", "new"]
+        assert sink.stats()["dropped"] == 1
+
+    def test_drop_newest_rejects_incoming(self):
+        """DROP_NEWEST keeps the buffered events and reports the rejection."""
+        writer = RecordingWriter()
+        sink = AuditSink(writer, capacity=1, overflow_policy=AuditOverflowPolicy.DROP_NEWEST)
+
+        assert sink.enqueue(_event("kept")) is True
+        assert sink.enqueue(_event("rejected")) is False
+        assert sink.enqueue(_event("critical", AuditEventSeverity.CRITICAL)) is True
+        sink.flush()
+
+        assert [event["message"] for event in writer.events] == ["kept", "critical"]
+
+    def test_close_drains_buffer(self):
+        """Closing the sink flushes everything still buffered."""
+        writer = RecordingWriter()
+        sink = AuditSink(writer, batch_size=1000, flush_interval=60.0).start()
+        for index in range(10):
+            sink.enqueue(_event(f"event {index}"))
+
+        sink.close()
+
+        assert len(writer.events) == 10
+        assert len(sink) == 0
+
+    def test_writer_errors_are_counted(self):
+        """A failing writer does not propagate to the caller."""
+        writer = Mock()
+        writer.write_batch.side_effect = OSError("disk full")
+        sink = AuditSink(writer)
+
+        sink.enqueue(_event("lost"))
+        sink.flush()
+
+        assert sink.stats()["write_errors"] == 1
+
+    def test_invalid_capacity(self):
+        """Capacity must be positive."""
+        with pytest.raises(ValueError, match="capacity"):
+            AuditSink(RecordingWriter(), capacity=0)
+
+
+class TestJsonLinesAuditWriter:
+    """Test cases for JsonLinesAuditWriter."""
+
+    def test_rotation_by_size(self, tmp_path):
+        """Files are rotated once they reach max_bytes."""
+        writer = JsonLinesAuditWriter(tmp_path / "audit.jsonl", max_bytes=8, backup_count=2)
+
+        for index in range(4):
+            writer.write_batch([f'{{"n":{index}}}\n'])
+
+        assert (tmp_path / "audit.jsonl").read_text() == '{"n":3}\n'
+        assert (tmp_path / "audit.jsonl.1").read_text() == '{"n":2}\n'
+        assert (tmp_path / "audit.jsonl.2").read_text() == '{"n":1}\n'
+        assert not (tmp_path / "audit.jsonl.3").exists()
+
+    def test_compressed_batches_are_readable(self, tmp_path):
+        """Compressed output is one gzip member per batch."""
+        writer = JsonLinesAuditWriter(tmp_path / "audit.jsonl", compress=True)
+        writer.write_batch(['{"n":1}\n'])
+        writer.write_batch(['{"n":2}\n'])
+
+        assert writer.path.name == "audit.jsonl.gz"
+        with gzip.open(writer.path, "rt") as handle:
+            assert handle.read() == '{"n":1}\n{"n":2}\n'
+
+
+class TestAuditLoggerWithSink:
+    """Test cases for AuditLogger routing through a sink."""
+
+    def test_log_event_only_enqueues(self):
+        """With a sink attached, log_event does not touch the logger."""
+        sink = AuditSink(RecordingWriter())
+        audit_logger = AuditLogger(sink=sink)
+        audit_logger.logger = Mock()
+
+        audit_logger.log_event(_event("queued"))
+
+        audit_logger.logger.bind.assert_not_called()
+        assert len(sink) == 1
+
+    def test_configure_and_shutdown_global_sink(self, tmp_path):
+        """The global logger writes through the sink until shutdown flushes it."""
+        settings = SimpleNamespace(
+            audit_log_async_enabled=True,
+            audit_log_path=str(tmp_path / "audit.jsonl"),
+            audit_log_max_bytes=1024 * 1024,
+            audit_log_backup_count=1,
+            audit_log_compress=False,
+            audit_log_buffer_size=100,
+            audit_log_overflow_policy="drop_oldest",
+        )
+
+        sink = configure_audit_sink(settings)
+        try:
+            assert audit_logger_instance.sink is sink
+            audit_logger_instance.log_security_event(AuditEventType.ADMIN_SYSTEM_SHUTDOWN, "Shutting down")
+        finally:
+            shutdown_audit_sink()
+
+        assert audit_logger_instance.sink is None
+        lines = (tmp_path / "audit.jsonl").read_text().splitlines()
+        assert json.loads(lines[0])["event_type"] == "admin.system.shutdown"
+
+    def test_configure_disabled(self):
+        """No sink is attached unless enabled in settings."""
+        assert configure_audit_sink(SimpleNamespace(audit_log_async_enabled=False)) is None
+        assert audit_logger_instance.sink is None
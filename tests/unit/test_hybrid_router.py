@@ -13,6 +13,7 @@ Test Coverage:
     - MCPClientInterface compliance and error handling
 """
 
+import gc
 from unittest.mock import MagicMock, patch
 import zlib
 
@@ -35,7 +36,9 @@ from src.mcp_integration.mcp_client import (
     Response,
     WorkflowStep,
 )
+from src.mcp_integration.routing_performance import AdaptiveRoutingConfig
 from src.utils.circuit_breaker import CircuitBreakerOpenError
+from src.utils.metrics_registry import get_metrics_registry
 
 
 class MockOpenRouterClient(MCPClientInterface):
@@ -913,6 +916,31 @@ class TestMetricsAndMonitoring:
         assert hybrid_router.metrics.total_requests == 0
         assert hybrid_router.metrics.successful_routes == 0
 
+    @pytest.mark.asyncio
+    async def test_registry_counters_survive_reset_and_collection(self, mock_openrouter_client, mock_mcp_client):
+        """Test exported routing totals never go down when a router is reset or garbage-collected."""
+        with (
+            patch("src.mcp_integration.hybrid_router.get_settings", return_value=MagicMock()),
+            patch("src.mcp_integration.hybrid_router.get_circuit_breaker", return_value=MockCircuitBreaker()),
+        ):
+            router = HybridRouter(
+                openrouter_client=mock_openrouter_client,
+                mcp_client=mock_mcp_client,
+                strategy=RoutingStrategy.OPENROUTER_PRIMARY,
+                enable_gradual_rollout=False,
+            )
+        successes = get_metrics_registry().get_family("routing_outcomes").labels("openrouter_primary", "success")
+        before = successes.value
+
+        await router.orchestrate_agents(
+            [WorkflowStep(step_id="step_1", agent_id="test_agent", input_data={"query": "Test query"})],
+        )
+        router.reset_metrics()
+        del router
+        gc.collect()
+
+        assert successes.value == before + 1
+
     def test_set_traffic_percentage(self, hybrid_router):
         """Test setting traffic percentage dynamically."""
         initial_percentage = hybrid_router.openrouter_traffic_percentage
@@ -969,3 +997,208 @@ class TestEdgeCasesAndErrorHandling:
 
         # Should be exponential moving average
         assert 1.0 < hybrid_router.metrics.average_response_time < 2.0
+
+
+class FakeClock:
+    """Controllable replacement for ``time.time`` shared by the router and its clients."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TimedClient(MockOpenRouterClient):
+    """Client whose orchestration takes ``latency`` seconds on a fake clock.
+
+    With ``report_errors`` set, the client answers every step with a failed
+    ``Response`` instead of raising, like a backend returning error payloads.
+    """
+
+    def __init__(self, clock: FakeClock, latency: float, report_errors: bool = False):
+        super().__init__()
+        self.clock = clock
+        self.latency = latency
+        self.report_errors = report_errors
+
+    async def orchestrate_agents(self, workflow_steps: list[WorkflowStep]) -> list[Response]:
+        self.orchestrate_calls += 1
+        self.clock.now += self.latency
+        return [
+            Response(
+                agent_id=step.agent_id,
+                content="" if self.report_errors else f"response for {step.step_id}",
+                confidence=0.9,
+                processing_time=self.latency,
+                success=not self.report_errors,
+                error_message="backend error" if self.report_errors else None,
+            )
+            for step in workflow_steps
+        ]
+
+
+class TestAdaptiveRouting:
+    """Test latency- and error-aware adaptive routing."""
+
+    STEP = WorkflowStep(step_id="s1", agent_id="agent", input_data={})
+
+    @staticmethod
+    def _router(
+        strategy: RoutingStrategy,
+        traffic_percentage: int = 0,
+        openrouter_client: MCPClientInterface | None = None,
+        mcp_client: MCPClientInterface | None = None,
+        exploration_share: float = 0.05,
+    ) -> HybridRouter:
+        with patch("src.mcp_integration.hybrid_router.get_settings") as mock_get_settings:
+            mock_settings = MagicMock()
+            mock_settings.openrouter_traffic_percentage = traffic_percentage
+            mock_settings.circuit_breaker_enabled = False
+            mock_get_settings.return_value = mock_settings
+
+            return HybridRouter(
+                openrouter_client=openrouter_client or MockOpenRouterClient(),
+                mcp_client=mcp_client or MockMCPClient(),
+                strategy=strategy,
+                enable_adaptive_routing=True,
+                adaptive_config=AdaptiveRoutingConfig(
+                    half_life_seconds=3600.0,
+                    min_samples=3,
+                    max_shift=0.5,
+                    exploration_share=exploration_share,
+                ),
+            )
+
+    @classmethod
+    def _timed_router(
+        cls,
+        strategy: RoutingStrategy,
+        openrouter_latency: float,
+        mcp_latency: float,
+        traffic_percentage: int = 0,
+        mcp_reports_errors: bool = False,
+    ) -> tuple[HybridRouter, FakeClock]:
+        clock = FakeClock()
+        router = cls._router(
+            strategy,
+            traffic_percentage,
+            openrouter_client=TimedClient(clock, openrouter_latency),
+            mcp_client=TimedClient(clock, mcp_latency, report_errors=mcp_reports_errors),
+        )
+        return router, clock
+
+    @classmethod
+    async def _drive(cls, router: HybridRouter, clock: FakeClock, requests: int) -> float:
+        """Run ``requests`` orchestrations and return the share served by OpenRouter."""
+        openrouter_calls = router.openrouter_client.orchestrate_calls
+        with patch("src.mcp_integration.hybrid_router.time.time", clock):
+            for _ in range(requests):
+                await router.orchestrate_agents([cls.STEP])
+        return (router.openrouter_client.orchestrate_calls - openrouter_calls) / requests
+
+    def test_disabled_by_default(self):
+        """Adaptive routing is off unless enabled explicitly or in settings."""
+        with patch("src.mcp_integration.hybrid_router.get_settings") as mock_get_settings:
+            mock_get_settings.return_value = MagicMock(openrouter_traffic_percentage=0, circuit_breaker_enabled=False)
+            router = HybridRouter(openrouter_client=MockOpenRouterClient(), mcp_client=MockMCPClient())
+
+        assert router.adaptive_routing is False
+
+    @pytest.mark.asyncio
+    async def test_no_shift_without_exploration_or_samples(self):
+        """Without exploration the secondary never gets samples, so the static strategy applies."""
+        clock = FakeClock()
+        router = self._router(
+            RoutingStrategy.OPENROUTER_PRIMARY,
+            openrouter_client=TimedClient(clock, 5.0),
+            mcp_client=TimedClient(clock, 1.0),
+            exploration_share=0.0,
+        )
+
+        assert await self._drive(router, clock, 100) == 1.0
+
+    @pytest.mark.asyncio
+    async def test_exploration_probes_the_secondary(self):
+        """A healthy primary keeps almost all traffic; a small share probes the secondary."""
+        router, clock = self._timed_router(RoutingStrategy.OPENROUTER_PRIMARY, openrouter_latency=1.0, mcp_latency=1.0)
+
+        share = await self._drive(router, clock, 400)
+
+        assert 0.9 <= share < 1.0
+        assert router.metrics.backend_performance.service_estimate("mcp").current_weight(clock.now) >= 3
+
+    @pytest.mark.asyncio
+    async def test_shifts_away_from_degraded_primary(self):
+        """A slow primary loses traffic once exploration has measured the secondary."""
+        router, clock = self._timed_router(RoutingStrategy.OPENROUTER_PRIMARY, openrouter_latency=4.0, mcp_latency=1.0)
+        await self._drive(router, clock, 200)
+
+        share = await self._drive(router, clock, 400)
+
+        # Relative advantage 0.75 * max_shift 0.5 moves ~37% of traffic to MCP
+        assert 0.55 < share < 0.72
+        decision = router._make_routing_decision("request_0", "test")
+        if decision.service == "mcp":
+            assert decision.reason.startswith("Adaptive routing")
+
+    @pytest.mark.asyncio
+    async def test_error_responses_count_against_a_backend(self):
+        """A fast primary answering with failed responses is treated as degraded."""
+        router, clock = self._timed_router(
+            RoutingStrategy.MCP_PRIMARY,
+            openrouter_latency=1.2,
+            mcp_latency=1.0,
+            mcp_reports_errors=True,
+        )
+        await self._drive(router, clock, 200)
+
+        assert router.metrics.backend_performance.service_estimate("mcp").error_rate == pytest.approx(1.0)
+        assert await self._drive(router, clock, 400) > 0.1
+
+    @pytest.mark.asyncio
+    async def test_rollout_percentage_is_a_ceiling(self):
+        """Adaptive routing never sends more than the rollout percentage to OpenRouter."""
+        router, clock = self._timed_router(
+            RoutingStrategy.OPENROUTER_PRIMARY,
+            openrouter_latency=0.5,
+            mcp_latency=5.0,
+            traffic_percentage=30,
+        )
+        await self._drive(router, clock, 100)
+
+        assert await self._drive(router, clock, 400) <= 0.35
+
+        router.reset_metrics()
+        router.openrouter_client.latency, router.mcp_client.latency = 5.0, 0.5
+        await self._drive(router, clock, 100)
+
+        assert await self._drive(router, clock, 400) < 0.1
+
+    @pytest.mark.asyncio
+    async def test_orchestration_outcomes_feed_estimates(self):
+        """Orchestration records per-backend and per-model outcomes."""
+        router = self._router(RoutingStrategy.OPENROUTER_PRIMARY)
+        router.openrouter_client.should_fail = True
+        step = WorkflowStep(step_id="s1", agent_id="agent", input_data={})
+
+        with patch.object(
+            router.mcp_client,
+            "orchestrate_agents",
+            return_value=[
+                Response(
+                    agent_id="agent",
+                    content="ok",
+                    metadata={"model_id": "test/model:free"},
+                    confidence=0.9,
+                    processing_time=0.3,
+                ),
+            ],
+        ):
+            await router.orchestrate_agents([step])
+
+        performance = router.metrics.backend_performance
+        assert performance.service_estimate("openrouter").error_rate == 1.0
+        assert performance.service_estimate("mcp").error_rate == 0.0
+        assert performance.model_estimate("test/model:free").latency == pytest.approx(0.3)
+        assert "backend_performance" in router.get_routing_metrics()
@@ -525,6 +525,78 @@ class TestModelRegistry:
         )
         assert model == "test/model2:free"
 
+    @patch("src.mcp_integration.model_registry.get_settings")
+    def test_selection_table_is_compiled_on_load(self, mock_get_settings, temp_config_file):
+        """Test that selections are precompiled per task type and context bucket."""
+        mock_get_settings.return_value = Mock()
+        registry = ModelRegistry(config_path=temp_config_file)
+
+        assert registry._context_buckets == [4096, 8192]
+        entry = registry._selection_table[(False, "general", 1)]
+        assert entry.candidates == ("test/model2:free", "test/model1:free")
+        assert entry.preferred == 1
+
+        # Requirements larger than every context window use the plain chain order
+        assert registry.select_best_model("general", max_tokens_needed=10_000) == "test/model1:free"
+
+    @patch("src.mcp_integration.model_registry.get_settings")
+    def test_selection_table_rebuilds_on_availability_change(self, mock_get_settings, temp_config_file):
+        """Test that marking a model unavailable changes later selections."""
+        mock_get_settings.return_value = Mock()
+        registry = ModelRegistry(config_path=temp_config_file)
+
+        assert registry.set_model_availability("test/model1:free", False) is True
+        assert registry.select_best_model("general") == "test/model2:free"
+        # model2 is not in a category limited users may access
+        assert registry.select_best_model_for_tier("limited", "general") == "deepseek/deepseek-chat-v3-0324:free"
+
+        assert registry.set_model_availability("test/model1:free", True) is True
+        assert registry.select_best_model("general") == "test/model1:free"
+        assert registry.set_model_availability("unknown/model", False) is False
+
+    @patch("src.mcp_integration.model_registry.get_settings")
+    def test_selection_table_rebuilds_on_add_and_remove(self, mock_get_settings, temp_config_file):
+        """Test that adding and removing models recompiles the selection table."""
+        mock_get_settings.return_value = Mock()
+        registry = ModelRegistry(config_path=temp_config_file)
+        registry._fallback_chains["large_context"] = ["test/large:free"]
+
+        registry.add_model(
+            ModelCapabilities(
+                model_id="test/large:free",
+                display_name="Large",
+                provider="test",
+                category="free_general",
+                context_window=200_000,
+                max_tokens_per_request=1024,
+                rate_limit_requests_per_minute=30,
+            ),
+        )
+        assert registry._context_buckets == [4096, 8192, 200_000]
+        assert registry.select_best_model("planning", max_tokens_needed=100_000) == "test/large:free"
+
+        assert registry.remove_model("test/large:free") is True
+        assert registry.remove_model("test/large:free") is False
+        assert registry._context_buckets == [4096, 8192]
+
+    @patch("src.mcp_integration.model_registry.get_settings")
+    def test_selection_skips_models_disabled_after_compilation(self, mock_get_settings, temp_config_file):
+        """Test that compiled candidates are still checked for availability."""
+        mock_get_settings.return_value = Mock()
+        registry = ModelRegistry(config_path=temp_config_file)
+
+        registry._models["test/model1:free"].enabled = False
+
+        assert registry.select_best_model("general") == "test/model2:free"
+
+    @patch("src.mcp_integration.model_registry.get_settings")
+    def test_select_best_model_for_unknown_tier(self, mock_get_settings, temp_config_file):
+        """Test that tiers outside the compiled table are ranked on demand."""
+        mock_get_settings.return_value = Mock()
+        registry = ModelRegistry(config_path=temp_config_file)
+
+        assert registry.select_best_model_for_tier("guest", "general") == "test/model1:free"
+
 
 class TestGlobalRegistry:
     """Test global registry functions."""
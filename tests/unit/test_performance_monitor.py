@@ -172,6 +172,50 @@ class TestPerformanceMonitor:
         self.monitor.reset_metrics()
         assert self.monitor.get_counter("test_metric") == 0
 
+    def test_timer_memory_is_bounded(self):
+        """Test timers keep constant memory under many observations."""
+        for i in range(20000):
+            self.monitor.record_metric(
+                MetricData(
+                    name="latency",
+                    value=0.001 * (i % 500 + 1),
+                    timestamp=time.time(),
+                    metric_type=MetricType.TIMER,
+                ),
+            )
+
+        stats = self.monitor.get_timer_stats("latency")
+        assert stats["count"] == 20000
+        assert stats["p95"] == pytest.approx(0.475, rel=0.02)
+        assert self.monitor.timers["latency"].bin_count < 500
+
+    def test_merge_timer_from_other_worker(self):
+        """Test merging timer sketches recorded by another monitor."""
+        other = PerformanceMonitor()
+        for value in (0.1, 0.2, 0.3):
+            other.record_metric(
+                MetricData(name="latency", value=value, timestamp=time.time(), metric_type=MetricType.TIMER),
+            )
+        self.monitor.record_metric(
+            MetricData(name="latency", value=0.4, timestamp=time.time(), metric_type=MetricType.TIMER),
+        )
+
+        self.monitor.merge_timer("latency", other.get_timer_sketch("latency"))
+
+        stats = self.monitor.get_timer_stats("latency")
+        assert stats["count"] == 4
+        assert stats["max"] == 0.4
+
+    def test_windowed_timers(self):
+        """Test timers backed by a rolling window."""
+        monitor = PerformanceMonitor(timer_window_seconds=60)
+        monitor.record_metric(
+            MetricData(name="latency", value=0.5, timestamp=time.time(), metric_type=MetricType.TIMER),
+        )
+
+        assert monitor.get_timer_stats("latency")["count"] == 1
+        assert monitor.get_timer_sketch("latency").count == 1
+
 
 class TestSLAMonitor:
     """Test cases for SLAMonitor class."""
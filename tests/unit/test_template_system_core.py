@@ -17,6 +17,7 @@ from src.core.template_system_core import (
     TemplateProcessor,
     TemplateSchema,
     TemplateType,
+    compile_template,
 )
 
 
@@ -159,6 +160,36 @@ class TestTemplateManager:
         result = self.manager.validate_template(template_data)
         assert result is False
 
+    def test_templates_are_loaded_lazily(self):
+        """Test templates are parsed only when requested."""
+        for name in ("first", "second"):
+            template_data = {
+                "metadata": {"name": name, "type": "business"},
+                "variables": {},
+                "structure": {"sections": []},
+            }
+            (self.templates_dir / f"{name}.yaml").write_text(yaml.dump(template_data))
+
+        load_template = TemplateManager._load_template
+        with patch.object(TemplateManager, "_load_template", autospec=True, side_effect=load_template) as mock_load:
+            manager = TemplateManager(str(self.templates_dir))
+            assert sorted(manager.list_templates()) == ["first", "second"]
+            mock_load.assert_not_called()
+
+            assert manager.get_template("first") is manager.get_template("first")
+            assert mock_load.call_count == 1
+
+    def test_failed_template_is_not_retried(self):
+        """Test a template that fails to load is dropped from the listing and not reloaded."""
+        (self.templates_dir / "broken.yaml").write_text("invalid: yaml: content: [")
+        manager = TemplateManager(str(self.templates_dir))
+
+        with patch.object(manager, "_load_template", wraps=manager._load_template) as mock_load:
+            assert manager.get_template("broken") is None
+            assert manager.get_template("broken") is None
+            assert mock_load.call_count == 1
+        assert manager.list_templates() == []
+
     def test_create_template_structure(self):
         """Test creating basic template structure."""
         structure = self.manager.create_template_structure("test_template", TemplateType.BUSINESS)
@@ -227,9 +258,72 @@ class TestTemplateProcessor:
         """Test processing template with missing variables."""
         variables = {"title": "Test Title"}  # Missing 'content'
 
-        # Should still process but with placeholder
-        result = self.processor.process_template("test", variables)
-        assert "# Test Title" in result
+        with pytest.raises(ValueError, match="Missing required variables: content"):
+            self.processor.process_template("test", variables)
+
+    def test_process_template_caches_repeat_renders(self):
+        """Test repeat renders are served from the render cache."""
+        variables = {"title": "Test Title", "content": "Test content"}
+        first = self.processor.process_template("test", variables)
+        second = self.processor.process_template("test", {**variables, "unused": object()})
+
+        assert second == first
+        stats = self.processor.get_cache_stats()
+        assert (stats["compiles"], stats["misses"], stats["hits"]) == (1, 1, 1)
+
+    def test_process_template_different_variables_miss_cache(self):
+        """Test different variable values are rendered separately."""
+        first = self.processor.process_template("test", {"title": "One", "content": "Body"})
+        second = self.processor.process_template("test", {"title": "Two", "content": "Body"})
+
+        assert first != second
+        assert self.processor.get_cache_stats()["misses"] == 2
+
+    def test_process_template_skips_cache_for_non_json_values(self):
+        """Test values other than plain JSON data are rendered every time, so mutations show."""
+
+        class Title:
+            def __init__(self, text):
+                self.text = text
+
+            def __str__(self):
+                return self.text
+
+        title = Title("Before")
+        variables = {"title": title, "content": "Body"}
+        first = self.processor.process_template("test", variables)
+        title.text = "After"
+        second = self.processor.process_template("test", variables)
+
+        assert "Before" in first
+        assert "After" in second
+        assert self.processor.process_template("test", {"title": ("a", "b"), "content": "Body"}) != (
+            self.processor.process_template("test", {"title": ["a", "b"], "content": "Body"})
+        )
+        stats = self.processor.get_cache_stats()
+        assert (stats["misses"], stats["hits"], stats["cached_renders"]) == (1, 0, 1)
+
+    def test_process_template_recompiles_after_reload(self):
+        """Test reloading a template invalidates its plan and cached renders."""
+        variables = {"title": "Test Title", "content": "Test content"}
+        self.processor.process_template("test", variables)
+
+        template_file = self.templates_dir / "test.yaml"
+        template_data = yaml.safe_load(template_file.read_text())
+        template_data["structure"]["sections"][0]["template"] = "## {title}"
+        template_file.write_text(yaml.dump(template_data))
+        self.manager.reload_template("test")
+
+        assert self.processor.process_template("test", variables).startswith("## Test Title")
+        assert self.processor.get_cache_stats()["compiles"] == 2
+
+    def test_process_template_without_render_cache(self):
+        """Test rendering with the render cache disabled."""
+        processor = TemplateProcessor(self.manager, render_cache_size=0)
+        variables = {"title": "Test Title", "content": "Test content"}
+
+        assert processor.process_template("test", variables) == processor.process_template("test", variables)
+        assert processor.get_cache_stats()["cached_renders"] == 0
 
     def test_validate_variables_success(self):
         """Test successful variable validation."""
@@ -264,6 +358,53 @@ class TestTemplateProcessor:
         assert info == {}
 
 
+class TestCompileTemplate:
+    """Test cases for compiling templates into render plans."""
+
+    def make_template(self, variables, sections):
+        """Build a template schema from variables and section templates."""
+        return TemplateSchema(
+            metadata={"name": "test", "type": "business"},
+            variables=variables,
+            structure={"sections": [{"name": f"s{i}", "template": text} for i, text in enumerate(sections)]},
+        )
+
+    def test_required_variables(self):
+        """Test declared required and undeclared referenced variables are required."""
+        template = self.make_template(
+            {"title": {"required": True}, "note": {"required": False}, "unused": {"required": True}},
+            ["# {title}", "{note} {author.name}"],
+        )
+
+        plan = compile_template(template, "1.0#1")
+
+        assert plan.fields == ("title", "note", "author")
+        assert plan.required == {"title", "unused", "author"}
+        assert plan.defaults == {"note": ""}
+
+    def test_optional_variables_use_defaults(self):
+        """Test optional variables fall back to their declared defaults."""
+        template = self.make_template(
+            {"title": {"required": True}, "audience": {"default": "everyone"}, "width": {"default": 6}},
+            ["# {title}", "For {audience:>{width}}"],
+        )
+
+        plan = compile_template(template)
+
+        assert plan.render({"title": "Hi"}) == "# Hi\n\nFor everyone"
+        assert plan.render({"title": "Hi", "audience": "devs", "width": 5}) == "# Hi\n\nFor  devs"
+
+    def test_positional_fields_are_rejected(self):
+        """Test positional fields fail at compile time."""
+        with pytest.raises(ValueError, match="Positional field"):
+            compile_template(self.make_template({}, ["{} and {0}"]))
+
+    def test_malformed_section_is_rejected(self):
+        """Test unbalanced braces fail at compile time."""
+        with pytest.raises(ValueError, match="expected '}'"):
+            compile_template(self.make_template({}, ["{title"]))
+
+
 class TestTemplateSchema:
     """Test cases for TemplateSchema validation."""
 
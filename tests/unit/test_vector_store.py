@@ -8,6 +8,7 @@ Tests cover functionality, performance, error handling, and integration scenario
 
 import asyncio
 import contextlib
+import gc
 import time
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -34,6 +35,7 @@ from src.core.vector_store import (
     VectorStoreType,
     vector_store_connection,
 )
+from src.utils.metrics_registry import get_metrics_registry
 
 
 # Import for integration tests
@@ -498,6 +500,22 @@ class TestEnhancedMockVectorStore:
         assert updated_metrics.insert_count == initial_insert_count + 1
         assert updated_metrics.avg_latency > 0
 
+    @pytest.mark.asyncio
+    async def test_registry_counters_survive_collection(self, mock_config):
+        """Test exported operation totals never go down when a store is garbage-collected."""
+        searches = (
+            get_metrics_registry().get_family("vector_store_operations").labels("EnhancedMockVectorStore", "search")
+        )
+        before = searches.value
+
+        store = EnhancedMockVectorStore(mock_config)
+        await store.connect()
+        await store.search(SearchParameters(embeddings=[[0.5] * DEFAULT_VECTOR_DIMENSIONS]))
+        del store
+        gc.collect()
+
+        assert searches.value == before + 1
+
     @pytest.mark.asyncio
     async def test_error_simulation(self):
         """Test error simulation functionality."""
@@ -0,0 +1,196 @@
+"""
+Unit tests for streaming Journey 1 file extraction.
+"""
+
+import io
+import json
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from src.ui.journeys.file_extraction import ExtractionCache, JsonStructure, scan_csv, scan_json_structure
+from src.ui.journeys.journey1_smart_templates import Journey1SmartTemplates
+
+
+def _chunks(text: str, size: int = 3):
+    return (text[index : index + size] for index in range(0, len(text), size))
+
+
+class MockFile:
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.mark.unit
+class TestStreamingReaders:
+    """Test cases for the incremental CSV and JSON readers."""
+
+    def test_csv_scan_counts_whole_file_within_budget(self):
+        """Rows are counted past the byte budget while content stops at it."""
+        content = "id,name\n" + "".join(f"{index},row{index}\n" for index in range(1000))
+
+        scan = scan_csv(io.StringIO(content), byte_budget=100)
+
+        assert scan.total_lines == len(content.split("\n"))
+        assert scan.columns == ["id", "name"]
+        assert scan.sample_lines == ["id,name", "0,row0", "1,row1", "2,row2", "3,row3"]
+        assert scan.truncated is True
+        assert content.startswith(scan.content)
+        assert len(scan.content.encode()) <= 100
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            {"b": [1, 2, {"c": "x"}], "a": "text with } and ,", "n": 12345.5, "d": None, "e": True, "f": 1},
+            [{"id": 1}, {"id": 2}, 3],
+            [],
+            {},
+            "scalar",
+            12345678,
+        ],
+    )
+    def test_json_scan_matches_parsed_structure(self, document):
+        """Scanning in tiny chunks describes the document like parsing it whole."""
+        text = json.dumps(document, indent=1)
+
+        assert scan_json_structure(_chunks(text)) == JsonStructure.from_value(document)
+
+    def test_json_scan_decodes_large_values_from_small_chunks(self):
+        """A top-level value spanning many chunks is decoded whole."""
+        document = [{"blob": "x" * 300_000}, {"blob": "y" * 300_000}]
+
+        structure = scan_json_structure(_chunks(json.dumps(document), size=64))
+
+        assert structure == JsonStructure("list", length=2, first_item_type="dict")
+
+    @pytest.mark.parametrize("text", ['{"a": 1,}', "[1, 2", '{"a" 1}', "[1] [2]", ""])
+    def test_json_scan_rejects_invalid_documents(self, text):
+        """Malformed JSON raises JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            scan_json_structure(_chunks(text))
+
+
+@pytest.mark.unit
+class TestExtractionCache:
+    """Test cases for ExtractionCache."""
+
+    def test_lru_eviction_by_size(self):
+        """Least recently used results are evicted once the character budget is exceeded."""
+        cache = ExtractionCache(max_chars=10)
+        cache.put("h1", "a.txt", 1024, ("12345", ".txt"))
+        cache.put("h2", "b.txt", 1024, ("12345", ".txt"))
+        assert cache.get("h1", "a.txt", 1024) == ("12345", ".txt")
+
+        cache.put("h3", "c.txt", 1024, ("12345", ".txt"))
+
+        assert cache.get("h2", "b.txt", 1024) is None
+        assert cache.get("h1", "a.txt", 1024) is not None
+        assert cache.get_stats()["chars"] == 10
+
+    def test_results_are_keyed_by_byte_budget(self):
+        """A result extracted with one byte budget is not served for another."""
+        cache = ExtractionCache()
+        cache.put("h1", "a.txt", 1024, ("12345", ".txt"))
+
+        assert cache.get("h1", "a.txt", 2048) is None
+        assert cache.get("h1", "a.txt", 1024) == ("12345", ".txt")
+
+
+@pytest.mark.unit
+class TestJourney1StreamingExtraction:
+    """Test cases for budgeted, cached extraction in Journey1SmartTemplates."""
+
+    def test_reupload_uses_cache(self, tmp_path):
+        """The same content uploaded again is not extracted a second time."""
+        journey = Journey1SmartTemplates()
+        first = tmp_path / "upload1"
+        second = tmp_path / "upload2"
+        for directory in (first, second):
+            directory.mkdir()
+            (directory / "data.csv").write_text("name,age\nJohn,25\n")
+
+        expected = journey.extract_file_content(str(first / "data.csv"))
+        with patch("src.ui.journeys.journey1_smart_templates.scan_csv") as mock_scan:
+            assert journey.extract_file_content(str(second / "data.csv")) == expected
+            mock_scan.assert_not_called()
+        assert journey.extraction_cache.get_stats()["hits"] == 1
+
+    def test_changed_byte_budget_bypasses_cache(self, tmp_path):
+        """Content cached under one byte budget is re-extracted after the budget changes."""
+        journey = Journey1SmartTemplates()
+        path = tmp_path / "notes.md"
+        path.write_text("line of notes\n" * 1000)
+
+        journey.max_extract_bytes = 1024
+        truncated, _ = journey.extract_file_content(str(path))
+        journey.max_extract_bytes = 64 * 1024
+        full, _ = journey.extract_file_content(str(path))
+
+        assert "[Truncated:" in truncated
+        assert "[Truncated:" not in full
+
+    def test_large_text_file_is_truncated(self, tmp_path):
+        """Text beyond the byte budget is not extracted."""
+        journey = Journey1SmartTemplates()
+        journey.max_extract_bytes = 1024
+        path = tmp_path / "notes.md"
+        path.write_text("line of notes\n" * 1000)
+
+        content, file_type = journey.extract_file_content(str(path))
+
+        assert file_type == ".md"
+        assert "[Truncated: showing the first 1 KB" in content
+        assert len(content) < 1200
+
+    def test_large_json_file_is_scanned(self, tmp_path):
+        """JSON beyond the byte budget gets a structure analysis without full parsing."""
+        journey = Journey1SmartTemplates()
+        journey.max_extract_bytes = 1024
+        path = tmp_path / "records.json"
+        path.write_text(json.dumps([{"id": index, "value": "x" * 20} for index in range(500)]))
+
+        with patch("src.ui.journeys.journey1_smart_templates.json.loads") as mock_loads:
+            content, _ = journey.extract_file_content(str(path))
+            mock_loads.assert_not_called()
+
+        assert "Array with 500 items (first item: dict)" in content
+        assert "Formatted Content" not in content
+        assert "[Truncated:" in content
+
+    def test_csv_extraction_memory_is_bounded(self, tmp_path):
+        """Peak memory for a large CSV stays near the byte budget, not the file size."""
+        journey = Journey1SmartTemplates()
+        journey.max_extract_bytes = 64 * 1024
+        path = tmp_path / "large.csv"
+        with path.open("w") as handle:
+            handle.write("id,name,score\n")
+            for index in range(200_000):
+                handle.write(f"{index},name{index},{index % 100}\n")
+        assert path.stat().st_size > 3 * 1024 * 1024
+
+        tracemalloc.start()
+        try:
+            content, _ = journey.extract_file_content(str(path))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Header, 200,000 rows and the empty line after the final newline
+        assert "200002 rows detected" in content
+        assert peak < 1024 * 1024
+
+    def test_process_files_joins_all_files(self, tmp_path):
+        """Combined content contains every file in upload order."""
+        journey = Journey1SmartTemplates()
+        paths = []
+        for index in range(3):
+            path = tmp_path / f"file{index}.txt"
+            path.write_text(f"content {index}")
+            paths.append(MockFile(str(path)))
+
+        result = journey.process_files(paths)
+
+        positions = [result["content"].index(f"content {index}") for index in range(3)]
+        assert positions == sorted(positions)
+        assert all("full_content" not in file_info for file_info in result["files"])
@@ -123,7 +123,13 @@ class TestJourney2IntelligentSearch:
         journey2_instance.zen_client.connect.assert_called_once()
         journey2_instance.zen_client.get_model_recommendations.assert_called_once_with(enhanced_prompt)
         journey2_instance.zen_client.execute_with_routing.assert_called_once_with(enhanced_prompt)
-        journey2_instance.zen_client.disconnect.assert_called_once()
+        journey2_instance.zen_client.disconnect.assert_not_called()
+
+        # The connection and the recommendation are reused by the next request
+        await journey2_instance._execute_with_intelligent_routing(enhanced_prompt, user_tier, sample_workflow_step)
+        journey2_instance.zen_client.connect.assert_called_once()
+        journey2_instance.zen_client.get_model_recommendations.assert_called_once()
+        assert journey2_instance.zen_client.execute_with_routing.call_count == 2
 
     @pytest.mark.asyncio
     async def test_execute_with_intelligent_routing_fallback_to_openrouter(
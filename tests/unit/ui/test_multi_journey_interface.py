@@ -7,13 +7,14 @@ including rate limiting, session management, and UI component functionality.
 
 import json
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import gradio as gr
 import gradio.exceptions
 import pytest
 
 from src.ui.multi_journey_interface import MultiJourneyInterface, RateLimiter
+from src.utils.rate_limit_store import InMemoryRateLimitBackend
 
 
 @pytest.mark.unit
@@ -27,7 +28,7 @@ class TestRateLimiter:
         assert limiter.max_requests_per_minute == 30
         assert limiter.max_requests_per_hour == 200
         assert limiter.max_file_uploads_per_hour == 50
-        assert limiter.cleanup_interval == 300
+        assert isinstance(limiter.backend, InMemoryRateLimitBackend)
 
     def test_rate_limiter_init_custom_values(self):
         """Test RateLimiter initialization with custom values."""
@@ -95,25 +96,18 @@ class TestRateLimiter:
         assert limiter.check_file_upload_rate(session_id) is False
 
     def test_cleanup_old_entries(self):
-        """Test cleanup of old entries."""
+        """Test amortized eviction of idle sessions."""
         limiter = RateLimiter()
         session_id = "test_session_6"
 
-        # Add some requests
-        limiter.check_request_rate(session_id)
-        assert session_id in limiter.request_windows
+        with patch("src.ui.multi_journey_interface.time.time", return_value=1000.0):
+            limiter.check_request_rate(session_id)
+        assert f"request:{session_id}" in limiter.backend
 
-        # Force cleanup by setting old timestamp
-        limiter.last_cleanup = time.time() - 400  # Force cleanup
-        old_time = time.time() - 7200  # 2 hours ago
-        limiter.request_windows[session_id].appendleft(old_time)
+        # Idle for longer than two hourly windows
+        limiter.backend.evict_idle(1000.0 + 7201)
 
-        # Trigger cleanup
-        limiter._cleanup_old_entries()
-
-        # Old entries should be removed
-        if session_id in limiter.request_windows:
-            assert old_time not in limiter.request_windows[session_id]
+        assert f"request:{session_id}" not in limiter.backend
 
     def test_separate_session_limits(self):
         """Test that different sessions have separate rate limits."""
@@ -135,18 +129,7 @@ class TestRateLimiter:
     @patch("src.ui.multi_journey_interface.time.time")
     def test_time_window_sliding(self, mock_time):
         """Test that rate limiting uses sliding time windows."""
-        # Mock time progression - need more values for cleanup calls
-        mock_time.side_effect = [
-            1000,  # __init__ last_cleanup
-            1000,  # first check_request_rate - cleanup call
-            1000,  # first check_request_rate - main call
-            1000,  # second check_request_rate - cleanup call
-            1000,  # second check_request_rate - main call
-            1000,  # third check_request_rate - cleanup call
-            1000,  # third check_request_rate - main call
-            1070,  # fourth check_request_rate - cleanup call
-            1070,  # fourth check_request_rate - main call
-        ]
+        mock_time.return_value = 1000
 
         limiter = RateLimiter(max_requests_per_minute=2)
         session_id = "test_session_7"
@@ -157,80 +140,51 @@ class TestRateLimiter:
         assert limiter.check_request_rate(session_id) is False  # t=1000, denied
 
         # After 70 seconds, should be allowed again (sliding window)
+        mock_time.return_value = 1070
         assert limiter.check_request_rate(session_id) is True  # t=1070
 
-    def test_cleanup_empty_request_windows(self):
-        """Test cleanup of empty request windows (covers line 71)."""
+    def test_cleanup_keeps_active_sessions(self):
+        """Test that eviction stops at the first session that is still active."""
         limiter = RateLimiter()
-        session_id = "test_empty_session"
-
-        # Add session but make it empty
-        limiter.request_windows[session_id] = limiter.request_windows[session_id]  # Initialize
-        limiter.check_request_rate(session_id)  # Add one request
 
-        # Clear the deque to make it empty
-        limiter.request_windows[session_id].clear()
+        with patch("src.ui.multi_journey_interface.time.time", return_value=1000.0):
+            limiter.check_request_rate("session_a")
+            limiter.check_file_upload_rate("session_a")
+        with patch("src.ui.multi_journey_interface.time.time", return_value=9000.0):
+            limiter.check_request_rate("session_c")
+            limiter.backend.evict_idle(9000.0)
 
-        # Force cleanup
-        limiter.last_cleanup = time.time() - 400
-        limiter._cleanup_old_entries()
+        # session_a was idle for more than two hours and is evicted on later hits
+        assert "request:session_a" not in limiter.backend
+        assert "upload:session_a" not in limiter.backend
+        assert "request:session_c" in limiter.backend
 
-        # Empty session should be removed (line 71)
-        assert session_id not in limiter.request_windows
-
-    def test_cleanup_empty_file_upload_windows(self):
-        """Test cleanup of empty file upload windows (covers line 79)."""
+    @patch("src.ui.multi_journey_interface.time.time")
+    def test_rate_limit_status(self, mock_time):
+        """Test status reporting from the sliding window counters."""
+        mock_time.return_value = 1000
         limiter = RateLimiter()
-        session_id = "test_empty_file_session"
-
-        # Add session but make it empty
-        limiter.file_upload_windows[session_id] = limiter.file_upload_windows[session_id]  # Initialize
-        limiter.check_file_upload_rate(session_id)  # Add one upload
-
-        # Clear the deque to make it empty
-        limiter.file_upload_windows[session_id].clear()
+        session_id = "status_session"
 
-        # Force cleanup
-        limiter.last_cleanup = time.time() - 400
-        limiter._cleanup_old_entries()
+        for _ in range(3):
+            limiter.check_request_rate(session_id)
+        limiter.check_file_upload_rate(session_id)
 
-        # Empty session should be removed (line 79)
-        assert session_id not in limiter.file_upload_windows
+        status = limiter.get_rate_limit_status(session_id)
+        assert status["requests_last_minute"] == 3
+        assert status["requests_last_hour"] == 3
+        assert status["uploads_last_hour"] == 1
+        assert limiter.get_rate_limit_status("unknown")["requests_last_minute"] == 0
 
-    def test_cleanup_boundary_conditions(self):
-        """Test cleanup with various boundary conditions."""
+    def test_limits_changed_after_construction_apply(self):
+        """Test that updating a limit attribute changes enforcement, not just reporting."""
         limiter = RateLimiter()
-        current_time = time.time()
-
-        # Test with multiple sessions in different states
-        sessions = ["session_a", "session_b", "session_c"]
-
-        for session in sessions:
-            limiter.check_request_rate(session)
-            limiter.check_file_upload_rate(session)
+        limiter.max_requests_per_minute = 1
+        session_id = "reconfigured_session"
 
-        # Make session_a empty
-        limiter.request_windows["session_a"].clear()
-        limiter.file_upload_windows["session_a"].clear()
-
-        # Make session_b have only old entries
-        limiter.request_windows["session_b"].clear()
-        limiter.request_windows["session_b"].append(current_time - 7200)  # 2 hours ago
-        limiter.file_upload_windows["session_b"].clear()
-        limiter.file_upload_windows["session_b"].append(current_time - 7200)
-
-        # session_c has recent entries (should be kept)
-
-        # Force cleanup
-        limiter.last_cleanup = current_time - 400
-        limiter._cleanup_old_entries()
-
-        # session_a should be removed (empty)
-        assert "session_a" not in limiter.request_windows
-        assert "session_a" not in limiter.file_upload_windows
-
-        # session_b should still exist but be empty after cleanup
-        # session_c should still exist with recent entries
+        assert limiter.check_request_rate(session_id) is True
+        assert limiter.check_request_rate(session_id) is False
+        assert limiter.get_rate_limit_status(session_id)["limits"]["max_requests_per_minute"] == 1
 
 
 @pytest.mark.unit
@@ -585,7 +539,7 @@ class TestMultiJourneyInterfaceExtended:
     """Extended test cases for comprehensive coverage of MultiJourneyInterface."""
 
     def test_rate_limiter_cleanup_edge_cases(self):
-        """Test rate limiter cleanup edge cases for missing lines 71, 75-79."""
+        """Test that cleanup keeps sessions with recent activity."""
         limiter = RateLimiter()
         session_id = "test_cleanup_session"
 
@@ -593,38 +547,27 @@ class TestMultiJourneyInterfaceExtended:
         limiter.check_request_rate(session_id)
         limiter.check_file_upload_rate(session_id)
 
-        # Manually add old entries
-        old_time = time.time() - 7200  # 2 hours ago
-        limiter.request_windows[session_id].appendleft(old_time)
-        limiter.file_upload_windows[session_id].appendleft(old_time)
-
-        # Force cleanup by setting cleanup time
-        limiter.last_cleanup = time.time() - 400
-
         # Trigger cleanup
-        limiter._cleanup_old_entries()
+        limiter.backend.evict_idle(time.time())
 
-        # Verify cleanup occurred - sessions should be deleted when empty (line 71, 79)
-        # Note: These lines may not be hit if sessions still have recent entries
-        assert session_id in limiter.request_windows or len(limiter.request_windows[session_id]) > 0
-        assert session_id in limiter.file_upload_windows or len(limiter.file_upload_windows[session_id]) > 0
+        assert f"request:{session_id}" in limiter.backend
+        assert f"upload:{session_id}" in limiter.backend
 
     def test_rate_limiter_window_popleft_boundary(self):
-        """Test rate limiter window boundary conditions for line 100, 134."""
+        """Test that activity older than the windows no longer counts."""
         limiter = RateLimiter(max_requests_per_minute=1, max_requests_per_hour=2)
         session_id = "boundary_test"
+        current_time = time.time()
 
-        # Add old entries that will be popped
-        old_time = time.time() - 7200  # 2 hours ago
-        limiter.request_windows[session_id].append(old_time)
-        limiter.file_upload_windows[session_id].append(old_time)
-
-        # Check rate - should trigger popleft for old entries (lines 100, 134)
-        result = limiter.check_request_rate(session_id)
-        assert result is True
+        # Exhaust both limits two hours ago
+        with patch("src.ui.multi_journey_interface.time.time", return_value=current_time - 7200):
+            limiter.check_request_rate(session_id)
+            for _ in range(50):
+                limiter.check_file_upload_rate(session_id)
 
-        file_result = limiter.check_file_upload_rate(session_id)
-        assert file_result is True
+        with patch("src.ui.multi_journey_interface.time.time", return_value=current_time):
+            assert limiter.check_request_rate(session_id) is True
+            assert limiter.check_file_upload_rate(session_id) is True
 
     def test_get_rate_limit_status_detailed(self):
         """Test detailed rate limit status for missing lines 146-158."""
@@ -670,6 +613,43 @@ class TestMultiJourneyInterfaceExtended:
         mock_gr.HTML.assert_called()
         mock_gr.Markdown.assert_called()
 
+    @patch("src.ui.multi_journey_interface.gr")
+    def test_journey2_requests_share_one_zen_connection(self, mock_gr):
+        """Journey 2 requests run on one event loop, so the Zen session connects only once."""
+        mock_gr.Column.return_value = MagicMock()
+        mock_gr.Row.return_value = MagicMock()
+        zen_client = MagicMock()
+        zen_client.connect = AsyncMock(return_value=True)
+        zen_client.get_model_recommendations = AsyncMock(return_value=None)
+        zen_client.execute_with_routing = AsyncMock(
+            return_value={
+                "success": True,
+                "result": {
+                    "content": "Routed response",
+                    "model_used": "test-model",
+                    "response_time": 0.01,
+                    "routing_metadata": {},
+                },
+            },
+        )
+
+        interface = MultiJourneyInterface()
+        with patch("src.ui.journeys.journey2_intelligent_search.ZenStdioMCPClient", return_value=zen_client):
+            interface._create_journey2_interface()
+        handle_zen_execution = next(
+            c.kwargs["fn"]
+            for c in mock_gr.Button.return_value.click.call_args_list
+            if c.kwargs["fn"].__name__ == "handle_zen_execution"
+        )
+
+        first = handle_zen_execution("Explain recursion", "standard", "", 0.7, 500)
+        second = handle_zen_execution("Explain iteration", "standard", "", 0.7, 500)
+
+        assert first[0] == "Routed response"
+        assert second[0] == "Routed response"
+        assert interface.journey2_processor.zen_session.stats["connects"] == 1
+        assert interface.journey2_processor.zen_session.stats["loop_changes"] == 0
+
     @patch("src.ui.multi_journey_interface.gr")
     def test_create_journey3_interface(self, mock_gr):
         """Test Journey 3 interface creation for missing lines 1020-1035."""
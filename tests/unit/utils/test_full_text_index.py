@@ -0,0 +1,113 @@
+"""Unit tests for the persistent full-text index."""
+
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.full_text_index import FullTextIndex
+
+
+@pytest.fixture
+def docs(tmp_path):
+    root = tmp_path / "docs"
+    (root / "guides").mkdir(parents=True)
+    (root / "retries.md").write_text("# Retries\nUse exponential backoff.\nRetry budgets cap retry storms.\n")
+    (root / "guides" / "breaker.md").write_text("Intro\n\nThe circuit breaker opens after failures.\n")
+    (root / "guides" / "notes.md").write_text("A breaker panel and a circuit diagram.\n")
+    (root / "ignored.txt").write_text("circuit breaker retry\n")
+    return root
+
+
+@pytest.fixture
+def index(docs, tmp_path):
+    full_text_index = FullTextIndex(docs, tmp_path / "index" / "search.db", refresh_interval=3600)
+    yield full_text_index
+    full_text_index.close()
+
+
+class TestFullTextIndex:
+    """Test cases for FullTextIndex."""
+
+    def test_bm25_ranking_and_offsets(self, index):
+        """More relevant documents rank first and hits carry match offsets."""
+        hits = index.search("retry")
+
+        assert [hit.path.rsplit("/", 1)[-1] for hit in hits] == ["retries.md"]
+        content = (index.root / "retries.md").read_text()
+        assert content[hits[0].start : hits[0].end] == "Retry"
+        assert hits[0].line == 3
+        assert "exponential backoff" in hits[0].context
+
+    def test_phrase_and_prefix_queries(self, index):
+        """Quoted phrases require adjacency and trailing * matches prefixes."""
+        phrase_hits = index.search('"circuit breaker"')
+        assert [hit.path.rsplit("/", 1)[-1] for hit in phrase_hits] == ["breaker.md"]
+        assert phrase_hits[0].line == 3
+
+        # Both words anywhere in the document
+        assert len(index.search("circuit breaker")) == 2
+        assert [hit.path.rsplit("/", 1)[-1] for hit in index.search("retr*")] == ["retries.md"]
+
+    def test_incremental_refresh(self, index, docs):
+        """Only changed files are reindexed and deleted files are removed."""
+        assert index.refresh() == {"indexed": 3, "unchanged": 0, "removed": 0}
+        assert index.refresh() == {"indexed": 0, "unchanged": 3, "removed": 0}
+
+        # A new mtime with identical content is not reindexed
+        stat = (docs / "retries.md").stat()
+        os.utime(docs / "retries.md", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (docs / "guides" / "notes.md").write_text("Now about idempotency keys.\n")
+        (docs / "guides" / "breaker.md").unlink()
+
+        assert index.refresh() == {"indexed": 1, "unchanged": 1, "removed": 1}
+        assert index.search("breaker") == []
+        assert len(index.search("idempotency")) == 1
+
+    def test_stale_search_refreshes_in_background(self, docs, tmp_path):
+        """Queries on a stale index are answered while the tree walk runs in another thread."""
+        index = FullTextIndex(docs, tmp_path / "index" / "search.db", refresh_interval=0)
+        walking, release = threading.Event(), threading.Event()
+        scan = index._scan
+
+        def blocked_scan(existing):
+            walking.set()
+            release.wait(5)
+            return scan(existing)
+
+        try:
+            assert len(index.search("breaker")) == 2
+            (docs / "guides" / "notes.md").write_text("Now about idempotency keys.\n")
+
+            with patch.object(index, "_scan", side_effect=blocked_scan):
+                assert index.search("idempotency") == []
+                assert walking.wait(5)
+                # The walk holds no lock that queries need
+                assert len(index.search("circuit")) == 2
+                release.set()
+                with index._refresh_lock:
+                    pass
+
+            assert len(index.search("idempotency")) == 1
+        finally:
+            release.set()
+            index.close()
+
+    def test_index_persists_across_instances(self, index, docs, tmp_path):
+        """A reopened index does not rebuild unchanged documents."""
+        index.refresh()
+        index.close()
+
+        reopened = FullTextIndex(docs, tmp_path / "index" / "search.db")
+        try:
+            assert reopened.stats()["documents"] == 3
+            assert reopened.refresh()["indexed"] == 0
+        finally:
+            reopened.close()
+
+    def test_queries_cannot_inject_fts_syntax(self, index):
+        """Operators and punctuation in user input are treated as plain words."""
+        assert len(index.search('breaker: -circuit"')) == 2
+        assert index.search("***") == []
+        assert index.search("retry", limit=0) == []
@@ -0,0 +1,151 @@
+"""Unit tests for the unified metrics registry and OpenMetrics exposition."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from src.api.routers.monitoring import metrics_router
+from src.utils.metrics_registry import (
+    OPENMETRICS_CONTENT_TYPE,
+    MetricSnapshot,
+    MetricsRegistry,
+    get_metrics_registry,
+    summary_snapshot,
+)
+from src.utils.quantile_sketch import QuantileSketch
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.registry = MetricsRegistry(namespace="test")
+
+    def test_counter_render(self):
+        """Counters render with the _total suffix and cached labels."""
+        counter = self.registry.counter("requests_total", "Requests", ("method",))
+        counter.labels("GET").inc()
+        counter.labels("GET").inc(2)
+        counter.labels("POST").inc()
+
+        text = self.registry.render_text()
+
+        assert "# TYPE test_requests counter\n" in text
+        assert 'test_requests_total{method="GET"} 3\n' in text
+        assert 'test_requests_total{method="POST"} 1\n' in text
+        assert text.endswith("# EOF\n")
+
+    def test_label_children_are_reused(self):
+        """The same label tuple always returns the same child."""
+        gauge = self.registry.gauge("temperature", "Temperature", ("room",))
+
+        assert gauge.labels("kitchen") is gauge.labels("kitchen")
+
+    def test_counter_rejects_negative_increment(self):
+        """Counters are monotonic."""
+        counter = self.registry.counter("events", "Events")
+
+        with pytest.raises(ValueError, match="non-negative"):
+            counter.inc(-1)
+
+    def test_wrong_label_count(self):
+        """Label arity is enforced."""
+        counter = self.registry.counter("events", "Events", ("kind",))
+
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.labels("a", "b")
+
+    def test_conflicting_registration(self):
+        """Re-registering a name returns the same family or fails on mismatch."""
+        first = self.registry.counter("events", "Events", ("kind",))
+
+        assert self.registry.counter("events", "Events", ("kind",)) is first
+        with pytest.raises(ValueError, match="different definition"):
+            self.registry.gauge("events", "Events")
+
+    def test_histogram_render(self):
+        """Histograms render cumulative buckets, count and sum."""
+        histogram = self.registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        child = histogram.labels("/x")
+        for value in (0.05, 0.5, 0.5, 5.0):
+            child.observe(value)
+
+        text = self.registry.render_text()
+
+        assert 'test_latency_seconds_bucket{route="/x",le="0.1"} 1\n' in text
+        assert 'test_latency_seconds_bucket{route="/x",le="1"} 3\n' in text
+        assert 'test_latency_seconds_bucket{route="/x",le="+Inf"} 4\n' in text
+        assert 'test_latency_seconds_count{route="/x"} 4\n' in text
+        assert 'test_latency_seconds_sum{route="/x"} 6.05\n' in text
+
+    def test_label_values_are_escaped(self):
+        """Label values are escaped per the exposition format."""
+        self.registry.gauge("info", "Info", ("value",)).labels('a"b\\c').set(1)
+
+        assert 'test_info{value="a\\"b\\\\c"} 1\n' in self.registry.render_text()
+
+    def test_collectors_are_merged_by_family(self):
+        """Snapshots sharing a family name are rendered contiguously."""
+
+        def first_collector():
+            snapshot = MetricSnapshot("jobs", "counter", "Jobs")
+            snapshot.add(1, {"worker": "a"}, "_total")
+            return [snapshot]
+
+        def second_collector():
+            snapshot = MetricSnapshot("jobs", "counter", "Jobs")
+            snapshot.add(2, {"worker": "b"}, "_total")
+            return [snapshot]
+
+        self.registry.register_collector(first_collector)
+        self.registry.register_collector(second_collector)
+
+        text = self.registry.render_text()
+
+        assert text.count("# TYPE test_jobs counter") == 1
+        assert 'test_jobs_total{worker="a"} 1\ntest_jobs_total{worker="b"} 2\n' in text
+
+    def test_failing_collector_is_skipped(self):
+        """A broken collector does not break the scrape."""
+
+        def broken_collector():
+            raise RuntimeError("boom")
+
+        self.registry.register_collector(broken_collector)
+        self.registry.counter("events", "Events").inc()
+
+        text = self.registry.render_text()
+        assert "test_events_total 1\n" in text
+        assert text.endswith("# EOF\n")
+
+    def test_summary_snapshot(self):
+        """Quantile sketches render as OpenMetrics summaries."""
+        sketch = QuantileSketch.from_values([1.0, 2.0, 3.0])
+        self.registry.register_collector(lambda: [summary_snapshot("work_seconds", "Work", [({"job": "x"}, sketch)])])
+
+        text = self.registry.render_text()
+
+        assert "# TYPE test_work_seconds summary\n" in text
+        assert 'test_work_seconds{job="x",quantile="0.5"} 2\n' in text
+        assert 'test_work_seconds_count{job="x"} 3\n' in text
+        assert 'test_work_seconds_sum{job="x"} 6\n' in text
+
+
+class TestMetricsEndpoint:
+    """Test cases for the /metrics scrape endpoint."""
+
+    def test_metrics_endpoint_streams_openmetrics(self):
+        """The endpoint exposes registered metrics and collectors."""
+        app = FastAPI()
+        app.include_router(metrics_router)
+        get_metrics_registry().counter("endpoint_test_events", "Endpoint test events").inc()
+
+        with TestClient(app) as client:
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == OPENMETRICS_CONTENT_TYPE
+        assert "promptcraft_endpoint_test_events_total 1" in response.text
+        assert "# TYPE promptcraft_monitor_timer summary" in response.text
+        assert response.text.endswith("# EOF\n")
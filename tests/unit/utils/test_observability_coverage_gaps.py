@@ -351,21 +351,18 @@ class TestAgentMetricsCoverageGaps:
         assert "p95" in stats
         assert "p99" in stats
 
-    def test_agent_metrics_percentile_method(self):
-        """Test _percentile method with 0% coverage."""
-        metrics = AgentMetrics()
-
-        # Test with values
-        values = [1.0, 2.0, 3.0, 4.0, 5.0]
-        p95 = metrics._percentile(values, 95)
-        assert p95 == 5.0  # 95th percentile of small dataset
+    def test_agent_metrics_duration_stats_are_windowed(self):
+        """Test duration statistics only cover the sliding window."""
+        metrics = AgentMetrics(duration_window_seconds=60)
 
-        p50 = metrics._percentile(values, 50)
-        assert p50 == 3.0  # 50th percentile (median)
+        with patch("src.utils.quantile_sketch.time.time", return_value=1_000.0):
+            metrics.record_duration("agent_execution_duration_seconds", 30.0)
+        with patch("src.utils.quantile_sketch.time.time", return_value=1_100.0):
+            metrics.record_duration("agent_execution_duration_seconds", 0.5)
+            stats = metrics.get_metrics()["agent_execution_duration_stats"]
 
-        # Test with empty list
-        empty_p95 = metrics._percentile([], 95)
-        assert empty_p95 == 0.0
+        assert stats["count"] == 1
+        assert stats["max"] == 0.5
 
     def test_agent_metrics_get_metrics_empty_durations(self):
         """Test get_metrics with empty duration list."""
@@ -514,11 +511,13 @@ def test_opentelemetry_instrumentor_service_names(service_name):
 
 @pytest.mark.parametrize(("percentile", "expected_index"), [(50, 2), (95, 4), (99, 4)])
 def test_agent_metrics_percentile_calculations(percentile, expected_index):
-    """Test AgentMetrics percentile calculations with different percentiles."""
+    """Test AgentMetrics duration percentiles with different percentiles."""
     metrics = AgentMetrics()
     values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    for value in values:
+        metrics.record_duration("agent_execution_duration_seconds", value)
 
-    result = metrics._percentile(values, percentile)
+    result = metrics.get_duration_sketch("agent_execution_duration_seconds").percentile(percentile)
     expected = values[expected_index]
 
     assert result == expected
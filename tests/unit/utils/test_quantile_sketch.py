@@ -0,0 +1,160 @@
+"""Unit tests for the streaming quantile sketches."""
+
+import json
+import random
+
+import pytest
+
+from src.utils.quantile_sketch import QuantileSketch, RollingQuantileSketch
+
+
+def _exact_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1) + 0.5)]
+
+
+class TestQuantileSketch:
+    """Test cases for QuantileSketch."""
+
+    def test_empty_sketch(self):
+        """Empty sketches report zeros and no summary."""
+        sketch = QuantileSketch()
+
+        assert sketch.count == 0
+        assert sketch.quantile(0.95) == 0.0
+        assert sketch.summary() == {}
+
+    def test_small_samples_are_exact(self):
+        """Values within the exact limit produce exact quantiles."""
+        sketch = QuantileSketch.from_values(range(1, 101))
+
+        assert sketch.quantile(0.95) == 95
+        assert sketch.quantile(0.99) == 99
+        assert sketch.quantile(0.5) == 51
+        assert sketch.min == 1
+        assert sketch.max == 100
+
+    def test_compensated_mean(self):
+        """Mean is computed with compensated summation."""
+        sketch = QuantileSketch.from_values([0.1, 0.2, 0.15, 0.3, 0.25])
+
+        assert sketch.mean == 0.2
+
+    @pytest.mark.parametrize("q", [0.5, 0.9, 0.95, 0.99, 0.999])
+    def test_relative_accuracy_on_large_streams(self, q):
+        """Quantiles stay within the configured relative error."""
+        rng = random.Random(42)  # noqa: S311 - deterministic test data
+        values = [rng.lognormvariate(0, 1.5) for _ in range(50_000)]
+        sketch = QuantileSketch.from_values(values, relative_accuracy=0.01)
+
+        expected = _exact_quantile(values, q)
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+
+    def test_memory_is_bounded(self):
+        """Bucket count stays under max_bins regardless of value range."""
+        sketch = QuantileSketch(max_bins=64)
+        for exponent in range(-8, 8):
+            for step in range(1, 500):
+                sketch.add(step * 10.0**exponent)
+
+        assert sketch.bin_count <= 64
+        assert sketch.count == 16 * 499
+
+    def test_negative_and_zero_values(self):
+        """Negative values and zeros are ordered correctly."""
+        values = [-100.0 + i for i in range(200)] + [0.0] * 10
+        sketch = QuantileSketch.from_values(values, exact_limit=0)
+
+        assert sketch.quantile(0.0) == pytest.approx(-100.0, rel=0.01)
+        assert sketch.quantile(1.0) == pytest.approx(99.0, rel=0.01)
+        assert sketch.quantile(0.5) == pytest.approx(_exact_quantile(values, 0.5), rel=0.02, abs=1.0)
+
+    def test_merge_matches_single_sketch(self):
+        """Merging per-worker sketches equals recording everything in one."""
+        rng = random.Random(7)  # noqa: S311 - deterministic test data
+        values = [rng.expovariate(1 / 50) for _ in range(10_000)]
+        whole = QuantileSketch.from_values(values)
+        left = QuantileSketch.from_values(values[:4000])
+        right = QuantileSketch.from_values(values[4000:])
+
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.sum == pytest.approx(whole.sum)
+        for q in (0.5, 0.95, 0.99):
+            assert left.quantile(q) == whole.quantile(q)
+
+    def test_merge_rejects_different_accuracy(self):
+        """Sketches with different bucket mappings cannot be merged."""
+        with pytest.raises(ValueError, match="relative accuracy"):
+            QuantileSketch(relative_accuracy=0.01).merge(QuantileSketch(relative_accuracy=0.02))
+
+    def test_serialization_round_trip(self):
+        """Sketches survive JSON transport between workers."""
+        sketch = QuantileSketch.from_values(float(i) for i in range(1000))
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.count == sketch.count
+        assert restored.quantile(0.99) == sketch.quantile(0.99)
+
+    def test_invalid_arguments(self):
+        """Invalid construction and query parameters raise ValueError."""
+        with pytest.raises(ValueError, match="relative_accuracy"):
+            QuantileSketch(relative_accuracy=1.5)
+        with pytest.raises(ValueError, match="quantile"):
+            QuantileSketch().quantile(1.5)
+
+
+class TestRollingQuantileSketch:
+    """Test cases for RollingQuantileSketch."""
+
+    def test_values_age_out_of_window(self):
+        """Observations older than the window are excluded."""
+        rolling = RollingQuantileSketch(window_seconds=60, slots=6)
+        rolling.add(1000.0, timestamp=0.0)
+        rolling.add(1.0, timestamp=55.0)
+
+        assert rolling.snapshot(now=59.0).count == 2
+        assert rolling.snapshot(now=65.0).count == 1
+        assert rolling.quantile(1.0, now=65.0) == 1.0
+
+    def test_slots_are_reused(self):
+        """Slot storage is recycled so memory does not grow over time."""
+        rolling = RollingQuantileSketch(window_seconds=10, slots=2)
+        for second in range(1000):
+            rolling.add(float(second), timestamp=float(second))
+
+        snapshot = rolling.snapshot(now=999.0)
+        assert snapshot.count == 10
+        assert snapshot.min == 990.0
+
+    def test_late_values_do_not_wipe_newer_slots(self):
+        """A value older than its slot's current epoch is dropped, not allowed to clear the slot."""
+        rolling = RollingQuantileSketch(window_seconds=60, slots=6)
+        for i in range(100):
+            rolling.add(1.0, timestamp=1000.0 + i * 0.5)
+        rolling.add(2.0, timestamp=1031.0 - 69.0)
+        rolling.merge_snapshot(QuantileSketch.from_values([3.0]), timestamp=1031.0 - 69.0)
+
+        snapshot = rolling.snapshot(now=1049.5)
+        assert snapshot.count == 100
+        assert snapshot.max == 1.0
+
+    def test_merge_rolling_sketches(self):
+        """Rolling sketches from several workers merge slot by slot."""
+        first = RollingQuantileSketch(window_seconds=60, slots=6)
+        second = RollingQuantileSketch(window_seconds=60, slots=6)
+        first.add(1.0, timestamp=10.0)
+        second.add(2.0, timestamp=10.0)
+        second.add(3.0, timestamp=30.0)
+
+        first.merge(second)
+
+        assert first.snapshot(now=30.0).count == 3
+
+    def test_merge_snapshot(self):
+        """Plain sketches merge into the current slot."""
+        rolling = RollingQuantileSketch(window_seconds=60)
+        rolling.merge_snapshot(QuantileSketch.from_values([1.0, 2.0, 3.0]), timestamp=100.0)
+
+        assert rolling.snapshot(now=100.0).count == 3
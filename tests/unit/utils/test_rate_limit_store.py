@@ -0,0 +1,174 @@
+"""Unit tests for the sliding-window-counter rate limit backends."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.rate_limit_store import (
+    InMemoryRateLimitBackend,
+    RateWindow,
+    RedisRateLimitBackend,
+    create_rate_limit_backend,
+    sliding_window_estimate,
+)
+
+
+class FakeRedis:
+    """Minimal Redis-protocol fake supporting the commands the backend uses."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, int] = {}
+        self.ttls: dict[str, int] = {}
+        self.available = True
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and applies them on execute, like redis-py pipelines."""
+
+    def __init__(self, server: FakeRedis) -> None:
+        self.server = server
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def decr(self, key):
+        self.commands.append(("decr", key))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    def get(self, key):
+        self.commands.append(("get", key))
+
+    def execute(self):
+        if not self.server.available:
+            raise ConnectionError("connection refused")
+        results = []
+        for command, key, *args in self.commands:
+            if command == "incr":
+                self.server.data[key] = self.server.data.get(key, 0) + 1
+                results.append(self.server.data[key])
+            elif command == "decr":
+                self.server.data[key] = self.server.data.get(key, 0) - 1
+                results.append(self.server.data[key])
+            elif command == "expire":
+                self.server.ttls[key] = args[0]
+                results.append(True)
+            else:
+                value = self.server.data.get(key)
+                results.append(None if value is None else str(value).encode())
+        return results
+
+
+MINUTE_AND_HOUR = (RateWindow(60, 3), RateWindow(3600, 5))
+
+
+class TestSlidingWindowEstimate:
+    """Test cases for the sliding window estimate."""
+
+    def test_previous_bucket_is_weighted_by_overlap(self):
+        """The previous bucket counts in proportion to its overlap with the window."""
+        window = RateWindow(60, 10)
+
+        assert sliding_window_estimate(6, 2, window, now=120.0) == 8.0
+        assert sliding_window_estimate(6, 2, window, now=150.0) == 5.0
+
+    def test_invalid_window(self):
+        """Windows must have a positive length."""
+        with pytest.raises(ValueError, match="seconds"):
+            RateWindow(0, 10)
+
+
+class TestInMemoryRateLimitBackend:
+    """Test cases for InMemoryRateLimitBackend."""
+
+    def test_all_windows_must_allow(self):
+        """A hit is rejected, and not recorded, when any window is full."""
+        backend = InMemoryRateLimitBackend()
+
+        assert [backend.hit("k", MINUTE_AND_HOUR, 0.0) for _ in range(4)] == [True, True, True, False]
+        assert backend.counts("k", MINUTE_AND_HOUR, 0.0) == [3.0, 3.0]
+
+        # The minute window has slid past, the hourly one still has room for two
+        assert backend.hit("k", MINUTE_AND_HOUR, 130.0) is True
+        assert backend.hit("k", MINUTE_AND_HOUR, 130.0) is True
+        assert backend.hit("k", MINUTE_AND_HOUR, 130.0) is False
+
+    def test_idle_keys_are_evicted_incrementally(self):
+        """Each hit evicts at most ``eviction_batch`` idle keys."""
+        backend = InMemoryRateLimitBackend(eviction_batch=2)
+        for index in range(5):
+            backend.hit(f"idle_{index}", MINUTE_AND_HOUR, 0.0)
+
+        backend.hit("active", MINUTE_AND_HOUR, 10_000.0)
+        assert len(backend) == 4
+
+        assert backend.evict_idle(10_000.0) == 2
+        assert backend.evict_idle(10_000.0) == 1
+        assert len(backend) == 1
+        assert "active" in backend
+
+
+class TestRedisRateLimitBackend:
+    """Test cases for RedisRateLimitBackend."""
+
+    def test_limits_are_shared_between_workers(self):
+        """Two limiters on the same server share one budget."""
+        server = FakeRedis()
+        first = RedisRateLimitBackend(server)
+        second = RedisRateLimitBackend(server)
+
+        assert first.hit("k", MINUTE_AND_HOUR, 0.0) is True
+        assert second.hit("k", MINUTE_AND_HOUR, 1.0) is True
+        assert first.hit("k", MINUTE_AND_HOUR, 2.0) is True
+        assert second.hit("k", MINUTE_AND_HOUR, 3.0) is False
+        assert first.counts("k", MINUTE_AND_HOUR, 3.0) == [3.0, 3.0]
+
+    def test_rejected_hits_are_rolled_back(self):
+        """Rejected hits do not consume budget in any window."""
+        server = FakeRedis()
+        backend = RedisRateLimitBackend(server)
+        for _ in range(10):
+            backend.hit("k", MINUTE_AND_HOUR, 0.0)
+
+        assert backend.counts("k", MINUTE_AND_HOUR, 0.0) == [3.0, 3.0]
+        assert server.ttls["promptcraft:ratelimit:k:60:0"] == 120
+
+    def test_falls_back_to_local_limits(self):
+        """An unreachable server degrades to per-process limits."""
+        server = FakeRedis()
+        server.available = False
+        backend = RedisRateLimitBackend(server)
+
+        assert [backend.hit("k", MINUTE_AND_HOUR, 0.0) for _ in range(4)] == [True, True, True, False]
+        assert backend.counts("k", MINUTE_AND_HOUR, 0.0) == [3.0, 3.0]
+
+    def test_failure_skips_server_during_cooldown(self):
+        """After a failure the server is not contacted again until the cooldown ends."""
+        server = FakeRedis()
+        server.available = False
+        backend = RedisRateLimitBackend(server, cooldown_seconds=30)
+
+        with patch("src.utils.rate_limit_store.time.monotonic", return_value=100.0):
+            backend.hit("k", MINUTE_AND_HOUR, 0.0)
+            server.available = True
+            backend.hit("k", MINUTE_AND_HOUR, 0.0)
+            backend.counts("k", MINUTE_AND_HOUR, 0.0)
+            assert not backend.available
+        assert server.data == {}
+
+        with patch("src.utils.rate_limit_store.time.monotonic", return_value=131.0):
+            assert backend.hit("k", MINUTE_AND_HOUR, 0.0) is True
+        assert server.data == {"promptcraft:ratelimit:k:60:0": 1, "promptcraft:ratelimit:k:3600:0": 1}
+
+
+def test_create_rate_limit_backend_for_development():
+    """Non-production environments use in-memory storage."""
+    backend = create_rate_limit_backend(SimpleNamespace(environment="dev"))
+
+    assert isinstance(backend, InMemoryRateLimitBackend)
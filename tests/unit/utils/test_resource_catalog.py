@@ -0,0 +1,203 @@
+"""Unit tests for the shared resource catalog."""
+
+import json
+import os
+
+import pytest
+
+from src.utils import resource_catalog
+from src.utils.resource_catalog import ResourceCatalog, get_resource_catalog
+
+
+class Definition:
+    """Minimal definition with the ``to_dict``/``from_dict`` pair the catalog snapshots."""
+
+    def __init__(self, text):
+        self.text = text
+
+    def to_dict(self):
+        return {"text": self.text}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["text"])
+
+
+@pytest.fixture
+def resource(tmp_path):
+    """A resource file on disk."""
+    path = tmp_path / "resource.md"
+    path.write_text("first")
+    return path
+
+
+def load(catalog, path, kind="commands", identity=()):
+    """Load ``path`` through the catalog, counting parses on the catalog itself."""
+    return catalog.load(kind, path, lambda: Definition(path.read_text()), Definition.from_dict, identity=identity)
+
+
+def test_unchanged_file_is_parsed_once(resource):
+    """A second load of an unchanged file is a cache hit."""
+    catalog = ResourceCatalog()
+
+    first = load(catalog, resource)
+    second = load(catalog, resource)
+
+    assert second is first
+    assert (catalog.parses, catalog.hits) == (1, 1)
+
+
+def test_changed_file_is_reparsed(resource):
+    """Writing the file invalidates its cached definition."""
+    catalog = ResourceCatalog()
+    load(catalog, resource)
+
+    resource.write_text("second, longer")
+
+    assert load(catalog, resource).text == "second, longer"
+    assert catalog.parses == 2
+
+
+def test_mode_change_invalidates_entry(resource):
+    """Making a file executable is a change, even with the same mtime and size."""
+    catalog = ResourceCatalog()
+    load(catalog, resource)
+    stat = resource.stat()
+
+    resource.chmod(0o755)
+    os.utime(resource, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    load(catalog, resource)
+
+    assert catalog.parses == 2
+
+
+def test_kinds_do_not_share_entries(resource):
+    """The same file loaded as another kind of resource is parsed again."""
+    catalog = ResourceCatalog()
+    load(catalog, resource, kind="commands")
+    load(catalog, resource, kind="standards")
+
+    assert catalog.parses == 2
+
+
+def test_parse_identity_is_part_of_the_key(resource):
+    """The same file parsed under another id or source type gets its own entry."""
+    catalog = ResourceCatalog()
+    project = load(catalog, resource, identity=("review", "project"))
+    user = load(catalog, resource, identity=("review", "user"))
+
+    assert user is not project
+    assert load(catalog, resource, identity=("review", "project")) is project
+    assert (catalog.parses, catalog.hits, len(catalog)) == (2, 1, 2)
+
+
+def test_missing_file_is_parsed_without_caching(tmp_path):
+    """Files that cannot be stat'ed are parsed every time and never cached."""
+    catalog = ResourceCatalog()
+    parse_calls = []
+
+    def parse():
+        parse_calls.append(1)
+        return Definition("virtual")
+
+    for _ in range(2):
+        catalog.load("commands", tmp_path / "missing.md", parse, Definition.from_dict)
+
+    assert len(parse_calls) == 2
+    assert len(catalog) == 0
+
+
+def test_snapshot_survives_restart(tmp_path, resource):
+    """A new catalog reuses snapshotted definitions of unchanged files without parsing."""
+    snapshot = tmp_path / "cache" / "catalog.json"
+    catalog = ResourceCatalog(snapshot_path=snapshot)
+    load(catalog, resource)
+    assert catalog.save_snapshot()
+
+    restarted = ResourceCatalog(snapshot_path=snapshot)
+
+    assert restarted.snapshot_entries == 1
+    assert load(restarted, resource).text == "first"
+    assert (restarted.parses, restarted.hits) == (0, 1)
+
+
+def test_snapshot_is_only_written_when_dirty(tmp_path, resource):
+    """Saving twice without new parses writes the snapshot once."""
+    catalog = ResourceCatalog(snapshot_path=tmp_path / "catalog.json")
+    load(catalog, resource)
+
+    assert catalog.save_snapshot()
+    assert not catalog.save_snapshot()
+
+
+def test_snapshot_drops_deleted_files(tmp_path, resource):
+    """Entries for files that no longer exist are not carried into the next snapshot."""
+    snapshot = tmp_path / "catalog.json"
+    catalog = ResourceCatalog(snapshot_path=snapshot)
+    load(catalog, resource)
+    other = tmp_path / "other.md"
+    other.write_text("other")
+    load(catalog, other)
+    catalog.save_snapshot()
+
+    resource.unlink()
+    restarted = ResourceCatalog(snapshot_path=snapshot)
+    load(restarted, other)
+    other.write_text("changed other")
+    load(restarted, other)
+    restarted.save_snapshot()
+
+    assert [entry["path"] for entry in json.loads(snapshot.read_text())["entries"]] == [str(other.absolute())]
+
+
+def test_snapshot_drops_files_deleted_after_loading(tmp_path, resource):
+    """A file loaded in this process is dropped from the snapshot once it is deleted."""
+    snapshot = tmp_path / "catalog.json"
+    catalog = ResourceCatalog(snapshot_path=snapshot)
+    load(catalog, resource)
+    other = tmp_path / "other.md"
+    other.write_text("other")
+    load(catalog, other)
+
+    resource.unlink()
+    catalog.save_snapshot()
+
+    assert [entry["path"] for entry in json.loads(snapshot.read_text())["entries"]] == [str(other.absolute())]
+
+
+def test_shared_catalog_persistence_is_opt_in(tmp_path, resource, monkeypatch):
+    """The process-wide catalog writes no snapshot until a path is given."""
+    monkeypatch.setattr(resource_catalog, "_catalog", None)
+    catalog = get_resource_catalog()
+    load(catalog, resource)
+
+    assert catalog.snapshot_path is None
+    assert not catalog.save_snapshot()
+
+    snapshot = tmp_path / "catalog.json"
+    assert get_resource_catalog(snapshot_path=snapshot) is catalog
+    assert catalog.save_snapshot()
+    assert ResourceCatalog(snapshot_path=snapshot).snapshot_entries == 1
+
+
+@pytest.mark.parametrize("content", ["not json", json.dumps({"version": 0, "entries": {}}), json.dumps({"version": 2})])
+def test_unusable_snapshot_is_ignored(tmp_path, content):
+    """Corrupt, outdated or malformed snapshots start the catalog empty."""
+    snapshot = tmp_path / "catalog.json"
+    snapshot.write_text(content)
+
+    assert len(ResourceCatalog(snapshot_path=snapshot)) == 0
+
+
+def test_stats_report_scan_timings(resource):
+    """Timed scans are reported per resource kind."""
+    catalog = ResourceCatalog()
+    for _ in range(2):
+        with catalog.timed_scan("scripts"):
+            load(catalog, resource, kind="scripts")
+
+    stats = catalog.get_stats()
+
+    assert stats["entries"] == 1
+    assert stats["scans"]["scripts"]["count"] == 2
+    assert stats["scans"]["scripts"]["total_seconds"] >= stats["scans"]["scripts"]["last_seconds"]
@@ -0,0 +1,170 @@
+"""Unit tests for the startup profiler and deferred imports."""
+
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from src.utils.lazy_import import LazyModule, lazy_exports, lazy_import
+from src.utils.startup_profiler import StartupProfiler
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+APPLICATION_PROBE = """
+import json
+import src
+import src.utils.lazy_import
+from src.utils.startup_profiler import get_startup_profiler
+print(json.dumps(get_startup_profiler().report()))
+"""
+
+
+@pytest.fixture
+def fake_package(tmp_path, monkeypatch):
+    """Importable throwaway package ``lazypkg`` with two submodules."""
+    package = tmp_path / "lazypkg"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        textwrap.dedent(
+            """
+            from src.utils.lazy_import import lazy_exports
+
+            _EXPORTS = {"Heavy": ".heavy", "CONSTANT": "lazypkg.light"}
+            __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+            """,
+        ),
+    )
+    (package / "heavy.py").write_text("class Heavy:\n    pass\n")
+    (package / "light.py").write_text("CONSTANT = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in [name for name in sys.modules if name == "lazypkg" or name.startswith("lazypkg.")]:
+        del sys.modules[name]
+
+
+class TestStartupProfiler:
+    """Test cases for StartupProfiler."""
+
+    def test_nested_imports_split_self_and_cumulative_time(self):
+        """Nested profiled imports count toward the parent's cumulative time only."""
+        profiler = StartupProfiler()
+
+        with profiler.time_import("outer"):
+            time.sleep(0.01)
+            with profiler.time_import("inner"):
+                time.sleep(0.02)
+
+        timings = {timing.module: timing for timing in profiler.imports()}
+        outer, inner = timings["outer"], timings["inner"]
+        assert outer.cumulative_seconds >= inner.cumulative_seconds + 0.01
+        assert outer.self_seconds == pytest.approx(outer.cumulative_seconds - inner.cumulative_seconds)
+        assert inner.self_seconds == inner.cumulative_seconds
+
+    def test_lazy_imports_reported_separately(self):
+        """Deferred imports, and anything they import, are excluded from startup totals."""
+        profiler = StartupProfiler()
+
+        with profiler.time_import("eager"):
+            pass
+        with profiler.time_import("deferred", lazy=True), profiler.time_import("deferred.child"):
+            pass
+
+        report = profiler.report()
+        assert report["modules_imported"] == 1
+        assert [entry["module"] for entry in report["slowest_imports"]] == ["eager"]
+        assert [entry["module"] for entry in report["lazy_imports"]] == ["deferred", "deferred.child"]
+
+    def test_steps_record_failures(self):
+        """Steps are recorded in completion order, including ones that raise."""
+        profiler = StartupProfiler()
+
+        with profiler.step("first"):
+            pass
+        with pytest.raises(RuntimeError), profiler.step("second"):
+            raise RuntimeError("boom")
+
+        assert [(step["name"], step["failed"]) for step in profiler.report()["steps"]] == [
+            ("first", False),
+            ("second", True),
+        ]
+
+    def test_import_timer_records_module_execution(self, fake_package):
+        """The import timer records profiled packages and leaves others alone."""
+        profiler = StartupProfiler()
+        profiler.install_import_timer(packages=("lazypkg",))
+        try:
+            import lazypkg.light  # noqa: F401
+        finally:
+            profiler.uninstall_import_timer()
+
+        assert {timing.module for timing in profiler.imports()} == {"lazypkg", "lazypkg.light"}
+        assert sys.modules["lazypkg.light"].__spec__.origin.endswith("light.py")
+        assert profiler.report()["import_timer_installed"] is False
+
+    @pytest.mark.parametrize(("env_value", "installed"), [(None, False), ("1", True)])
+    def test_application_import_timer_is_opt_in(self, env_value, installed):
+        """The application package installs the process-wide timer only when asked to."""
+        env = {key: value for key, value in os.environ.items() if key != "PROMPTCRAFT_PROFILE_IMPORTS"}
+        if env_value is not None:
+            env["PROMPTCRAFT_PROFILE_IMPORTS"] = env_value
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", APPLICATION_PROBE],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=True,
+        )
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+
+        assert report["import_timer_installed"] is installed
+        assert (report["modules_imported"] > 0) is installed
+
+
+class TestLazyImport:
+    """Test cases for lazy_import and lazy_exports."""
+
+    def test_lazy_module_loads_on_first_attribute_access(self, fake_package):
+        """The proxy does not import the module until it is used."""
+        module = lazy_import("lazypkg.light")
+
+        assert isinstance(module, LazyModule)
+        assert not module.is_loaded
+        assert "lazypkg.light" not in sys.modules
+        assert module.CONSTANT == 42
+        assert module.is_loaded
+        assert "loaded" in repr(module)
+
+    def test_lazy_exports_import_only_the_needed_submodule(self, fake_package):
+        """Package re-exports resolve relative names and are cached after first use."""
+        import lazypkg
+
+        assert "Heavy" in dir(lazypkg)
+        assert "lazypkg.heavy" not in sys.modules
+        assert lazypkg.CONSTANT == 42
+        assert "lazypkg.heavy" not in sys.modules
+        heavy = lazypkg.Heavy
+        assert heavy.__module__ == "lazypkg.heavy"
+        assert lazypkg.__dict__["Heavy"] is heavy
+        with pytest.raises(AttributeError, match="Missing"):
+            _ = lazypkg.Missing
+
+    def test_lazy_exports_from_import(self, fake_package):
+        """``from package import name`` works with deferred exports."""
+        from lazypkg import Heavy
+
+        assert Heavy.__name__ == "Heavy"
+
+    def test_lazy_exports_helper_rejects_unknown_names(self):
+        """Unknown names raise AttributeError like a regular module."""
+        getattr_, dir_ = lazy_exports("src.utils", {"Thing": ".nowhere"})
+
+        with pytest.raises(AttributeError):
+            getattr_("Other")
+        assert "Thing" in dir_()
@@ -0,0 +1,98 @@
+"""Unit tests for the trigram fuzzy search index."""
+
+import pytest
+
+from src.utils.trigram_index import TrigramIndex, edit_distance, trigrams
+
+
+@pytest.fixture
+def index():
+    """Index of a few commands with names and tags."""
+    trigram_index = TrigramIndex()
+    trigram_index.add("load-category", [("load-category", 1.0), ("loading categories", 0.7)])
+    trigram_index.add("list-categories", [("list-categories", 1.0)])
+    trigram_index.add("deploy-staging", [("deploy-staging", 1.0), ("release", 0.7)])
+    trigram_index.add("quality-lint", [("quality-lint", 1.0), ("Runs linting checks", 0.5)])
+    return trigram_index
+
+
+def keys(matches):
+    """Keys of search matches, in rank order."""
+    return [match.key for match in matches]
+
+
+def test_trigrams_are_padded():
+    """Word starts carry two padded trigrams and the end one."""
+    assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "distance"),
+    [("lint", "lint", 0), ("lnit", "lint", 1), ("serach", "search", 1), ("deploy", "dplyo", 2)],
+)
+def test_edit_distance(a, b, distance):
+    """Transpositions count as a single edit."""
+    assert edit_distance(a, b, limit=3) == distance
+
+
+def test_edit_distance_stops_past_limit():
+    """Distances past the limit are reported as limit + 1."""
+    assert edit_distance("category", "deploy", limit=2) == 3
+    assert edit_distance("a", "abcdef", limit=1) == 2
+
+
+def test_exact_prefix_and_substring_matches_rank_in_order(index):
+    """Exact words outrank prefixes, which outrank substrings, which outrank fuzzy matches."""
+    index.add("categorize", [("categorize", 1.0)])
+    index.add("recategory", [("recategory", 1.0)])
+
+    assert keys(index.search("category")) == ["load-category", "recategory", "categorize", "list-categories"]
+    assert keys(index.search("lint")) == ["quality-lint", "list-categories"]
+
+
+@pytest.mark.parametrize(("query", "expected"), [("lnit", "quality-lint"), ("deplyo", "deploy-staging")])
+def test_typos_are_tolerated(index, query, expected):
+    """Small typos still find the entry."""
+    assert keys(index.search(query)) == [expected]
+
+
+def test_every_query_word_must_match(index):
+    """Multi-word queries narrow the results."""
+    assert keys(index.search("list categories")) == ["list-categories"]
+    assert index.search("list deploy") == []
+    assert index.search("xyz123") == []
+    assert index.search("  --  ") == []
+
+
+def test_field_weights_affect_ranking(index):
+    """A word found in a heavier field ranks higher."""
+    index.add("release-notes", [("release-notes", 1.0)])
+
+    matches = index.search("release")
+
+    assert keys(matches) == ["release-notes", "deploy-staging"]
+    assert matches[0].score == pytest.approx(1.0)
+    assert matches[1].score == pytest.approx(0.7)
+
+
+def test_limit(index):
+    """Results are cut to the limit after ranking."""
+    assert keys(index.search("categor", limit=1)) == ["list-categories"]
+
+
+def test_replace_and_remove(index):
+    """Re-adding replaces an entry's words and removing drops its vocabulary."""
+    index.add("quality-lint", [("quality-format", 1.0)])
+
+    assert keys(index.search("lint")) == ["list-categories"]  # Only the fuzzy neighbour is left
+    assert keys(index.search("format")) == ["quality-lint"]
+
+    assert index.remove("quality-lint")
+    assert not index.remove("quality-lint")
+    assert "quality-lint" not in index
+    assert index.search("format") == []
+    assert len(index) == 3
+
+    index.clear()
+    assert len(index) == 0
+    assert index.search("deploy") == []